@@ -62,6 +62,15 @@ sciezka_zakotwienie = os.path.join(sciezka_moduly, "PODSTAWOWE DANE_DLUGOSC ZAKO
 sciezka_otulina     = os.path.join(sciezka_moduly, "PODSTAWOWE DANE_OTULINA ZBROJENIA")
 sciezka_beton       = os.path.join(sciezka_moduly, "PODSTAWOWE DANE_PARAMETRY BETONU")
 sciezka_stal        = os.path.join(sciezka_moduly, "PODSTAWOWE DANE_PARAMETRY STALI")
+sciezka_kombinacje  = os.path.join(sciezka_moduly, "OBCIAZENIA_KOMBINACJE OBCIAZEN")
+sciezka_el_stalowe  = os.path.join(sciezka_moduly, "KONSTRUKCJE STALOWE_ELEMENTY STALOWE")
+sciezka_el_drewno   = os.path.join(sciezka_moduly, "KONSTRUKCJE DREWNIANE_ELEMENTY DREWNIANE")
+sciezka_rysy        = os.path.join(sciezka_moduly, "SGU_ZARYSOWANIE")
+sciezka_pelzanie    = os.path.join(sciezka_moduly, "PODSTAWOWE DANE_PELZANIE I SKURCZ")
+sciezka_dobor_pretow = os.path.join(sciezka_moduly, "PODSTAWOWE DANE_DOBOR PRETOW")
+sciezka_zestawienie = os.path.join(sciezka_moduly, "ZESTAWIENIA_ZESTAWIENIE STALI")
+sciezka_plan_ciecia = os.path.join(sciezka_moduly, "ZESTAWIENIA_PLAN CIECIA")
+sciezka_tom_obliczen = os.path.join(sciezka_moduly, "ZESTAWIENIA_TOM OBLICZEN")
 
 sciezki_do_sys = [
     KATALOG_GLOWNY,
@@ -71,6 +80,15 @@ sciezki_do_sys = [
     sciezka_otulina,
     sciezka_beton,
     sciezka_stal,
+    sciezka_kombinacje,
+    sciezka_el_stalowe,
+    sciezka_el_drewno,
+    sciezka_rysy,
+    sciezka_pelzanie,
+    sciezka_dobor_pretow,
+    sciezka_zestawienie,
+    sciezka_plan_ciecia,
+    sciezka_tom_obliczen,
 ]
 
 for sciezka in sciezki_do_sys:
@@ -85,9 +103,23 @@ try:
     from OtulinaZbrojenia import StronaOtulinaZbrojenia
     from ParametryBetonuStrona import StronaParametryBetonu
     from ParametryStaliStrona import StronaParametryStali
+    from KombinacjeObciazenStrona import StronaKombinacjeObciazen
+    from ElementyStaloweStrona import StronaElementyStalowe
+    from ElementyDrewnianeStrona import StronaElementyDrewniane
+    from ZarysowanieStrona import StronaZarysowanie
+    from PelzanieSkurczStrona import StronaPelzanieSkurcz
+    from DoborPretowStrona import StronaDoborPretow
+    from ZestawienieStaliStrona import StronaZestawienieStali
+    from PlanCieciaStrona import StronaPlanCiecia
+    from TomObliczenStrona import StronaTomObliczen
 except ImportError:
     pass # Obsługa błędów w routingu
 
+try:
+    from NARZEDZIA.Pamiec import StatystykiPamieci, WyczyscPamiec
+except ImportError:
+    pass
+
 # --- 5. EKRAN LOGOWANIA ---
 if "zalogowany" not in st.session_state:
     st.session_state["zalogowany"] = False
@@ -144,7 +176,46 @@ with st.sidebar:
 
     # --- LOGIKA WYŚWIETLANIA PODMENU ---
     
-    if wybrany_dzial == "2. KONSTRUKCJE ŻELBETOWE (EC2)":
+    if wybrany_dzial == "1. OBCIĄŻENIA (EC0/EC1)":
+        st.markdown("**📂 KATEGORIE**")
+
+        with st.expander("⚖️ KOMBINACJE (EC0)", expanded=True):
+            narzedzie_obciazenia = st.radio(
+                "Wybierz kalkulator:",
+                options=[
+                    "Kombinacje obciążeń"
+                ],
+                label_visibility="collapsed"
+            )
+            wybrane_narzedzie = narzedzie_obciazenia
+
+    elif wybrany_dzial == "3. KONSTRUKCJE STALOWE (EC3)":
+        st.markdown("**📂 KATEGORIE**")
+
+        with st.expander("🏗️ PRĘTY STALOWE", expanded=True):
+            narzedzie_stal = st.radio(
+                "Wybierz kalkulator:",
+                options=[
+                    "Nośność pręta / dobór profilu"
+                ],
+                label_visibility="collapsed"
+            )
+            wybrane_narzedzie = narzedzie_stal
+
+    elif wybrany_dzial == "4. KONSTRUKCJE DREWNIANE (EC5)":
+        st.markdown("**📂 KATEGORIE**")
+
+        with st.expander("🪵 PRĘTY DREWNIANE", expanded=True):
+            narzedzie_drewno = st.radio(
+                "Wybierz kalkulator:",
+                options=[
+                    "Nośność i ugięcie pręta"
+                ],
+                label_visibility="collapsed"
+            )
+            wybrane_narzedzie = narzedzie_drewno
+
+    elif wybrany_dzial == "2. KONSTRUKCJE ŻELBETOWE (EC2)":
         st.markdown("**📂 KATEGORIE**")
         
         # 1. PODSTAWOWE DANE (Istniejące)
@@ -156,7 +227,9 @@ with st.sidebar:
                     "Parametry stali",
                     "Otulina zbrojenia",
                     "Długość zakotwienia",
-                    "Długość zakładu"
+                    "Długość zakładu",
+                    "Pełzanie i skurcz",
+                    "Dobór prętów"
                 ],
                 label_visibility="collapsed"
             )
@@ -192,9 +265,60 @@ with st.sidebar:
             if narzedzie_min:
                 wybrane_narzedzie = narzedzie_min
 
-    # Pozostałe działy nie mają podmenu (są w budowie)
-    
+        # 4. STAN GRANICZNY UŻYTKOWALNOŚCI
+        with st.expander("🔍 STAN GRANICZNY UŻYTKOWALNOŚCI (SGU)", expanded=False):
+            narzedzie_sgu = st.radio(
+                "Wybierz element:",
+                options=[
+                    "Szerokość rys i naprężenia"
+                ],
+                index=None,
+                label_visibility="collapsed"
+            )
+            if narzedzie_sgu:
+                wybrane_narzedzie = narzedzie_sgu
+
+        # 5. ZESTAWIENIA
+        with st.expander("📋 ZESTAWIENIA", expanded=False):
+            narzedzie_zestawienia = st.radio(
+                "Wybierz zestawienie:",
+                options=[
+                    "Zestawienie stali zbrojeniowej",
+                    "Plan cięcia prętów",
+                    "Tom obliczeń projektu"
+                ],
+                index=None,
+                label_visibility="collapsed"
+            )
+            if narzedzie_zestawienia:
+                wybrane_narzedzie = narzedzie_zestawienia
+
     st.markdown("---")
+
+    # PAMIĘĆ WYNIKÓW (wspólna dla wszystkich sesji)
+    # Statystyki (w tym rozmiary plików raportów na dysku) liczone tylko przy rozwiniętym panelu
+    if 'StatystykiPamieci' in globals():
+        pamiec = st.expander("📊 Pamięć obliczeń", key="pamiec_obliczen", on_change="rerun")
+        if pamiec.open:
+            with pamiec:
+                statystyki = [s for s in StatystykiPamieci() if s.trafienia + s.chybienia > 0]
+                if statystyki:
+                    st.dataframe(
+                        {
+                            "Funkcja": [s.funkcja.rsplit(".", 1)[-1] for s in statystyki],
+                            "Trafienia": [s.trafienia for s in statystyki],
+                            "Chybienia": [s.chybienia for s in statystyki],
+                            "Usunięte": [s.usuniecia for s in statystyki],
+                            "Wpisy": [s.wpisy for s in statystyki],
+                            "kB": [round(s.bajty / 1024, 1) for s in statystyki],
+                        },
+                        hide_index=True,
+                    )
+                else:
+                    st.caption("Brak wywołań funkcji objętych pamięcią.")
+                if st.button("Wyczyść pamięć", use_container_width=True):
+                    WyczyscPamiec()
+                    st.rerun()
     
     # INFO O AUTORZE
     st.markdown(
@@ -227,17 +351,43 @@ def show_w_opracowaniu(tytul):
         unsafe_allow_html=True
     )
 
-# A. DZIAŁY "W BUDOWIE"
+# A. DZIAŁ OBCIĄŻENIA (EC0/EC1)
 if wybrany_dzial == "1. OBCIĄŻENIA (EC0/EC1)":
-    show_w_opracowaniu("OBCIĄŻENIA I KOMBINACJE (EC0 / EC1)")
 
+    if wybrane_narzedzie == "Kombinacje obciążeń":
+        if 'StronaKombinacjeObciazen' in globals():
+            StronaKombinacjeObciazen()
+        else:
+            st.error("Błąd: Nie znaleziono modułu Kombinacje Obciążeń")
+
+    else:
+        show_w_opracowaniu("OBCIĄŻENIA I KOMBINACJE (EC0 / EC1)")
+
+# B. DZIAŁ STAL (EC3)
 elif wybrany_dzial == "3. KONSTRUKCJE STALOWE (EC3)":
-    show_w_opracowaniu("KONSTRUKCJE STALOWE (EC3)")
 
+    if wybrane_narzedzie == "Nośność pręta / dobór profilu":
+        if 'StronaElementyStalowe' in globals():
+            StronaElementyStalowe()
+        else:
+            st.error("Błąd: Nie znaleziono modułu Elementy Stalowe")
+
+    else:
+        show_w_opracowaniu("KONSTRUKCJE STALOWE (EC3)")
+
+# C. DZIAŁ DREWNO (EC5)
 elif wybrany_dzial == "4. KONSTRUKCJE DREWNIANE (EC5)":
-    show_w_opracowaniu("KONSTRUKCJE DREWNIANE (EC5)")
 
-# B. DZIAŁ ŻELBET (EC2)
+    if wybrane_narzedzie == "Nośność i ugięcie pręta":
+        if 'StronaElementyDrewniane' in globals():
+            StronaElementyDrewniane()
+        else:
+            st.error("Błąd: Nie znaleziono modułu Elementy Drewniane")
+
+    else:
+        show_w_opracowaniu("KONSTRUKCJE DREWNIANE (EC5)")
+
+# D. DZIAŁ ŻELBET (EC2)
 elif wybrany_dzial == "2. KONSTRUKCJE ŻELBETOWE (EC2)":
     
     # -- PODSTAWOWE DANE (Działające moduły) --
@@ -271,10 +421,48 @@ elif wybrany_dzial == "2. KONSTRUKCJE ŻELBETOWE (EC2)":
         else:
             st.error("Błąd: Nie znaleziono modułu Długość Zakładu")
 
+    elif wybrane_narzedzie == "Pełzanie i skurcz":
+        if 'StronaPelzanieSkurcz' in globals():
+            StronaPelzanieSkurcz()
+        else:
+            st.error("Błąd: Nie znaleziono modułu Pełzanie i Skurcz")
+
+    elif wybrane_narzedzie == "Dobór prętów":
+        if 'StronaDoborPretow' in globals():
+            StronaDoborPretow()
+        else:
+            st.error("Błąd: Nie znaleziono modułu Dobór Prętów")
+
     # -- WYMIAROWANIE (SGN) --
     elif wybrane_narzedzie in ["Zginanie - Przekrój prostokątny", "Ścinanie - V_Ed vs V_Rd,c"]:
         show_w_opracowaniu(f"WYMIAROWANIE: {wybrane_narzedzie.upper()}")
 
+    # -- STAN GRANICZNY UŻYTKOWALNOŚCI (SGU) --
+    elif wybrane_narzedzie == "Szerokość rys i naprężenia":
+        if 'StronaZarysowanie' in globals():
+            StronaZarysowanie()
+        else:
+            st.error("Błąd: Nie znaleziono modułu Zarysowanie")
+
+    # -- ZESTAWIENIA --
+    elif wybrane_narzedzie == "Zestawienie stali zbrojeniowej":
+        if 'StronaZestawienieStali' in globals():
+            StronaZestawienieStali()
+        else:
+            st.error("Błąd: Nie znaleziono modułu Zestawienie Stali")
+
+    elif wybrane_narzedzie == "Plan cięcia prętów":
+        if 'StronaPlanCiecia' in globals():
+            StronaPlanCiecia()
+        else:
+            st.error("Błąd: Nie znaleziono modułu Plan Cięcia")
+
+    elif wybrane_narzedzie == "Tom obliczeń projektu":
+        if 'StronaTomObliczen' in globals():
+            StronaTomObliczen()
+        else:
+            st.error("Błąd: Nie znaleziono modułu Tom Obliczeń")
+
     # -- ZBROJENIE MINIMALNE --
     elif wybrane_narzedzie in ["Płyty", "Belki", "Słupy", "Ściany"]:
         show_w_opracowaniu(f"ZBROJENIE MINIMALNE: {wybrane_narzedzie.upper()}")
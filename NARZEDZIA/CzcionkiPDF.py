@@ -0,0 +1,139 @@
+# NARZEDZIA/CzcionkiPDF.py
+"""
+Wspólna konfiguracja czcionek raportów PDF (FPDF).
+
+DodajCzcionki rejestruje w dokumencie rodzinę ArialUni (regular, B)
+z katalogu CZCIONKI. Kursywy nie ma w osobnym pliku - styl "I" dawał
+ten sam krój co regular, osadzony w PDF drugi raz; renderujące raporty
+przy czcionce Unicode pomijają "I". Wywołanie jest idempotentne - kolejne raporty
+dopisywane do tego samego dokumentu (raport projektu) korzystają z już
+zarejestrowanych czcionek.
+
+Pliki .pkl obok czcionek (metryki zapisane przez FPDF) pamiętają ścieżkę
+do .ttf z komputera, na którym powstały - po rejestracji ścieżka jest
+podmieniana na rzeczywistą, inaczej osadzanie czcionki przy zapisie PDF
+kończy się błędem FileNotFoundError.
+
+FPDF dopisuje do listy podzbioru czcionki każdy narysowany znak (także
+powtórzenia), a przy zapisie przegląda ją liniowo - w dokumentach
+wielostronicowych lista rośnie bez ograniczeń. _Podzbior pomija
+powtórzenia, więc lista ma tyle elementów, ile różnych znaków.
+
+FPDF osadza w PDF tylko podzbiór glifów użytych w dokumencie, ale przy
+każdym zapisie od nowa czyta plik .ttf i buduje podzbiór (ok. 3/4 czasu
+tworzenia jednostronicowego raportu). Gotowe podzbiory są pamiętane
+(NARZEDZIA.Pamiec) dla pliku czcionki i zestawu znaków - kolejne raporty
+z tym samym zestawem znaków (typowo: polskie litery, symbole SYM, cyfry)
+korzystają z gotowego strumienia.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import fpdf.fpdf
+from fpdf import FPDF
+from fpdf.ttfonts import TTFontFile
+
+from NARZEDZIA.Pamiec import pamietaj
+
+SCIEZKA_CZCIONKI = Path(__file__).resolve().parents[1] / "CZCIONKI"
+CZCIONKA_REGULAR = SCIEZKA_CZCIONKI / "ArialUnicode.ttf"
+CZCIONKA_BOLD = SCIEZKA_CZCIONKI / "ArialUnicode-Bold.ttf"
+
+RODZINA = "ArialUni"
+RODZINA_ZASTEPCZA = "Arial"
+
+
+@pamietaj(maks_wpisow=64, maks_bajtow=32 * 1024 * 1024)
+def _PodzbiorCzcionki(plik: str, zmiana: float, znaki: frozenset) -> tuple:
+    """Podzbiór czcionki dla zestawu znaków: (strumień TTF, kod -> glif, największy kod)."""
+    ttf = TTFontFile()
+    strumien = ttf.makeSubset(plik, list(znaki))
+    return strumien, ttf.codeToGlyph, ttf.maxUni
+
+
+class _TTFontFilePodzbiory(TTFontFile):
+    """TTFontFile z pamięcią podzbiorów (podstawiany w module fpdf.fpdf)."""
+
+    def makeSubset(self, file, subset):
+        strumien, kody, self.maxUni = _PodzbiorCzcionki(file, os.path.getmtime(file), frozenset(subset))
+        self.codeToGlyph = dict(kody)
+        return strumien
+
+
+# FPDF._putfonts tworzy TTFontFile() z przestrzeni nazw modułu fpdf.fpdf
+fpdf.fpdf.TTFontFile = _TTFontFilePodzbiory
+
+
+class _Podzbior(list):
+    """Lista kodów znaków czcionki bez powtórzeń (append pomija znane kody)."""
+
+    def __init__(self, kody=()):
+        super().__init__(dict.fromkeys(kody))
+        self._znane = set(self)
+
+    def append(self, kod):
+        if kod not in self._znane:
+            self._znane.add(kod)
+            super().append(kod)
+
+
+def DodajCzcionki(pdf: FPDF) -> tuple[str, bool]:
+    """
+    Rejestruje czcionki Unicode w dokumencie; zwraca (rodzina, use_unicode).
+    Bez plików czcionek - wbudowany Arial (tekst bez polskich znaków, z kursywą).
+    """
+    if RODZINA.lower() in pdf.fonts:
+        return RODZINA, True
+    if not CZCIONKA_REGULAR.exists():
+        return RODZINA_ZASTEPCZA, False
+
+    pliki = {
+        "": CZCIONKA_REGULAR,
+        "B": CZCIONKA_BOLD if CZCIONKA_BOLD.exists() else CZCIONKA_REGULAR,
+    }
+    try:
+        for styl, plik in pliki.items():
+            pdf.add_font(RODZINA, styl, str(plik), uni=True)
+    except Exception:
+        return RODZINA_ZASTEPCZA, False
+
+    for styl, plik in pliki.items():
+        czcionka = pdf.fonts[RODZINA.lower() + styl]
+        czcionka["ttffile"] = str(plik)
+        czcionka["subset"] = _Podzbior(czcionka["subset"])
+    return RODZINA, True
+
+
+if __name__ == "__main__":
+    import time
+
+    TEKST = "Długość zakotwienia ΦΔαηρσ ≥ ≤ · ąćęłńóśźż ĄĆĘŁŃÓŚŹŻ 0123456789 (l_bd = 640 mm)"
+
+    def _raport() -> bytes:
+        pdf = FPDF()
+        pdf.add_page()
+        rodzina, unicode = DodajCzcionki(pdf)
+        assert unicode, "brak plików czcionek w katalogu CZCIONKI"
+        for styl in ("", "B"):
+            pdf.set_font(rodzina, styl, 11)
+            pdf.multi_cell(0, 6, TEKST * 3)
+        return pdf.output(dest="S").encode("latin-1")
+
+    def _czas(n: int) -> float:
+        t0 = time.perf_counter()
+        for _ in range(n):
+            _raport()
+        return (time.perf_counter() - t0) / n * 1000
+
+    _PodzbiorCzcionki.wyczysc()
+    bez_pamieci = _czas(1)
+    rozmiar = len(_raport())
+    z_pamiecia = _czas(20)
+
+    ttf = sum(p.stat().st_size for p in {CZCIONKA_REGULAR, CZCIONKA_BOLD} if p.exists())
+    print(f"Pliki czcionek: {ttf / 1024:.0f} kB, raport PDF (podzbiór {len(set(TEKST))} znaków): {rozmiar / 1024:.1f} kB")
+    print(f"Raport: {bez_pamieci:.1f} ms (budowa podzbiorów), {z_pamiecia:.1f} ms (podzbiory z pamięci)")
+    print(_PodzbiorCzcionki.statystyki())
@@ -0,0 +1,210 @@
+# NARZEDZIA/Pamiec.py
+"""
+Wspólna pamięć wyników (memoizacja) dla czystych funkcji obliczeniowych.
+
+Dekorator pamietaj zapamiętuje wynik dla zestawu argumentów (po dopasowaniu
+do sygnatury, więc f(12, "C30/37") i f(fi_mm=12, klasa_betonu="C30/37") to
+ten sam wpis). Pamięć jest wspólna dla wszystkich sesji Streamlit w procesie
+i dla kodu wsadowego, chroniona blokadą (threading.Lock).
+
+Usuwanie wpisów: LRU po przekroczeniu liczby wpisów lub rozmiaru [B],
+opcjonalnie TTL [s]. Wyniki typu dict/list zwracane są jako płytka kopia,
+żeby modyfikacja wyniku przez wywołującego nie zmieniała pamięci.
+Argumenty niehashowalne (np. tablice numpy) - wywołanie bez pamięci,
+chyba że dekorator dostał własną funkcję klucza (np. KluczJSON dla
+argumentów-słowników wyników).
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+# Domyślne limity jednej funkcji
+MAKS_WPISOW = 4096
+MAKS_BAJTOW = 16 * 1024 * 1024
+
+
+@dataclass
+class Statystyki:
+    """Liczniki pamięci jednej funkcji."""
+    funkcja: str
+    trafienia: int = 0
+    chybienia: int = 0
+    usuniecia: int = 0
+    pominiete: int = 0
+    wpisy: int = 0
+    bajty: int = 0
+
+    @property
+    def skutecznosc(self) -> float:
+        """Udział trafień w wywołaniach korzystających z pamięci [-]."""
+        n = self.trafienia + self.chybienia
+        return self.trafienia / n if n else 0.0
+
+
+@dataclass
+class _Wpis:
+    wynik: object
+    bajty: int
+    czas: float = field(default_factory=time.monotonic)
+
+
+def _rozmiar(obiekt, glebokosc: int = 3) -> int:
+    """Przybliżony rozmiar obiektu [B] (słowniki i sekwencje do zadanej głębokości)."""
+    bajty = sys.getsizeof(obiekt)
+    if glebokosc > 0:
+        if isinstance(obiekt, dict):
+            bajty += sum(_rozmiar(k, glebokosc - 1) + _rozmiar(v, glebokosc - 1) for k, v in obiekt.items())
+        elif isinstance(obiekt, (list, tuple, set, frozenset)):
+            bajty += sum(_rozmiar(v, glebokosc - 1) for v in obiekt)
+        elif hasattr(obiekt, "__dataclass_fields__"):
+            bajty += sum(_rozmiar(getattr(obiekt, f), glebokosc - 1) for f in obiekt.__dataclass_fields__)
+    return bajty
+
+
+def _kopia(wynik):
+    if isinstance(wynik, dict):
+        return dict(wynik)
+    if isinstance(wynik, list):
+        return list(wynik)
+    return wynik
+
+
+class PamiecFunkcji:
+    """Pamięć LRU/TTL jednej funkcji z licznikami (tworzona przez dekorator pamietaj)."""
+
+    def __init__(self, funkcja, maks_wpisow: int, maks_bajtow: int, ttl: float | None, klucz=None):
+        self.funkcja = funkcja
+        self.klucz = klucz
+        self.maks_wpisow = maks_wpisow
+        self.maks_bajtow = maks_bajtow
+        self.ttl = ttl
+        self._sygnatura = inspect.signature(funkcja)
+        self._wpisy: OrderedDict = OrderedDict()
+        self._blokada = threading.Lock()
+        self._stat = Statystyki(f"{funkcja.__module__}.{funkcja.__qualname__}")
+        functools.update_wrapper(self, funkcja)
+
+    def _klucz(self, args, kwargs):
+        if self.klucz is not None:
+            klucz = self.klucz(*args, **kwargs)
+            hash(klucz)
+            return klucz
+        argumenty = self._sygnatura.bind(*args, **kwargs)
+        argumenty.apply_defaults()
+        klucz = tuple(argumenty.arguments.values())
+        hash(klucz)
+        return klucz
+
+    def _usun_najstarszy(self):
+        _, wpis = self._wpisy.popitem(last=False)
+        self._stat.bajty -= wpis.bajty
+        self._stat.usuniecia += 1
+
+    def __call__(self, *args, **kwargs):
+        try:
+            klucz = self._klucz(args, kwargs)
+        except TypeError:
+            with self._blokada:
+                self._stat.pominiete += 1
+            return self.funkcja(*args, **kwargs)
+
+        with self._blokada:
+            wpis = self._wpisy.get(klucz)
+            if wpis is not None and self.ttl is not None and time.monotonic() - wpis.czas > self.ttl:
+                del self._wpisy[klucz]
+                self._stat.bajty -= wpis.bajty
+                self._stat.usuniecia += 1
+                wpis = None
+            if wpis is not None:
+                self._wpisy.move_to_end(klucz)
+                self._stat.trafienia += 1
+                return _kopia(wpis.wynik)
+            self._stat.chybienia += 1
+
+        # Obliczenie poza blokadą - równoległe sesje nie czekają na siebie
+        wynik = self.funkcja(*args, **kwargs)
+        wpis = _Wpis(_kopia(wynik), _rozmiar(wynik))
+
+        with self._blokada:
+            stary = self._wpisy.pop(klucz, None)
+            if stary is not None:
+                self._stat.bajty -= stary.bajty
+            self._wpisy[klucz] = wpis
+            self._stat.bajty += wpis.bajty
+            while self._wpisy and (len(self._wpisy) > self.maks_wpisow or self._stat.bajty > self.maks_bajtow):
+                self._usun_najstarszy()
+        return wynik
+
+    def statystyki(self) -> Statystyki:
+        """Kopia bieżących liczników."""
+        with self._blokada:
+            self._stat.wpisy = len(self._wpisy)
+            return Statystyki(**vars(self._stat))
+
+    def wyczysc(self):
+        """Usuwa wszystkie wpisy (liczniki trafień i chybień pozostają)."""
+        with self._blokada:
+            self._stat.usuniecia += len(self._wpisy)
+            self._wpisy.clear()
+            self._stat.bajty = 0
+
+
+# Wszystkie funkcje objęte pamięcią (do podglądu w interfejsie)
+REJESTR: list[PamiecFunkcji] = []
+
+
+def KluczJSON(*args, **kwargs) -> str:
+    """Klucz pamięci dla argumentów-słowników (np. wynik, inputs) - ich zapis JSON."""
+    return json.dumps([args, kwargs], sort_keys=True, ensure_ascii=False, default=str)
+
+
+def pamietaj(funkcja=None, *, maks_wpisow: int = MAKS_WPISOW, maks_bajtow: int = MAKS_BAJTOW, ttl: float | None = None,
+             klucz=None):
+    """Dekorator memoizacji: @pamietaj lub @pamietaj(maks_wpisow=..., ttl=..., klucz=KluczJSON)."""
+    def dekorator(f):
+        pamiec = PamiecFunkcji(f, maks_wpisow, maks_bajtow, ttl, klucz)
+        REJESTR.append(pamiec)
+        return pamiec
+    return dekorator(funkcja) if funkcja is not None else dekorator
+
+
+def StatystykiPamieci() -> list[Statystyki]:
+    """Liczniki wszystkich zarejestrowanych funkcji."""
+    return [p.statystyki() for p in REJESTR]
+
+
+def WyczyscPamiec():
+    """Czyści pamięć wszystkich zarejestrowanych funkcji."""
+    for p in REJESTR:
+        p.wyczysc()
+
+
+if __name__ == "__main__":
+    import random
+    from concurrent.futures import ThreadPoolExecutor
+
+    @pamietaj(maks_wpisow=100)
+    def _funkcja(a: int, b: float = 2.0) -> dict:
+        time.sleep(0.0005)
+        return {"wynik": a * b}
+
+    assert _funkcja(3) == _funkcja(a=3, b=2.0) == {"wynik": 6.0}
+    _funkcja(3)["wynik"] = -1.0
+    assert _funkcja(3)["wynik"] == 6.0
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(8) as pula:
+        list(pula.map(_funkcja, [random.Random(i).randrange(150) for i in range(20_000)]))
+    t1 = time.perf_counter()
+
+    s = _funkcja.statystyki()
+    assert s.wpisy <= 100 and s.trafienia + s.chybienia == 20_004
+    print(f"20 000 wywołań w 8 wątkach: {(t1 - t0) * 1000:.0f} ms; {s}; skuteczność {s.skutecznosc:.1%}")
@@ -0,0 +1,289 @@
+# NARZEDZIA/PamiecRaportow.py
+"""
+Pamięć dyskowa gotowych raportów (PDF, DOCX), wspólna dla procesów serwera.
+
+Te same dane dają ten sam raport, a każda sesja (i każdy proces serwera)
+generowała go od nowa. Dekorator raport_na_dysku zapisuje wynik funkcji
+raportu w katalogu KATALOG pod kluczem treści: SHA-256 z zapisu JSON
+(NARZEDZIA.Pamiec.KluczJSON) nazwy kalkulatora, formatu, wersji szablonów
+(RaportIR.WERSJA_SZABLONU i wersja raportu kalkulatora) oraz argumentów
+wynik i inputs. Zmiana wersji to nowe klucze - stare pliki wypadają
+z pamięci przy sprzątaniu.
+
+Bezpieczeństwo przy wielu procesach bez blokad:
+- zapis do pliku tymczasowego w tym samym katalogu i os.replace (atomowo:
+  czytający widzi stary albo kompletny nowy plik, nigdy częściowy),
+- równoległy zapis tego samego klucza zapisuje te same dane,
+- plik usunięty przez inny proces między sprawdzeniem a odczytem to
+  chybienie (FileNotFoundError), nie błąd.
+
+Rozmiar katalogu ograniczony jest maks_bajtow: po zapisaniu ok. 1/20
+limitu proces przegląda katalog i usuwa najdawniej używane pliki (czas
+modyfikacji odświeżany przy trafieniu) do 90% limitu. Błędy dysku
+(brak miejsca, brak uprawnień) nie przerywają raportu - raport jest
+wtedy zwracany bez zapisu.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from io import BytesIO
+from pathlib import Path
+
+from NARZEDZIA.Pamiec import REJESTR, KluczJSON, Statystyki
+from NARZEDZIA.RaportIR import WERSJA_SZABLONU
+
+KATALOG = Path(tempfile.gettempdir()) / "KALKULATORY_RAPORTY"
+MAKS_BAJTOW = 256 * 1024 * 1024
+
+# Formaty zwracane jako bufor (jak RaportDOCX), pozostałe jako bytes
+FORMATY_BUFOROWANE = {"docx"}
+
+# Pliki tymczasowe przerwanych zapisów usuwane po [s]
+WIEK_PLIKOW_TYMCZASOWYCH = 3600
+
+# Rozmiary grup (podgląd pamięci) z jednego przeglądu katalogu ważne przez [s]
+WAZNOSC_ROZMIAROW = 10.0
+
+
+def KluczTresci(*czesci) -> str:
+    """Klucz treści: SHA-256 (hex) kanonicznego zapisu JSON części klucza."""
+    return hashlib.sha256(KluczJSON(*czesci).encode("utf-8")).hexdigest()
+
+
+class PamiecDyskowa:
+    """Katalog plików adresowanych kluczem treści z limitem rozmiaru (LRU wg czasu modyfikacji)."""
+
+    def __init__(self, katalog: str | Path = KATALOG, maks_bajtow: int = MAKS_BAJTOW):
+        self.katalog = Path(katalog)
+        self.maks_bajtow = maks_bajtow
+        self._zapisane = None  # bajty zapisane od ostatniego sprzątania (None - jeszcze nie sprzątano)
+        self._rozmiary = (-float("inf"), {})  # (czas przeglądu, {grupa: (pliki, bajty)})
+        self._blokada = threading.Lock()
+
+    def sciezka(self, grupa: str, klucz: str, rozszerzenie: str) -> Path:
+        return self.katalog / grupa / klucz[:2] / f"{klucz}.{rozszerzenie}"
+
+    def pobierz(self, grupa: str, klucz: str, rozszerzenie: str) -> bytes | None:
+        sciezka = self.sciezka(grupa, klucz, rozszerzenie)
+        try:
+            with open(sciezka, "rb") as f:
+                dane = f.read()
+        except OSError:
+            return None
+        try:
+            os.utime(sciezka)
+        except OSError:
+            pass
+        return dane
+
+    def zapisz(self, grupa: str, klucz: str, rozszerzenie: str, dane: bytes) -> bool:
+        """Zapis atomowy; False - błąd dysku (raport nie trafił do pamięci)."""
+        sciezka = self.sciezka(grupa, klucz, rozszerzenie)
+        tymczasowy = None
+        try:
+            sciezka.parent.mkdir(parents=True, exist_ok=True)
+            fd, tymczasowy = tempfile.mkstemp(dir=sciezka.parent, prefix=".", suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(dane)
+            os.replace(tymczasowy, sciezka)
+        except OSError:
+            # Windows: plik docelowy otwarty przez inny proces - ten sam klucz, te same dane
+            if tymczasowy is not None:
+                try:
+                    os.remove(tymczasowy)
+                except OSError:
+                    pass
+            return False
+
+        with self._blokada:
+            sprzatac = self._zapisane is None or self._zapisane + len(dane) > self.maks_bajtow // 20
+            self._zapisane = 0 if sprzatac else self._zapisane + len(dane)
+            self._rozmiary = (-float("inf"), {})
+        if sprzatac:
+            self.sprzataj()
+        return True
+
+    def _pliki(self, grupa: str | None = None) -> list[tuple[float, int, str]]:
+        """(czas modyfikacji, rozmiar, ścieżka) plików pamięci; usuwa stare pliki tymczasowe."""
+        pliki = []
+        teraz = time.time()
+        for katalog, _, nazwy in os.walk(self.katalog / grupa if grupa else self.katalog):
+            for nazwa in nazwy:
+                sciezka = os.path.join(katalog, nazwa)
+                try:
+                    stat = os.stat(sciezka)
+                    if nazwa.startswith("."):
+                        if teraz - stat.st_mtime > WIEK_PLIKOW_TYMCZASOWYCH:
+                            os.remove(sciezka)
+                        continue
+                except OSError:
+                    continue
+                pliki.append((stat.st_mtime, stat.st_size, sciezka))
+        return pliki
+
+    def sprzataj(self) -> int:
+        """Usuwa najdawniej używane pliki, gdy katalog przekracza limit; zwraca liczbę usuniętych."""
+        pliki = self._pliki()
+        bajty = sum(p[1] for p in pliki)
+        usuniete = 0
+        if bajty <= self.maks_bajtow:
+            return 0
+        for _, rozmiar, sciezka in sorted(pliki):
+            if bajty <= 0.9 * self.maks_bajtow:
+                break
+            try:
+                os.remove(sciezka)
+            except OSError:
+                # usunięty przez inny proces lub (Windows) właśnie czytany
+                continue
+            bajty -= rozmiar
+            usuniete += 1
+        with self._blokada:
+            self._rozmiary = (-float("inf"), {})
+        return usuniete
+
+    def rozmiar(self, grupa: str | None = None) -> tuple[int, int]:
+        """
+        (liczba plików, bajty) całego katalogu lub grupy. Jeden przegląd
+        katalogu dla wszystkich grup, powtarzany po zapisie w tym procesie
+        lub po WAZNOSC_ROZMIAROW s (zapisy innych procesów).
+        """
+        with self._blokada:
+            czas, rozmiary = self._rozmiary
+        if time.monotonic() - czas > WAZNOSC_ROZMIAROW:
+            rozmiary = {}
+            for _, bajty, sciezka in self._pliki():
+                g = os.path.relpath(sciezka, self.katalog).split(os.sep)[0]
+                pliki, suma = rozmiary.get(g, (0, 0))
+                rozmiary[g] = (pliki + 1, suma + bajty)
+            with self._blokada:
+                self._rozmiary = (time.monotonic(), rozmiary)
+        if grupa is not None:
+            return rozmiary.get(grupa, (0, 0))
+        return sum(r[0] for r in rozmiary.values()), sum(r[1] for r in rozmiary.values())
+
+    def wyczysc(self, grupa: str | None = None) -> int:
+        """Usuwa pliki całego katalogu lub grupy; zwraca liczbę usuniętych."""
+        usuniete = 0
+        for _, _, sciezka in self._pliki(grupa):
+            try:
+                os.remove(sciezka)
+                usuniete += 1
+            except OSError:
+                pass
+        with self._blokada:
+            self._rozmiary = (-float("inf"), {})
+        return usuniete
+
+
+_PAMIEC = PamiecDyskowa()
+
+
+class RaportNaDysku:
+    """Funkcja raportu (wynik, inputs) z pamięcią dyskową (tworzona przez dekorator raport_na_dysku)."""
+
+    def __init__(self, funkcja, format: str, wersja, pamiec: PamiecDyskowa | None):
+        self.funkcja = funkcja
+        self.format = format
+        self.wersja = wersja
+        self.grupa = f"{funkcja.__module__}.{funkcja.__name__}"
+        self._pamiec = pamiec
+        self._blokada = threading.Lock()
+        # "create_pdf_report (DlugoscZakotwienia, dysk)" w podglądzie pamięci
+        self._stat = Statystyki(f"{funkcja.__name__} ({funkcja.__module__}, dysk)")
+        functools.update_wrapper(self, funkcja)
+
+    @property
+    def pamiec(self) -> PamiecDyskowa:
+        return self._pamiec or _PAMIEC
+
+    def __call__(self, wynik: dict, inputs: dict, *args, **kwargs):
+        if any(a is not None for a in args) or any(v is not None for v in kwargs.values()):
+            # np. create_pdf_report(wynik, inputs, pdf) - dopisanie do istniejącego dokumentu
+            with self._blokada:
+                self._stat.pominiete += 1
+            return self.funkcja(wynik, inputs, *args, **kwargs)
+
+        klucz = KluczTresci(self.grupa, self.format, WERSJA_SZABLONU, self.wersja, wynik, inputs)
+        dane = self.pamiec.pobierz(self.grupa, klucz, self.format)
+        with self._blokada:
+            if dane is not None:
+                self._stat.trafienia += 1
+            else:
+                self._stat.chybienia += 1
+        if dane is None:
+            raport = self.funkcja(wynik, inputs, *args, **kwargs)
+            dane = raport.getvalue() if isinstance(raport, BytesIO) else raport
+            if not self.pamiec.zapisz(self.grupa, klucz, self.format, dane):
+                with self._blokada:
+                    self._stat.pominiete += 1
+        return BytesIO(dane) if self.format in FORMATY_BUFOROWANE else dane
+
+    def statystyki(self) -> Statystyki:
+        """Liczniki procesu; wpisy i bajty - pliki grupy na dysku (wszystkich procesów)."""
+        with self._blokada:
+            self._stat.wpisy, self._stat.bajty = self.pamiec.rozmiar(self.grupa)
+            return Statystyki(**vars(self._stat))
+
+    def wyczysc(self):
+        """Usuwa pliki tej funkcji z dysku (liczniki trafień i chybień pozostają)."""
+        usuniete = self.pamiec.wyczysc(self.grupa)
+        with self._blokada:
+            self._stat.usuniecia += usuniete
+
+
+def raport_na_dysku(format: str, wersja=1, pamiec: PamiecDyskowa | None = None):
+    """Dekorator funkcji raportu f(wynik, inputs, ...): @raport_na_dysku("pdf", wersja=WERSJA_RAPORTU)."""
+    def dekorator(f):
+        raport = RaportNaDysku(f, format.lower(), wersja, pamiec)
+        # Podgląd i czyszczenie razem z pamięcią funkcji (NARZEDZIA.Pamiec)
+        REJESTR.append(raport)
+        return raport
+    return dekorator
+
+
+def _proces_testowy(katalog: str, n: int) -> int:
+    pamiec = PamiecDyskowa(katalog, maks_bajtow=400 * 1024)
+    bledy = 0
+    for i in range(n):
+        klucz = KluczTresci("test", i % 40)
+        dane = pamiec.pobierz("test", klucz, "bin")
+        if dane is not None and dane != bytes([i % 40]) * 20_000:
+            bledy += 1
+        elif dane is None:
+            pamiec.zapisz("test", klucz, "bin", bytes([i % 40]) * 20_000)
+    return bledy
+
+
+if __name__ == "__main__":
+    from concurrent.futures import ProcessPoolExecutor
+
+    with tempfile.TemporaryDirectory() as katalog:
+        # Kilka procesów zapisuje i czyta te same klucze przy limicie mniejszym niż zbiór danych
+        with ProcessPoolExecutor(4) as wykonawca:
+            bledy = sum(wykonawca.map(_proces_testowy, [katalog] * 4, [400] * 4))
+        pamiec = PamiecDyskowa(katalog, maks_bajtow=400 * 1024)
+        pliki, bajty = pamiec.rozmiar()
+        assert bledy == 0, f"{bledy} niekompletnych odczytów"
+        assert bajty <= 400 * 1024 + 4 * 400 * 1024 // 20 + 4 * 20_000, bajty
+        print(f"4 procesy x 400 operacji: 0 niekompletnych odczytów, {pliki} plików, {bajty / 1024:.0f} kB")
+
+        @raport_na_dysku("docx", pamiec=PamiecDyskowa(katalog))
+        def _raport(wynik: dict, inputs: dict) -> BytesIO:
+            time.sleep(0.02)
+            return BytesIO(repr((wynik, inputs)).encode())
+
+        t0 = time.perf_counter()
+        pierwszy = _raport({"l_bd": 640.0}, {"fi": 16}).getvalue()
+        t1 = time.perf_counter()
+        drugi = _raport({"l_bd": 640.0}, {"fi": 16}).getvalue()
+        t2 = time.perf_counter()
+        assert pierwszy == drugi
+        print(f"Raport: {(t1 - t0) * 1000:.1f} ms (generowanie i zapis), {(t2 - t1) * 1000:.2f} ms (z dysku)")
+        print(_raport.statystyki())
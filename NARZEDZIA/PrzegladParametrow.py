@@ -0,0 +1,155 @@
+# NARZEDZIA/PrzegladParametrow.py
+"""
+Przegląd parametrów (1-D / 2-D) dla wektorowych funkcji obliczeniowych.
+
+Funkcja obliczeniowa wywoływana jest raz na całą siatkę: oś X jako wiersz
+[1 x nx], oś Y jako kolumna [ny x 1], pozostałe argumenty jako skalary -
+wynik [ny x nx] powstaje z broadcastu numpy.
+
+Wyniki zapamiętywane są per zestaw parametrów stałych. Gdy użytkownik zmieni
+zakres jednej osi, liczone są tylko nowe wycinki siatki (nowe kolumny dla
+nowych wartości X, nowe wiersze dla nowych wartości Y); pozostałe punkty
+brane są z pamięci.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Hashable, Sequence
+
+import numpy as np
+
+# Liczba zapamiętanych zestawów parametrów stałych (najstarsze usuwane)
+MAKS_ZESTAWOW = 8
+
+
+@dataclass
+class _Siatka:
+    """Zapamiętana siatka wyników: wartości osi i tablica [ny x nx]."""
+    x: list
+    y: list
+    wartosci: np.ndarray
+    indeks_x: dict = field(default_factory=dict)
+    indeks_y: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.indeks_x = {v: i for i, v in enumerate(self.x)}
+        self.indeks_y = {v: i for i, v in enumerate(self.y)}
+
+
+def _zamroz(wartosc) -> Hashable:
+    """Postać hashowalna argumentu (listy i tablice -> krotki)."""
+    if isinstance(wartosc, np.ndarray):
+        return ("nd", wartosc.shape, wartosc.tobytes())
+    if isinstance(wartosc, (list, tuple)):
+        return tuple(_zamroz(v) for v in wartosc)
+    if isinstance(wartosc, np.generic):
+        return wartosc.item()
+    return wartosc
+
+
+def _bez_powtorzen(wartosci: Sequence) -> list:
+    """Wartości osi bez duplikatów, w kolejności podania (typy numpy -> Python)."""
+    return list(dict.fromkeys(_zamroz(v) for v in wartosci))
+
+
+class PrzegladParametrow:
+    """
+    Przegląd funkcji wektorowej po siatce parametrów z pamięcią wycinków.
+
+    funkcja(**argumenty) zwraca tablicę lub słownik tablic - w drugim
+    przypadku klucz_wyniku wskazuje oglądaną wielkość.
+    Statystyka ostatniego przeglądu: punkty_obliczone / punkty_wszystkie.
+    """
+
+    def __init__(self, funkcja: Callable, klucz_wyniku: str | None = None, maks_zestawow: int = MAKS_ZESTAWOW):
+        self.funkcja = funkcja
+        self.klucz_wyniku = klucz_wyniku
+        self.maks_zestawow = maks_zestawow
+        self._pamiec: OrderedDict[Hashable, _Siatka] = OrderedDict()
+        self.punkty_obliczone = 0
+        self.punkty_wszystkie = 0
+
+    def _licz(self, os_x: str, x: list, os_y: str | None, y: list, stale: dict) -> np.ndarray:
+        argumenty = dict(stale)
+        argumenty[os_x] = np.array(x)[None, :]
+        if os_y is not None:
+            argumenty[os_y] = np.array(y)[:, None]
+        wynik = self.funkcja(**argumenty)
+        if self.klucz_wyniku is not None:
+            wynik = wynik[self.klucz_wyniku]
+        self.punkty_obliczone += len(x) * len(y)
+        return np.broadcast_to(np.asarray(wynik, dtype=np.float64), (len(y), len(x)))
+
+    def oblicz(
+        self,
+        os_x: str,
+        wartosci_x: Sequence,
+        stale: dict,
+        os_y: str | None = None,
+        wartosci_y: Sequence = (None,),
+    ) -> np.ndarray:
+        """
+        Wynik na siatce [len(wartosci_y) x len(wartosci_x)] (przegląd 1-D:
+        os_y = None, wynik [1 x nx]). stale - pozostałe argumenty funkcji.
+        """
+        x = _bez_powtorzen(wartosci_x)
+        y = _bez_powtorzen(wartosci_y) if os_y is not None else [None]
+        klucz = (os_x, os_y, tuple(sorted((k, _zamroz(v)) for k, v in stale.items())))
+
+        self.punkty_obliczone = 0
+        self.punkty_wszystkie = len(x) * len(y)
+
+        siatka = self._pamiec.pop(klucz, None)
+        if siatka is None:
+            siatka = _Siatka(x, y, self._licz(os_x, x, os_y, y, stale))
+        else:
+            # Najpierw nowe wiersze (nowe Y dla znanych X), potem nowe kolumny (nowe X dla wszystkich Y)
+            nowe_y = [v for v in y if v not in siatka.indeks_y]
+            if nowe_y:
+                blok = self._licz(os_x, siatka.x, os_y, nowe_y, stale)
+                siatka = _Siatka(siatka.x, siatka.y + nowe_y, np.vstack([siatka.wartosci, blok]))
+            nowe_x = [v for v in x if v not in siatka.indeks_x]
+            if nowe_x:
+                blok = self._licz(os_x, nowe_x, os_y, siatka.y, stale)
+                siatka = _Siatka(siatka.x + nowe_x, siatka.y, np.hstack([siatka.wartosci, blok]))
+
+        self._pamiec[klucz] = siatka
+        while len(self._pamiec) > self.maks_zestawow:
+            self._pamiec.popitem(last=False)
+
+        iy = [siatka.indeks_y[v] for v in y]
+        ix = [siatka.indeks_x[v] for v in x]
+        return siatka.wartosci[np.ix_(iy, ix)]
+
+    def wyczysc(self):
+        """Usuwa wszystkie zapamiętane siatki."""
+        self._pamiec.clear()
+
+
+if __name__ == "__main__":
+    import time
+
+    wywolania = []
+
+    def _funkcja(a, b, c=1.0):
+        wywolania.append(np.broadcast(a, b).size)
+        return {"w": np.sqrt(np.asarray(a, dtype=float)) * np.log1p(b) + c}
+
+    przeglad = PrzegladParametrow(_funkcja, "w")
+    a = np.arange(1.0, 2001.0)
+    b = np.arange(0.0, 500.0)
+
+    t0 = time.perf_counter()
+    w1 = przeglad.oblicz("a", a, {"c": 2.0}, "b", b)
+    t1 = time.perf_counter()
+    w2 = przeglad.oblicz("a", np.arange(1.0, 2101.0), {"c": 2.0}, "b", b)
+    t2 = time.perf_counter()
+
+    assert wywolania == [1_000_000, 50_000]
+    assert np.allclose(w2[:, :2000], w1)
+    assert np.allclose(w2, _funkcja(np.arange(1.0, 2101.0)[None, :], b[:, None], 2.0)["w"])
+    print(f"pełna siatka 500 x 2000: {(t1 - t0) * 1000:.1f} ms; "
+          f"rozszerzenie osi X o 100 wartości: {(t2 - t1) * 1000:.1f} ms, "
+          f"przeliczono {przeglad.punkty_obliczone:,} z {przeglad.punkty_wszystkie:,} punktów")
@@ -0,0 +1,70 @@
+# NARZEDZIA/RaportHTML.py
+"""
+Renderowanie raportu (NARZEDZIA.RaportIR) do HTML.
+
+Czysty Python (bez fpdf i python-docx) - indeksy dolne jako <sub>,
+kursywa <i>, pogrubienie <b>. Domyślnie zwraca fragment <div> do
+osadzenia na stronie; pelny=True - kompletny dokument HTML.
+"""
+
+from __future__ import annotations
+
+from html import escape
+
+from NARZEDZIA.RaportIR import Linia, Naglowek, Odstep, Raport, Tabela, Tytul, Wynik
+
+STYL = (
+    ".raport{font-family:'Times New Roman',serif;font-size:11pt;line-height:1.45;max-width:48em}"
+    ".raport h2{text-align:center;font-size:16pt;margin:0}"
+    ".raport .podtytul{text-align:center;font-size:10pt;margin:0 0 1em}"
+    ".raport h3{font-size:12pt;border-bottom:1px solid #888;margin:1.1em 0 .3em}"
+    ".raport p{margin:0}.raport .w1{padding-left:1.5em}.raport .w2{padding-left:3em}"
+    ".raport table{border-collapse:collapse}.raport td{padding:0 1.5em 0 0}"
+    ".raport .wynik{background:#ebebeb;color:#222;padding:.6em 1em;margin-top:.6em;font-size:12pt}"
+)
+
+_ZNACZNIKI = {"B": "b", "I": "i", "_": "sub"}
+
+
+def _fragmenty(fragmenty: tuple) -> str:
+    czesci = []
+    for tekst, styl in fragmenty:
+        html = escape(tekst)
+        for litera in styl:
+            znacznik = _ZNACZNIKI[litera]
+            html = f"<{znacznik}>{html}</{znacznik}>"
+        czesci.append(html)
+    return "".join(czesci)
+
+
+def RenderujHTML(raport: Raport, pelny: bool = False) -> str:
+    """Raport HTML: fragment <div class="raport"> lub (pelny=True) cały dokument."""
+    czesci = [f"<style>{STYL}</style>", '<div class="raport">']
+    for blok in raport.bloki:
+        if isinstance(blok, Tytul):
+            czesci.append(f"<h2>{escape(blok.tekst)}</h2>")
+            if blok.podtytul:
+                czesci.append(f'<p class="podtytul">{escape(blok.podtytul)}</p>')
+        elif isinstance(blok, Naglowek):
+            czesci.append(f"<h3>{escape(blok.numer)}. {_fragmenty(blok.fragmenty)}</h3>")
+        elif isinstance(blok, Linia):
+            klasa = f' class="w{blok.wciecie}"' if blok.wciecie else ""
+            czesci.append(f"<p{klasa}>{_fragmenty(blok.fragmenty)}</p>")
+        elif isinstance(blok, Odstep):
+            czesci.append(f'<div style="height:{blok.wysokosc * 1.45:.2f}em"></div>')
+        elif isinstance(blok, Tabela):
+            wiersze = "".join(
+                "<tr>" + "".join(f"<td>{_fragmenty(k)}</td>" for k in wiersz) + "</tr>" for wiersz in blok.wiersze
+            )
+            czesci.append(f"<table>{wiersze}</table>")
+        elif isinstance(blok, Wynik):
+            czesci.append(f'<div class="wynik">{escape(blok.etykieta)} <b>{_fragmenty(blok.fragmenty)}</b></div>')
+    czesci.append("</div>")
+
+    tresc = "".join(czesci)
+    if not pelny:
+        return tresc
+    return (
+        f'<!DOCTYPE html><html lang="pl"><head><meta charset="utf-8"><title>{escape(raport.nazwa)}</title>'
+        f"</head><body>{tresc}</body></html>"
+    )
@@ -0,0 +1,190 @@
+# NARZEDZIA/RaportIR.py
+"""
+Wspólna reprezentacja pośrednia (IR) raportów obliczeniowych.
+
+Kalkulator buduje raz listę bloków (tytuł, nagłówki, linie wzorów
+z indeksami dolnymi, tabele, ramka wyniku), a osobne moduły renderujące
+zamieniają ją na PDF (RaportPDF), DOCX (RaportDOCX), HTML (RaportHTML)
+lub Markdown (RaportMD).
+Bloki są niezmienne i hashowalne, więc raport można zapamiętać
+(NARZEDZIA.Pamiec) i zserializować do JSON - drugi format kosztuje
+tylko renderowanie.
+
+Fragment tekstu to para (tekst, styl); styl składa się z liter:
+"B" - pogrubienie, "I" - kursywa, "_" - indeks dolny ("" - zwykły tekst).
+Funkcja Fr tworzy fragmenty z zapisu skróconego:
+
+    Fr("*l*_{b,rqd} = 250 mm")  ->  (("l", "I"), ("b,rqd", "_"), (" = 250 mm", ""))
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import re
+from dataclasses import dataclass, fields
+from typing import Callable, Union
+
+Fragment = tuple  # (tekst, styl)
+
+_ZNACZNIKI = re.compile(r"(_\{[^}]*\}|\*[^*]+\*)")
+
+
+def Fr(tekst: str, styl: str = "") -> tuple:
+    """Fragmenty z zapisu skróconego: _{...} - indeks dolny, *...* - kursywa."""
+    fragmenty = []
+    for czesc in _ZNACZNIKI.split(str(tekst)):
+        if not czesc:
+            continue
+        if czesc.startswith("_{"):
+            fragmenty.append((czesc[2:-1], styl + "_"))
+        elif czesc.startswith("*") and len(czesc) > 1:
+            fragmenty.append((czesc[1:-1], styl + "I"))
+        else:
+            fragmenty.append((czesc, styl))
+    return tuple(fragmenty)
+
+
+def Tekst(fragmenty: tuple) -> str:
+    """Sam tekst fragmentów (bez stylów), np. do spisu treści."""
+    return "".join(t for t, _ in fragmenty)
+
+
+# =============================================================================
+# BLOKI
+# =============================================================================
+
+@dataclass(frozen=True)
+class Tytul:
+    """Tytuł raportu z podtytułem (np. norma)."""
+    tekst: str
+    podtytul: str = ""
+
+
+@dataclass(frozen=True)
+class Naglowek:
+    """Nagłówek rozdziału: numer i fragmenty tekstu."""
+    numer: str
+    fragmenty: tuple
+
+
+@dataclass(frozen=True)
+class Linia:
+    """Wiersz tekstu lub wzoru; wciecie: 0 - margines, 1 - wypunktowanie, 2 - wzór."""
+    fragmenty: tuple
+    wciecie: int = 0
+
+
+@dataclass(frozen=True)
+class Odstep:
+    """Pionowy odstęp w wysokościach wiersza."""
+    wysokosc: float = 1.0
+
+
+@dataclass(frozen=True)
+class Tabela:
+    """Tabela bez obramowania: wiersze komórek (każda komórka to fragmenty)."""
+    wiersze: tuple
+    szerokosci: tuple = (0.5, 0.5)
+
+
+@dataclass(frozen=True)
+class Wynik:
+    """Wyróżniona ramka wyniku: etykieta i pogrubione fragmenty."""
+    etykieta: str
+    fragmenty: tuple
+
+
+Blok = Union[Tytul, Naglowek, Linia, Odstep, Tabela, Wynik]
+BLOKI = {k.__name__: k for k in (Tytul, Naglowek, Linia, Odstep, Tabela, Wynik)}
+
+
+def _krotki(wartosc):
+    """Listy z JSON z powrotem jako krotki (bloki są hashowalne)."""
+    if isinstance(wartosc, list):
+        return tuple(_krotki(v) for v in wartosc)
+    return wartosc
+
+
+@dataclass(frozen=True)
+class Raport:
+    """Raport jednego obliczenia: nazwa pliku, bloki i parametry składu."""
+    nazwa: str
+    bloki: tuple
+    rozmiar_czcionki: int = 11
+    wysokosc_linii: float = 6.0
+
+    def do_slownika(self) -> dict:
+        return {
+            "nazwa": self.nazwa,
+            "rozmiar_czcionki": self.rozmiar_czcionki,
+            "wysokosc_linii": self.wysokosc_linii,
+            "bloki": [
+                {"typ": type(b).__name__, **{f.name: getattr(b, f.name) for f in fields(b)}}
+                for b in self.bloki
+            ],
+        }
+
+    @classmethod
+    def z_slownika(cls, dane: dict) -> "Raport":
+        bloki = []
+        for b in dane["bloki"]:
+            b = dict(b)
+            klasa = BLOKI[b.pop("typ")]
+            bloki.append(klasa(**{k: _krotki(v) for k, v in b.items()}))
+        return cls(dane["nazwa"], tuple(bloki), dane.get("rozmiar_czcionki", 11), dane.get("wysokosc_linii", 6.0))
+
+    def do_json(self) -> str:
+        return json.dumps(self.do_slownika(), ensure_ascii=False)
+
+    @classmethod
+    def z_json(cls, tekst: str) -> "Raport":
+        return cls.z_slownika(json.loads(tekst))
+
+
+# =============================================================================
+# MODUŁY RENDERUJĄCE
+# =============================================================================
+
+# Wersja składu raportów - zwiększana przy zmianie wyglądu w modułach renderujących
+# (unieważnia raporty zapisane w NARZEDZIA.PamiecRaportow)
+WERSJA_SZABLONU = 1
+
+# format -> "moduł:funkcja"; moduł importowany przy pierwszym użyciu
+BACKENDY: dict[str, str | Callable] = {
+    "pdf": "NARZEDZIA.RaportPDF:RenderujPDF",
+    "docx": "NARZEDZIA.RaportDOCX:RenderujDOCX",
+    "html": "NARZEDZIA.RaportHTML:RenderujHTML",
+    "md": "NARZEDZIA.RaportMD:RenderujMD",
+}
+
+
+def ZarejestrujBackend(format: str, funkcja: Callable | str):
+    """Dodaje lub podmienia moduł renderujący formatu (funkcja(raport, **opcje))."""
+    BACKENDY[format.lower()] = funkcja
+
+
+def Renderuj(raport: Raport, format: str, **opcje):
+    """Raport w zadanym formacie (pdf - bytes, docx - BytesIO, html i md - str)."""
+    backend = BACKENDY.get(format.lower())
+    if backend is None:
+        raise KeyError(f"Nieznany format raportu: {format}")
+    if isinstance(backend, str):
+        modul, funkcja = backend.split(":")
+        backend = getattr(importlib.import_module(modul), funkcja)
+        BACKENDY[format.lower()] = backend
+    return backend(raport, **opcje)
+
+
+if __name__ == "__main__":
+    raport = Raport("Test", (
+        Tytul("TEST RAPORTU", "wg PN-EN 1992-1-1"),
+        Naglowek("1", Fr("Długość *l*_{bd}")),
+        Linia(Fr("*α*_{1} = 1.00"), 2),
+        Tabela(((Fr("Klasa betonu:"), Fr("C30/37")),), (90.0, 90.0)),
+        Wynik("WYNIK:", Fr("*l*_{bd} = 250 mm", "B")),
+    ))
+    assert Fr("*l*_{b,rqd} = 250 mm") == (("l", "I"), ("b,rqd", "_"), (" = 250 mm", ""))
+    assert Raport.z_json(raport.do_json()) == raport
+    hash(raport)
+    print(f"{len(raport.bloki)} bloków, JSON {len(raport.do_json())} znaków - zapis i odczyt zgodne")
@@ -0,0 +1,99 @@
+# NARZEDZIA/RaportMD.py
+"""
+Renderowanie raportu (NARZEDZIA.RaportIR) do Markdown (GitHub / e-mail).
+
+Czysty Python (bez fpdf i python-docx). Indeksy dolne zapisywane są
+jako <sub>, wzory wcinane spacjami twardymi (em), dane w tabeli Markdown
+z pustym nagłówkiem, wynik jako cytat z pogrubieniem.
+"""
+
+from __future__ import annotations
+
+from NARZEDZIA.RaportIR import Linia, Naglowek, Odstep, Raport, Tabela, Tytul, Wynik
+
+WCIECIA = {1: "\u2003", 2: "\u2003" * 3}
+
+_ZNAKI = str.maketrans({z: "\\" + z for z in "\\`*_[]|#"} | {"<": "&lt;", ">": "&gt;"})
+
+
+def _fragmenty(fragmenty: tuple) -> str:
+    # Sąsiednie fragmenty o tym samym kroju w jednym znaczniku (**c<sub>nom</sub> = 40 mm**),
+    # spacje brzegowe poza znacznikiem - inaczej Markdown nie rozpozna wyróżnienia
+    grupy = []
+    for tekst, styl in fragmenty:
+        md = tekst.translate(_ZNAKI)
+        if "_" in styl:
+            md = f"<sub>{md}</sub>"
+        znacznik = ("**" if "B" in styl else "") + ("*" if "I" in styl else "")
+        if grupy and grupy[-1][0] == znacznik:
+            grupy[-1][1] += md
+        else:
+            grupy.append([znacznik, md])
+
+    czesci = []
+    for znacznik, md in grupy:
+        tresc = md.strip()
+        if znacznik and tresc:
+            lewa, prawa = md[: len(md) - len(md.lstrip())], md[len(md.rstrip()):]
+            md = f"{lewa}{znacznik}{tresc}{znacznik[::-1]}{prawa}"
+        czesci.append(md)
+    return "".join(czesci)
+
+
+def RenderujMD(raport: Raport) -> str:
+    """Raport w Markdown; wiersze akapitu łamane twardo (dwie spacje)."""
+    wiersze = []
+    for blok in raport.bloki:
+        if isinstance(blok, Tytul):
+            wiersze += [f"# {blok.tekst.translate(_ZNAKI)}", ""]
+            if blok.podtytul:
+                wiersze += [f"*{blok.podtytul.translate(_ZNAKI)}*", ""]
+        elif isinstance(blok, Naglowek):
+            wiersze += ["", f"## {blok.numer}. {_fragmenty(blok.fragmenty)}", ""]
+        elif isinstance(blok, Linia):
+            wiersze.append(WCIECIA.get(blok.wciecie, "") + _fragmenty(blok.fragmenty).strip() + "  ")
+        elif isinstance(blok, Odstep):
+            wiersze.append("")
+        elif isinstance(blok, Tabela):
+            kolumny = len(blok.szerokosci)
+            wiersze += ["", "|" + " |" * kolumny, "|" + "---|" * kolumny]
+            wiersze += ["| " + " | ".join(_fragmenty(k) for k in w) + " |" for w in blok.wiersze]
+            wiersze.append("")
+        elif isinstance(blok, Wynik):
+            wiersze += ["", f"> {blok.etykieta.translate(_ZNAKI)} **{_fragmenty(blok.fragmenty)}**"]
+
+    tekst = "\n".join(wiersze).strip() + "\n"
+    while "\n\n\n" in tekst:
+        tekst = tekst.replace("\n\n\n", "\n\n")
+    return tekst
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from NARZEDZIA.RaportHTML import RenderujHTML
+    from NARZEDZIA.RaportIR import Fr
+
+    # Raport wielkości raportu zakotwienia (~30 bloków)
+    raport = Raport("Test", (
+        Tytul("DŁUGOŚĆ ZAKOTWIENIA PRĘTÓW ZBROJENIOWYCH", "wg PN-EN 1992-1-1"),
+        Naglowek("1", Fr("Parametry materiałowe")),
+        Tabela(((Fr("Klasa betonu:"), Fr("C30/37")), (Fr("Uziarnienie:"), Fr("d_{g} ≤ 32 mm")))),
+        *(Linia(Fr(f"*α*_{{{i}}} = 1.00 · *l*_{{b,rqd}} = ") + Fr(f"{i * 100.0:.1f} mm", "B"), i % 3) for i in range(25)),
+        Odstep(2.0),
+        Wynik("WYMAGANA DŁUGOŚĆ ZAKOTWIENIA:", Fr("l_{bd,req} = 640 mm")),
+    ))
+
+    n = 2000
+    t0 = time.perf_counter()
+    for _ in range(n):
+        RenderujHTML(raport)
+    t1 = time.perf_counter()
+    for _ in range(n):
+        md = RenderujMD(raport)
+    t2 = time.perf_counter()
+
+    assert "**l<sub>bd,req</sub> = 640 mm**" in md
+    assert "fpdf" not in sys.modules and "docx" not in sys.modules
+    print(f"HTML {(t1 - t0) / n * 1000:.3f} ms, Markdown {(t2 - t1) / n * 1000:.3f} ms na raport ({len(raport.bloki)} bloków)")
@@ -0,0 +1,138 @@
+# NARZEDZIA/RaportPDF.py
+"""
+Renderowanie raportu (NARZEDZIA.RaportIR) do PDF (FPDF).
+
+Skład odpowiada dotychczasowym raportom kalkulatorów: marginesy 15/15/10 mm,
+tytuł 16 pkt, nagłówki rozdziałów z linią, indeksy dolne 7 pkt obniżone
+o 1/3 wysokości wiersza, wzory wcięte na 25 mm, szara ramka wyniku.
+Z argumentem pdf raport dopisywany jest do istniejącego dokumentu
+(od nowej strony), np. do tomu obliczeń projektu.
+"""
+
+from __future__ import annotations
+
+from fpdf import FPDF
+
+from NARZEDZIA.CzcionkiPDF import DodajCzcionki
+from NARZEDZIA.RaportIR import Linia, Naglowek, Odstep, Raport, Tabela, Tekst, Tytul, Wynik
+
+MARGINES_LEWY = 15
+MARGINES_GORNY = 15
+MARGINES_PRAWY = 10
+
+# Położenie x [mm] dla poziomów wcięcia Linia.wciecie (0 - margines)
+WCIECIA = {1: 20, 2: 25}
+
+ROZMIAR_INDEKSU = 7
+
+# Zamienniki dla wbudowanego Arial (brak plików czcionek Unicode)
+_ZAMIENNIKI = str.maketrans({
+    "ą": "a", "ć": "c", "ę": "e", "ł": "l", "ń": "n", "ó": "o", "ś": "s", "ź": "z", "ż": "z",
+    "Ą": "A", "Ć": "C", "Ę": "E", "Ł": "L", "Ń": "N", "Ó": "O", "Ś": "S", "Ź": "Z", "Ż": "Z",
+    "Φ": "fi", "α": "a", "η": "eta", "ρ": "ro", "σ": "sigma", "Δ": "d", "γ": "g",
+    "≥": ">=", "≤": "<=", "→": "->",
+})
+
+
+class _Sklad:
+    """Stan składu jednego raportu (czcionka, wysokość wiersza)."""
+
+    def __init__(self, pdf: FPDF, raport: Raport):
+        self.pdf = pdf
+        self.czcionka, self.unicode = DodajCzcionki(pdf)
+        self.rozmiar = raport.rozmiar_czcionki
+        self.h = raport.wysokosc_linii
+
+    def tekst(self, tekst: str) -> str:
+        return str(tekst) if self.unicode else str(tekst).translate(_ZAMIENNIKI)
+
+    def fragmenty(self, fragmenty: tuple, rozmiar: int | None = None, rozmiar_indeksu: int = ROZMIAR_INDEKSU,
+                  pogrubienie: bool = False):
+        pdf = self.pdf
+        rozmiar = rozmiar or self.rozmiar
+        for tekst, styl in fragmenty:
+            styl_czcionki = styl.replace("_", "")
+            if self.unicode:
+                # ArialUni nie ma osobnej kursywy (NARZEDZIA.CzcionkiPDF)
+                styl_czcionki = styl_czcionki.replace("I", "")
+            if pogrubienie and "B" not in styl_czcionki:
+                styl_czcionki = "B" + styl_czcionki
+            if "_" in styl:
+                x, y = pdf.get_x(), pdf.get_y()
+                pdf.set_font(self.czcionka, styl_czcionki.replace("I", ""), rozmiar_indeksu)
+                pdf.set_xy(x, y + self.h / 3)
+                pdf.write(self.h, self.tekst(tekst))
+                pdf.set_xy(pdf.get_x(), y)
+            else:
+                pdf.set_font(self.czcionka, styl_czcionki, rozmiar)
+                pdf.write(self.h, self.tekst(tekst))
+        pdf.set_font(self.czcionka, "", self.rozmiar)
+
+
+def RenderujPDF(raport: Raport, pdf: FPDF | None = None) -> bytes | None:
+    """Raport PDF (bytes); z argumentem pdf dopisuje raport do dokumentu i zwraca None."""
+    wlasny_pdf = pdf is None
+    if wlasny_pdf:
+        pdf = FPDF()
+    pdf.add_page()
+
+    s = _Sklad(pdf, raport)
+    pdf.set_margins(MARGINES_LEWY, MARGINES_GORNY, MARGINES_PRAWY)
+    pdf.set_auto_page_break(True, margin=15)
+
+    for blok in raport.bloki:
+        if isinstance(blok, Tytul):
+            pdf.set_font(s.czcionka, "B", 16)
+            pdf.cell(0, 8, s.tekst(blok.tekst), ln=True, align="C")
+            if blok.podtytul:
+                pdf.set_font(s.czcionka, "", 10)
+                pdf.cell(0, 5, s.tekst(blok.podtytul), ln=True, align="C")
+            pdf.ln(s.h)
+
+        elif isinstance(blok, Naglowek):
+            wysokosc = s.h + 2
+            pdf.ln(s.h * 1.2)
+            if all("_" not in styl for _, styl in blok.fragmenty):
+                pdf.set_font(s.czcionka, "B", s.rozmiar + 1)
+                pdf.cell(0, wysokosc, s.tekst(f"{blok.numer}. {Tekst(blok.fragmenty)}"), ln=True, border="B")
+            else:
+                y = pdf.get_y()
+                s.fragmenty(((f"{blok.numer}. ", ""),) + blok.fragmenty, s.rozmiar + 1, pogrubienie=True)
+                pdf.set_xy(MARGINES_LEWY, y + wysokosc)
+                pdf.line(MARGINES_LEWY, y + wysokosc, pdf.w - MARGINES_PRAWY, y + wysokosc)
+            pdf.ln(s.h * 0.3)
+
+        elif isinstance(blok, Linia):
+            if blok.wciecie in WCIECIA:
+                pdf.set_x(WCIECIA[blok.wciecie])
+            s.fragmenty(blok.fragmenty)
+            pdf.ln(s.h)
+
+        elif isinstance(blok, Odstep):
+            pdf.ln(s.h * blok.wysokosc)
+
+        elif isinstance(blok, Tabela):
+            szerokosc = pdf.w - MARGINES_LEWY - MARGINES_PRAWY
+            for wiersz in blok.wiersze:
+                x = MARGINES_LEWY
+                for komorka, udzial in zip(wiersz, blok.szerokosci):
+                    pdf.set_x(x)
+                    s.fragmenty(komorka)
+                    x += udzial * szerokosc
+                pdf.ln(s.h)
+
+        elif isinstance(blok, Wynik):
+            wysokosc = 2 * s.h + 2
+            if pdf.get_y() + wysokosc > pdf.page_break_trigger:
+                pdf.add_page()
+            y = pdf.get_y()
+            pdf.set_fill_color(235, 235, 235)
+            pdf.rect(MARGINES_LEWY, y, 180, wysokosc, "F")
+            pdf.set_xy(MARGINES_LEWY + 5, y + (wysokosc - s.h) / 2)
+            s.fragmenty(((blok.etykieta + "  ", ""),), 12)
+            s.fragmenty(blok.fragmenty, 12, 8, pogrubienie=True)
+            pdf.set_xy(MARGINES_LEWY, y + wysokosc)
+
+    if not wlasny_pdf:
+        return None
+    return pdf.output(dest="S").encode("latin-1", "replace")
@@ -0,0 +1,396 @@
+# NARZEDZIA/RaportProjektu.py
+"""
+Raport projektu: jeden plik PDF z wieloma sprawdzeniami (setki zakotwień,
+zakładów, otulin ...), zapisywany strumieniowo.
+
+StrumieniowyPDF (podklasa FPDF) zapisuje każdą zamkniętą stronę od razu do
+pliku - skompresowaną treść i obiekt strony - i zwalnia ją z pamięci, więc
+zużycie pamięci nie rośnie z liczbą stron. Przy zamknięciu dopisywane są
+czcionki (podzbiór znaków użytych w całym dokumencie, osadzany raz),
+zasoby, drzewo stron, zakładki, tablica xref i trailer.
+
+Ograniczenia względem FPDF: brak aliasu liczby stron ({nb}); odnośniki
+wewnętrzne mogą wskazywać tylko strony wcześniejsze lub bieżącą.
+
+RaportProjektu dodaje stronę tytułową, rozdziały i sprawdzenia (funkcje
+rysujące, np. create_pdf_report(wynik, inputs, pdf) kalkulatorów),
+a na końcu spis treści z odnośnikami; ten sam spis trafia do zakładek.
+"""
+
+from __future__ import annotations
+
+import zlib
+from datetime import date
+from typing import BinaryIO, Callable
+
+from fpdf import FPDF
+
+from NARZEDZIA.CzcionkiPDF import DodajCzcionki
+
+
+def _tekst_pdf(tekst: str) -> str:
+    """Łańcuch PDF: ASCII w nawiasach, pozostałe jako UTF-16BE (hex z BOM)."""
+    if tekst.isascii():
+        return "(" + tekst.replace("\\", "\\\\").replace(")", "\\)").replace("(", "\\(").replace("\r", "\\r") + ")"
+    return "<FEFF" + tekst.encode("utf-16-be").hex().upper() + ">"
+
+
+class StrumieniowyPDF(FPDF):
+    """FPDF zapisujący strony do pliku binarnego w chwili ich zamknięcia."""
+
+    def __init__(self, plik: BinaryIO, stopka: str = "", **kwargs):
+        super().__init__(**kwargs)
+        self._plik = plik
+        self._pozycja = 0
+        self._tresc: list[str] = []
+        self._obiekty_stron: list[int] = []
+        self.stopka = stopka
+        # (poziom, tytuł, strona, y [mm]) - poziom 0 to najwyższy
+        self.zakladki: list[tuple[int, str, int, float]] = []
+        self._putheader()
+
+    # --- zapis ---------------------------------------------------------------
+
+    def _out(self, s):
+        if self.state == 2:
+            self._tresc.append(s if isinstance(s, str) else s.decode("latin1") if isinstance(s, bytes) else str(s))
+            self._tresc.append("\n")
+            return
+        dane = s if isinstance(s, bytes) else str(s).encode("latin1")
+        self._plik.write(dane)
+        self._plik.write(b"\n")
+        self._pozycja += len(dane) + 1
+
+    def _newobj(self):
+        self.n += 1
+        self.offsets[self.n] = self._pozycja
+        self._out(f"{self.n} 0 obj")
+
+    def _textstring(self, s):
+        return _tekst_pdf(s)
+
+    # --- strony --------------------------------------------------------------
+
+    def _beginpage(self, orientation):
+        super()._beginpage(orientation)
+        self._tresc = []
+
+    def _endpage(self):
+        super()._endpage()
+        self._zapisz_strone(self.page)
+
+    def _wymiary(self, strona: int) -> tuple[float, float]:
+        w_pt, h_pt = (self.fw_pt, self.fh_pt) if self.def_orientation == "P" else (self.fh_pt, self.fw_pt)
+        if strona in self.orientation_changes:
+            w_pt, h_pt = h_pt, w_pt
+        return w_pt, h_pt
+
+    def _zapisz_strone(self, strona: int):
+        tresc = "".join(self._tresc).encode("latin1")
+        if self.compress:
+            tresc = zlib.compress(tresc)
+        self._tresc = []
+        self.pages[strona] = ""
+
+        self._newobj()
+        self._obiekty_stron.append(self.n)
+        w_pt, h_pt = self._wymiary(strona)
+        self._out("<</Type /Page")
+        self._out("/Parent 1 0 R")
+        if strona in self.orientation_changes:
+            self._out("/MediaBox [0 0 %.2f %.2f]" % (w_pt, h_pt))
+        self._out("/Resources 2 0 R")
+        odnosniki = self.page_links.pop(strona, None) if self.page_links else None
+        if odnosniki:
+            annots = "/Annots ["
+            for x, y, w, h, cel in odnosniki:
+                rect = "%.2f %.2f %.2f %.2f" % (x, y, x + w, y - h)
+                annots += "<</Type /Annot /Subtype /Link /Rect [" + rect + "] /Border [0 0 0] "
+                if isinstance(cel, str):
+                    annots += "/A <</S /URI /URI " + self._textstring(cel) + ">>>>"
+                else:
+                    strona_celu, y_celu = self.links[cel]
+                    if not 1 <= strona_celu <= len(self._obiekty_stron):
+                        raise ValueError("Odnośnik wewnętrzny do strony jeszcze nie zapisanej")
+                    h_celu = self._wymiary(strona_celu)[1]
+                    annots += "/Dest [%d 0 R /XYZ 0 %.2f null]>>" % (
+                        self._obiekty_stron[strona_celu - 1], h_celu - y_celu * self.k)
+            self._out(annots + "]")
+        if self.pdf_version > "1.3":
+            self._out("/Group <</Type /Group /S /Transparency /CS /DeviceRGB>>")
+        self._out(f"/Contents {self.n + 1} 0 R>>")
+        self._out("endobj")
+
+        self._newobj()
+        self._out("<<" + ("/Filter /FlateDecode " if self.compress else "") + f"/Length {len(tresc)}>>")
+        self._putstream(tresc)
+        self._out("endobj")
+
+    def footer(self):
+        if not self.stopka:
+            return
+        rodzina, unicode = DodajCzcionki(self)
+        self.set_y(-10)
+        self.set_font(rodzina, "", 8)
+        self.set_text_color(110, 110, 110)
+        tekst = self.stopka if unicode else self.stopka.encode("latin-1", "replace").decode("latin-1")
+        self.cell(0, 4, tekst, align="L")
+        self.set_x(self.l_margin)
+        self.cell(0, 4, f"Strona {self.page}", align="R")
+        self.set_text_color(0, 0, 0)
+
+    # --- zakończenie dokumentu -----------------------------------------------
+
+    def _putresources(self):
+        self._putfonts()
+        self._putimages()
+        self.offsets[2] = self._pozycja
+        self._out("2 0 obj")
+        self._out("<<")
+        self._putresourcedict()
+        self._out(">>")
+        self._out("endobj")
+
+    def _putzakladki(self) -> int | None:
+        """Drzewo zakładek (outline); zwraca numer obiektu korzenia."""
+        if not self.zakladki:
+            return None
+        korzen = {"dzieci": []}
+        stos = [(-1, korzen)]
+        for poziom, tytul, strona, y in self.zakladki:
+            while stos[-1][0] >= poziom:
+                stos.pop()
+            wezel = {"tytul": tytul, "strona": strona, "y": y, "dzieci": [], "rodzic": stos[-1][1]}
+            stos[-1][1]["dzieci"].append(wezel)
+            stos.append((poziom, wezel))
+
+        # Numeracja obiektów w kolejności zapisu (preorder)
+        kolejnosc = [korzen]
+        i = 0
+        while i < len(kolejnosc):
+            wezel = kolejnosc[i]
+            kolejnosc[i + 1:i + 1] = wezel["dzieci"]
+            i += 1
+        for nr, wezel in enumerate(kolejnosc, start=self.n + 1):
+            wezel["n"] = nr
+
+        for wezel in kolejnosc:
+            self._newobj()
+            dzieci = wezel["dzieci"]
+            if wezel is korzen:
+                self._out("<</Type /Outlines")
+                self._out(f"/Count {len(dzieci)}")
+            else:
+                self._out("<</Title " + self._textstring(wezel["tytul"]))
+                self._out(f"/Parent {wezel['rodzic']['n']} 0 R")
+                if wezel.get("poprzedni"):
+                    self._out(f"/Prev {wezel['poprzedni']['n']} 0 R")
+                if wezel.get("nastepny"):
+                    self._out(f"/Next {wezel['nastepny']['n']} 0 R")
+                strona = min(max(wezel["strona"], 1), len(self._obiekty_stron))
+                h_pt = self._wymiary(strona)[1]
+                self._out("/Dest [%d 0 R /XYZ 0 %.2f null]" % (
+                    self._obiekty_stron[strona - 1], h_pt - wezel["y"] * self.k))
+                if dzieci:
+                    # Rozdziały zwinięte - przy setkach sprawdzeń zakładki pozostają czytelne
+                    self._out(f"/Count -{len(dzieci)}")
+            for poprzedni, nastepny in zip(dzieci, dzieci[1:]):
+                poprzedni["nastepny"], nastepny["poprzedni"] = nastepny, poprzedni
+            if dzieci:
+                self._out(f"/First {dzieci[0]['n']} 0 R")
+                self._out(f"/Last {dzieci[-1]['n']} 0 R")
+            self._out(">>")
+            self._out("endobj")
+        return korzen["n"]
+
+    def _putcatalog(self):
+        super()._putcatalog()
+        if self._korzen_zakladek is not None:
+            self._out(f"/Outlines {self._korzen_zakladek} 0 R")
+            self._out("/PageMode /UseOutlines")
+
+    def _enddoc(self):
+        # Nagłówek i strony są już zapisane
+        self._putresources()
+        self._korzen_zakladek = self._putzakladki()
+
+        w_pt, h_pt = self._wymiary(0)
+        self.offsets[1] = self._pozycja
+        self._out("1 0 obj")
+        self._out("<</Type /Pages")
+        self._out("/Kids [" + " ".join(f"{n} 0 R" for n in self._obiekty_stron) + "]")
+        self._out(f"/Count {len(self._obiekty_stron)}")
+        self._out("/MediaBox [0 0 %.2f %.2f]" % (w_pt, h_pt))
+        self._out(">>")
+        self._out("endobj")
+
+        self._newobj()
+        self._out("<<")
+        self._putinfo()
+        self._out(">>")
+        self._out("endobj")
+        self._newobj()
+        self._out("<<")
+        self._putcatalog()
+        self._out(">>")
+        self._out("endobj")
+
+        xref = self._pozycja
+        self._out("xref")
+        self._out(f"0 {self.n + 1}")
+        self._out("0000000000 65535 f ")
+        for i in range(1, self.n + 1):
+            self._out("%010d 00000 n " % self.offsets[i])
+        self._out("trailer")
+        self._out("<<")
+        self._puttrailer()
+        self._out(">>")
+        self._out("startxref")
+        self._out(xref)
+        self._out("%%EOF")
+        self.state = 3
+
+    def output(self, name="", dest=""):
+        """Zamyka dokument (treść jest już w pliku); zwraca liczbę zapisanych bajtów."""
+        if self.state < 3:
+            self.close()
+        return self._pozycja
+
+
+class RaportProjektu:
+    """
+    Tom obliczeń projektu zapisywany strumieniowo do pliku binarnego:
+
+        with open("tom.pdf", "wb") as f, RaportProjektu(f, "Hala magazynowa") as raport:
+            raport.rozdzial("Długości zakotwienia")
+            raport.dodaj("B-1: pręt Φ16", lambda pdf: create_pdf_report(wynik, inputs, pdf))
+
+    Funkcja rysująca dopisuje sprawdzenie do pdf, zaczynając od nowej strony.
+    """
+
+    def __init__(self, plik: BinaryIO, tytul: str, opis: str = "", autor: str = ""):
+        self.pdf = StrumieniowyPDF(plik, stopka=tytul)
+        self.pdf.set_title(tytul)
+        if autor:
+            self.pdf.set_author(autor)
+        self.pdf.set_creator("KALKULATORY")
+        self.tytul = tytul
+        self.sprawdzenia = 0
+        self._rozdzial: str | None = None
+        self._rozdzial_dodany = True
+        self._strona_tytulowa(opis, autor)
+
+    def _tekst(self, tekst: str) -> str:
+        _, unicode = DodajCzcionki(self.pdf)
+        return tekst if unicode else tekst.encode("latin-1", "replace").decode("latin-1")
+
+    def _strona_tytulowa(self, opis: str, autor: str):
+        pdf = self.pdf
+        pdf.add_page()
+        rodzina, _ = DodajCzcionki(pdf)
+        pdf.set_y(90)
+        pdf.set_font(rodzina, "B", 22)
+        pdf.multi_cell(0, 11, self._tekst(self.tytul), align="C")
+        pdf.ln(4)
+        pdf.set_font(rodzina, "", 12)
+        pdf.cell(0, 7, self._tekst("Tom obliczeń statycznych wg PN-EN 1992-1-1"), ln=True, align="C")
+        if opis:
+            pdf.ln(4)
+            pdf.multi_cell(0, 6, self._tekst(opis), align="C")
+        pdf.ln(20)
+        pdf.set_font(rodzina, "", 10)
+        if autor:
+            pdf.cell(0, 6, self._tekst(f"Opracował: {autor}"), ln=True, align="C")
+        pdf.cell(0, 6, date.today().strftime("%d.%m.%Y"), ln=True, align="C")
+
+    def rozdzial(self, tytul: str):
+        """Rozpoczyna rozdział - zakładka nadrzędna dla kolejnych sprawdzeń."""
+        self._rozdzial = tytul
+        self._rozdzial_dodany = False
+
+    def dodaj(self, tytul: str, rysuj: Callable[[FPDF], object]):
+        """Dopisuje sprawdzenie; rysuj(pdf) musi zacząć od nowej strony."""
+        strona = self.pdf.page + 1
+        rysuj(self.pdf)
+        if self.pdf.page < strona:
+            raise ValueError(f"Sprawdzenie '{tytul}' nie rozpoczęło nowej strony")
+        if not self._rozdzial_dodany:
+            self.pdf.zakladki.append((0, self._rozdzial, strona, 0.0))
+            self._rozdzial_dodany = True
+        self.pdf.zakladki.append((1 if self._rozdzial else 0, tytul, strona, 0.0))
+        self.sprawdzenia += 1
+
+    def _spis_tresci(self):
+        pdf = self.pdf
+        pozycje = list(self.pdf.zakladki)
+        pdf.add_page()
+        rodzina, _ = DodajCzcionki(pdf)
+        pdf.set_margins(15, 15, 10)
+        pdf.set_auto_page_break(True, margin=15)
+        pdf.zakladki.append((0, "Spis treści", pdf.page, 0.0))
+        pdf.set_font(rodzina, "B", 16)
+        pdf.cell(0, 10, self._tekst("SPIS TREŚCI"), ln=True, align="C")
+        pdf.ln(4)
+        szerokosc = pdf.w - pdf.l_margin - pdf.r_margin
+        for poziom, tytul, strona, _ in pozycje:
+            odnosnik = pdf.add_link()
+            pdf.set_link(odnosnik, 0, strona)
+            wciecie = 8.0 * poziom
+            pdf.set_font(rodzina, "B" if poziom == 0 else "", 11 if poziom == 0 else 10)
+            pdf.set_x(pdf.l_margin + wciecie)
+            pdf.cell(szerokosc - wciecie - 15, 6, self._tekst(tytul), link=odnosnik)
+            pdf.cell(15, 6, str(strona), ln=True, align="R", link=odnosnik)
+
+    def zamknij(self) -> int:
+        """Spis treści, zakładki i zakończenie pliku; zwraca liczbę bajtów."""
+        if self.pdf.state < 3:
+            self._spis_tresci()
+        return self.pdf.output()
+
+    @property
+    def strony(self) -> int:
+        return self.pdf.page
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, typ, wartosc, slad):
+        if typ is None:
+            self.zamknij()
+        return False
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+    import tracemalloc
+
+    def _sprawdzenie(nr: int):
+        def rysuj(pdf: FPDF):
+            pdf.add_page()
+            rodzina, _ = DodajCzcionki(pdf)
+            pdf.set_font(rodzina, "B", 14)
+            pdf.cell(0, 8, f"Sprawdzenie {nr}: zakotwienie pręta Φ{12 + nr % 5 * 4}", ln=True)
+            pdf.set_font(rodzina, "", 10)
+            for i in range(30):
+                pdf.cell(0, 5.5, f"η₁ = 1,0; α₂ = 0,{70 + i}; l_bd = {200 + nr + i} mm - zależność {i}", ln=True)
+        return rysuj
+
+    for n in (100, 1000):
+        plik = tempfile.TemporaryFile()
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        with RaportProjektu(plik, "Przykładowy projekt - hala stalowa", "Sprawdzenia zbrojenia") as raport:
+            for nr in range(n):
+                if nr % 100 == 0:
+                    raport.rozdzial(f"Rozdział {nr // 100 + 1}")
+                raport.dodaj(f"Sprawdzenie {nr}", _sprawdzenie(nr))
+        t1 = time.perf_counter()
+        _, szczyt = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        plik.seek(0)
+        dane = plik.read()
+        plik.close()
+        assert dane.startswith(b"%PDF-") and dane.rstrip().endswith(b"%%EOF")
+        print(f"{n} sprawdzeń: {raport.strony} stron, {len(dane) / 1024:.0f} kB, "
+              f"{t1 - t0:.2f} s, szczyt pamięci {szczyt / 1024 ** 2:.1f} MB")
@@ -0,0 +1,169 @@
+# NARZEDZIA/Rysunki.py
+"""
+Rysunki pomocy kalkulatorów (PNG z katalogów _MODULY) przygotowane raz.
+
+st.image przy każdym przeładowaniu strony czyta plik PNG, a obraz szerszy
+od zadanej szerokości zmniejsza i koduje od nowa. Tutaj każdy rysunek
+kodowany jest raz do katalogu KATALOG (static/rysunki obok Aplikacja.py)
+jako:
+- WebP bezstratny (rysunki to tabele i schematy z tekstem - bezstratny
+  WebP jest ok. 2x mniejszy od PNG i ostrzejszy od stratnego),
+  szerokość do 2x szerokości wyświetlanej (ekrany o dużej gęstości),
+- PNG w szerokości wyświetlanej - zapas, gdy serwowanie plików
+  statycznych (server.enableStaticServing) jest wyłączone; takie bajty
+  st.image przekazuje bez zmian.
+
+Nazwy plików zawierają skrót treści źródła i szerokość
+(DlugoscZakladu_alfa6.3f2a9c1b04de.1100.webp), więc zmieniony rysunek
+to nowy plik, a przeglądarka może przechowywać stary bez sprawdzania.
+Zapis atomowy (plik tymczasowy i os.replace) - bezpieczny przy wielu
+procesach serwera.
+
+PomocZRysunkiem tworzy expander, którego treść wykonywana jest dopiero po
+rozwinięciu (on_change="rerun") - zwinięta pomoc nie wysyła rysunku.
+
+    python -m NARZEDZIA.Rysunki  - przygotowanie wszystkich rysunków z góry
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import time
+from io import BytesIO
+from pathlib import Path
+from urllib.parse import quote
+
+from NARZEDZIA.Pamiec import pamietaj
+
+SCIEZKA_BAZOWA = Path(__file__).resolve().parents[1]
+KATALOG = SCIEZKA_BAZOWA / "static" / "rysunki"
+URL = "/app/static/rysunki"
+
+# Największa szerokość treści strony Streamlit [px] (st.image zmniejsza szersze obrazy)
+MAKS_SZEROKOSC = 1460
+
+# Zmiana ustawień kodowania - nowe nazwy plików
+WERSJA = 1
+
+
+def _szerokosc(oryginalna: int, wyswietlana: int | None, format: str) -> int:
+    """Szerokość wariantu [px]: WebP 2x wyświetlanej, PNG równa wyświetlanej, nie większa od oryginału."""
+    docelowa = MAKS_SZEROKOSC if wyswietlana is None else wyswietlana * (2 if format == "webp" else 1)
+    return min(oryginalna, docelowa, MAKS_SZEROKOSC)
+
+
+def _zapisz(sciezka: Path, dane: bytes):
+    sciezka.parent.mkdir(parents=True, exist_ok=True)
+    fd, tymczasowy = tempfile.mkstemp(dir=sciezka.parent, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(dane)
+        os.replace(tymczasowy, sciezka)
+    except OSError:
+        try:
+            os.remove(tymczasowy)
+        except OSError:
+            pass
+        raise
+
+
+@pamietaj(maks_wpisow=128)
+def _Wariant(zrodlo: str, zmiana: float, szerokosc: int | None, format: str) -> Path:
+    """Plik wariantu rysunku (kodowany przy pierwszym użyciu, potem tylko sprawdzenie nazwy)."""
+    from PIL import Image
+
+    dane = Path(zrodlo).read_bytes()
+    skrot = hashlib.sha256(dane + b"%d" % WERSJA).hexdigest()[:12]
+    obraz = Image.open(BytesIO(dane))
+    docelowa = _szerokosc(obraz.width, szerokosc, format)
+    sciezka = KATALOG / f"{Path(zrodlo).stem}.{skrot}.{docelowa}.{format}"
+    if sciezka.exists():
+        return sciezka
+
+    if docelowa < obraz.width:
+        obraz = obraz.resize((docelowa, round(obraz.height * docelowa / obraz.width)), Image.LANCZOS)
+    bufor = BytesIO()
+    if format == "webp":
+        obraz.save(bufor, "WEBP", lossless=True, method=6)
+    else:
+        obraz.save(bufor, "PNG", optimize=True)
+    _zapisz(sciezka, bufor.getvalue())
+    return sciezka
+
+
+def Wariant(zrodlo: str | Path, szerokosc: int | None = None, format: str = "webp") -> Path:
+    """Ścieżka przygotowanego wariantu rysunku (webp lub png) dla szerokości wyświetlanej [px]."""
+    zrodlo = Path(zrodlo)
+    return _Wariant(str(zrodlo), zrodlo.stat().st_mtime, szerokosc, format)
+
+
+@pamietaj(maks_wpisow=32, maks_bajtow=16 * 1024 * 1024)
+def _Bajty(sciezka: str) -> bytes:
+    return Path(sciezka).read_bytes()
+
+
+def PokazRysunek(zrodlo: str | Path, szerokosc: int | None = None, brak: str | None = None):
+    """st.image z przygotowanego wariantu; brak pliku źródłowego - komunikat brak (lub nic)."""
+    import streamlit as st
+
+    if not Path(zrodlo).exists():
+        if brak:
+            st.info(brak)
+        return
+    if st.get_option("server.enableStaticServing"):
+        # Plik statyczny: przeglądarka pobiera go raz, Streamlit niczego nie koduje
+        st.image(f"{URL}/{quote(Wariant(zrodlo, szerokosc, 'webp').name)}", width=szerokosc or "stretch")
+    else:
+        st.image(_Bajty(str(Wariant(zrodlo, szerokosc, "png"))), width=szerokosc or "stretch")
+
+
+def PomocZRysunkiem(etykieta: str, zrodlo: str | Path, szerokosc: int | None = None, kolumny: list | None = None,
+                    brak: str | None = None, key: str | None = None):
+    """Expander pomocy z rysunkiem wykonywany tylko po rozwinięciu; kolumny - [lewa, środek, prawa]."""
+    import streamlit as st
+
+    pomoc = st.expander(etykieta, key=key or f"pomoc_{Path(zrodlo).stem}", on_change="rerun")
+    if not pomoc.open:
+        return
+    with pomoc:
+        if kolumny:
+            _, srodek, _ = st.columns(kolumny)
+            with srodek:
+                PokazRysunek(zrodlo, szerokosc, brak)
+        else:
+            PokazRysunek(zrodlo, szerokosc, brak)
+
+
+def PrzygotujRysunki(katalog: str | Path = SCIEZKA_BAZOWA / "_MODULY", szerokosci=(None,)) -> list[tuple[Path, Path]]:
+    """Koduje z góry wszystkie PNG z katalogu (oba formaty); usuwa warianty nieaktualnych wersji."""
+    pary = []
+    for zrodlo in sorted(Path(katalog).rglob("*.png")):
+        for szerokosc in szerokosci:
+            for format in ("webp", "png"):
+                pary.append((zrodlo, Wariant(zrodlo, szerokosc, format)))
+
+    # Warianty poprzednich wersji rysunków (zmieniony plik lub ustawienia kodowania)
+    skroty = dict(w.name.rsplit(".", 3)[:2] for _, w in pary)
+    for plik in KATALOG.glob("*.*.*.*"):
+        nazwa, skrot = plik.name.rsplit(".", 3)[:2]
+        if skroty.get(nazwa, skrot) != skrot:
+            plik.unlink(missing_ok=True)
+    return pary
+
+
+if __name__ == "__main__":
+    t0 = time.perf_counter()
+    pary = PrzygotujRysunki(szerokosci=(None, 550, 650))
+    t1 = time.perf_counter()
+    PrzygotujRysunki(szerokosci=(None, 550, 650))
+    t2 = time.perf_counter()
+
+    # Rozmiar przesyłany dla szerokości strony: źródło PNG i wariant WebP
+    pelne = [(z, Wariant(z, None, "webp")) for z in sorted({z for z, _ in pary})]
+    png = sum(z.stat().st_size for z, _ in pelne)
+    webp = sum(w.stat().st_size for _, w in pelne)
+    print(f"{len({z for z, _ in pary})} rysunków, {len(pary)} wariantów: {t1 - t0:.1f} s (kodowanie), "
+          f"{(t2 - t1) * 1000:.1f} ms (gotowe)")
+    print(f"Pełna szerokość: PNG {png / 1024:.0f} kB -> WebP {webp / 1024:.0f} kB")
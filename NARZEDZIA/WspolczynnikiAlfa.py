@@ -0,0 +1,168 @@
+# NARZEDZIA/WspolczynnikiAlfa.py
+"""
+Współczynniki α2, α3, α5 (PN-EN 1992-1-1, Tablica 8.2) i przegląd wariantów
+środków zmniejszających długość - wspólne dla kalkulatorów długości
+zakotwienia i zakładu (DlugoscZakotwienia, DlugoscZakladu).
+
+Funkcje przyjmują liczby lub tablice numpy (broadcast); dla argumentów
+skalarnych zwracają skalary.
+
+Warianty (SiatkaOpcji) opisane są wielkościami fizycznymi - otulina cd,
+zbrojenie poprzeczne ΣAst, nacisk p - a współczynniki liczone są dopiero
+dla każdego wariantu (AlfyOpcji), bo α2 zależy od kształtu pręta, a α2 i α3
+od średnicy:
+- α2 = 1 - 0.15·(cd - Φ)/Φ dla prętów prostych,
+  α2 = 1 - 0.15·(cd - 3Φ)/Φ dla haków, pętli i odgięć,
+- α3 = 1 - K·λ, λ = (ΣAst - ΣAst,min)/As, As = πΦ²/4 (jeden pręt),
+- α5 = 1 - 0.04·p,
+wszystkie w granicach 0.7 ≤ α ≤ 1.0.
+
+NajwiekszaSrednica - wspólne zadanie odwrotne (największa średnica dla
+dostępnej długości); wywołujący liczy α2 i α3 dla każdej średnicy z cd
+i ΣAst (AlfyOpcji), a nie stałe dla średnicy wejściowej.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+# Kształt pręta prostego (pozostałe kształty: haki, pętle, odgięcia)
+PROSTE = "Proste"
+
+
+def ZTabeli(klucze, tabela: dict, nazwa: str) -> np.ndarray:
+    """Wartości słownika dla tablicy kluczy; nieznany klucz - KeyError (bez wartości domyślnej)."""
+    klucze = np.asarray(klucze)
+    unikalne, odwrotne = np.unique(klucze, return_inverse=True)
+    try:
+        wartosci = np.array([tabela[str(k)] for k in unikalne], dtype=np.float64)
+    except KeyError as exc:
+        raise KeyError(f"Nieznana wartość ({nazwa}): {exc.args[0]!r}") from exc
+    return wartosci[odwrotne].reshape(klucze.shape)[()]
+
+
+def Alfa2(cd, fi_mm, ksztalt_preta=PROSTE):
+    """α2 dla otuliny cd [mm] i średnicy Φ [mm]; pręty inne niż proste - (cd - 3Φ)/Φ."""
+    fi_mm = np.asarray(fi_mm, dtype=np.float64)
+    odjemna = np.where(np.asarray(ksztalt_preta) == PROSTE, 1.0, 3.0) * fi_mm
+    return np.clip(1.0 - 0.15 * (np.asarray(cd, dtype=np.float64) - odjemna) / fi_mm, 0.7, 1.0)[()]
+
+
+def Alfa3(sum_ast, fi_mm, K, sum_ast_min):
+    """α3 dla ΣAst i ΣAst,min [cm²] zbrojenia poprzecznego wzdłuż lbd i średnicy Φ [mm]."""
+    As_1 = math.pi * np.asarray(fi_mm, dtype=np.float64) ** 2 / 400.0
+    return np.clip(1.0 - K * (np.asarray(sum_ast, dtype=np.float64) - sum_ast_min) / As_1, 0.7, 1.0)[()]
+
+
+def Alfa5(p):
+    """α5 dla nacisku poprzecznego p [MPa]."""
+    return np.clip(1.0 - 0.04 * np.asarray(p, dtype=np.float64), 0.7, 1.0)[()]
+
+
+def AlfyOpcji(fi_mm, ksztalt_preta=PROSTE, cd=np.nan, sum_ast=np.nan, p=0.0, K: float = 0.05,
+              sum_ast_min: float = 2.5) -> tuple:
+    """(α2, α3, α5) wariantów; cd lub ΣAst równe NaN - środek nieuwzględniony (α = 1.0)."""
+    cd = np.asarray(cd, dtype=np.float64)
+    sum_ast = np.asarray(sum_ast, dtype=np.float64)
+    alfa2 = np.where(np.isnan(cd), 1.0, Alfa2(cd, fi_mm, ksztalt_preta))[()]
+    alfa3 = np.where(np.isnan(sum_ast), 1.0, Alfa3(sum_ast, fi_mm, K, sum_ast_min))[()]
+    return alfa2, alfa3, Alfa5(p)
+
+# =============================================================================
+# PRZEGLĄD WARIANTÓW (FRONT PARETO)
+# =============================================================================
+
+
+def PoziomyAlfa(
+    fi_mm: float,
+    wysilek: dict,
+    cd_lista=(),
+    cd_aktualne: float | None = None,
+    sum_ast_lista=(),
+    p: float = 0.0,
+) -> dict:
+    """
+    Poziomy opcji "cd", "sum_ast", "p" dla SiatkaOpcji (pierwszy poziom - środek
+    nieużyty). wysilek - koszty "alfa2", "alfa2_cd" (za każde Φ zwiększenia cd
+    ponad cd_aktualne), "alfa3", "alfa3_ast" (za cm²), "alfa5".
+    Pusta cd_lista - cd = 1.5Φ ... 3Φ.
+    """
+    cd_lista = list(cd_lista) or [fi_mm * k for k in (1.5, 2.0, 2.5, 3.0)]
+    cd_akt = min(cd_lista) if cd_aktualne is None else cd_aktualne
+    return {
+        "cd": [(np.nan, 0.0, "")] + [
+            (cd, wysilek["alfa2"] + wysilek["alfa2_cd"] * max(cd - cd_akt, 0.0) / fi_mm, f"α2: cd = {cd:.0f} mm")
+            for cd in cd_lista
+        ],
+        "sum_ast": [(np.nan, 0.0, "")] + [
+            (ast, wysilek["alfa3"] + wysilek["alfa3_ast"] * ast, f"α3: ΣAst = {ast:.2f} cm²")
+            for ast in sum_ast_lista
+        ],
+        "p": [(0.0, 0.0, "")] + ([(p, wysilek["alfa5"], f"α5: p = {p:.1f} MPa")] if p > 0.0 else []),
+    }
+
+
+def SiatkaOpcji(poziomy: dict) -> dict:
+    """Iloczyn kartezjański poziomów opcji: {nazwa: [(wartość, wysiłek, opis), ...]}."""
+    nazwy = list(poziomy)
+    indeksy = np.meshgrid(*[np.arange(len(poziomy[n])) for n in nazwy], indexing="ij")
+    indeksy = [i.ravel() for i in indeksy]
+    wynik = {"wysilek": np.zeros(indeksy[0].size), "opis": [[] for _ in range(indeksy[0].size)]}
+    for n, idx in zip(nazwy, indeksy):
+        wartosci = np.array([p[0] for p in poziomy[n]], dtype=object)
+        wynik[n] = wartosci[idx]
+        wynik["wysilek"] = wynik["wysilek"] + np.array([p[1] for p in poziomy[n]])[idx]
+        for k, i in enumerate(idx):
+            if poziomy[n][i][2]:
+                wynik["opis"][k].append(poziomy[n][i][2])
+    wynik["opis"] = [", ".join(o) if o else "brak środków" for o in wynik["opis"]]
+    return wynik
+
+
+def NajwiekszaSrednica(dlugosci: np.ndarray, l_dostepne: np.ndarray, srednice: np.ndarray) -> np.ndarray:
+    """
+    Największa średnica, dla której wymagana długość (ostatnia oś tablicy
+    dlugosci, kolejne średnice) nie przekracza l_dostepne; NaN gdy żadna.
+    Obwiednia narastająca gwarantuje monotoniczność przedziałów.
+    """
+    obwiednia = np.maximum.accumulate(dlugosci, axis=-1)
+    ile = np.sum(obwiednia <= l_dostepne[..., None] + 1e-9, axis=-1)
+    return np.where(ile > 0, srednice[np.maximum(ile - 1, 0)], np.nan)
+
+
+def FrontPareto(dlugosc: np.ndarray, wysilek: np.ndarray) -> np.ndarray:
+    """
+    Indeksy wariantów niezdominowanych (mniejszy wysiłek i krótsza długość),
+    posortowane rosnąco wg wysiłku. Długości porównywane z dokładnością do 1 mm.
+    """
+    dl = np.ceil(dlugosc - 1e-9)
+    kolejnosc = np.lexsort((dl, wysilek))
+    dl_sort = dl[kolejnosc]
+    dotychczasowe_min = np.minimum.accumulate(dl_sort)
+    lepszy = dl_sort < np.concatenate(([np.inf], dotychczasowe_min[:-1]))
+    return kolejnosc[lepszy]
+
+
+if __name__ == "__main__":
+    # Tablica 8.2: pręt prosty cd = 3Φ -> α2 = 0.7; hak przy cd = 3Φ -> α2 = 1.0 (cd ≤ 3Φ bez redukcji)
+    assert Alfa2(48.0, 16.0) == 0.7 and Alfa2(48.0, 16.0, "Inne (haki, pętle)") == 1.0
+    assert np.allclose(Alfa2(64.0, 16.0, ["Proste", "Hak"]), [0.7, 0.85])
+    # α3 maleje ze średnicą mniej niż liniowo (As ~ Φ²): większy pręt - słabszy wpływ ΣAst
+    assert np.all(np.diff(Alfa3(4.0, np.array([8.0, 16.0, 32.0]), 0.1, 0.0)) > 0)
+    assert AlfyOpcji(16.0) == (1.0, 1.0, 1.0)
+    assert np.array_equal(NajwiekszaSrednica(np.array([[300.0, 500.0, 450.0, 700.0]]), np.array([100.0, 480.0, 600.0]),
+                                             np.array([8.0, 12.0, 16.0, 20.0])), [np.nan, 8.0, 16.0], equal_nan=True)
+
+    poziomy = {"ksztalt": [(PROSTE, 0.0, ""), ("Hak", 2.0, "hak")],
+               **PoziomyAlfa(16.0, {"alfa2": 0.5, "alfa2_cd": 1.0, "alfa3": 0.5, "alfa3_ast": 1.0, "alfa5": 0.5},
+                             sum_ast_lista=(1.0, 2.0), p=5.0)}
+    warianty = SiatkaOpcji(poziomy)
+    alfy = AlfyOpcji(16.0, warianty["ksztalt"].astype(str), warianty["cd"].astype(float),
+                     warianty["sum_ast"].astype(float), warianty["p"].astype(float))
+    dlugosc = 600.0 * np.where(warianty["ksztalt"] == PROSTE, 1.0, 0.7) * alfy[0] * alfy[1] * alfy[2]
+    front = FrontPareto(dlugosc, warianty["wysilek"])
+    print(f"{dlugosc.size} wariantów, front Pareto: {len(front)}")
+    for i in front:
+        print(f"  {dlugosc[i]:6.0f} mm  wysiłek {warianty['wysilek'][i]:4.1f}  {warianty['opis'][i]}")
@@ -0,0 +1,246 @@
+# NARZEDZIA/ZadaniaRaportow.py
+"""
+Generowanie raportów w tle: pula wątków z zadaniami o identyfikatorach.
+
+Strona Streamlit zleca zadanie (PulaZadan.zlec) i od razu wraca do
+użytkownika - wątek skryptu nie czeka na create_pdf_report / ZapiszTom,
+więc dane wejściowe można dalej edytować. Stan zadania (postęp, błąd,
+wynik) strona odczytuje cyklicznie po identyfikatorze zapisanym
+w st.session_state.
+
+Funkcja zadania dostaje plik binarny i funkcję postep(gotowe, wszystkie):
+
+    funkcja(plik, *args, postep=postep, **kwargs) -> wynik (np. statystyki)
+
+Gotowy plik leży w katalogu tymczasowym (nie w pamięci) i jest usuwany
+po czasie przechowywania liczonym od zakończenia zadania [s]; sprzątanie
+odbywa się przy zlecaniu i odczycie stanu. Pula (Pula()) jest wspólna dla
+wszystkich sesji w procesie, stan chroniony blokadą (threading.Lock).
+Wątki, a nie procesy - funkcje raportów (lambdy, funkcje rysujące) nie
+są serializowalne; GIL jest zwalniany między krokami, więc interfejs
+pozostaje responsywny.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable
+
+# Domyślna liczba wątków i czas przechowywania gotowych plików [s]
+WATKI = 2
+PRZECHOWYWANIE = 30 * 60
+
+OCZEKUJE = "oczekuje"
+W_TOKU = "w toku"
+GOTOWE = "gotowe"
+BLAD = "błąd"
+ANULOWANE = "anulowane"
+
+
+class ZadanieAnulowane(Exception):
+    """Zgłaszany przez postep() w zadaniu anulowanym (przerywa generowanie)."""
+
+
+@dataclass
+class Zadanie:
+    """Stan jednego zadania (kopia zwracana przez PulaZadan.stan)."""
+    id: str
+    nazwa: str
+    plik: str
+    mime: str
+    stan: str = OCZEKUJE
+    gotowe: int = 0
+    wszystkie: int = 0
+    wynik: object = None
+    blad: str = ""
+    sciezka: str | None = None
+    utworzono: float = field(default_factory=time.monotonic)
+    zakonczono: float | None = None
+    anulowanie: bool = False
+
+    @property
+    def zakonczone(self) -> bool:
+        return self.stan in (GOTOWE, BLAD, ANULOWANE)
+
+    @property
+    def postep(self) -> float:
+        """Udział wykonanej pracy [0-1]."""
+        if self.stan == GOTOWE:
+            return 1.0
+        return self.gotowe / self.wszystkie if self.wszystkie else 0.0
+
+    def dane(self) -> bytes:
+        """Zawartość gotowego pliku (FileNotFoundError - plik usunięty po czasie przechowywania)."""
+        if self.sciezka is None:
+            raise FileNotFoundError(f"Zadanie {self.id} nie ma gotowego pliku ({self.stan})")
+        with open(self.sciezka, "rb") as f:
+            return f.read()
+
+
+def _usun_plik(sciezka: str | None):
+    if sciezka is not None:
+        try:
+            os.remove(sciezka)
+        except FileNotFoundError:
+            pass
+
+
+class PulaZadan:
+    """Pula wątków generujących raporty; zadania dostępne po identyfikatorze."""
+
+    def __init__(self, watki: int = WATKI, przechowywanie: float = PRZECHOWYWANIE, katalog: str | None = None):
+        self.przechowywanie = przechowywanie
+        self.katalog = katalog
+        self._wykonawca = ThreadPoolExecutor(max_workers=watki, thread_name_prefix="raport")
+        self._zadania: dict[str, Zadanie] = {}
+        self._blokada = threading.Lock()
+
+    def zlec(self, funkcja: Callable, *args, nazwa: str = "", plik: str = "raport", mime: str = "application/octet-stream",
+             **kwargs) -> str:
+        """Dodaje zadanie funkcja(plik, *args, postep=..., **kwargs); zwraca identyfikator."""
+        self.sprzataj()
+        zadanie = Zadanie(uuid.uuid4().hex, nazwa or plik, plik, mime)
+        with self._blokada:
+            self._zadania[zadanie.id] = zadanie
+        self._wykonawca.submit(self._wykonaj, zadanie, funkcja, args, kwargs)
+        return zadanie.id
+
+    def _wykonaj(self, zadanie: Zadanie, funkcja: Callable, args: tuple, kwargs: dict):
+        with self._blokada:
+            if zadanie.anulowanie:
+                zadanie.stan, zadanie.zakonczono = ANULOWANE, time.monotonic()
+                return
+            zadanie.stan = W_TOKU
+
+        def postep(gotowe: int, wszystkie: int):
+            with self._blokada:
+                zadanie.gotowe, zadanie.wszystkie = gotowe, wszystkie
+                if zadanie.anulowanie:
+                    raise ZadanieAnulowane(zadanie.id)
+
+        rozszerzenie = os.path.splitext(zadanie.plik)[1]
+        f = tempfile.NamedTemporaryFile(prefix="raport_", suffix=rozszerzenie, dir=self.katalog, delete=False)
+        try:
+            with f:
+                wynik = funkcja(f, *args, postep=postep, **kwargs)
+        except ZadanieAnulowane:
+            stan, wynik, blad = ANULOWANE, None, ""
+        except Exception as e:
+            # Wątek w tle nie ma gdzie zgłosić wyjątku - opis trafia do stanu zadania
+            stan, wynik, blad = BLAD, None, f"{type(e).__name__}: {e}"
+        else:
+            stan, blad = GOTOWE, ""
+        if stan != GOTOWE:
+            _usun_plik(f.name)
+
+        with self._blokada:
+            zadanie.stan, zadanie.wynik, zadanie.blad = stan, wynik, blad
+            zadanie.sciezka = f.name if stan == GOTOWE else None
+            zadanie.zakonczono = time.monotonic()
+            if zadanie.id not in self._zadania:
+                # usunięte w trakcie generowania
+                _usun_plik(zadanie.sciezka)
+
+    def stan(self, id: str | None) -> Zadanie | None:
+        """Kopia stanu zadania lub None (nieznane albo usunięte po czasie przechowywania)."""
+        self.sprzataj()
+        with self._blokada:
+            zadanie = self._zadania.get(id)
+            return dataclasses.replace(zadanie) if zadanie is not None else None
+
+    def anuluj(self, id: str | None):
+        """Przerywa zadanie przy najbliższym wywołaniu postep() (zadania zakończone bez zmian)."""
+        with self._blokada:
+            zadanie = self._zadania.get(id)
+            if zadanie is not None and not zadanie.zakonczone:
+                zadanie.anulowanie = True
+
+    def usun(self, id: str | None):
+        """Anuluje zadanie i usuwa je wraz z plikiem."""
+        with self._blokada:
+            zadanie = self._zadania.pop(id, None)
+            if zadanie is None:
+                return
+            zadanie.anulowanie = True
+            _usun_plik(zadanie.sciezka)
+
+    def sprzataj(self):
+        """Usuwa zadania zakończone dawniej niż czas przechowywania (wraz z plikami)."""
+        granica = time.monotonic() - self.przechowywanie
+        with self._blokada:
+            for id in [i for i, z in self._zadania.items() if z.zakonczono is not None and z.zakonczono < granica]:
+                _usun_plik(self._zadania.pop(id).sciezka)
+
+    def zadania(self) -> list[Zadanie]:
+        """Kopie stanów wszystkich zadań (do podglądu)."""
+        self.sprzataj()
+        with self._blokada:
+            return [dataclasses.replace(z) for z in self._zadania.values()]
+
+    def zamknij(self):
+        """Anuluje zadania, czeka na wątki i usuwa wszystkie pliki."""
+        with self._blokada:
+            for zadanie in self._zadania.values():
+                zadanie.anulowanie = True
+        self._wykonawca.shutdown(wait=True, cancel_futures=True)
+        with self._blokada:
+            for zadanie in self._zadania.values():
+                _usun_plik(zadanie.sciezka)
+            self._zadania.clear()
+
+
+_PULA: PulaZadan | None = None
+_BLOKADA_PULI = threading.Lock()
+
+
+def Pula() -> PulaZadan:
+    """Wspólna pula procesu (tworzona przy pierwszym użyciu - import nie uruchamia wątków)."""
+    global _PULA
+    with _BLOKADA_PULI:
+        if _PULA is None:
+            _PULA = PulaZadan()
+        return _PULA
+
+
+if __name__ == "__main__":
+    def _raport(plik, n: int, postep=None) -> dict:
+        for i in range(1, n + 1):
+            time.sleep(0.01)
+            plik.write(b"%d\n" % i)
+            postep(i, n)
+        return {"wiersze": n}
+
+    def _blad(plik, postep=None):
+        raise ValueError("test")
+
+    pula = PulaZadan(przechowywanie=2.0)
+    t0 = time.perf_counter()
+    id = pula.zlec(_raport, 50, plik="test.txt")
+    id_anulowane = pula.zlec(_raport, 1000, plik="test.txt")
+    id_blad = pula.zlec(_blad, plik="test.txt")
+    t1 = time.perf_counter()
+
+    pula.anuluj(id_anulowane)
+    while not pula.stan(id).zakonczone:
+        time.sleep(0.02)
+    t2 = time.perf_counter()
+    while not all(pula.stan(i).zakonczone for i in (id_anulowane, id_blad)):
+        time.sleep(0.02)
+
+    zadanie = pula.stan(id)
+    assert zadanie.stan == GOTOWE and zadanie.wynik == {"wiersze": 50} and zadanie.dane().endswith(b"50\n")
+    assert pula.stan(id_anulowane).stan == ANULOWANE and pula.stan(id_anulowane).sciezka is None
+    assert pula.stan(id_blad).stan == BLAD and "ValueError" in pula.stan(id_blad).blad
+    print(f"Zlecenie: {(t1 - t0) * 1000:.2f} ms, zadanie (50 kroków): {(t2 - t0) * 1000:.0f} ms")
+
+    time.sleep(2.1)
+    assert pula.stan(id) is None and not os.path.exists(zadanie.sciezka)
+    pula.zamknij()
+    print("Pliki usunięte po czasie przechowywania")
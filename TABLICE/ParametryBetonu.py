@@ -1,6 +1,9 @@
 # TABLICE/ParametryBetonu.py
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache
+
+import numpy as np
 
 @dataclass(frozen=True)
 class ConcreteParams:
@@ -107,4 +110,29 @@ def get_concrete_params(klasa_betonu: str) -> ConcreteParams:
 
 def list_concrete_classes() -> list[str]:
     """Zwraca listę dostępnych klas betonu (do selectboxów w UI)."""
-    return list(CONCRETE_TABLE.keys())
\ No newline at end of file
+    return list(CONCRETE_TABLE.keys())
+
+
+@lru_cache(maxsize=1)
+def get_concrete_arrays() -> dict[str, np.ndarray]:
+    """
+    Tablica 3.1 w układzie kolumnowym: każdy parametr to tablica numpy
+    indeksowana kodem klasy (pozycja w CONCRETE_TABLE) - do obliczeń wsadowych.
+    """
+    klasy = list(CONCRETE_TABLE.values())
+    tablice = {
+        f.name: np.array([getattr(p, f.name) for p in klasy], dtype=np.float64)
+        for f in fields(ConcreteParams)
+    }
+    for t in tablice.values():
+        t.setflags(write=False)
+    return tablice
+
+
+def concrete_class_codes(klasy_betonu) -> np.ndarray:
+    """Kody klas (indeksy do get_concrete_arrays) dla listy nazw, np. ["C30/37"]."""
+    kody = {k: i for i, k in enumerate(CONCRETE_TABLE)}
+    try:
+        return np.array([kody[k] for k in np.atleast_1d(klasy_betonu)], dtype=np.int64)
+    except KeyError as exc:
+        raise KeyError(f"Nieznana klasa betonu: {exc.args[0]!r}.") from exc
\ No newline at end of file
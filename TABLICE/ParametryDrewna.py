@@ -0,0 +1,161 @@
+# TABLICE/ParametryDrewna.py
+
+from __future__ import annotations
+from dataclasses import dataclass, fields
+from functools import lru_cache
+
+import numpy as np
+
+@dataclass(frozen=True)
+class TimberParams:
+    """
+    Właściwości drewna wg PN-EN 338:2009 (lite) i PN-EN 14080:2013 (klejone).
+    Wytrzymałości w MPa, moduły w MPa, gęstości w kg/m³.
+    """
+    name: str          # Klasa, np. "C24", "GL24h"
+    glulam: bool       # True - drewno klejone warstwowo
+    fm_k: float        # Zginanie
+    ft0_k: float       # Rozciąganie wzdłuż włókien
+    ft90_k: float      # Rozciąganie w poprzek włókien
+    fc0_k: float       # Ściskanie wzdłuż włókien
+    fc90_k: float      # Ściskanie w poprzek włókien
+    fv_k: float        # Ścinanie
+    E0_mean: float     # Średni moduł sprężystości wzdłuż włókien
+    E0_05: float       # 5% kwantyl modułu sprężystości
+    E90_mean: float    # Średni moduł sprężystości w poprzek włókien
+    G_mean: float      # Średni moduł odkształcenia postaciowego
+    rho_k: float       # Gęstość charakterystyczna
+    rho_mean: float    # Gęstość średnia
+
+
+def _C(name, fm, ft0, ft90, fc0, fc90, fv, E0, E05, E90, G, rk, rm) -> TimberParams:
+    # PN-EN 338 podaje moduły w kN/mm²
+    return TimberParams(name, False, fm, ft0, ft90, fc0, fc90, fv,
+                        E0 * 1000, E05 * 1000, E90 * 1000, G * 1000, rk, rm)
+
+
+def _GL(name, fm, ft0, ft90, fc0, fc90, fv, E0, E05, E90, G, rk, rm) -> TimberParams:
+    return TimberParams(name, True, fm, ft0, ft90, fc0, fc90, fv, E0, E05, E90, G, rk, rm)
+
+
+TIMBER_TABLE: dict[str, TimberParams] = {p.name: p for p in (
+    # PN-EN 338:2009 - drewno lite iglaste
+    _C("C14", 14, 8, 0.4, 16, 2.0, 3.0, 7.0, 4.7, 0.23, 0.44, 290, 350),
+    _C("C16", 16, 10, 0.5, 17, 2.2, 3.2, 8.0, 5.4, 0.27, 0.50, 310, 370),
+    _C("C18", 18, 11, 0.5, 18, 2.2, 3.4, 9.0, 6.0, 0.30, 0.56, 320, 380),
+    _C("C20", 20, 12, 0.5, 19, 2.3, 3.6, 9.5, 6.4, 0.32, 0.59, 330, 390),
+    _C("C22", 22, 13, 0.5, 20, 2.4, 3.8, 10.0, 6.7, 0.33, 0.63, 340, 410),
+    _C("C24", 24, 14, 0.5, 21, 2.5, 4.0, 11.0, 7.4, 0.37, 0.69, 350, 420),
+    _C("C27", 27, 16, 0.6, 22, 2.6, 4.0, 11.5, 7.7, 0.38, 0.72, 370, 450),
+    _C("C30", 30, 18, 0.6, 23, 2.7, 4.0, 12.0, 8.0, 0.40, 0.75, 380, 460),
+    _C("C35", 35, 21, 0.6, 25, 2.8, 4.0, 13.0, 8.7, 0.43, 0.81, 400, 480),
+    _C("C40", 40, 24, 0.6, 26, 2.9, 4.0, 14.0, 9.4, 0.47, 0.88, 420, 500),
+    _C("C45", 45, 27, 0.6, 27, 3.1, 4.0, 15.0, 10.0, 0.50, 0.94, 440, 520),
+    _C("C50", 50, 30, 0.6, 29, 3.2, 4.0, 16.0, 10.7, 0.53, 1.00, 460, 550),
+    # PN-EN 14080:2013 - drewno klejone warstwowo (jednorodne "h" i kombinowane "c")
+    _GL("GL20h", 20, 16.0, 0.5, 20.0, 2.5, 3.5, 8400, 7000, 300, 650, 340, 370),
+    _GL("GL22h", 22, 17.6, 0.5, 22.0, 2.5, 3.5, 10500, 8800, 300, 650, 370, 410),
+    _GL("GL24h", 24, 19.2, 0.5, 24.0, 2.5, 3.5, 11500, 9600, 300, 650, 385, 420),
+    _GL("GL26h", 26, 20.8, 0.5, 26.0, 2.5, 3.5, 12100, 10100, 300, 650, 405, 445),
+    _GL("GL28h", 28, 22.3, 0.5, 28.0, 2.5, 3.5, 12600, 10500, 300, 650, 425, 460),
+    _GL("GL30h", 30, 24.0, 0.5, 30.0, 2.5, 3.5, 13600, 11300, 300, 650, 430, 480),
+    _GL("GL32h", 32, 25.6, 0.5, 32.0, 2.5, 3.5, 14200, 11800, 300, 650, 440, 490),
+    _GL("GL20c", 20, 15.0, 0.5, 18.5, 2.5, 3.5, 10400, 8600, 300, 650, 355, 390),
+    _GL("GL22c", 22, 16.0, 0.5, 20.0, 2.5, 3.5, 10400, 8600, 300, 650, 355, 390),
+    _GL("GL24c", 24, 17.0, 0.5, 21.5, 2.5, 3.5, 11000, 9100, 300, 650, 365, 400),
+    _GL("GL26c", 26, 19.0, 0.5, 23.5, 2.5, 3.5, 12000, 10000, 300, 650, 385, 420),
+    _GL("GL28c", 28, 19.5, 0.5, 24.0, 2.5, 3.5, 12500, 10400, 300, 650, 390, 420),
+    _GL("GL30c", 30, 19.5, 0.5, 24.5, 2.5, 3.5, 13000, 10800, 300, 650, 390, 430),
+    _GL("GL32c", 32, 19.5, 0.5, 24.5, 2.5, 3.5, 13500, 11200, 300, 650, 400, 440),
+)}
+
+# Klasy trwania obciążenia (PN-EN 1995-1-1, Tablica 2.1)
+LOAD_DURATION_CLASSES = ("stałe", "długotrwałe", "średniotrwałe", "krótkotrwałe", "chwilowe")
+
+# Klasy użytkowania (PN-EN 1995-1-1, 2.3.1.3)
+SERVICE_CLASSES = (1, 2, 3)
+
+# kmod [klasa użytkowania - 1, klasa trwania] - Tablica 3.1 (drewno lite i klejone)
+KMOD_TABLE = np.array([
+    [0.60, 0.70, 0.80, 0.90, 1.10],
+    [0.60, 0.70, 0.80, 0.90, 1.10],
+    [0.50, 0.55, 0.65, 0.70, 0.90],
+])
+KMOD_TABLE.setflags(write=False)
+
+# kdef [klasa użytkowania - 1] - Tablica 3.2 (drewno lite i klejone)
+KDEF_TABLE = np.array([0.60, 0.80, 2.00])
+KDEF_TABLE.setflags(write=False)
+
+# Częściowe współczynniki materiałowe γM - Tablica 2.3
+GAMMA_M_SOLID = 1.30
+GAMMA_M_GLULAM = 1.25
+
+
+def get_timber_params(name: str) -> TimberParams:
+    """
+    Zwraca właściwości drewna dla klasy wytrzymałości, np. "C24" lub "GL24h".
+    """
+    try:
+        return TIMBER_TABLE[name]
+    except KeyError as exc:
+        raise KeyError(
+            f"Nieznana klasa drewna: {name!r}. "
+            f"Dostępne: {', '.join(TIMBER_TABLE.keys())}"
+        ) from exc
+
+
+def list_timber_classes(glulam: bool | None = None) -> list[str]:
+    """Lista klas drewna (do selectboxów w UI); glulam=None - wszystkie."""
+    return [k for k, p in TIMBER_TABLE.items() if glulam is None or p.glulam == glulam]
+
+
+def get_kmod(service_class: int, duration: str) -> float:
+    """kmod dla klasy użytkowania (1-3) i klasy trwania obciążenia."""
+    return float(KMOD_TABLE[service_class - 1, LOAD_DURATION_CLASSES.index(duration)])
+
+
+def get_kdef(service_class: int) -> float:
+    """kdef dla klasy użytkowania (1-3)."""
+    return float(KDEF_TABLE[service_class - 1])
+
+
+def get_gamma_M(name: str) -> float:
+    """γM dla klasy drewna."""
+    return GAMMA_M_GLULAM if get_timber_params(name).glulam else GAMMA_M_SOLID
+
+
+@lru_cache(maxsize=1)
+def get_timber_arrays() -> dict[str, np.ndarray]:
+    """
+    Tabela klas w układzie kolumnowym: każda właściwość to tablica numpy
+    indeksowana kodem klasy (pozycja w TIMBER_TABLE), plus kolumna gamma_M.
+    Służy do obliczeń wsadowych - kod klasy zamienia wyszukiwanie po nazwie
+    na indeksowanie tablic.
+    """
+    klasy = list(TIMBER_TABLE.values())
+    tablice = {
+        f.name: np.array([getattr(p, f.name) for p in klasy])
+        for f in fields(TimberParams)
+    }
+    tablice["gamma_M"] = np.where(tablice["glulam"], GAMMA_M_GLULAM, GAMMA_M_SOLID)
+    for t in tablice.values():
+        t.setflags(write=False)
+    return tablice
+
+
+def timber_class_codes(names) -> np.ndarray:
+    """Kody klas (indeksy do get_timber_arrays) dla listy nazw."""
+    kody = {k: i for i, k in enumerate(TIMBER_TABLE)}
+    try:
+        return np.array([kody[n] for n in np.atleast_1d(names)], dtype=np.int64)
+    except KeyError as exc:
+        raise KeyError(f"Nieznana klasa drewna: {exc.args[0]!r}.") from exc
+
+
+if __name__ == '__main__':
+    print("--- Klasy drewna (EC5) ---")
+    for k, p in TIMBER_TABLE.items():
+        print(f"{k:6s} | fm,k = {p.fm_k:4.1f} MPa | E0,mean = {p.E0_mean:7.0f} MPa | "
+              f"ρk = {p.rho_k:.0f} kg/m³ | γM = {get_gamma_M(k)}")
+    print(f"\nkmod (kl. 2, średniotrwałe) = {get_kmod(2, 'średniotrwałe')}, kdef (kl. 2) = {get_kdef(2)}")
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 import math
 
+import numpy as np
+
 @dataclass(frozen=True)
 class ParametryPreta:
     """
@@ -62,6 +65,34 @@ def list_bar_diameters() -> list[int]:
     """
     return sorted(list(PARAMETRY_PRETOW.keys()))
 
+@lru_cache(maxsize=1)
+def get_bar_arrays() -> dict[str, np.ndarray]:
+    """
+    Parametry prętów w układzie kolumnowym (rosnąco wg średnicy):
+    "fi" [mm], "As" [mm²], "masa_liniowa" [kg/m] - do obliczeń wsadowych.
+    """
+    srednice = list_bar_diameters()
+    tablice = {
+        "fi": np.array(srednice, dtype=np.int64),
+        "As": np.array([PARAMETRY_PRETOW[fi].As for fi in srednice]),
+        "masa_liniowa": np.array([PARAMETRY_PRETOW[fi].masa_liniowa for fi in srednice]),
+    }
+    for t in tablice.values():
+        t.setflags(write=False)
+    return tablice
+
+def bar_indices(fi_mm) -> np.ndarray:
+    """
+    Indeksy (do get_bar_arrays) dla tablicy średnic; ValueError dla średnicy spoza tabeli.
+    """
+    fi = get_bar_arrays()["fi"]
+    fi_mm = np.asarray(fi_mm)
+    idx = np.clip(np.searchsorted(fi, fi_mm), 0, len(fi) - 1)
+    if not np.all(fi[idx] == fi_mm):
+        zle = np.unique(fi_mm[fi[idx] != fi_mm])
+        raise ValueError(f"Nieznana średnica pręta: {', '.join(str(z) for z in zle)} mm.")
+    return idx
+
 if __name__ == '__main__':
     print("--- Parametry prętów zbrojeniowych (EC2) ---")
     for fi, params in PARAMETRY_PRETOW.items():
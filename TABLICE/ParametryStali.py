@@ -50,4 +50,46 @@ def get_steel_params(grade: str) -> SteelParams:
 
 def list_steel_grades() -> list[str]:
     """Lista dostępnych gatunków stali (do selectboxów w UI)."""
-    return list(STEEL_TABLE.keys())
\ No newline at end of file
+    return list(STEEL_TABLE.keys())
+
+@dataclass(frozen=True)
+class StructuralSteelParams:
+    """
+    Parametry stali konstrukcyjnej wg PN-EN 1993-1-1, Tablica 3.1.
+    """
+    grade: str     # np. "S355"
+    fy: float      # granica plastyczności dla t <= 40 mm [MPa]
+    fu: float      # wytrzymałość na rozciąganie dla t <= 40 mm [MPa]
+    fy_40: float   # granica plastyczności dla 40 < t <= 80 mm [MPa]
+    fu_40: float   # wytrzymałość na rozciąganie dla 40 < t <= 80 mm [MPa]
+    E: float = 210_000.0  # moduł sprężystości [MPa]
+    G: float = 81_000.0   # moduł odkształcenia postaciowego [MPa]
+
+    def fy_for_thickness(self, t_mm: float) -> float:
+        """Granica plastyczności dla grubości ścianki t [mm]."""
+        return self.fy if t_mm <= 40.0 else self.fy_40
+
+# EN 10025-2 (S235–S355) oraz EN 10025-4 (S420, S460)
+STRUCTURAL_STEEL_TABLE: dict[str, StructuralSteelParams] = {
+    "S235": StructuralSteelParams(grade="S235", fy=235.0, fu=360.0, fy_40=215.0, fu_40=360.0),
+    "S275": StructuralSteelParams(grade="S275", fy=275.0, fu=430.0, fy_40=255.0, fu_40=410.0),
+    "S355": StructuralSteelParams(grade="S355", fy=355.0, fu=490.0, fy_40=335.0, fu_40=470.0),
+    "S420": StructuralSteelParams(grade="S420", fy=420.0, fu=520.0, fy_40=390.0, fu_40=500.0),
+    "S460": StructuralSteelParams(grade="S460", fy=460.0, fu=540.0, fy_40=430.0, fu_40=530.0),
+}
+
+def get_structural_steel_params(grade: str) -> StructuralSteelParams:
+    """
+    Zwraca parametry stali konstrukcyjnej dla danego gatunku, np. "S355".
+    """
+    try:
+        return STRUCTURAL_STEEL_TABLE[grade]
+    except KeyError as exc:
+        raise KeyError(
+            f"Nieznany gatunek stali konstrukcyjnej: {grade!r}. "
+            f"Dostępne: {', '.join(STRUCTURAL_STEEL_TABLE.keys())}"
+        ) from exc
+
+def list_structural_steel_grades() -> list[str]:
+    """Lista dostępnych gatunków stali konstrukcyjnej (do selectboxów w UI)."""
+    return list(STRUCTURAL_STEEL_TABLE.keys())
\ No newline at end of file
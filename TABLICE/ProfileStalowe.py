@@ -0,0 +1,322 @@
+# TABLICE/ProfileStalowe.py
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from functools import lru_cache
+import math
+
+import numpy as np
+
+# Gęstość stali (przyjęta 7850 kg/m³)
+GESTOSC_STALI = 7850.0  # [kg/m³]
+
+# -----------------------------------------------------------------------------
+# Wymiary nominalne profili (mm)
+# I, U: (h, b, tw, tf, r)   RHS/SHS: (h, b, t)   CHS: (D, t)
+# Półki UPN przyjęte jako równoległe o średniej grubości tf.
+# -----------------------------------------------------------------------------
+_IPE = {
+    "80": (80, 46, 3.8, 5.2, 5), "100": (100, 55, 4.1, 5.7, 7),
+    "120": (120, 64, 4.4, 6.3, 7), "140": (140, 73, 4.7, 6.9, 7),
+    "160": (160, 82, 5.0, 7.4, 9), "180": (180, 91, 5.3, 8.0, 9),
+    "200": (200, 100, 5.6, 8.5, 12), "220": (220, 110, 5.9, 9.2, 12),
+    "240": (240, 120, 6.2, 9.8, 15), "270": (270, 135, 6.6, 10.2, 15),
+    "300": (300, 150, 7.1, 10.7, 15), "330": (330, 160, 7.5, 11.5, 18),
+    "360": (360, 170, 8.0, 12.7, 18), "400": (400, 180, 8.6, 13.5, 21),
+    "450": (450, 190, 9.4, 14.6, 21), "500": (500, 200, 10.2, 16.0, 21),
+    "550": (550, 210, 11.1, 17.2, 24), "600": (600, 220, 12.0, 19.0, 24),
+}
+
+_HEA = {
+    "100": (96, 100, 5.0, 8.0, 12), "120": (114, 120, 5.0, 8.0, 12),
+    "140": (133, 140, 5.5, 8.5, 12), "160": (152, 160, 6.0, 9.0, 15),
+    "180": (171, 180, 6.0, 9.5, 15), "200": (190, 200, 6.5, 10.0, 18),
+    "220": (210, 220, 7.0, 11.0, 18), "240": (230, 240, 7.5, 12.0, 21),
+    "260": (250, 260, 7.5, 12.5, 24), "280": (270, 280, 8.0, 13.0, 24),
+    "300": (290, 300, 8.5, 14.0, 27), "320": (310, 300, 9.0, 15.5, 27),
+    "340": (330, 300, 9.5, 16.5, 27), "360": (350, 300, 10.0, 17.5, 27),
+    "400": (390, 300, 11.0, 19.0, 27), "450": (440, 300, 11.5, 21.0, 27),
+    "500": (490, 300, 12.0, 23.0, 27), "550": (540, 300, 12.5, 24.0, 27),
+    "600": (590, 300, 13.0, 25.0, 27),
+}
+
+_HEB = {
+    "100": (100, 100, 6.0, 10.0, 12), "120": (120, 120, 6.5, 11.0, 12),
+    "140": (140, 140, 7.0, 12.0, 12), "160": (160, 160, 8.0, 13.0, 15),
+    "180": (180, 180, 8.5, 14.0, 15), "200": (200, 200, 9.0, 15.0, 18),
+    "220": (220, 220, 9.5, 16.0, 18), "240": (240, 240, 10.0, 17.0, 21),
+    "260": (260, 260, 10.0, 17.5, 24), "280": (280, 280, 10.5, 18.0, 24),
+    "300": (300, 300, 11.0, 19.0, 27), "320": (320, 300, 11.5, 20.5, 27),
+    "340": (340, 300, 12.0, 21.5, 27), "360": (360, 300, 12.5, 22.5, 27),
+    "400": (400, 300, 13.5, 24.0, 27), "450": (450, 300, 14.0, 26.0, 27),
+    "500": (500, 300, 14.5, 28.0, 27), "550": (550, 300, 15.0, 29.0, 27),
+    "600": (600, 300, 15.5, 30.0, 27),
+}
+
+_UPN = {
+    "80": (80, 45, 6.0, 8.0, 8.0), "100": (100, 50, 6.0, 8.5, 8.5),
+    "120": (120, 55, 7.0, 9.0, 9.0), "140": (140, 60, 7.0, 10.0, 10.0),
+    "160": (160, 65, 7.5, 10.5, 10.5), "180": (180, 70, 8.0, 11.0, 11.0),
+    "200": (200, 75, 8.5, 11.5, 11.5), "220": (220, 80, 9.0, 12.5, 12.5),
+    "240": (240, 85, 9.5, 13.0, 13.0), "260": (260, 90, 10.0, 14.0, 14.0),
+    "280": (280, 95, 10.0, 15.0, 15.0), "300": (300, 100, 10.0, 16.0, 16.0),
+}
+
+_SHS = [
+    (40, 40, 3), (40, 40, 4), (50, 50, 3), (50, 50, 4), (50, 50, 5),
+    (60, 60, 4), (60, 60, 5), (70, 70, 4), (70, 70, 5), (80, 80, 4),
+    (80, 80, 5), (80, 80, 6), (90, 90, 5), (90, 90, 6), (100, 100, 5),
+    (100, 100, 6), (100, 100, 8), (120, 120, 5), (120, 120, 6), (120, 120, 8),
+    (120, 120, 10), (140, 140, 6), (140, 140, 8), (140, 140, 10), (150, 150, 6),
+    (150, 150, 8), (150, 150, 10), (160, 160, 6), (160, 160, 8), (160, 160, 10),
+    (180, 180, 8), (180, 180, 10), (200, 200, 8), (200, 200, 10), (200, 200, 12.5),
+    (250, 250, 10), (250, 250, 12.5), (300, 300, 10), (300, 300, 12.5),
+]
+
+_RHS = [
+    (80, 40, 4), (100, 50, 4), (100, 50, 5), (120, 60, 4), (120, 60, 5),
+    (120, 60, 6), (120, 80, 5), (120, 80, 6), (140, 80, 5), (140, 80, 6),
+    (150, 100, 5), (150, 100, 6), (150, 100, 8), (160, 80, 5), (160, 80, 6),
+    (180, 100, 6), (180, 100, 8), (200, 100, 6), (200, 100, 8), (200, 100, 10),
+    (200, 120, 6), (200, 120, 8), (200, 120, 10), (250, 150, 8), (250, 150, 10),
+    (300, 200, 8), (300, 200, 10), (300, 200, 12.5),
+]
+
+_CHS = [
+    (33.7, 3.2), (42.4, 3.2), (48.3, 3.2), (48.3, 4.0), (60.3, 3.2), (60.3, 4.0),
+    (76.1, 3.2), (76.1, 4.0), (88.9, 4.0), (88.9, 5.0), (101.6, 4.0), (101.6, 5.0),
+    (114.3, 4.0), (114.3, 5.0), (114.3, 6.3), (139.7, 5.0), (139.7, 6.3),
+    (168.3, 5.0), (168.3, 6.3), (168.3, 8.0), (193.7, 6.3), (193.7, 8.0),
+    (219.1, 6.3), (219.1, 8.0), (219.1, 10.0), (244.5, 8.0), (244.5, 10.0),
+    (273.0, 8.0), (273.0, 10.0), (323.9, 8.0), (323.9, 10.0), (355.6, 10.0),
+    (406.4, 10.0),
+]
+
+# Kolumny biblioteki (jednostki: mm, mm², mm³, mm⁴, mm⁶, kg/m)
+SECTION_COLUMNS = (
+    "h", "b", "tw", "tf", "r", "A", "mass", "Iy", "Iz", "Wel_y", "Wel_z",
+    "Wpl_y", "Wpl_z", "iy", "iz", "It", "Iw", "Avz",
+)
+
+# Kształty przekrojów (kody w kolumnie "shape")
+SHAPES = ("I", "U", "RHS", "CHS")
+
+# -----------------------------------------------------------------------------
+# Charakterystyki geometryczne liczone z wymiarów
+# -----------------------------------------------------------------------------
+_K_NAROZE = 1.0 - math.pi / 4.0                  # pole wyokrąglenia / r²
+_E_NAROZE = (10.0 - 3.0 * math.pi) / (12.0 - 3.0 * math.pi)  # środek ciężkości wyokrąglenia / r
+
+
+def _props_I(h, b, tw, tf, r) -> dict:
+    hw = h - 2 * tf
+    Af = _K_NAROZE * r ** 2                      # pole jednego wyokrąglenia
+    yf = h / 2 - tf - _E_NAROZE * r              # odległość wyokrąglenia od osi y
+    zf = tw / 2 + _E_NAROZE * r                  # odległość wyokrąglenia od osi z
+
+    A = 2 * b * tf + hw * tw + 4 * Af
+    Iy = (b * h ** 3 - (b - tw) * hw ** 3) / 12 + 4 * Af * yf ** 2
+    Iz = (2 * tf * b ** 3 + hw * tw ** 3) / 12 + 4 * Af * zf ** 2
+    Wpl_y = b * tf * (h - tf) + tw * hw ** 2 / 4 + 4 * Af * yf
+    Wpl_z = tf * b ** 2 / 2 + hw * tw ** 2 / 4 + 4 * Af * zf
+    # Stała St. Venanta z udziałem wyokrągleń (wzór katalogowy dla profili walcowanych)
+    alfa = ((r + tw / 2) ** 2 + (r + tf) ** 2 - r ** 2) / (2 * r + tf)
+    It = (2 / 3 * (b - 0.63 * tf) * tf ** 3 + (h - 2 * tf) * tw ** 3 / 3
+          + 2 * (tw / tf) * (0.145 + 0.1 * r / tf) * alfa ** 4)
+    Iw = Iz * (h - tf) ** 2 / 4
+    Avz = max(A - 2 * b * tf + (tw + 2 * r) * tf, hw * tw)
+    return dict(A=A, Iy=Iy, Iz=Iz, Wel_y=2 * Iy / h, Wel_z=2 * Iz / b,
+                Wpl_y=Wpl_y, Wpl_z=Wpl_z, It=It, Iw=Iw, Avz=Avz)
+
+
+def _props_U(h, b, tw, tf, r) -> dict:
+    hw = h - 2 * tf
+    Af = _K_NAROZE * r ** 2
+    yf = h / 2 - tf - _E_NAROZE * r
+
+    A = 2 * b * tf + hw * tw + 2 * Af
+    Iy = (b * h ** 3 - (b - tw) * hw ** 3) / 12 + 2 * Af * yf ** 2
+    Wpl_y = b * tf * (h - tf) + tw * hw ** 2 / 4 + 2 * Af * yf
+
+    # Oś z - środek ciężkości mierzony od grzbietu środnika (bez wyokrągleń)
+    A0 = 2 * b * tf + hw * tw
+    xc = (b * b * tf + hw * tw * tw / 2) / A0
+    Iz = (2 * (tf * b ** 3 / 12 + b * tf * (b / 2 - xc) ** 2)
+          + hw * (tw ** 3 / 12 + tw * (tw / 2 - xc) ** 2))
+    # Plastyczna oś obojętna dzieli pole na połowy
+    if h * tw >= A0 / 2:
+        xp = A0 / (2 * h)
+        Wpl_z = h * xp ** 2 / 2 + h * (tw - xp) ** 2 / 2 + 2 * tf * (b - tw) * ((b + tw) / 2 - xp)
+    else:
+        xp = tw + (A0 / 2 - h * tw) / (2 * tf)
+        Wpl_z = (h * tw * (xp - tw / 2) + 2 * tf * (xp - tw) ** 2 / 2
+                 + 2 * tf * (b - xp) ** 2 / 2)
+
+    It = (2 * b * tf ** 3 + hw * tw ** 3) / 3
+    bs, hs = b - tw / 2, h - tf
+    Iw = tf * bs ** 3 * hs ** 2 / 12 * (3 * bs * tf + 2 * hs * tw) / (6 * bs * tf + hs * tw)
+    Avz = max(A - 2 * b * tf + (tw + r) * tf, hw * tw)
+    return dict(A=A, Iy=Iy, Iz=Iz, Wel_y=2 * Iy / h, Wel_z=Iz / (b - xc),
+                Wpl_y=Wpl_y, Wpl_z=Wpl_z, It=It, Iw=Iw, Avz=Avz)
+
+
+def _props_RHS(h, b, t) -> dict:
+    # Rury gorącowykończone wg EN 10210-2: ro = 1.5 t, ri = 1.0 t
+    ro, ri = 1.5 * t, 1.0 * t
+    dA = _K_NAROZE * (ro ** 2 - ri ** 2)         # ubytek pola w jednym narożu
+    e = _E_NAROZE * ro
+
+    A = 2 * t * (b + h - 2 * t) - 4 * dA
+    Iy = (b * h ** 3 - (b - 2 * t) * (h - 2 * t) ** 3) / 12 - 4 * dA * (h / 2 - e) ** 2
+    Iz = (h * b ** 3 - (h - 2 * t) * (b - 2 * t) ** 3) / 12 - 4 * dA * (b / 2 - e) ** 2
+    Wpl_y = (b * h ** 2 - (b - 2 * t) * (h - 2 * t) ** 2) / 4 - 4 * dA * (h / 2 - e)
+    Wpl_z = (h * b ** 2 - (h - 2 * t) * (b - 2 * t) ** 2) / 4 - 4 * dA * (b / 2 - e)
+
+    Rc = (ro + ri) / 2
+    p = 2 * ((b - t) + (h - t)) - 2 * Rc * (4 - math.pi)
+    Am = (b - t) * (h - t) - Rc ** 2 * (4 - math.pi)
+    It = 4 * Am ** 2 * t / p
+    return dict(A=A, Iy=Iy, Iz=Iz, Wel_y=2 * Iy / h, Wel_z=2 * Iz / b,
+                Wpl_y=Wpl_y, Wpl_z=Wpl_z, It=It, Iw=0.0, Avz=A * h / (b + h))
+
+
+def _props_CHS(D, t) -> dict:
+    d = D - 2 * t
+    A = math.pi * (D ** 2 - d ** 2) / 4
+    I = math.pi * (D ** 4 - d ** 4) / 64
+    Wpl = (D ** 3 - d ** 3) / 6
+    return dict(A=A, Iy=I, Iz=I, Wel_y=2 * I / D, Wel_z=2 * I / D,
+                Wpl_y=Wpl, Wpl_z=Wpl, It=2 * I, Iw=0.0, Avz=2 * A / math.pi)
+
+
+def _wiersze_biblioteki() -> list[tuple[str, str, str, dict]]:
+    """(nazwa, rodzina, kształt, kolumny) dla wszystkich profili."""
+    wiersze = []
+    for rodzina, tabela, ksztalt in (("IPE", _IPE, "I"), ("HEA", _HEA, "I"),
+                                     ("HEB", _HEB, "I"), ("UPN", _UPN, "U")):
+        funkcja = _props_I if ksztalt == "I" else _props_U
+        for rozmiar, (h, b, tw, tf, r) in tabela.items():
+            kol = dict(h=h, b=b, tw=tw, tf=tf, r=r, **funkcja(h, b, tw, tf, r))
+            wiersze.append((f"{rodzina} {rozmiar}", rodzina, ksztalt, kol))
+
+    for rodzina, lista in (("SHS", _SHS), ("RHS", _RHS)):
+        for h, b, t in lista:
+            kol = dict(h=h, b=b, tw=t, tf=t, r=1.5 * t, **_props_RHS(h, b, t))
+            wiersze.append((f"{rodzina} {h:g}x{b:g}x{t:g}", rodzina, "RHS", kol))
+
+    for D, t in _CHS:
+        kol = dict(h=D, b=D, tw=t, tf=t, r=0.0, **_props_CHS(D, t))
+        wiersze.append((f"CHS {D:g}x{t:g}", "CHS", "CHS", kol))
+
+    for _, _, _, kol in wiersze:
+        kol["mass"] = kol["A"] * 1e-6 * GESTOSC_STALI
+        kol["iy"] = math.sqrt(kol["Iy"] / kol["A"])
+        kol["iz"] = math.sqrt(kol["Iz"] / kol["A"])
+    return wiersze
+
+# -----------------------------------------------------------------------------
+# Biblioteka kolumnowa
+# -----------------------------------------------------------------------------
+
+@dataclass(frozen=True, eq=False)
+class SectionLibrary:
+    """
+    Kolumnowa biblioteka profili stalowych.
+    - Każda charakterystyka to osobna tablica numpy (jeden wiersz = jeden profil),
+      więc obliczenia dla wielu profili to operacje na całych kolumnach.
+    - Wiersze posortowane rosnąco wg masy (stabilnie), dzięki czemu indeksy
+      profili jednej rodziny są od razu uporządkowane od najlżejszego.
+    """
+    names: np.ndarray                  # Oznaczenia, np. "IPE 200"
+    families: np.ndarray               # Rodzina, np. "IPE"
+    shapes: np.ndarray                 # Kształt: "I", "U", "RHS", "CHS"
+    columns: dict[str, np.ndarray]     # Charakterystyki (SECTION_COLUMNS)
+    index: dict[str, int] = field(repr=False)  # Oznaczenie -> numer wiersza
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    def row(self, name: str) -> int:
+        """Numer wiersza profilu o danym oznaczeniu."""
+        try:
+            return self.index[name]
+        except KeyError as exc:
+            raise KeyError(f"Nieznany profil: {name!r}.") from exc
+
+    def rows(self, names) -> np.ndarray:
+        """Numery wierszy dla listy oznaczeń."""
+        return np.array([self.row(n) for n in names], dtype=np.int64)
+
+    def family_rows(self, family: str) -> np.ndarray:
+        """Numery wierszy profili rodziny - od najlżejszego."""
+        return np.flatnonzero(self.families == family)
+
+
+@lru_cache(maxsize=1)
+def get_section_library() -> SectionLibrary:
+    """
+    Zwraca (jednorazowo budowaną) bibliotekę profili posortowaną wg masy.
+    """
+    wiersze = _wiersze_biblioteki()
+    masy = np.array([w[3]["mass"] for w in wiersze])
+    kolejnosc = np.argsort(masy, kind="stable")
+    wiersze = [wiersze[i] for i in kolejnosc]
+
+    names = np.array([w[0] for w in wiersze])
+    columns = {}
+    for kol in SECTION_COLUMNS:
+        tablica = np.array([w[3][kol] for w in wiersze], dtype=np.float64)
+        tablica.setflags(write=False)
+        columns[kol] = tablica
+
+    return SectionLibrary(
+        names=names,
+        families=np.array([w[1] for w in wiersze]),
+        shapes=np.array([w[2] for w in wiersze]),
+        columns=columns,
+        index={n: i for i, n in enumerate(names)},
+    )
+
+
+def get_section_params(name: str) -> dict[str, float]:
+    """
+    Zwraca charakterystyki pojedynczego profilu, np. "HEB 200".
+    """
+    lib = get_section_library()
+    i = lib.row(name)
+    wynik = {kol: float(lib.columns[kol][i]) for kol in SECTION_COLUMNS}
+    wynik["shape"] = str(lib.shapes[i])
+    return wynik
+
+
+def list_section_families() -> list[str]:
+    """Lista dostępnych rodzin profili (do selectboxów w UI)."""
+    return ["IPE", "HEA", "HEB", "UPN", "RHS", "SHS", "CHS"]
+
+
+def list_sections(family: str) -> list[str]:
+    """
+    Lista oznaczeń profili danej rodziny w kolejności katalogowej.
+    """
+    lib = get_section_library()
+    wiersze = lib.family_rows(family)
+    if wiersze.size == 0:
+        raise KeyError(f"Nieznana rodzina profili: {family!r}.")
+    # Kolejność katalogowa: wg wysokości, potem szerokości i grubości
+    klucz = np.lexsort((lib["tf"][wiersze], lib["b"][wiersze], lib["h"][wiersze]))
+    return [str(n) for n in lib.names[wiersze[klucz]]]
+
+
+if __name__ == '__main__':
+    lib = get_section_library()
+    print(f"--- Biblioteka profili stalowych: {len(lib)} pozycji ---")
+    for nazwa in ("IPE 200", "HEA 200", "HEB 300", "UPN 200", "SHS 100x100x5", "CHS 168.3x6.3"):
+        p = get_section_params(nazwa)
+        print(
+            f"{nazwa:15s} | A = {p['A'] / 100:7.2f} cm² | m = {p['mass']:6.1f} kg/m | "
+            f"Iy = {p['Iy'] / 1e4:9.1f} cm⁴ | Wpl,y = {p['Wpl_y'] / 1e3:7.1f} cm³ | "
+            f"It = {p['It'] / 1e4:7.2f} cm⁴"
+        )
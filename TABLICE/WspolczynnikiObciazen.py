@@ -0,0 +1,56 @@
+# TABLICE/WspolczynnikiObciazen.py
+
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class LoadCategoryParams:
+    """
+    Współczynniki kombinacyjne ψ oddziaływań zmiennych wg PN-EN 1990, Tablica A1.1.
+    """
+    kategoria: str  # Klucz kategorii, np. "A"
+    opis: str       # Opis do selectboxów w UI
+    psi0: float     # Wartość kombinacyjna
+    psi1: float     # Wartość częsta
+    psi2: float     # Wartość prawie stała
+
+
+# Częściowe współczynniki bezpieczeństwa wg PN-EN 1990, Tablica A1.2(B) (+ NA)
+GAMMA_G_SUP = 1.35  # Oddziaływania stałe niekorzystne
+GAMMA_G_INF = 1.00  # Oddziaływania stałe korzystne
+GAMMA_Q = 1.50      # Oddziaływania zmienne niekorzystne
+XI = 0.85           # Współczynnik redukcyjny ξ (wzór 6.10b)
+
+
+# Tablica A1.1 wg PN-EN 1990 (budynki)
+LOAD_CATEGORY_TABLE: dict[str, LoadCategoryParams] = {
+    "A": LoadCategoryParams("A", "Kat. A – powierzchnie mieszkalne", psi0=0.7, psi1=0.5, psi2=0.3),
+    "B": LoadCategoryParams("B", "Kat. B – powierzchnie biurowe", psi0=0.7, psi1=0.5, psi2=0.3),
+    "C": LoadCategoryParams("C", "Kat. C – miejsca zebrań", psi0=0.7, psi1=0.7, psi2=0.6),
+    "D": LoadCategoryParams("D", "Kat. D – powierzchnie handlowe", psi0=0.7, psi1=0.7, psi2=0.6),
+    "E": LoadCategoryParams("E", "Kat. E – powierzchnie magazynowe", psi0=1.0, psi1=0.9, psi2=0.8),
+    "F": LoadCategoryParams("F", "Kat. F – ruch pojazdów ≤ 30 kN", psi0=0.7, psi1=0.7, psi2=0.6),
+    "G": LoadCategoryParams("G", "Kat. G – ruch pojazdów 30–160 kN", psi0=0.7, psi1=0.5, psi2=0.3),
+    "H": LoadCategoryParams("H", "Kat. H – dachy", psi0=0.0, psi1=0.0, psi2=0.0),
+    "S": LoadCategoryParams("S", "Śnieg (H ≤ 1000 m n.p.m.)", psi0=0.5, psi1=0.2, psi2=0.0),
+    "S1000": LoadCategoryParams("S1000", "Śnieg (H > 1000 m n.p.m.)", psi0=0.7, psi1=0.5, psi2=0.2),
+    "W": LoadCategoryParams("W", "Wiatr", psi0=0.6, psi1=0.2, psi2=0.0),
+    "T": LoadCategoryParams("T", "Temperatura (bez pożaru)", psi0=0.6, psi1=0.5, psi2=0.0),
+}
+
+
+def get_load_category_params(kategoria: str) -> LoadCategoryParams:
+    """
+    Zwraca współczynniki ψ dla podanej kategorii oddziaływania, np. "B".
+    """
+    try:
+        return LOAD_CATEGORY_TABLE[kategoria]
+    except KeyError as exc:
+        raise KeyError(
+            f"Nieznana kategoria oddziaływania: {kategoria!r}. "
+            f"Dostępne: {', '.join(LOAD_CATEGORY_TABLE.keys())}"
+        ) from exc
+
+
+def list_load_categories() -> list[str]:
+    """Zwraca listę dostępnych kategorii oddziaływań (do selectboxów w UI)."""
+    return list(LOAD_CATEGORY_TABLE.keys())
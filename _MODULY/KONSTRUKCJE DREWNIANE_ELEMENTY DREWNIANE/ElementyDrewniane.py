@@ -0,0 +1,270 @@
+"""
+PROGRAMY/ElementyDrewniane.py
+Nośność i ugięcia prętów drewnianych o przekroju prostokątnym wg PN-EN 1995-1-1
+(obliczenia wsadowe)
+
+Każdy argument może być tablicą (jeden element = jeden pręt lub wariant
+obciążenia); wszystko jest liczone przez broadcast numpy, a klasy drewna,
+klasy użytkowania i klasy trwania obciążenia to indeksy do tablic
+z TABLICE.ParametryDrewna:
+- zginanie z kh i kcrit (6.1.6, 6.3.3),
+- ścinanie z kcr (6.1.7),
+- ściskanie z wyboczeniem kc (6.3.2) i interakcja N + M (6.23, 6.24, 6.35),
+- ugięcie belki swobodnie podpartej z pełzaniem (2.3.2.2, 7.2).
+Jednostki wejścia: b, h [mm], długości [m], M [kNm], V, N [kN], q [kN/m].
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# --- KONFIGURACJA ŚCIEŻEK (SZUKAMY KATALOGU KALKULATORY) ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+if SCIEZKA_BAZOWA is None:
+    # Fallback – dwa poziomy wyżej
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+if str(SCIEZKA_BAZOWA) not in sys.path:
+    sys.path.append(str(SCIEZKA_BAZOWA))
+
+from TABLICE.ParametryDrewna import (
+    KDEF_TABLE,
+    KMOD_TABLE,
+    LOAD_DURATION_CLASSES,
+    get_timber_arrays,
+    timber_class_codes,
+)
+
+# Współczynnik pęknięć przy ścinaniu (6.1.7(2), NA)
+K_CR = 0.67
+
+# Współczynnik km dla przekrojów prostokątnych (6.1.6(2))
+K_M = 0.7
+
+# Współczynnik βc prostoliniowości (6.29): lite / klejone
+BETA_C_SOLID = 0.2
+BETA_C_GLULAM = 0.1
+
+# =============================================================================
+# POMOCNICZE
+# =============================================================================
+
+def _kody_trwania(trwanie) -> np.ndarray:
+    trwanie = np.asarray(trwanie)
+    if trwanie.dtype.kind in "US":
+        kody = {k: i for i, k in enumerate(LOAD_DURATION_CLASSES)}
+        try:
+            return np.vectorize(kody.__getitem__, otypes=[np.int64])(trwanie)
+        except KeyError as exc:
+            raise KeyError(f"Nieznana klasa trwania obciążenia: {exc.args[0]!r}.") from exc
+    return trwanie.astype(np.int64)
+
+
+def _kody_klas(klasa) -> np.ndarray:
+    klasa = np.asarray(klasa)
+    if klasa.dtype.kind in "US":
+        return timber_class_codes(klasa.ravel()).reshape(klasa.shape)
+    return klasa.astype(np.int64)
+
+
+def WspolczynnikKh(h: np.ndarray, klejone: np.ndarray) -> np.ndarray:
+    """Współczynnik wysokości kh (3.2(3) i 3.3(3)); h [mm]."""
+    kh_lite = np.where(h < 150.0, np.minimum((150.0 / h) ** 0.2, 1.3), 1.0)
+    kh_klej = np.where(h < 600.0, np.minimum((600.0 / h) ** 0.1, 1.1), 1.0)
+    return np.where(klejone, kh_klej, kh_lite)
+
+
+def WspolczynnikKcrit(lam_rel_m: np.ndarray) -> np.ndarray:
+    """Współczynnik zwichrzenia kcrit (6.34)."""
+    return np.select(
+        [lam_rel_m <= 0.75, lam_rel_m <= 1.4],
+        [1.0, 1.56 - 0.75 * lam_rel_m],
+        default=1.0 / np.maximum(lam_rel_m, 1e-9) ** 2,
+    )
+
+
+def WspolczynnikKc(lam_rel: np.ndarray, beta_c: np.ndarray) -> np.ndarray:
+    """Współczynnik wyboczeniowy kc (6.25 - 6.29)."""
+    k = 0.5 * (1.0 + beta_c * (lam_rel - 0.3) + lam_rel ** 2)
+    kc = 1.0 / (k + np.sqrt(np.maximum(k ** 2 - lam_rel ** 2, 0.0)))
+    return np.where(lam_rel <= 0.3, 1.0, np.minimum(kc, 1.0))
+
+# =============================================================================
+# SPRAWDZENIE ELEMENTÓW
+# =============================================================================
+
+def SprawdzElementyDrewniane(
+    klasa,
+    b,
+    h,
+    L,
+    klasa_uzytkowania=1,
+    trwanie="średniotrwałe",
+    M_Ed=0.0,
+    V_Ed=0.0,
+    N_Ed=0.0,
+    L_c_y=None,
+    L_c_z=None,
+    l_ef=None,
+    q_G_k=0.0,
+    q_Q_k=0.0,
+    psi2=0.3,
+    limit_ugiecia=250.0,
+) -> dict:
+    """
+    Sprawdzenie prętów prostokątnych b x h (zginanie względem osi y-y).
+    klasa - nazwy ("C24") lub kody klas, trwanie - nazwy lub kody klas trwania
+    (kmod dla obciążenia o najkrótszym czasie trwania w kombinacji).
+    L - rozpiętość [m]; L_c_y, L_c_z - długości wyboczeniowe (domyślnie L);
+    l_ef - długość efektywna zwichrzenia (domyślnie 0.9 L + 2h, obciążenie
+    równomierne przyłożone do pasa ściskanego).
+    q_G_k, q_Q_k - obciążenia charakterystyczne do ugięcia belki swobodnie
+    podpartej; ugięcie końcowe porównywane z L / limit_ugiecia.
+    """
+    kod = _kody_klas(klasa)
+    kod_tr = _kody_trwania(trwanie)
+    (kod, kod_tr, b, h, L, ku, M_Ed, V_Ed, N_Ed, q_G_k, q_Q_k, psi2, limit_ugiecia) = np.broadcast_arrays(
+        kod, kod_tr, *(np.asarray(x, dtype=np.float64) for x in (b, h, L)),
+        np.asarray(klasa_uzytkowania, dtype=np.int64),
+        *(np.asarray(x, dtype=np.float64) for x in (M_Ed, V_Ed, N_Ed, q_G_k, q_Q_k, psi2, limit_ugiecia)),
+    )
+    L_c_y = L if L_c_y is None else np.broadcast_to(np.asarray(L_c_y, dtype=np.float64), L.shape)
+    L_c_z = L if L_c_z is None else np.broadcast_to(np.asarray(L_c_z, dtype=np.float64), L.shape)
+
+    t = get_timber_arrays()
+    klejone = t["glulam"][kod]
+    fm_k, fc0_k, fv_k = t["fm_k"][kod], t["fc0_k"][kod], t["fv_k"][kod]
+    E0_mean, E0_05 = t["E0_mean"][kod], t["E0_05"][kod]
+    gamma_M = t["gamma_M"][kod]
+
+    kmod = KMOD_TABLE[ku - 1, kod_tr]
+    kdef = KDEF_TABLE[ku - 1]
+
+    # --- Charakterystyki przekroju [mm] ---
+    A = b * h
+    W_y = b * h ** 2 / 6.0
+    I_y = b * h ** 3 / 12.0
+    i_y = h / np.sqrt(12.0)
+    i_z = b / np.sqrt(12.0)
+
+    # --- Wytrzymałości obliczeniowe [MPa] ---
+    kh = WspolczynnikKh(h, klejone)
+    fm_d = kmod * kh * fm_k / gamma_M
+    fv_d = kmod * fv_k / gamma_M
+    fc0_d = kmod * fc0_k / gamma_M
+
+    # --- Naprężenia [MPa] ---
+    sigma_m = np.abs(M_Ed) * 1e6 / W_y
+    tau = 1.5 * np.abs(V_Ed) * 1e3 / (K_CR * b * h)
+    sigma_c = np.maximum(N_Ed, 0.0) * 1e3 / A
+
+    # --- Zwichrzenie (6.3.3) ---
+    L_mm = L * 1e3
+    l_ef_mm = (0.9 * L_mm + 2.0 * h) if l_ef is None else np.asarray(l_ef, dtype=np.float64) * 1e3
+    sigma_m_crit = 0.78 * b ** 2 * E0_05 / (h * np.maximum(l_ef_mm, 1.0))
+    lam_rel_m = np.sqrt(fm_k / sigma_m_crit)
+    kcrit = WspolczynnikKcrit(lam_rel_m)
+
+    # --- Wyboczenie (6.3.2) ---
+    beta_c = np.where(klejone, BETA_C_GLULAM, BETA_C_SOLID)
+    wsp = np.sqrt(fc0_k / E0_05) / np.pi
+    lam_rel_y = L_c_y * 1e3 / i_y * wsp
+    lam_rel_z = L_c_z * 1e3 / i_z * wsp
+    kc_y = WspolczynnikKc(lam_rel_y, beta_c)
+    kc_z = WspolczynnikKc(lam_rel_z, beta_c)
+
+    # --- Warunki nośności ---
+    u_zginanie = sigma_m / (kcrit * fm_d)
+    u_scinanie = tau / fv_d
+    u_sc_y = sigma_c / (kc_y * fc0_d) + sigma_m / fm_d
+    u_sc_z = sigma_c / (kc_z * fc0_d) + K_M * sigma_m / fm_d
+    u_zwichrzenie = (sigma_m / (kcrit * fm_d)) ** 2 + sigma_c / (kc_z * fc0_d)
+
+    # --- Ugięcie belki swobodnie podpartej [mm] ---
+    w_jedn = 5.0 * L_mm ** 4 / (384.0 * E0_mean * I_y)     # od 1 kN/m = 1 N/mm
+    w_inst_G = q_G_k * w_jedn
+    w_inst_Q = q_Q_k * w_jedn
+    w_fin = w_inst_G * (1.0 + kdef) + w_inst_Q * (1.0 + psi2 * kdef)
+    w_dop = L_mm / limit_ugiecia
+    u_ugiecie = np.where(w_dop > 0.0, w_fin / w_dop, 0.0)
+
+    u_max = np.maximum.reduce([u_zginanie, u_scinanie, u_sc_y, u_sc_z, u_zwichrzenie, u_ugiecie])
+
+    return {
+        "kmod": kmod,
+        "kdef": kdef,
+        "gamma_M": gamma_M,
+        "kh": kh,
+        "fm_d": fm_d,
+        "fv_d": fv_d,
+        "fc0_d": fc0_d,
+        "sigma_m": sigma_m,
+        "tau": tau,
+        "sigma_c": sigma_c,
+        "lambda_rel_m": lam_rel_m,
+        "kcrit": kcrit,
+        "lambda_rel_y": lam_rel_y,
+        "lambda_rel_z": lam_rel_z,
+        "kc_y": kc_y,
+        "kc_z": kc_z,
+        "w_inst": w_inst_G + w_inst_Q,
+        "w_fin": w_fin,
+        "w_dop": w_dop,
+        "u_zginanie": u_zginanie,
+        "u_scinanie": u_scinanie,
+        "u_sc_y": u_sc_y,
+        "u_sc_z": u_sc_z,
+        "u_zwichrzenie": u_zwichrzenie,
+        "u_ugiecie": u_ugiecie,
+        "u_max": u_max,
+        "ok": u_max <= 1.0,
+    }
+
+
+if __name__ == "__main__":
+    import time
+
+    from TABLICE.ParametryDrewna import get_kmod, get_timber_params, get_gamma_M
+
+    r = SprawdzElementyDrewniane("C24", 100, 200, 4.0, 1, "średniotrwałe",
+                                 M_Ed=8.0, V_Ed=8.0, q_G_k=1.0, q_Q_k=2.0)
+    for k in ("kh", "fm_d", "sigma_m", "kcrit", "w_fin", "u_max"):
+        print(f"{k:8s} {float(r[k]):.3f}")
+
+    rng = np.random.default_rng(0)
+    n = 200_000
+    klasy = rng.choice(["C24", "C30", "GL24h", "GL28c"], n)
+    b = rng.choice([60.0, 80.0, 100.0, 120.0, 160.0], n)
+    h = rng.choice([120.0, 160.0, 200.0, 240.0, 300.0, 400.0], n)
+    L = rng.uniform(2.0, 8.0, n)
+    ku = rng.integers(1, 4, n)
+    trwanie = rng.integers(0, len(LOAD_DURATION_CLASSES), n)
+    N = rng.uniform(0.0, 80.0, n)
+    M = rng.uniform(0.0, 30.0, n)
+
+    t0 = time.perf_counter()
+    w = SprawdzElementyDrewniane(klasy, b, h, L, ku, trwanie, M_Ed=M, V_Ed=M / L * 2, N_Ed=N,
+                                 q_G_k=1.0, q_Q_k=2.0)
+    t1 = time.perf_counter()
+
+    # Pętla skalarna dla próbki - ta sama funkcja, wyszukiwanie po nazwie
+    t2 = time.perf_counter()
+    for i in range(0, n, 200):
+        p = get_timber_params(str(klasy[i]))
+        kmod = get_kmod(int(ku[i]), LOAD_DURATION_CLASSES[trwanie[i]])
+        s = SprawdzElementyDrewniane(str(klasy[i]), b[i], h[i], L[i], int(ku[i]), int(trwanie[i]),
+                                     M_Ed=M[i], V_Ed=M[i] / L[i] * 2, N_Ed=N[i], q_G_k=1.0, q_Q_k=2.0)
+        assert np.isclose(s["kmod"], kmod)
+        assert np.isclose(s["fm_d"], kmod * s["kh"] * p.fm_k / get_gamma_M(p.name))
+        assert np.isclose(s["u_max"], w["u_max"][i])
+    t3 = time.perf_counter()
+    print(f"{n} prętów wsadowo: {(t1 - t0) * 1000:.0f} ms; "
+          f"pętla: ~{(t3 - t2) / (n // 200) * n:.1f} s dla {n} prętów; "
+          f"niespełnione: {(~w['ok']).sum()}")
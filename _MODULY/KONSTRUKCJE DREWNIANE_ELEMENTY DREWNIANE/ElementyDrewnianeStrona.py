@@ -0,0 +1,210 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# --- KONFIGURACJA ŚCIEŻEK (SZUKAMY KATALOGU KALKULATORY) ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+SCIEZKA_FOLDERU_LOKALNEGO = SCIEZKA_PLIKU.parent
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+if SCIEZKA_BAZOWA is None:
+    # Fallback – dwa poziomy wyżej
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+for sciezka in (SCIEZKA_BAZOWA, SCIEZKA_FOLDERU_LOKALNEGO):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+try:
+    from TABLICE.ParametryDrewna import LOAD_DURATION_CLASSES, SERVICE_CLASSES, list_timber_classes
+    from ElementyDrewniane import SprawdzElementyDrewniane
+except ImportError as e:
+    st.error(f"⚠️ Błąd importu modułu drewnianego: {e}. Sprawdź strukturę folderów.")
+    st.stop()
+
+
+def StronaElementyDrewniane():
+    # --- STYL (spójny z pozostałymi kalkulatorami) ---
+    st.markdown(
+        """
+        <style>
+        .block-container { padding-top: 1.5rem; padding-bottom: 1.5rem; }
+        h3 { margin-top: 1.0rem !important; margin-bottom: 0.4rem !important; font-size: 1.1rem; }
+        .big-result {
+            font-size: 22px; font-weight: bold; color: #2E8B57; background-color: #f0f2f6;
+            padding: 15px; border-radius: 8px; text-align: center; margin-top: 20px; border: 2px solid #2E8B57;
+        }
+        .big-result-bad {
+            font-size: 22px; font-weight: bold; color: #B22222; background-color: #f0f2f6;
+            padding: 15px; border-radius: 8px; text-align: center; margin-top: 20px; border: 2px solid #B22222;
+        }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # --- TYTUŁ GŁÓWNY ---
+    st.markdown(
+        """
+        <div style="text-align:center; margin-top:0.4rem; margin-bottom:0rem;">
+            <span style="font-size:42px; font-weight:800; letter-spacing:1px; color:#dddddd;">
+                NOŚNOŚĆ PRĘTÓW DREWNIANYCH
+            </span>
+        </div>
+        <div style="text-align:center; font-size:14px; color:#aaaaaa; margin-top:-12px; margin-bottom:0.6rem;">
+            wg PN-EN 1995-1-1
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # 1. DANE WEJŚCIOWE
+    st.markdown("### MATERIAŁ I PRZEKRÓJ")
+    klasy = list_timber_classes()
+    c1, c2, c3, c4 = st.columns(4)
+    with c1:
+        klasa = st.selectbox("Klasa drewna", klasy, index=klasy.index("C24"))
+    with c2:
+        b = st.number_input("b [mm]", 20.0, 500.0, 100.0, 10.0)
+    with c3:
+        h = st.number_input("h [mm]", 20.0, 2000.0, 200.0, 10.0)
+    with c4:
+        L = st.number_input("Rozpiętość L [m]", 0.1, 40.0, 4.0, 0.1)
+
+    c1, c2 = st.columns(2)
+    with c1:
+        ku = st.selectbox("Klasa użytkowania", SERVICE_CLASSES, index=0)
+    with c2:
+        trwanie = st.selectbox("Klasa trwania obciążenia", LOAD_DURATION_CLASSES, index=2)
+
+    st.markdown("### SIŁY WEWNĘTRZNE (SGN)")
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        M_Ed = st.number_input("M_y,Ed [kNm]", 0.0, 2000.0, 8.0, 0.5)
+    with c2:
+        V_Ed = st.number_input("V_Ed [kN]", 0.0, 2000.0, 8.0, 0.5)
+    with c3:
+        N_Ed = st.number_input("N_c,Ed (ściskanie) [kN]", 0.0, 5000.0, 0.0, 1.0)
+
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        L_c_y = st.number_input("L_c,y [m]", 0.0, 40.0, float(L), 0.1)
+    with c2:
+        L_c_z = st.number_input("L_c,z [m]", 0.0, 40.0, float(L), 0.1)
+    with c3:
+        l_ef = st.number_input("l_ef zwichrzenia [m] (0 = 0.9L + 2h)", 0.0, 40.0, 0.0, 0.1)
+
+    st.markdown("### UGIĘCIE (SGU)")
+    c1, c2, c3, c4 = st.columns(4)
+    with c1:
+        q_G_k = st.number_input("g_k [kN/m]", 0.0, 200.0, 1.0, 0.1)
+    with c2:
+        q_Q_k = st.number_input("q_k [kN/m]", 0.0, 200.0, 2.0, 0.1)
+    with c3:
+        psi2 = st.number_input("ψ₂", 0.0, 1.0, 0.3, 0.1)
+    with c4:
+        limit = st.number_input("w_fin ≤ L / ...", 100.0, 1000.0, 250.0, 50.0)
+
+    st.markdown("---")
+
+    _, c_btn, _ = st.columns([1, 2, 1])
+    with c_btn:
+        oblicz = st.button("OBLICZ", type="primary", use_container_width=True)
+
+    if oblicz:
+        try:
+            # Jedno wywołanie dla wszystkich klas trwania - wybrana to jeden wiersz wyniku
+            wynik = SprawdzElementyDrewniane(
+                klasa, b, h, L, ku, np.arange(len(LOAD_DURATION_CLASSES)),
+                M_Ed=M_Ed, V_Ed=V_Ed, N_Ed=N_Ed, L_c_y=L_c_y, L_c_z=L_c_z,
+                l_ef=(l_ef if l_ef > 0 else None),
+                q_G_k=q_G_k, q_Q_k=q_Q_k, psi2=psi2, limit_ugiecia=limit,
+            )
+            st.session_state["wynik_drewno_el"] = {
+                "klasa": klasa,
+                "trwanie": LOAD_DURATION_CLASSES.index(trwanie),
+                "wynik": wynik,
+            }
+            st.session_state["pokaz_drewno_el"] = True
+        except (KeyError, ValueError) as e:
+            st.error(f"Wystąpił błąd podczas obliczeń: {e}")
+            st.session_state["pokaz_drewno_el"] = False
+
+    # WYNIKI
+    if st.session_state.get("pokaz_drewno_el", False):
+        res = st.session_state["wynik_drewno_el"]
+        wszystkie = res["wynik"]
+        i = res["trwanie"]
+        w = {k: np.asarray(v)[i] for k, v in wszystkie.items()}
+
+        klasa_css = "big-result" if w["ok"] else "big-result-bad"
+        st.markdown(
+            f"""
+            <div class="{klasa_css}">
+                {res['klasa']} {b:.0f}×{h:.0f} mm &nbsp;|&nbsp; wytężenie = {w['u_max'] * 100:.1f}%
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+        st.markdown("<div style='height: 12px;'></div>", unsafe_allow_html=True)
+
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("k_mod", f"{w['kmod']:.2f}")
+        m2.metric("k_def", f"{w['kdef']:.2f}")
+        m3.metric("k_crit", f"{w['kcrit']:.3f}")
+        m4.metric("w_fin [mm]", f"{w['w_fin']:.1f}", f"dop. {w['w_dop']:.1f}", delta_color="off")
+
+        tabela = pd.DataFrame({
+            "Warunek": [
+                "Zginanie ze zwichrzeniem (6.33)",
+                "Ścinanie (6.13)",
+                "Ściskanie + zginanie, oś y (6.23)",
+                "Ściskanie + zginanie, oś z (6.24)",
+                "Zwichrzenie + ściskanie (6.35)",
+                "Ugięcie końcowe w_fin",
+            ],
+            "Wytężenie [%]": np.round([
+                w["u_zginanie"] * 100, w["u_scinanie"] * 100, w["u_sc_y"] * 100,
+                w["u_sc_z"] * 100, w["u_zwichrzenie"] * 100, w["u_ugiecie"] * 100,
+            ], 1),
+        })
+        st.dataframe(tabela, use_container_width=True, hide_index=True)
+
+        with st.expander("Wpływ klasy trwania obciążenia", expanded=False):
+            st.dataframe(
+                pd.DataFrame({
+                    "Klasa trwania": LOAD_DURATION_CLASSES,
+                    "k_mod": np.asarray(wszystkie["kmod"]),
+                    "f_m,d [MPa]": np.round(wszystkie["fm_d"], 2),
+                    "Wytężenie [%]": np.round(wszystkie["u_max"] * 100, 1),
+                }),
+                use_container_width=True,
+                hide_index=True,
+            )
+
+        with st.expander("Szczegóły obliczeń", expanded=False):
+            st.markdown(
+                f"""
+                | Wielkość | Wartość |
+                | :--- | :--- |
+                | γ<sub>M</sub> / k<sub>h</sub> | {w['gamma_M']:.2f} / {w['kh']:.3f} |
+                | f<sub>m,d</sub> / σ<sub>m,d</sub> | {w['fm_d']:.2f} / {w['sigma_m']:.2f} MPa |
+                | f<sub>v,d</sub> / τ<sub>d</sub> | {w['fv_d']:.2f} / {w['tau']:.2f} MPa |
+                | f<sub>c,0,d</sub> / σ<sub>c,0,d</sub> | {w['fc0_d']:.2f} / {w['sigma_c']:.2f} MPa |
+                | λ<sub>rel,m</sub> | {w['lambda_rel_m']:.3f} |
+                | λ<sub>rel,y</sub> / λ<sub>rel,z</sub> | {w['lambda_rel_y']:.3f} / {w['lambda_rel_z']:.3f} |
+                | k<sub>c,y</sub> / k<sub>c,z</sub> | {w['kc_y']:.3f} / {w['kc_z']:.3f} |
+                | w<sub>inst</sub> / w<sub>fin</sub> | {w['w_inst']:.1f} / {w['w_fin']:.1f} mm |
+                """,
+                unsafe_allow_html=True,
+            )
+
+
+if __name__ == "__main__":
+    StronaElementyDrewniane()
@@ -0,0 +1,375 @@
+"""
+PROGRAMY/ElementyStalowe.py
+Nośność prętów stalowych wg PN-EN 1993-1-1 (obliczenia wsadowe)
+
+Wszystkie funkcje przyjmują tablice (jeden element = jeden pręt) i liczą
+całymi kolumnami biblioteki profili (TABLICE.ProfileStalowe):
+- klasa przekroju (Tablica 5.2),
+- nośność przekroju: N_pl,Rd, M_c,Rd, V_pl,Rd,
+- wyboczenie giętne (6.3.1) i zwichrzenie (6.3.2.2, M_cr dla C1),
+- interakcja N + M_y (6.3.3, współczynniki k wg Załącznika B),
+- dobór najlżejszego profilu z rodziny dla tysięcy prętów naraz.
+Jednostki wejścia: N, V [kN], M [kNm], długości [m].
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# --- KONFIGURACJA ŚCIEŻEK (SZUKAMY KATALOGU KALKULATORY) ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+if SCIEZKA_BAZOWA is None:
+    # Fallback – dwa poziomy wyżej
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+if str(SCIEZKA_BAZOWA) not in sys.path:
+    sys.path.append(str(SCIEZKA_BAZOWA))
+
+from TABLICE.ParametryStali import get_structural_steel_params
+from TABLICE.ProfileStalowe import get_section_library
+
+# Częściowe współczynniki bezpieczeństwa (PN-EN 1993-1-1, NA)
+GAMMA_M0 = 1.00
+GAMMA_M1 = 1.00
+
+# Parametry imperfekcji krzywych wyboczeniowych (Tablica 6.1)
+ALFA_KRZYWEJ = {"a0": 0.13, "a": 0.21, "b": 0.34, "c": 0.49, "d": 0.76}
+
+# Smukłość graniczna zwichrzenia λ_LT,0 (metoda ogólna 6.3.2.2)
+LAMBDA_LT0 = 0.2
+
+# Budżet elementów macierzy (pręt x profil) przetwarzanej jednym blokiem
+ROZMIAR_BLOKU_DOBORU = 2_000_000
+
+# =============================================================================
+# POMOCNICZE
+# =============================================================================
+
+def _dane_stali(gatunek, t_max: np.ndarray):
+    """fy [MPa] (z redukcją dla t > 40 mm), E, G - z broadcastem po gatunkach."""
+    gatunki = np.broadcast_to(np.asarray(gatunek), t_max.shape)
+    fy = np.empty(t_max.shape)
+    E = np.empty(t_max.shape)
+    G = np.empty(t_max.shape)
+    for g in np.unique(gatunki):
+        p = get_structural_steel_params(str(g))
+        m = gatunki == g
+        fy[m] = np.where(t_max[m] <= 40.0, p.fy, p.fy_40)
+        E[m] = p.E
+        G[m] = p.G
+    return fy, E, G
+
+
+def _chi(lam: np.ndarray, alfa: np.ndarray, lam0: float = 0.2) -> np.ndarray:
+    """Współczynnik wyboczeniowy χ (wzory 6.49 / 6.56)."""
+    phi = 0.5 * (1.0 + alfa * (lam - lam0) + lam ** 2)
+    chi = 1.0 / (phi + np.sqrt(np.maximum(phi ** 2 - lam ** 2, 0.0)))
+    return np.where(lam <= lam0, 1.0, np.minimum(chi, 1.0))
+
+
+def _klasa(smuklosc: np.ndarray, granice: tuple, eps: np.ndarray) -> np.ndarray:
+    """Klasa ścianki 1..4 dla c/t wg granic (k1 ε, k2 ε, k3 ε)."""
+    k = np.full(smuklosc.shape, 4, dtype=np.int8)
+    for klasa, g in zip((3, 2, 1), granice[::-1]):
+        k[smuklosc <= g * eps] = klasa
+    return k
+
+# =============================================================================
+# KLASA PRZEKROJU (TABLICA 5.2)
+# =============================================================================
+
+def KlasaPrzekroju(profil: np.ndarray, fy: np.ndarray) -> dict:
+    """
+    Klasa przekroju przy ściskaniu i przy zginaniu względem osi y-y.
+    profil - numery wierszy biblioteki, fy - granica plastyczności [MPa].
+    """
+    lib = get_section_library()
+    ksztalt = lib.shapes[profil]
+    h, b = lib["h"][profil], lib["b"][profil]
+    tw, tf, r = lib["tw"][profil], lib["tf"][profil], lib["r"][profil]
+    eps = np.sqrt(235.0 / fy)
+
+    jest_I = ksztalt == "I"
+    jest_U = ksztalt == "U"
+    jest_RHS = ksztalt == "RHS"
+    jest_CHS = ksztalt == "CHS"
+
+    # Środnik (część wewnętrzna) i półka (wspornikowa lub wewnętrzna)
+    c_w = np.where(jest_RHS, h - 3.0 * tw, h - 2.0 * tf - 2.0 * r)
+    c_f = np.select(
+        [jest_I, jest_U, jest_RHS],
+        [(b - tw - 2.0 * r) / 2.0, b - tw - r, b - 3.0 * tf],
+        default=1.0,
+    )
+    sm_w = c_w / tw
+    sm_f = c_f / tf
+
+    kl_w_N = _klasa(sm_w, (33.0, 38.0, 42.0), eps)
+    kl_w_M = _klasa(sm_w, (72.0, 83.0, 124.0), eps)
+    kl_f = np.where(
+        jest_RHS,
+        _klasa(sm_f, (33.0, 38.0, 42.0), eps),
+        _klasa(sm_f, (9.0, 10.0, 14.0), eps),
+    )
+
+    # Rury okrągłe: d/t wg ε²
+    kl_chs = _klasa(h / tw, (50.0, 70.0, 90.0), eps ** 2)
+
+    klasa_N = np.where(jest_CHS, kl_chs, np.maximum(kl_w_N, kl_f))
+    klasa_M = np.where(jest_CHS, kl_chs, np.maximum(kl_w_M, kl_f))
+    return {"klasa_N": klasa_N, "klasa_M": klasa_M}
+
+# =============================================================================
+# SPRAWDZENIE ELEMENTÓW
+# =============================================================================
+
+def _krzywe_wyboczeniowe(profil: np.ndarray):
+    """Parametry α dla osi y, z i zwichrzenia (Tablice 6.2 i 6.4)."""
+    lib = get_section_library()
+    ksztalt = lib.shapes[profil]
+    h, b, tf = lib["h"][profil], lib["b"][profil], lib["tf"][profil]
+    jest_I = ksztalt == "I"
+    smukly = h / b > 1.2
+
+    a_y = np.select(
+        [jest_I & smukly & (tf <= 40.0), jest_I, ksztalt == "U"],
+        [ALFA_KRZYWEJ["a"], ALFA_KRZYWEJ["b"], ALFA_KRZYWEJ["c"]],
+        default=ALFA_KRZYWEJ["a"],  # rury gorącowykończone
+    )
+    a_z = np.select(
+        [jest_I & smukly & (tf <= 40.0), jest_I, ksztalt == "U"],
+        [ALFA_KRZYWEJ["b"], ALFA_KRZYWEJ["c"], ALFA_KRZYWEJ["c"]],
+        default=ALFA_KRZYWEJ["a"],
+    )
+    a_LT = np.select(
+        [jest_I & (h / b <= 2.0), jest_I],
+        [ALFA_KRZYWEJ["a"], ALFA_KRZYWEJ["b"]],
+        default=ALFA_KRZYWEJ["d"],
+    )
+    return a_y, a_z, a_LT
+
+
+def SprawdzElementyStalowe(
+    profil,
+    gatunek="S355",
+    L_y=3.0,
+    L_z=3.0,
+    L_LT=3.0,
+    N_Ed=0.0,
+    M_Ed=0.0,
+    V_Ed=0.0,
+    C1=1.0,
+    Cm=1.0,
+) -> dict:
+    """
+    Sprawdzenie prętów ściskanych (N_Ed > 0) i zginanych względem osi y-y.
+    profil - oznaczenia ("IPE 300") lub numery wierszy biblioteki.
+    L_y, L_z - długości wyboczeniowe [m], L_LT - rozstaw stężeń bocznych [m].
+    C1 - współczynnik rozkładu momentu do M_cr, Cm - współczynnik równoważnego
+    momentu (C_my = C_mLT) do interakcji.
+    Zwraca słownik tablic; u_max > 1 lub klasa 4 oznacza brak nośności.
+    """
+    lib = get_section_library()
+    profil = np.asarray(profil)
+    if profil.dtype.kind in "US":
+        profil = lib.rows(np.atleast_1d(profil).ravel()).reshape(profil.shape)
+
+    profil, L_y, L_z, L_LT, N_Ed, M_Ed, V_Ed, C1, Cm = np.broadcast_arrays(
+        profil, *(np.asarray(x, dtype=np.float64) for x in (L_y, L_z, L_LT, N_Ed, M_Ed, V_Ed, C1, Cm))
+    )
+    profil = profil.astype(np.int64)
+
+    A = lib["A"][profil]
+    t_max = np.maximum(lib["tf"][profil], lib["tw"][profil])
+    fy, E, G = _dane_stali(gatunek, t_max)
+
+    klasy = KlasaPrzekroju(profil, fy)
+    klasa_N, klasa_M = klasy["klasa_N"], klasy["klasa_M"]
+    W_y = np.where(klasa_M <= 2, lib["Wpl_y"][profil], lib["Wel_y"][profil])
+
+    # --- Nośność przekroju [kN, kNm] ---
+    N_Rk = A * fy / 1e3
+    M_Rk = W_y * fy / 1e6
+    N_pl_Rd = N_Rk / GAMMA_M0
+    M_c_Rd = M_Rk / GAMMA_M0
+    V_pl_Rd = lib["Avz"][profil] * fy / np.sqrt(3.0) / GAMMA_M0 / 1e3
+
+    N = np.abs(N_Ed)
+    M = np.abs(M_Ed)
+    u_przekroj = N / N_pl_Rd + M / M_c_Rd
+    u_V = np.abs(V_Ed) / V_pl_Rd
+
+    # --- Wyboczenie giętne ---
+    a_y, a_z, a_LT = _krzywe_wyboczeniowe(profil)
+    lam1 = np.pi * np.sqrt(E / fy)
+    lam_y = L_y * 1e3 / lib["iy"][profil] / lam1
+    lam_z = L_z * 1e3 / lib["iz"][profil] / lam1
+    chi_y = _chi(lam_y, a_y)
+    chi_z = _chi(lam_z, a_z)
+    ze_sciskaniem = N_Ed > 0.0
+    chi_y = np.where(ze_sciskaniem, chi_y, 1.0)
+    chi_z = np.where(ze_sciskaniem, chi_z, 1.0)
+
+    # --- Zwichrzenie (przekroje otwarte) ---
+    podatny = np.isin(lib.shapes[profil], ("I", "U"))
+    Iz, It, Iw = lib["Iz"][profil], lib["It"][profil], lib["Iw"][profil]
+    L_mm = np.maximum(L_LT * 1e3, 1.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        M_cr = (C1 * np.pi ** 2 * E * Iz / L_mm ** 2
+                * np.sqrt(Iw / Iz + L_mm ** 2 * G * It / (np.pi ** 2 * E * Iz))) / 1e6
+        lam_LT = np.sqrt(M_Rk / M_cr)
+    chi_LT = np.where(podatny & (L_LT > 0.0), _chi(lam_LT, a_LT, LAMBDA_LT0), 1.0)
+    M_cr = np.where(podatny, M_cr, np.inf)
+
+    N_b_Rd = np.minimum(chi_y, chi_z) * N_Rk / GAMMA_M1
+    M_b_Rd = chi_LT * M_Rk / GAMMA_M1
+
+    # --- Interakcja (6.61, 6.62) - współczynniki k wg Załącznika B ---
+    n_y = N / (chi_y * N_Rk / GAMMA_M1)
+    n_z = N / (chi_z * N_Rk / GAMMA_M1)
+    kl12 = klasa_M <= 2
+    k_yy = np.where(
+        kl12,
+        Cm * np.minimum(1.0 + (lam_y - 0.2) * n_y, 1.0 + 0.8 * n_y),
+        Cm * np.minimum(1.0 + 0.6 * lam_y * n_y, 1.0 + 0.6 * n_y),
+    )
+    wsp = np.where(kl12, 0.1, 0.05)
+    CmLT = np.maximum(Cm, 0.4)
+    k_zy_skret = np.maximum(
+        1.0 - wsp * lam_z * n_z / (CmLT - 0.25),
+        1.0 - wsp * n_z / (CmLT - 0.25),
+    )
+    k_zy_skret = np.where(lam_z < 0.4, np.minimum(0.6 + lam_z, k_zy_skret), k_zy_skret)
+    k_zy = np.where(podatny, k_zy_skret, np.where(kl12, 0.6, 0.8) * k_yy)
+
+    u_wyb_y = n_y + k_yy * M / M_b_Rd
+    u_wyb_z = n_z + k_zy * M / M_b_Rd
+
+    u_max = np.maximum.reduce([u_przekroj, u_V, u_wyb_y, u_wyb_z])
+    klasa4 = np.where(ze_sciskaniem, klasa_N, 1) == 4
+    klasa4 |= (M > 0.0) & (klasa_M == 4)
+    u_max = np.where(klasa4, np.inf, u_max)
+
+    return {
+        "profil": profil,
+        "fy": fy,
+        "klasa_N": klasa_N,
+        "klasa_M": klasa_M,
+        "N_pl_Rd": N_pl_Rd,
+        "M_c_Rd": M_c_Rd,
+        "V_pl_Rd": V_pl_Rd,
+        "lambda_y": lam_y,
+        "lambda_z": lam_z,
+        "chi_y": chi_y,
+        "chi_z": chi_z,
+        "N_b_Rd": N_b_Rd,
+        "M_cr": M_cr,
+        "lambda_LT": np.where(podatny, lam_LT, 0.0),
+        "chi_LT": chi_LT,
+        "M_b_Rd": M_b_Rd,
+        "k_yy": k_yy,
+        "k_zy": k_zy,
+        "u_przekroj": u_przekroj,
+        "u_V": u_V,
+        "u_wyb_y": u_wyb_y,
+        "u_wyb_z": u_wyb_z,
+        "u_max": u_max,
+        "klasa4": klasa4,
+        "ok": u_max <= 1.0,
+    }
+
+# =============================================================================
+# DOBÓR NAJLŻEJSZEGO PROFILU
+# =============================================================================
+
+def DobierzNajlzejszyProfil(
+    rodzina: str,
+    gatunek="S355",
+    L_y=3.0,
+    L_z=3.0,
+    L_LT=3.0,
+    N_Ed=0.0,
+    M_Ed=0.0,
+    V_Ed=0.0,
+    C1=1.0,
+    Cm=1.0,
+    rozmiar_bloku: int = ROZMIAR_BLOKU_DOBORU,
+) -> dict:
+    """
+    Najlżejszy profil z rodziny spełniający wszystkie warunki - dla każdego pręta.
+    Profile rodziny są posortowane wg masy, więc wynik to pierwsza kolumna
+    macierzy "ok" [pręty x profile] (argmax); macierz liczona blokami prętów.
+    Zwraca numery wierszy biblioteki (-1 = żaden profil nie wystarcza),
+    oznaczenia, masy i wykorzystanie dobranego profilu.
+    """
+    lib = get_section_library()
+    kandydaci = lib.family_rows(rodzina)
+    if kandydaci.size == 0:
+        raise KeyError(f"Nieznana rodzina profili: {rodzina!r}.")
+
+    dane = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(x, dtype=np.float64)) for x in (L_y, L_z, L_LT, N_Ed, M_Ed, V_Ed, C1, Cm))
+    )
+    n = dane[0].shape[0]
+    gatunki = np.broadcast_to(np.asarray(gatunek), (n,))
+    blok = max(1, rozmiar_bloku // kandydaci.size)
+
+    wybrany = np.full(n, -1, dtype=np.int64)
+    u_wyb = np.full(n, np.nan)
+    for p0 in range(0, n, blok):
+        p1 = min(p0 + blok, n)
+        kolumny = [d[p0:p1, None] for d in dane]
+        wynik = SprawdzElementyStalowe(
+            kandydaci[None, :], gatunki[p0:p1, None], *kolumny
+        )
+        ok = wynik["ok"]
+        j = np.argmax(ok, axis=1)
+        jest = ok[np.arange(p1 - p0), j]
+        wybrany[p0:p1] = np.where(jest, kandydaci[j], -1)
+        u_wyb[p0:p1] = np.where(jest, wynik["u_max"][np.arange(p1 - p0), j], np.nan)
+
+    znaleziony = wybrany >= 0
+    return {
+        "profil": wybrany,
+        "nazwa": np.where(znaleziony, lib.names[np.maximum(wybrany, 0)], ""),
+        "masa": np.where(znaleziony, lib["mass"][np.maximum(wybrany, 0)], np.nan),
+        "u_max": u_wyb,
+    }
+
+
+if __name__ == "__main__":
+    import time
+
+    r = SprawdzElementyStalowe(["IPE 300", "HEB 200", "SHS 150x150x8"], "S355",
+                               L_y=5.0, L_z=2.5, L_LT=2.5, N_Ed=300.0, M_Ed=80.0, V_Ed=60.0)
+    for k in ("klasa_N", "klasa_M", "N_b_Rd", "M_cr", "chi_LT", "M_b_Rd", "u_max"):
+        print(f"{k:8s}", np.round(r[k], 3))
+
+    rng = np.random.default_rng(0)
+    n = 10_000
+    N = rng.uniform(0.0, 1500.0, n)
+    M = rng.uniform(0.0, 300.0, n)
+    L = rng.uniform(2.0, 8.0, n)
+
+    t0 = time.perf_counter()
+    d = DobierzNajlzejszyProfil("HEB", "S355", L_y=L, L_z=L, L_LT=L, N_Ed=N, M_Ed=M)
+    t1 = time.perf_counter()
+
+    # Kontrola: pętla po prętach i profilach po kolei
+    kandydaci = get_section_library().family_rows("HEB")
+    for i in range(0, n, 997):
+        pierwszy = -1
+        for k in kandydaci:
+            if SprawdzElementyStalowe(k, "S355", L[i], L[i], L[i], N[i], M[i])["ok"]:
+                pierwszy = k
+                break
+        assert pierwszy == d["profil"][i]
+    print(f"Dobór HEB dla {n} prętów: {(t1 - t0) * 1000:.0f} ms, "
+          f"brak rozwiązania: {(d['profil'] < 0).sum()}, masa łączna: {np.nansum(d['masa'] * L):.0f} kg")
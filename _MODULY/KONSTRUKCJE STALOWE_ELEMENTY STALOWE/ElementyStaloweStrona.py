@@ -0,0 +1,199 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# --- KONFIGURACJA ŚCIEŻEK (SZUKAMY KATALOGU KALKULATORY) ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+SCIEZKA_FOLDERU_LOKALNEGO = SCIEZKA_PLIKU.parent
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+if SCIEZKA_BAZOWA is None:
+    # Fallback – dwa poziomy wyżej
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+for sciezka in (SCIEZKA_BAZOWA, SCIEZKA_FOLDERU_LOKALNEGO):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+try:
+    from TABLICE.ParametryStali import list_structural_steel_grades
+    from TABLICE.ProfileStalowe import (
+        get_section_library,
+        list_section_families,
+        list_sections,
+    )
+    from ElementyStalowe import SprawdzElementyStalowe, DobierzNajlzejszyProfil
+except ImportError as e:
+    st.error(f"⚠️ Błąd importu modułu stalowego: {e}. Sprawdź strukturę folderów.")
+    st.stop()
+
+
+def StronaElementyStalowe():
+    # --- STYL (spójny z pozostałymi kalkulatorami) ---
+    st.markdown(
+        """
+        <style>
+        .block-container { padding-top: 1.5rem; padding-bottom: 1.5rem; }
+        h3 { margin-top: 1.0rem !important; margin-bottom: 0.4rem !important; font-size: 1.1rem; }
+        .big-result {
+            font-size: 22px; font-weight: bold; color: #2E8B57; background-color: #f0f2f6;
+            padding: 15px; border-radius: 8px; text-align: center; margin-top: 20px; border: 2px solid #2E8B57;
+        }
+        .big-result-bad {
+            font-size: 22px; font-weight: bold; color: #B22222; background-color: #f0f2f6;
+            padding: 15px; border-radius: 8px; text-align: center; margin-top: 20px; border: 2px solid #B22222;
+        }
+        div.row-widget.stRadio > div { flex-direction: row; gap: 16px; }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # --- TYTUŁ GŁÓWNY ---
+    st.markdown(
+        """
+        <div style="text-align:center; margin-top:0.4rem; margin-bottom:0rem;">
+            <span style="font-size:42px; font-weight:800; letter-spacing:1px; color:#dddddd;">
+                NOŚNOŚĆ PRĘTÓW STALOWYCH
+            </span>
+        </div>
+        <div style="text-align:center; font-size:14px; color:#aaaaaa; margin-top:-12px; margin-bottom:0.6rem;">
+            wg PN-EN 1993-1-1
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # 1. DANE WEJŚCIOWE
+    st.markdown("### DANE WEJŚCIOWE")
+
+    tryb = st.radio("Tryb", ["Sprawdzenie profilu", "Dobór najlżejszego profilu"], horizontal=True)
+
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        rodzina = st.selectbox("Rodzina profili", list_section_families(), index=0)
+    with c2:
+        profile = list_sections(rodzina)
+        profil = st.selectbox(
+            "Profil", profile, index=min(6, len(profile) - 1),
+            disabled=(tryb != "Sprawdzenie profilu"),
+        )
+    with c3:
+        gatunki = list_structural_steel_grades()
+        gatunek = st.selectbox("Gatunek stali", gatunki, index=gatunki.index("S355"))
+
+    st.markdown("### DŁUGOŚCI I OBCIĄŻENIA")
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        L_y = st.number_input("L_cr,y [m]", 0.0, 50.0, 4.0, 0.1)
+        N_Ed = st.number_input("N_Ed (ściskanie +) [kN]", -20000.0, 20000.0, 250.0, 10.0)
+    with c2:
+        L_z = st.number_input("L_cr,z [m]", 0.0, 50.0, 4.0, 0.1)
+        M_Ed = st.number_input("M_y,Ed [kNm]", 0.0, 5000.0, 60.0, 5.0)
+    with c3:
+        L_LT = st.number_input("L_LT (rozstaw stężeń) [m]", 0.0, 50.0, 4.0, 0.1)
+        V_Ed = st.number_input("V_z,Ed [kN]", 0.0, 10000.0, 40.0, 5.0)
+
+    c1, c2 = st.columns(2)
+    with c1:
+        C1 = st.number_input("C₁ (rozkład momentu do M_cr)", 1.0, 3.0, 1.0, 0.05)
+    with c2:
+        Cm = st.number_input("C_m (równoważny stały moment)", 0.4, 1.0, 1.0, 0.05)
+
+    st.markdown("---")
+
+    _, c_btn, _ = st.columns([1, 2, 1])
+    with c_btn:
+        oblicz = st.button("OBLICZ", type="primary", use_container_width=True)
+
+    if oblicz:
+        try:
+            if tryb == "Dobór najlżejszego profilu":
+                dobor = DobierzNajlzejszyProfil(rodzina, gatunek, L_y, L_z, L_LT, N_Ed, M_Ed, V_Ed, C1, Cm)
+                if dobor["profil"][0] < 0:
+                    raise ValueError(f"Żaden profil rodziny {rodzina} nie spełnia warunków nośności.")
+                profil = str(dobor["nazwa"][0])
+            wynik = SprawdzElementyStalowe([profil], gatunek, L_y, L_z, L_LT, N_Ed, M_Ed, V_Ed, C1, Cm)
+            st.session_state["wynik_stal_el"] = {
+                "profil": profil,
+                "gatunek": gatunek,
+                "wynik": {k: v[0] for k, v in wynik.items()},
+            }
+            st.session_state["pokaz_stal_el"] = True
+        except (KeyError, ValueError) as e:
+            st.error(f"Wystąpił błąd podczas obliczeń: {e}")
+            st.session_state["pokaz_stal_el"] = False
+
+    # WYNIKI
+    if st.session_state.get("pokaz_stal_el", False):
+        res = st.session_state["wynik_stal_el"]
+        w = res["wynik"]
+        lib = get_section_library()
+        masa = lib["mass"][lib.row(res["profil"])]
+
+        if w["klasa4"]:
+            st.markdown(
+                f"""<div class="big-result-bad">{res['profil']} ({res['gatunek']}) – przekrój klasy 4
+                (wymaga przekroju efektywnego wg PN-EN 1993-1-5)</div>""",
+                unsafe_allow_html=True,
+            )
+        else:
+            klasa_css = "big-result" if w["ok"] else "big-result-bad"
+            st.markdown(
+                f"""
+                <div class="{klasa_css}">
+                    {res['profil']} ({res['gatunek']}, {masa:.1f} kg/m) &nbsp;|&nbsp; wytężenie = {w['u_max'] * 100:.1f}%
+                </div>
+                """,
+                unsafe_allow_html=True,
+            )
+        st.markdown("<div style='height: 12px;'></div>", unsafe_allow_html=True)
+
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Klasa (N / M)", f"{w['klasa_N']} / {w['klasa_M']}")
+        m2.metric("f_y [MPa]", f"{w['fy']:.0f}")
+        m3.metric("χ_min", f"{min(w['chi_y'], w['chi_z']):.3f}")
+        m4.metric("χ_LT", f"{w['chi_LT']:.3f}")
+
+        tabela = pd.DataFrame({
+            "Warunek": [
+                "Nośność przekroju N + M (6.2.1)",
+                "Ścinanie V_z (6.2.6)",
+                "Interakcja – wzór 6.61",
+                "Interakcja – wzór 6.62",
+            ],
+            "Wytężenie [%]": np.round(
+                [w["u_przekroj"] * 100, w["u_V"] * 100, w["u_wyb_y"] * 100, w["u_wyb_z"] * 100], 1
+            ),
+        })
+        st.dataframe(tabela, use_container_width=True, hide_index=True)
+
+        with st.expander("Szczegóły obliczeń", expanded=False):
+            M_cr = "∞ (przekrój zamknięty)" if not np.isfinite(w["M_cr"]) else f"{w['M_cr']:.1f} kNm"
+            st.markdown(
+                f"""
+                | Wielkość | Wartość |
+                | :--- | :--- |
+                | N<sub>pl,Rd</sub> | {w['N_pl_Rd']:.1f} kN |
+                | M<sub>c,Rd</sub> | {w['M_c_Rd']:.1f} kNm |
+                | V<sub>pl,Rd</sub> | {w['V_pl_Rd']:.1f} kN |
+                | λ̄<sub>y</sub> / λ̄<sub>z</sub> | {w['lambda_y']:.3f} / {w['lambda_z']:.3f} |
+                | χ<sub>y</sub> / χ<sub>z</sub> | {w['chi_y']:.3f} / {w['chi_z']:.3f} |
+                | N<sub>b,Rd</sub> | {w['N_b_Rd']:.1f} kN |
+                | M<sub>cr</sub> | {M_cr} |
+                | λ̄<sub>LT</sub> | {w['lambda_LT']:.3f} |
+                | M<sub>b,Rd</sub> | {w['M_b_Rd']:.1f} kNm |
+                | k<sub>yy</sub> / k<sub>zy</sub> | {w['k_yy']:.3f} / {w['k_zy']:.3f} |
+                """,
+                unsafe_allow_html=True,
+            )
+
+
+if __name__ == "__main__":
+    StronaElementyStalowe()
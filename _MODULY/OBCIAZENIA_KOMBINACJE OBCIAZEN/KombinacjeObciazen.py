@@ -0,0 +1,319 @@
+"""
+PROGRAMY/KombinacjeObciazen.py
+Silnik kombinacji oddziaływań wg PN-EN 1990 (SGN: 6.10, 6.10a/b; SGU: ch., cz., q-s.)
+
+Efekty oddziaływań trzymane są jako macierz E [n_przypadkow x n_punktow]
+(np. momenty od każdego przypadku w punktach wynikowych). Obwiednia liczona
+jest bez wyliczania wszystkich kombinacji: dla efektów liniowych ekstremum
+w punkcie wybiera się wprost (G niekorzystne/korzystne, Q obecne/nieobecne,
+najlepsze oddziaływanie wiodące), co sprowadza się do kilku iloczynów macierzy.
+"""
+
+from __future__ import annotations
+
+import itertools
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+# --- KONFIGURACJA ŚCIEŻEK ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+
+if SCIEZKA_BAZOWA is None:
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+if str(SCIEZKA_BAZOWA) not in sys.path:
+    sys.path.append(str(SCIEZKA_BAZOWA))
+
+from TABLICE.WspolczynnikiObciazen import (
+    GAMMA_G_INF,
+    GAMMA_G_SUP,
+    GAMMA_Q,
+    XI,
+    get_load_category_params,
+)
+
+# =============================================================================
+# DEFINICJE
+# =============================================================================
+
+@dataclass(frozen=True)
+class PrzypadekObciazenia:
+    """Pojedynczy przypadek obciążenia (wiersz macierzy efektów)."""
+    nazwa: str
+    rodzaj: str          # "G" - stałe, "Q" - zmienne
+    kategoria: str = ""  # Kategoria wg Tablicy A1.1 (tylko dla "Q")
+
+
+@dataclass(frozen=True)
+class RegulaKombinacji:
+    """
+    Współczynniki jednego wzoru kombinacyjnego.
+    - g_sup / g_inf: mnożniki G niekorzystnych / korzystnych,
+    - wiodace / towarzyszace: "1", "psi0", "psi1", "psi2" (mnożone przez gamma_q).
+    """
+    nazwa: str
+    g_sup: float
+    g_inf: float
+    wiodace: str
+    towarzyszace: str
+    gamma_q: float = 1.0
+
+
+REGULY = {
+    "6.10": RegulaKombinacji("6.10", GAMMA_G_SUP, GAMMA_G_INF, "1", "psi0", GAMMA_Q),
+    "6.10a": RegulaKombinacji("6.10a", GAMMA_G_SUP, GAMMA_G_INF, "psi0", "psi0", GAMMA_Q),
+    "6.10b": RegulaKombinacji("6.10b", XI * GAMMA_G_SUP, GAMMA_G_INF, "1", "psi0", GAMMA_Q),
+    "char": RegulaKombinacji("charakterystyczna", 1.0, 1.0, "1", "psi0"),
+    "czesta": RegulaKombinacji("częsta", 1.0, 1.0, "psi1", "psi2"),
+    "quasi": RegulaKombinacji("quasi-stała", 1.0, 1.0, "psi2", "psi2"),
+}
+
+# Zestawy wzorów - obwiednia jest ekstremum po wszystkich regułach zestawu
+ZESTAWY_KOMBINACJI = {
+    "SGN – wzór 6.10": ["6.10"],
+    "SGN – wzory 6.10a / 6.10b": ["6.10a", "6.10b"],
+    "SGU – kombinacja charakterystyczna": ["char"],
+    "SGU – kombinacja częsta": ["czesta"],
+    "SGU – kombinacja quasi-stała": ["quasi"],
+}
+
+# =============================================================================
+# LOGIKA OBLICZENIOWA
+# =============================================================================
+
+def _psi(kategoria: str, rodzaj_wsp: str) -> float:
+    if rodzaj_wsp == "1":
+        return 1.0
+    return getattr(get_load_category_params(kategoria), rodzaj_wsp)
+
+
+def _podziel_przypadki(przypadki: list[PrzypadekObciazenia]) -> tuple[np.ndarray, np.ndarray]:
+    rodzaje = np.array([p.rodzaj for p in przypadki])
+    if not np.isin(rodzaje, ["G", "Q"]).all():
+        raise ValueError("Rodzaj przypadku musi być 'G' (stałe) lub 'Q' (zmienne).")
+    return np.flatnonzero(rodzaje == "G"), np.flatnonzero(rodzaje == "Q")
+
+
+def wspolczynniki_reguly(
+    przypadki: list[PrzypadekObciazenia], regula: RegulaKombinacji
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Zwraca wektory (a, l) dla oddziaływań zmiennych:
+    a - mnożnik jako towarzyszące, l - mnożnik jako wiodące (l >= a).
+    """
+    _, idx_q = _podziel_przypadki(przypadki)
+    a = np.array([regula.gamma_q * _psi(przypadki[i].kategoria, regula.towarzyszace) for i in idx_q])
+    l = np.array([regula.gamma_q * _psi(przypadki[i].kategoria, regula.wiodace) for i in idx_q])
+    return a, np.maximum(l, a)
+
+
+def _ekstremum_reguly(E_G, E_Q, regula, a, l, znak: float):
+    """
+    Ekstremum (znak=+1 maksimum, -1 minimum) jednej reguły w każdym punkcie.
+    Zwraca (wartości, indeks oddziaływania wiodącego lub -1).
+    """
+    EG = znak * E_G
+    EQ = znak * E_Q
+    wart = regula.g_sup * np.maximum(EG, 0.0).sum(axis=0) + regula.g_inf * np.minimum(EG, 0.0).sum(axis=0)
+
+    wiodace = np.full(EG.shape[1], -1, dtype=np.int64)
+    if EQ.shape[0]:
+        EQ_plus = np.maximum(EQ, 0.0)
+        wart = wart + a @ EQ_plus
+        zysk = (l - a)[:, None] * EQ_plus
+        j = np.argmax(zysk, axis=0)
+        zysk_max = np.take_along_axis(zysk, j[None, :], axis=0)[0]
+        wart = wart + zysk_max
+        wiodace = np.where(zysk_max > 0.0, j, -1)
+    return znak * wart, wiodace
+
+
+def ObwiedniaKombinacji(
+    E: np.ndarray,
+    przypadki: list[PrzypadekObciazenia],
+    zestaw: str,
+) -> dict:
+    """
+    Obwiednia efektów dla zestawu wzorów kombinacyjnych.
+    E: macierz [n_przypadkow x n_punktow] efektów charakterystycznych.
+    """
+    E = np.asarray(E, dtype=float)
+    if E.ndim == 1:
+        E = E[:, None]
+    if E.shape[0] != len(przypadki):
+        raise ValueError("Liczba wierszy macierzy efektów musi odpowiadać liczbie przypadków.")
+
+    idx_g, idx_q = _podziel_przypadki(przypadki)
+    E_G, E_Q = E[idx_g], E[idx_q]
+
+    wyniki = {}
+    for nazwa_ekstr, znak in (("max", 1.0), ("min", -1.0)):
+        wart_r, wiod_r = [], []
+        for klucz in ZESTAWY_KOMBINACJI[zestaw]:
+            regula = REGULY[klucz]
+            a, l = wspolczynniki_reguly(przypadki, regula)
+            w, j = _ekstremum_reguly(E_G, E_Q, regula, a, l, znak)
+            wart_r.append(w)
+            wiod_r.append(j)
+        wart_r = np.vstack(wart_r)
+        r = np.argmax(znak * wart_r, axis=0)
+        kol = np.arange(E.shape[1])
+        wiod = np.vstack(wiod_r)[r, kol]
+        wyniki[nazwa_ekstr] = wart_r[r, kol]
+        wyniki[f"regula_{nazwa_ekstr}"] = r
+        # Indeks wiodącego w numeracji wszystkich przypadków
+        wyniki[f"wiodace_{nazwa_ekstr}"] = np.where(wiod >= 0, idx_q[np.maximum(wiod, 0)] if idx_q.size else -1, -1)
+
+    wyniki["zestaw"] = zestaw
+    wyniki["reguly"] = list(ZESTAWY_KOMBINACJI[zestaw])
+    return wyniki
+
+
+def WspolczynnikiMiarodajne(
+    E: np.ndarray,
+    przypadki: list[PrzypadekObciazenia],
+    obwiednia: dict,
+    ekstremum: str = "max",
+) -> np.ndarray:
+    """
+    Odtwarza wiersze współczynników kombinacji miarodajnych w każdym punkcie.
+    Zwraca macierz [n_punktow x n_przypadkow] taką, że (C * E.T).sum(1) == obwiednia.
+    """
+    E = np.asarray(E, dtype=float)
+    if E.ndim == 1:
+        E = E[:, None]
+    znak = 1.0 if ekstremum == "max" else -1.0
+    idx_g, idx_q = _podziel_przypadki(przypadki)
+    reguly = [REGULY[k] for k in obwiednia["reguly"]]
+    r = obwiednia[f"regula_{ekstremum}"]
+    wiodace = obwiednia[f"wiodace_{ekstremum}"]
+
+    n_pkt = E.shape[1]
+    C = np.zeros((n_pkt, len(przypadki)))
+    g_sup = np.array([rg.g_sup for rg in reguly])[r]
+    g_inf = np.array([rg.g_inf for rg in reguly])[r]
+    niekorzystne = (znak * E[idx_g]).T > 0.0
+    C[:, idx_g] = np.where(niekorzystne, g_sup[:, None], g_inf[:, None])
+
+    if idx_q.size:
+        A = np.vstack([wspolczynniki_reguly(przypadki, rg)[0] for rg in reguly])
+        L = np.vstack([wspolczynniki_reguly(przypadki, rg)[1] for rg in reguly])
+        obecne = (znak * E[idx_q]).T > 0.0
+        C[:, idx_q] = np.where(obecne, A[r], 0.0)
+        maska = wiodace >= 0
+        poz_q = np.searchsorted(idx_q, wiodace[maska])
+        C[np.flatnonzero(maska), wiodace[maska]] = L[r[maska], poz_q]
+    return C
+
+
+def KombinacjeMiarodajne(
+    E: np.ndarray,
+    przypadki: list[PrzypadekObciazenia],
+    zestaw: str,
+) -> dict:
+    """
+    Zbiór kombinacji, które rządzą obwiednią choć w jednym punkcie.
+    Kombinacje zdominowane (nigdy nie dające ekstremum) nie są generowane.
+    """
+    obw = ObwiedniaKombinacji(E, przypadki, zestaw)
+    C = np.vstack([
+        WspolczynnikiMiarodajne(E, przypadki, obw, "max"),
+        WspolczynnikiMiarodajne(E, przypadki, obw, "min"),
+    ])
+    C_unikalne, idx_odwr = np.unique(np.round(C, 6), axis=0, return_inverse=True)
+    n_pkt = obw["max"].size
+    return {
+        "C": C_unikalne,
+        "kombinacja_max": idx_odwr[:n_pkt].ravel(),
+        "kombinacja_min": idx_odwr[n_pkt:].ravel(),
+        "obwiednia": obw,
+    }
+
+
+def LiczbaKombinacjiNaiwnych(przypadki: list[PrzypadekObciazenia], zestaw: str) -> int:
+    """
+    Liczba kombinacji przy pełnym wyliczeniu (G sup/inf, Q obecne/nieobecne, wiodące):
+    na regułę 2^n_g · (2^n_q bez wiodącego + n_q · 2^(n_q-1) z wiodącym).
+    """
+    idx_g, idx_q = _podziel_przypadki(przypadki)
+    n_g, n_q = idx_g.size, idx_q.size
+    na_regule = 2 ** n_g * (2 ** n_q + n_q * 2 ** max(n_q - 1, 0))
+    return len(ZESTAWY_KOMBINACJI[zestaw]) * na_regule
+
+
+def GenerujKombinacje(
+    przypadki: list[PrzypadekObciazenia],
+    zestaw: str,
+    maks_liczba: int = 100_000,
+) -> np.ndarray:
+    """
+    Pełne wyliczenie kombinacji (tylko dla małych modeli - do weryfikacji).
+    Zwraca macierz współczynników [n_kombinacji x n_przypadkow].
+    """
+    n = LiczbaKombinacjiNaiwnych(przypadki, zestaw)
+    if n > maks_liczba:
+        raise ValueError(
+            f"Pełne wyliczenie daje {n} kombinacji (limit {maks_liczba}). "
+            "Użyj ObwiedniaKombinacji / KombinacjeMiarodajne."
+        )
+    idx_g, idx_q = _podziel_przypadki(przypadki)
+    wiersze = []
+    for klucz in ZESTAWY_KOMBINACJI[zestaw]:
+        regula = REGULY[klucz]
+        a, l = wspolczynniki_reguly(przypadki, regula)
+        for g_wyb in itertools.product((regula.g_sup, regula.g_inf), repeat=idx_g.size):
+            for wiodace in range(-1, idx_q.size):
+                for obecne in itertools.product((0.0, 1.0), repeat=idx_q.size):
+                    if wiodace >= 0 and not obecne[wiodace]:
+                        continue
+                    c = np.zeros(len(przypadki))
+                    c[idx_g] = g_wyb
+                    c[idx_q] = a * np.array(obecne)
+                    if wiodace >= 0:
+                        c[idx_q[wiodace]] = l[wiodace]
+                    wiersze.append(c)
+    assert len(wiersze) == n, (len(wiersze), n)
+    return np.unique(np.round(np.array(wiersze), 6), axis=0)
+
+
+def OpisKombinacji(c: np.ndarray, przypadki: list[PrzypadekObciazenia]) -> str:
+    """Zapis kombinacji w postaci '1.35·G1 + 1.50·Q1 + 1.05·Q2'."""
+    skladniki = [f"{wsp:.2f}·{p.nazwa}" for wsp, p in zip(c, przypadki) if abs(wsp) > 1e-9]
+    return " + ".join(skladniki) if skladniki else "0"
+
+
+if __name__ == "__main__":
+    import time
+
+    # Liczba kombinacji naiwnych = liczba wierszy pełnego wyliczenia (przed usunięciem powtórzeń)
+    maly = [PrzypadekObciazenia("G1", "G"), PrzypadekObciazenia("Q1", "Q", "B"), PrzypadekObciazenia("Q2", "Q", "B")]
+    for zestaw_testu in ZESTAWY_KOMBINACJI:
+        GenerujKombinacje(maly, zestaw_testu)
+    assert LiczbaKombinacjiNaiwnych(maly, "SGN – wzory 6.10a / 6.10b") == 2 * 16
+
+    rng = np.random.default_rng(0)
+    n_g, n_q, n_pkt = 4, 32, 5000
+    przypadki = [PrzypadekObciazenia(f"G{i+1}", "G") for i in range(n_g)]
+    przypadki += [PrzypadekObciazenia(f"Q{i+1}", "Q", "B") for i in range(n_q)]
+    E = rng.normal(size=(n_g + n_q, n_pkt))
+
+    t0 = time.perf_counter()
+    wynik = KombinacjeMiarodajne(E, przypadki, "SGN – wzory 6.10a / 6.10b")
+    dt = time.perf_counter() - t0
+
+    C = wynik["C"]
+    R = C @ E
+    assert np.allclose(R.max(axis=0), wynik["obwiednia"]["max"])
+    assert np.allclose(R.min(axis=0), wynik["obwiednia"]["min"])
+    print(f"Przypadki: {n_g + n_q}, punkty: {n_pkt}")
+    print(f"Kombinacje naiwne: {LiczbaKombinacjiNaiwnych(przypadki, 'SGN – wzory 6.10a / 6.10b'):.3e}")
+    print(f"Kombinacje miarodajne: {C.shape[0]}  (czas {dt * 1000:.1f} ms)")
@@ -0,0 +1,215 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+import sys
+from pathlib import Path
+
+# --- KONFIGURACJA ŚCIEŻEK (SZUKAMY KATALOGU KALKULATORY) ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+SCIEZKA_FOLDERU_LOKALNEGO = SCIEZKA_PLIKU.parent
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+if SCIEZKA_BAZOWA is None:
+    # Fallback – dwa poziomy wyżej
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+for sciezka in (SCIEZKA_BAZOWA, SCIEZKA_FOLDERU_LOKALNEGO):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+try:
+    from TABLICE.WspolczynnikiObciazen import LOAD_CATEGORY_TABLE, list_load_categories
+    from KombinacjeObciazen import (
+        ZESTAWY_KOMBINACJI,
+        PrzypadekObciazenia,
+        KombinacjeMiarodajne,
+        LiczbaKombinacjiNaiwnych,
+        OpisKombinacji,
+    )
+    from Superpozycja import Superpozycja
+except ImportError as e:
+    st.error(f"⚠️ Błąd importu modułu kombinacji: {e}. Sprawdź strukturę folderów.")
+    st.stop()
+
+
+def _domyslne_przypadki(n_pkt: int) -> pd.DataFrame:
+    x = np.linspace(0.0, 1.0, n_pkt)
+    ksztalt = 4.0 * x * (1.0 - x)
+    dane = {
+        "Nazwa": ["G1", "G2", "Q1", "Q2", "Q3"],
+        "Rodzaj": ["G", "G", "Q", "Q", "Q"],
+        "Kategoria": ["", "", "B", "S", "W"],
+    }
+    amplitudy = [40.0, 15.0, 25.0, 10.0, -12.0]
+    for k in range(n_pkt):
+        dane[f"P{k + 1}"] = [round(a * ksztalt[k], 2) for a in amplitudy]
+    return pd.DataFrame(dane)
+
+
+def StronaKombinacjeObciazen():
+    # --- STYL (spójny z pozostałymi kalkulatorami) ---
+    st.markdown(
+        """
+        <style>
+        .block-container { padding-top: 1.5rem; padding-bottom: 1.5rem; }
+        h3 { margin-top: 1.0rem !important; margin-bottom: 0.4rem !important; font-size: 1.1rem; }
+        .big-result {
+            font-size: 22px; font-weight: bold; color: #2E8B57; background-color: #f0f2f6;
+            padding: 15px; border-radius: 8px; text-align: center; margin-top: 20px; border: 2px solid #2E8B57;
+        }
+        div.row-widget.stRadio > div { flex-direction: row; gap: 16px; }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # --- TYTUŁ GŁÓWNY ---
+    st.markdown(
+        """
+        <div style="text-align:center; margin-top:0.4rem; margin-bottom:0rem;">
+            <span style="font-size:42px; font-weight:800; letter-spacing:1px; color:#dddddd;">
+                KOMBINACJE OBCIĄŻEŃ
+            </span>
+        </div>
+        <div style="text-align:center; font-size:14px; color:#aaaaaa; margin-top:-12px; margin-bottom:0.6rem;">
+            wg PN-EN 1990
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # 1. DANE WEJŚCIOWE
+    st.markdown("### DANE WEJŚCIOWE")
+
+    c1, c2 = st.columns([1, 2])
+    with c1:
+        n_pkt = st.number_input("Liczba punktów wynikowych", 1, 50, 7, 1)
+    with c2:
+        zestaw = st.radio("Kombinacja", list(ZESTAWY_KOMBINACJI.keys()), index=1, horizontal=True)
+
+    st.write("Efekty charakterystyczne od przypadków obciążeń (np. M [kNm]) w punktach P1…Pn:")
+    klucz_tabeli = f"tabela_komb_{n_pkt}"
+    if klucz_tabeli not in st.session_state:
+        st.session_state[klucz_tabeli] = _domyslne_przypadki(int(n_pkt))
+
+    kategorie = [""] + list_load_categories()
+    df = st.data_editor(
+        st.session_state[klucz_tabeli],
+        num_rows="dynamic",
+        use_container_width=True,
+        column_config={
+            "Rodzaj": st.column_config.SelectboxColumn("Rodzaj", options=["G", "Q"], required=True),
+            "Kategoria": st.column_config.SelectboxColumn("Kategoria", options=kategorie),
+        },
+        key=f"editor_komb_{n_pkt}",
+    )
+
+    with st.expander("ℹ️ Pomoc: Współczynniki ψ (Tablica A1.1)"):
+        st.markdown(
+            "| Kategoria | Opis | ψ0 | ψ1 | ψ2 |\n| :--- | :--- | :--- | :--- | :--- |\n"
+            + "\n".join(
+                f"| {k} | {v.opis} | {v.psi0} | {v.psi1} | {v.psi2} |"
+                for k, v in LOAD_CATEGORY_TABLE.items()
+            )
+        )
+
+    st.markdown("---")
+
+    _, c_btn, _ = st.columns([1, 2, 1])
+    with c_btn:
+        oblicz = st.button("OBLICZ KOMBINACJE", type="primary", use_container_width=True)
+
+    if oblicz:
+        try:
+            df = df.dropna(subset=["Nazwa", "Rodzaj"])
+            przypadki = [
+                PrzypadekObciazenia(
+                    str(r["Nazwa"]),
+                    str(r["Rodzaj"]),
+                    r["Kategoria"] if isinstance(r["Kategoria"], str) else "",
+                )
+                for _, r in df.iterrows()
+            ]
+            kol_pkt = [k for k in df.columns if k.startswith("P") and k[1:].isdigit()]
+            E = df[kol_pkt].fillna(0.0).to_numpy(dtype=float)
+
+            wynik = KombinacjeMiarodajne(E, przypadki, zestaw)
+            st.session_state["wynik_komb"] = {
+                "wynik": wynik,
+                "przypadki": przypadki,
+                "E": E,
+                "punkty": kol_pkt,
+                "zestaw": zestaw,
+                "n_naiwnych": LiczbaKombinacjiNaiwnych(przypadki, zestaw),
+            }
+            st.session_state["pokaz_komb"] = True
+        except (KeyError, ValueError) as e:
+            st.error(f"Wystąpił błąd podczas obliczeń: {e}")
+            st.session_state["pokaz_komb"] = False
+
+    # WYNIKI
+    if st.session_state.get("pokaz_komb", False):
+        res = st.session_state["wynik_komb"]
+        wynik = res["wynik"]
+        obw = wynik["obwiednia"]
+        przypadki = res["przypadki"]
+
+        st.markdown(
+            f"""
+            <div class="big-result">
+                max E<sub>d</sub> = {obw['max'].max():.2f} &nbsp;&nbsp;|&nbsp;&nbsp; min E<sub>d</sub> = {obw['min'].min():.2f}
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+        st.markdown("<div style='height: 12px;'></div>", unsafe_allow_html=True)
+
+        m1, m2 = st.columns(2)
+        m1.metric("Kombinacje przy pełnym wyliczeniu", f"{res['n_naiwnych']:,}".replace(",", " "))
+        m2.metric("Kombinacje miarodajne", f"{wynik['C'].shape[0]}")
+
+        C = wynik["C"]
+        tabela = pd.DataFrame({
+            "Punkt": res["punkty"],
+            "E_max": np.round(obw["max"], 2),
+            "Kombinacja (max)": [OpisKombinacji(C[i], przypadki) for i in wynik["kombinacja_max"]],
+            "E_min": np.round(obw["min"], 2),
+            "Kombinacja (min)": [OpisKombinacji(C[i], przypadki) for i in wynik["kombinacja_min"]],
+        })
+        st.dataframe(tabela, use_container_width=True, hide_index=True)
+
+        with st.expander("📈 Wykres obwiedni", expanded=False):
+            x = np.arange(1, len(res["punkty"]) + 1)
+            fig, ax = plt.subplots(figsize=(7, 3.5))
+            ax.plot(x, obw["max"], linewidth=2.0, label="max")
+            ax.plot(x, obw["min"], linewidth=2.0, label="min")
+            ax.fill_between(x, obw["min"], obw["max"], alpha=0.08)
+            ax.axhline(0.0, linewidth=0.8, color="#888888")
+            ax.set_xlabel("Punkt wynikowy", fontsize=11)
+            ax.set_ylabel("Efekt obliczeniowy E_d", fontsize=11)
+            ax.grid(True, linestyle="--", alpha=0.4)
+            ax.legend()
+            ax.spines["top"].set_visible(False)
+            ax.spines["right"].set_visible(False)
+            fig.tight_layout()
+            st.pyplot(fig)
+
+        with st.expander("Kombinacje miarodajne", expanded=False):
+            # Wyniki wszystkich kombinacji miarodajnych w punktach - jeden iloczyn macierzy
+            R = Superpozycja(C, res["E"].T)
+            tabela_komb = pd.DataFrame({
+                "Nr": np.arange(1, C.shape[0] + 1),
+                "Kombinacja": [OpisKombinacji(c, przypadki) for c in C],
+            })
+            for k, nazwa in enumerate(res["punkty"]):
+                tabela_komb[nazwa] = np.round(R[k], 2)
+            st.dataframe(tabela_komb, use_container_width=True, hide_index=True)
+
+
+if __name__ == "__main__":
+    StronaKombinacjeObciazen()
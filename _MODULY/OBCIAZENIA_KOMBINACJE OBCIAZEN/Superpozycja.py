@@ -0,0 +1,215 @@
+"""
+PROGRAMY/Superpozycja.py
+Superpozycja wyników przypadków jednostkowych (macierz punkt x przypadek)
+
+Wyniki przypadków trzymane są w układzie [n_punktow x n_przypadkow]
+(wiersz = punkt wynikowy), dzięki czemu blok kolejnych punktów jest ciągłym
+fragmentem pamięci/pliku. Kombinacje to macierz współczynników C
+[n_kombinacji x n_przypadkow], a wyniki kombinacji to jeden iloczyn U @ C.T
+(BLAS). Dla modeli większych niż RAM macierz U jest plikiem .npy otwieranym
+przez np.memmap i przetwarzanym blokami.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+from KombinacjeObciazen import (
+    PrzypadekObciazenia,
+    ObwiedniaKombinacji,
+)
+
+# Domyślny budżet pamięci na blok wyników pośrednich
+LIMIT_PAMIECI_MB = 256
+
+# =============================================================================
+# MACIERZ WYNIKÓW PRZYPADKÓW JEDNOSTKOWYCH
+# =============================================================================
+
+def UtworzMacierzWynikow(
+    sciezka: str | Path | None,
+    n_punktow: int,
+    n_przypadkow: int,
+    dtype=np.float64,
+) -> np.ndarray:
+    """
+    Tworzy macierz [n_punktow x n_przypadkow] wypełnioną zerami.
+    sciezka=None - tablica w pamięci, w przeciwnym razie plik .npy (memmap).
+    """
+    if sciezka is None:
+        return np.zeros((n_punktow, n_przypadkow), dtype=dtype)
+    return np.lib.format.open_memmap(
+        str(sciezka), mode="w+", dtype=dtype, shape=(n_punktow, n_przypadkow)
+    )
+
+
+def OtworzMacierzWynikow(sciezka: str | Path) -> np.ndarray:
+    """Otwiera zapisaną macierz wyników tylko do odczytu (bez wczytywania do RAM)."""
+    return np.load(str(sciezka), mmap_mode="r")
+
+
+def _rozmiar_bloku(n_kolumn: int, limit_pamieci_mb: float) -> int:
+    bajty_wiersza = max(1, n_kolumn) * 8
+    return max(1, int(limit_pamieci_mb * 1024 * 1024 // bajty_wiersza))
+
+# =============================================================================
+# SUPERPOZYCJA I OBWIEDNIE
+# =============================================================================
+
+def Superpozycja(C: np.ndarray, U: np.ndarray) -> np.ndarray:
+    """
+    Wyniki kombinacji R = U @ C.T  [n_punktow x n_kombinacji].
+    C: [n_kombinacji x n_przypadkow], U: [n_punktow x n_przypadkow].
+    """
+    C = np.ascontiguousarray(C, dtype=np.float64)
+    U = np.asarray(U)
+    if U.shape[1] != C.shape[1]:
+        raise ValueError("Liczba przypadków w U i C musi być zgodna.")
+    return np.asarray(U, dtype=np.float64) @ C.T
+
+
+def ObwiedniaStrumieniowa(
+    C: np.ndarray,
+    U: np.ndarray,
+    rozmiar_bloku: int | None = None,
+    limit_pamieci_mb: float = LIMIT_PAMIECI_MB,
+    katalog_wyjscia: str | Path | None = None,
+) -> dict:
+    """
+    Obwiednia (max/min) po kombinacjach wraz z numerem kombinacji miarodajnej.
+    U może być memmapą - przetwarzana jest blokami punktów, a przy bardzo
+    dużej liczbie kombinacji również blokami kombinacji.
+    katalog_wyjscia - jeżeli podany, wyniki zapisywane są jako pliki .npy (memmap).
+    Pusta lista kombinacji: obwiednia NaN, numery kombinacji -1.
+    """
+    C = np.ascontiguousarray(C, dtype=np.float64)
+    n_pkt, n_przyp = U.shape
+    n_komb = C.shape[0]
+    if n_przyp != C.shape[1]:
+        raise ValueError("Liczba przypadków w U i C musi być zgodna.")
+
+    blok_komb = max(1, min(n_komb, _rozmiar_bloku(n_przyp, limit_pamieci_mb / 4)))
+    if rozmiar_bloku is None:
+        rozmiar_bloku = _rozmiar_bloku(blok_komb + n_przyp, limit_pamieci_mb)
+
+    def _wyjscie(nazwa, dtype):
+        if katalog_wyjscia is None:
+            return np.empty(n_pkt, dtype=dtype)
+        Path(katalog_wyjscia).mkdir(parents=True, exist_ok=True)
+        return np.lib.format.open_memmap(
+            str(Path(katalog_wyjscia) / f"{nazwa}.npy"), mode="w+", dtype=dtype, shape=(n_pkt,)
+        )
+
+    wynik = {
+        "max": _wyjscie("max", np.float64),
+        "min": _wyjscie("min", np.float64),
+        "kombinacja_max": _wyjscie("kombinacja_max", np.int64),
+        "kombinacja_min": _wyjscie("kombinacja_min", np.int64),
+    }
+    if n_komb == 0:
+        # Brak kombinacji - obwiednia nieokreślona (NaN, numer kombinacji -1)
+        wynik["max"][:] = wynik["min"][:] = np.nan
+        wynik["kombinacja_max"][:] = wynik["kombinacja_min"][:] = -1
+        return wynik
+
+    for p0 in range(0, n_pkt, rozmiar_bloku):
+        p1 = min(p0 + rozmiar_bloku, n_pkt)
+        blok_U = np.asarray(U[p0:p1], dtype=np.float64)
+
+        bmax = np.full(p1 - p0, -np.inf)
+        bmin = np.full(p1 - p0, np.inf)
+        imax = np.zeros(p1 - p0, dtype=np.int64)
+        imin = np.zeros(p1 - p0, dtype=np.int64)
+        wiersze = np.arange(p1 - p0)
+
+        for k0 in range(0, n_komb, blok_komb):
+            k1 = min(k0 + blok_komb, n_komb)
+            R = blok_U @ C[k0:k1].T
+
+            j = np.argmax(R, axis=1)
+            v = R[wiersze, j]
+            lepsze = v > bmax
+            bmax[lepsze] = v[lepsze]
+            imax[lepsze] = j[lepsze] + k0
+
+            j = np.argmin(R, axis=1)
+            v = R[wiersze, j]
+            lepsze = v < bmin
+            bmin[lepsze] = v[lepsze]
+            imin[lepsze] = j[lepsze] + k0
+
+        wynik["max"][p0:p1] = bmax
+        wynik["min"][p0:p1] = bmin
+        wynik["kombinacja_max"][p0:p1] = imax
+        wynik["kombinacja_min"][p0:p1] = imin
+
+    return wynik
+
+
+def ObwiedniaKombinacjiStrumieniowa(
+    U: np.ndarray,
+    przypadki: list[PrzypadekObciazenia],
+    zestaw: str,
+    rozmiar_bloku: int | None = None,
+    limit_pamieci_mb: float = LIMIT_PAMIECI_MB,
+) -> dict:
+    """
+    Obwiednia wg ObwiedniaKombinacji (bez jawnej listy kombinacji) liczona
+    blokami punktów macierzy U [n_punktow x n_przypadkow].
+    """
+    n_pkt, n_przyp = U.shape
+    if rozmiar_bloku is None:
+        # Kilka tablic pośrednich wielkości bloku na regułę
+        rozmiar_bloku = _rozmiar_bloku(4 * n_przyp, limit_pamieci_mb)
+
+    czesci = []
+    for p0 in range(0, n_pkt, rozmiar_bloku):
+        p1 = min(p0 + rozmiar_bloku, n_pkt)
+        E = np.asarray(U[p0:p1], dtype=np.float64).T
+        czesci.append(ObwiedniaKombinacji(E, przypadki, zestaw))
+
+    wynik = {
+        klucz: np.concatenate([c[klucz] for c in czesci])
+        for klucz in ("max", "min", "regula_max", "regula_min", "wiodace_max", "wiodace_min")
+    }
+    wynik["zestaw"] = zestaw
+    wynik["reguly"] = czesci[0]["reguly"] if czesci else []
+    return wynik
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    from KombinacjeObciazen import KombinacjeMiarodajne
+
+    rng = np.random.default_rng(0)
+    n_g, n_q, n_pkt = 3, 30, 200_000
+    przypadki = [PrzypadekObciazenia(f"G{i+1}", "G") for i in range(n_g)]
+    przypadki += [PrzypadekObciazenia(f"Q{i+1}", "Q", "B") for i in range(n_q)]
+    zestaw = "SGN – wzory 6.10a / 6.10b"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        U = UtworzMacierzWynikow(Path(tmp) / "U.npy", n_pkt, n_g + n_q, dtype=np.float32)
+        for p0 in range(0, n_pkt, 50_000):
+            U[p0:p0 + 50_000] = rng.normal(size=(min(50_000, n_pkt - p0), n_g + n_q))
+        U.flush()
+        del U
+        U = OtworzMacierzWynikow(Path(tmp) / "U.npy")
+
+        C = KombinacjeMiarodajne(np.asarray(U[:2000], dtype=np.float64).T, przypadki, zestaw)["C"]
+
+        t0 = time.perf_counter()
+        obw = ObwiedniaStrumieniowa(C, U, limit_pamieci_mb=32)
+        t1 = time.perf_counter()
+        obw_z = ObwiedniaKombinacjiStrumieniowa(U, przypadki, zestaw, limit_pamieci_mb=32)
+        t2 = time.perf_counter()
+
+        R = Superpozycja(C, U[:2000])
+        assert np.allclose(R.max(axis=1), obw["max"][:2000])
+        assert np.all(obw_z["max"] >= obw["max"] - 1e-9)
+        print(f"Punkty: {n_pkt}, przypadki: {n_g + n_q}, kombinacje: {C.shape[0]}")
+        print(f"Obwiednia po C (strumieniowo): {(t1 - t0) * 1000:.0f} ms")
+        print(f"Obwiednia bez listy kombinacji: {(t2 - t1) * 1000:.0f} ms")
@@ -8,15 +8,12 @@ from pathlib import Path
 from io import BytesIO
 import sys
 import math
-import re
+from typing import TYPE_CHECKING
 
-# Biblioteki do PDF
-from fpdf import FPDF
+import numpy as np
 
-# Biblioteki do DOCX
-from docx import Document
-from docx.shared import Pt, Cm, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+if TYPE_CHECKING:
+    from fpdf import FPDF
 
 # --- KONFIGURACJA ŚCIEŻEK ---
 SCIEZKA_PLIKU = Path(__file__).resolve()
@@ -31,8 +28,6 @@ for parent in SCIEZKA_PLIKU.parents:
 if SCIEZKA_BAZOWA is None:
     SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
 
-SCIEZKA_CZCIONKI = SCIEZKA_BAZOWA / "CZCIONKI"
-
 if str(SCIEZKA_BAZOWA) not in sys.path:
     sys.path.append(str(SCIEZKA_BAZOWA))
 
@@ -53,6 +48,14 @@ try:
 except ImportError:
     STAL_DATA = STAL_DATA_FALLBACK
 
+from NARZEDZIA.Pamiec import KluczJSON, pamietaj
+from NARZEDZIA.PamiecRaportow import raport_na_dysku
+from NARZEDZIA.RaportIR import Fr, Linia, Naglowek, Odstep, Raport, Renderuj, Tytul, Wynik
+from NARZEDZIA.Rysunki import PokazRysunek, PomocZRysunkiem
+from NARZEDZIA.WspolczynnikiAlfa import (
+    Alfa2, Alfa3, Alfa5, AlfyOpcji, FrontPareto, NajwiekszaSrednica, PoziomyAlfa, SiatkaOpcji, ZTabeli,
+)
+
 BETON_DATA = {
     "C12/15":  [12, 1.6],
     "C16/20":  [16, 1.9],
@@ -72,6 +75,9 @@ BETON_DATA = {
 
 FI_LIST = [6, 8, 10, 12, 14, 16, 20, 25, 28, 32, 40]
 
+# Współczynnik α6 wg udziału prętów łączonych w przekroju (Tablica 8.3)
+MAPA_ALFA6 = {"100%": 1.5, "50%": 1.4, "33%": 1.15, "25%": 1.15, "< 25%": 1.0}
+
 # --- SYMBOLE UNICODE DLA PDF ---
 SYM = {
     "fi": "\u03A6", "alpha": "\u03B1", "sigma": "\u03C3", "eta": "\u03B7",
@@ -83,6 +89,7 @@ SYM = {
 # LOGIKA OBLICZENIOWA
 # =============================================================================
 
+@pamietaj
 def ObliczDlugoscZakladu(
     fi_mm: float,
     klasa_betonu: str,
@@ -119,8 +126,7 @@ def ObliczDlugoscZakladu(
     alfa1 = 1.0
     alfa4 = 1.0 
     
-    mapa_a6 = {"100%": 1.5, "50%": 1.4, "33%": 1.15, "25%": 1.15, "< 25%": 1.0}
-    alfa6 = mapa_a6.get(alfa6_proc, 1.0)
+    alfa6 = MAPA_ALFA6.get(alfa6_proc, 1.0)
     
     if rodzaj_preta == "Ściskany":
         alfa2 = 1.0
@@ -166,295 +172,300 @@ def ObliczDlugoscZakladu(
         "rodzaj_preta": rodzaj_preta
     }
 
+def ObliczDlugoscZakladuWektorowo(
+    fi_mm,
+    klasa_betonu,
+    stal_nazwa,
+    procent_naprezenia,
+    warunki_przyczepnosci,
+    rodzaj_preta,
+    alfa6_proc,
+    alfa2=1.0,
+    alfa3=1.0,
+    alfa5=1.0
+) -> dict:
+    """
+    Wersja wektorowa ObliczDlugoscZakladu - te same wzory, ale każdy
+    argument może być tablicą numpy (broadcast). Zwraca słownik tablic
+    z kluczami liczbowymi jak wersja skalarna.
+    """
+    fi_mm = np.asarray(fi_mm, dtype=np.float64)
+    fctm = ZTabeli(klasa_betonu, {k: v[1] for k, v in BETON_DATA.items()}, "klasa betonu")
+    fyk = ZTabeli(stal_nazwa, STAL_DATA, "klasa stali")
+    alfa6 = ZTabeli(alfa6_proc, MAPA_ALFA6, "udział prętów łączonych")
+
+    gamma_c = 1.4
+    gamma_s = 1.15
+
+    fctd = 0.7 * fctm / gamma_c
+    eta1 = np.where(np.asarray(warunki_przyczepnosci) == "Dobre", 1.0, 0.7)
+    eta2 = np.where(fi_mm > 32, (132 - fi_mm) / 100.0, 1.0)
+    fbd = 2.25 * eta1 * eta2 * fctd
+
+    fyd = fyk / gamma_s
+    sigma_sd = (np.asarray(procent_naprezenia, dtype=np.float64) / 100.0) * fyd
+    lb_rqd = (fi_mm / 4.0) * (sigma_sd / fbd)
+
+    rozciagany = np.asarray(rodzaj_preta) == "Rozciągany"
+    alfa2 = np.where(rozciagany, alfa2, 1.0)
+    alfa3 = np.where(rozciagany, alfa3, 1.0)
+    alfa5 = np.where(rozciagany, alfa5, 1.0)
+
+    prod_a235 = alfa2 * alfa3 * alfa5
+    warning_alfa = rozciagany & (prod_a235 < 0.7)
+    alfa_global = alfa6 * np.where(warning_alfa, 0.7, prod_a235)
+
+    l0_calc = alfa_global * lb_rqd
+    l0_min_val = np.maximum(np.maximum(0.3 * alfa6 * lb_rqd, 15.0 * fi_mm), 200.0)
+    l0_final = np.maximum(l0_calc, l0_min_val)
+
+    return {
+        "fi_mm": fi_mm,
+        "fctd": fctd,
+        "fyk": fyk,
+        "fyd": fyd,
+        "sigma_sd": sigma_sd,
+        "eta1": eta1,
+        "eta2": eta2,
+        "fbd": fbd,
+        "lb_rqd": lb_rqd,
+        "alfa2": alfa2,
+        "alfa3": alfa3,
+        "alfa5": alfa5,
+        "alfa6": alfa6,
+        "alfa_global": alfa_global,
+        "warning_alfa": warning_alfa,
+        "l0_calc": l0_calc,
+        "l0_min": l0_min_val,
+        "l0_final": l0_final,
+    }
+
 # =============================================================================
-# GENERATOR PDF
+# OPTYMALIZACJA WSPÓŁCZYNNIKÓW ALFA (FRONT PARETO)
 # =============================================================================
 
-def create_pdf_report(wynik: dict, inputs: dict) -> bytes:
-    pdf = FPDF()
-    pdf.add_page()
-    
-    font_regular = SCIEZKA_CZCIONKI / "ArialUnicode.ttf"
-    font_bold = SCIEZKA_CZCIONKI / "ArialUnicode-Bold.ttf"
-    
-    main_font = "Arial"
-    use_unicode = False
-    
-    if font_regular.exists():
-        try:
-            pdf.add_font("ArialUni", "", str(font_regular), uni=True)
-            if font_bold.exists():
-                pdf.add_font("ArialUni", "B", str(font_bold), uni=True)
-            else:
-                pdf.add_font("ArialUni", "B", str(font_regular), uni=True)
-            
-            pdf.add_font("ArialUni", "I", str(font_regular), uni=True)
-            main_font = "ArialUni"
-            use_unicode = True
-        except Exception:
-            use_unicode = False
-
-    def fix_txt(text: str) -> str:
-        if use_unicode:
-            return str(text)
-        replacements = {
-            "ą": "a", "ć": "c", "ę": "e", "ł": "l", "ń": "n", "ó": "o", "ś": "s", "ź": "z", "ż": "z",
-            "Ą": "A", "Ć": "C", "Ę": "E", "Ł": "L", "Ń": "N", "Ó": "O", "Ś": "S", "Ź": "S", "Ż": "Z",
-            "Φ": SYM["fi"], "α": SYM["alpha"], "η": SYM["eta"], "ρ": SYM["rho"], "σ": SYM["sigma"]
-        }
-        text = str(text)
-        for k, v in replacements.items():
-            text = text.replace(k, v)
-        return text
-
-    LINE_H = 6
-    MARGIN_LEFT = 15
-    MARGIN_TOP = 15
-    X_INDENT = 20
-    X_EQ = 25
-    
-    pdf.set_margins(MARGIN_LEFT, MARGIN_TOP, 10)
-    pdf.set_auto_page_break(True, margin=15)
-
-    def new_line(mult: float = 1.0):
-        pdf.ln(LINE_H * mult)
-
-    def w_txt(text: str, bold: bool = False, italic: bool = False, size: int = 11):
-        style = ""
-        if bold: style += "B"
-        if italic: style += "I"
-        pdf.set_font(main_font, style, size)
-        pdf.write(LINE_H, fix_txt(text))
-
-    def w_sub(text: str, size: int = 7, move_down: float = 2.0):
-        orig_y, orig_x = pdf.get_y(), pdf.get_x()
-        pdf.set_font(main_font, "", size)
-        pdf.set_xy(orig_x, orig_y + move_down)
-        pdf.write(LINE_H, fix_txt(text))
-        pdf.set_xy(pdf.get_x(), orig_y)
-        pdf.set_font(main_font, "", 11)
-
-    def header_sec(text: str, num: str):
-        new_line(1.2)
-        pdf.set_font(main_font, "B", 12)
-        pdf.cell(0, 8, fix_txt(f"{num}. {text}"), ln=True, border="B")
-        new_line(0.3)
-
-    def build_line(segments, indent=0):
-        if indent > 0:
-            pdf.set_x(indent)
-        for item in segments:
-            text = str(item[0])
-            type_ = item[1]
-            if type_ == 'txt': w_txt(text)
-            elif type_ == 'bold': w_txt(text, bold=True)
-            elif type_ == 'italic': w_txt(text, italic=True)
-            elif type_ == 'sub': w_sub(text)
-            elif type_ == 'sym': w_txt(text)
-        new_line()
-
-    # --- NAGŁÓWEK ---
-    pdf.set_font(main_font, "B", 16)
-    pdf.cell(0, 8, fix_txt("DŁUGOŚĆ ZAKŁADU PRĘTÓW ZBROJENIOWYCH"), ln=True, align="C")
-    pdf.set_font(main_font, "", 10)
-    pdf.cell(0, 5, fix_txt("wg PN-EN 1992-1-1"), ln=True, align="C")
-    new_line(1.0)
-
-    # 1. PARAMETRY
-    header_sec("Parametry materiałowe", "1")
-    build_line([("- Średnica pręta: ", 'txt'), (f"{SYM['fi']} = {wynik['fi_mm']:.0f} mm", 'txt')], X_INDENT)
-    build_line([(f"- Beton: {wynik['klasa_betonu']} (f", 'txt'), ("ctd", 'sub'), (f" = {wynik['fctd']:.2f} MPa)", 'txt')], X_INDENT)
-    build_line([(f"- Stal: {wynik['stal_nazwa']} (f", 'txt'), ("yk", 'sub'), (f" = {wynik['fyk']:.0f} MPa, f", 'txt'), ("yd", 'sub'), (f" = {wynik['fyd']:.1f} MPa)", 'txt')], X_INDENT)
-    
-    # 2. PODSTAWOWA DŁUGOŚĆ
-    header_sec("Podstawowa długość zakotwienia", "2")
-    build_line([(f"- Warunki przyczepności: {inputs['warunki']} (", 'txt'), (SYM['eta'], 'sym'), ("1", 'sub'), (f" = {wynik['eta1']})", 'txt')], X_INDENT)
-    build_line([(f"- Współczynnik średnicy: ", 'txt'), (SYM['eta'], 'sym'), ("2", 'sub'), (f" = {wynik['eta2']:.2f}", 'txt')], X_INDENT)
-    new_line(0.5)
-
-    # fbd
-    build_line([("Przyczepność graniczna: ", 'txt'), ("f", 'italic'), ("bd", 'sub'), (" = 2.25 · ", 'txt'), (SYM['eta'], 'sym'), ("1", 'sub'), (" · ", 'txt'), (SYM['eta'], 'sym'), ("2", 'sub'), (" · f", 'txt'), ("ctd", 'sub'), (f" = {wynik['fbd']:.2f} MPa", 'txt')], X_EQ)
-    
-    # lb,rqd
-    fi_str = f"{wynik['fi_mm']:.0f}"
-    build_line([("l", 'italic'), ("b,rqd", 'sub'), (" = (", 'txt'), (SYM['fi'], 'txt'), (" / 4) · (", 'txt'), (SYM['sigma'], 'sym'), ("sd", 'sub'), (" / f", 'txt'), ("bd", 'sub'), (") = ", 'txt'), (f"({fi_str} / 4) · ({wynik['sigma_sd']:.1f} / {wynik['fbd']:.2f}) = ", 'txt'), (f"{wynik['lb_rqd']:.1f} mm", 'txt')], X_EQ)
-
-    # 3. ALFY
-    header_sec(f"Współczynniki wpływu {SYM['alpha']}", "3")
-    alphas = [
-        (1, wynik['alfa1']),
-        (2, wynik['alfa2']),
-        (3, wynik['alfa3']),
-        (5, wynik['alfa5']),
-        (6, wynik['alfa6'], f"   ({SYM['rho']}", "1", f" = {inputs['alfa6_in']})")
-    ]
-    for item in alphas:
-        segments = [(SYM['alpha'], 'italic'), (str(item[0]), 'sub'), (f" = {item[1]:.2f}", 'txt')]
-        if len(item) > 3:
-            segments.extend([(item[2], 'txt'), (item[3], 'sub'), (item[4], 'txt')])
-        build_line(segments, X_EQ)
-
-    if wynik['warning_alfa']:
-        new_line(0.5)
-        pdf.set_text_color(0, 0, 0)
-        build_line([("Warunek EC2 8.4.4(1): ", 'txt'), (SYM['alpha'], 'italic'), ("2", 'sub'), (" · ", 'txt'), (SYM['alpha'], 'italic'), ("3", 'sub'), (" · ", 'txt'), (SYM['alpha'], 'italic'), ("5", 'sub'), (" < 0.7 -> Przyjęto iloczyn = 0.7", 'txt')], X_EQ)
-        pdf.set_text_color(0, 0, 0)
-    
-    new_line()
-    build_line([(SYM['alpha'], 'italic'), ("global", 'sub'), (f" = {wynik['alfa_global']:.2f}", 'txt')], X_EQ)
+# Umowny "wysiłek" detalowania: stała za użycie środka + składnik za jego wielkość
+WYSILEK_OPCJI = {
+    "alfa2": 0.5,      # wykazanie otuliny cd
+    "alfa2_cd": 1.0,   # za każde Φ zwiększenia cd ponad obecne
+    "alfa3": 0.5,      # uwzględnienie zbrojenia poprzecznego
+    "alfa3_ast": 1.0,  # za każdy cm² zbrojenia poprzecznego
+    "alfa5": 0.5,      # wykazanie nacisku poprzecznego p
+    "alfa6": 1.0,      # za każdy stopień rozsunięcia zakładów (100% -> 50% -> ...)
+}
 
-    # 4. MINIMALNA
-    header_sec("Minimalna długość zakładu", "4")
-    build_line([("l", 'italic'), ("0,min", 'sub'), (f" = max(0.3 · {SYM['alpha']}", 'txt'), ("6", 'sub'), (" · l", 'txt'), ("b,rqd", 'sub'), (f"; 15{SYM['fi']}; 200 mm)", 'txt')], X_EQ)
-    
-    val1 = 0.3 * wynik['alfa6'] * wynik['lb_rqd']
-    val2 = 15.0 * wynik['fi_mm']
-    build_line([("      = max(", 'txt'), (f"{val1:.1f} mm; {val2:.1f} mm; 200 mm", 'txt'), (") = ", 'txt'), (f"{wynik['l0_min']:.1f} mm", 'txt')], X_EQ)
 
-    # 5. WYNIK
-    header_sec("Obliczenie długości zakładu", "5")
-    build_line([("l", 'italic'), ("0", 'sub'), (" = ", 'txt'), (SYM['alpha'], 'italic'), ("global", 'sub'), (" · l", 'txt'), ("b,rqd", 'sub'), (f" = {wynik['alfa_global']:.2f} · {wynik['lb_rqd']:.1f} = {wynik['l0_calc']:.1f} mm", 'txt')], X_EQ)
-    
-    new_line(2.0)
-    
-    # RAMKA WYNIKU
-    pdf.set_fill_color(235, 235, 235)
-    pdf.rect(MARGIN_LEFT, pdf.get_y(), 180, 14, 'F')
-    pdf.set_y(pdf.get_y() + 4)
-    pdf.set_x(MARGIN_LEFT + 5)
-    
-    # Etykieta: DUŻE LITERY, bez pogrubienia
-    pdf.set_font(main_font, "", 12)
-    pdf.write(LINE_H, fix_txt("WYMAGANA DŁUGOŚĆ ZAKŁADU:  "))
-    
-    # Symbol: POGRUBIONY
-    pdf.set_font(main_font, "B", 12)
-    pdf.write(LINE_H, fix_txt("l"))
-    
-    curr_x, curr_y = pdf.get_x(), pdf.get_y()
-    pdf.set_xy(curr_x, curr_y + 2)
-    pdf.set_font(main_font, "B", 8)
-    pdf.write(LINE_H, fix_txt("0,req"))
-    
-    # Wynik: POGRUBIONY
-    pdf.set_xy(pdf.get_x(), curr_y)
-    pdf.set_font(main_font, "B", 12)
-    pdf.write(LINE_H, fix_txt(f" = {wynik['l0_final']:.0f} mm"))
+def OptymalizujZaklad(
+    fi_mm: float,
+    klasa_betonu: str,
+    stal_nazwa: str,
+    procent_naprezenia: float,
+    warunki_przyczepnosci: str,
+    rodzaj_preta: str = "Rozciągany",
+    alfa6_dopuszczalne=tuple(MAPA_ALFA6),
+    cd_lista=(),
+    cd_aktualne: float | None = None,
+    sum_ast_lista=(),
+    K: float = 0.05,
+    sum_ast_min: float = 2.5,
+    p: float = 0.0,
+    wysilek: dict | None = None,
+) -> dict:
+    """
+    Przegląd wszystkich dopuszczalnych kombinacji środków zmniejszających l0
+    (cd z listy dla α2, ΣAst z listy dla α3, nacisk p dla α5, udział łączonych
+    prętów dla α6) jednym wywołaniem wersji wektorowej. Pręty łączone są
+    proste - α2 wg (cd - Φ)/Φ. Zwraca wszystkie warianty oraz indeksy
+    frontu Pareto (l0, wysiłek detalowania).
+    """
+    w = {**WYSILEK_OPCJI, **(wysilek or {})}
+    rozciagany = rodzaj_preta == "Rozciągany"
+    alfy = PoziomyAlfa(fi_mm, w, cd_lista, cd_aktualne, sum_ast_lista, p)
+
+    poziomy = {
+        "alfa6": [
+            (klucz, w["alfa6"] * stopien, "" if stopien == 0 else f"α6: łączone {klucz}")
+            for stopien, klucz in enumerate(MAPA_ALFA6)
+            if klucz in alfa6_dopuszczalne
+        ],
+        # Pręt ściskany: α2 = α3 = α5 = 1.0 - tylko poziomy "bez środka"
+        "cd": alfy["cd"] if rozciagany else alfy["cd"][:1],
+        "sum_ast": alfy["sum_ast"] if rozciagany else alfy["sum_ast"][:1],
+        "p": alfy["p"] if rozciagany else alfy["p"][:1],
+    }
+    if not poziomy["alfa6"]:
+        raise ValueError("Brak dopuszczalnych wartości udziału prętów łączonych (α6).")
 
-    return pdf.output(dest="S").encode("latin-1", "replace")
+    warianty = SiatkaOpcji(poziomy)
+    alfa2, alfa3, alfa5 = AlfyOpcji(
+        fi_mm, "Proste", warianty["cd"].astype(float), warianty["sum_ast"].astype(float),
+        warianty["p"].astype(float), K, sum_ast_min,
+    )
+    wynik = ObliczDlugoscZakladuWektorowo(
+        fi_mm, klasa_betonu, stal_nazwa, procent_naprezenia, warunki_przyczepnosci,
+        rodzaj_preta, warianty["alfa6"].astype(str), alfa2, alfa3, alfa5,
+    )
+    l0 = wynik["l0_final"]
+    return {
+        "l0": l0,
+        "wysilek": warianty["wysilek"],
+        "opis": warianty["opis"],
+        "alfa_global": wynik["alfa_global"],
+        "pareto": FrontPareto(l0, warianty["wysilek"]),
+        "n_wariantow": l0.size,
+    }
 
 # =============================================================================
-# GENERATOR DOCX
+# ZADANIE ODWROTNE (DOSTĘPNA DŁUGOŚĆ ZAKŁADU)
 # =============================================================================
 
-def add_docx_formatted(paragraph, text, base_bold=False):
-    replacements = {
-        r"\Phi": "Φ", r"\sigma": "σ", r"\alpha": "α", r"\eta": "η", 
-        r"\rho": "ρ", r"\cdot": "·", r"\le": "≤", r"\ge": "≥"
+def OdwrotnyZaklad(
+    l_dostepne,
+    fi_mm,
+    klasa_betonu,
+    stal_nazwa,
+    procent_naprezenia,
+    warunki_przyczepnosci,
+    rodzaj_preta,
+    alfa6_proc,
+    alfa2=1.0,
+    alfa3=1.0,
+    alfa5=1.0,
+    srednice=FI_LIST,
+    cd=np.nan,
+    sum_ast=np.nan,
+    K: float = 0.05,
+    sum_ast_min: float = 2.5,
+) -> dict:
+    """
+    Zadanie odwrotne dla danej (dostępnej) długości zakładu l_dostepne [mm]:
+    - "procent_max" - największe σsd/fyd [%] dla średnicy fi_mm
+      (l0 = max(α·lb,rqd; 0.3·α6·lb,rqd; 15Φ; 200) odwrócone wprost),
+    - "fi_max" - największa średnica z listy srednice przy procent_naprezenia.
+    α2 i α3 zależą od średnicy: podane cd [mm] i ΣAst [cm²] (K, ΣAst,min)
+    - liczone dla każdej średnicy (pręty proste); NaN - stałe alfa2, alfa3
+    dla wszystkich średnic (np. α = 1.0, bez redukcji).
+    Argumenty podlegają broadcastowi. NaN oznacza brak rozwiązania.
+    """
+    l_dostepne = np.asarray(l_dostepne, dtype=np.float64)
+    fi_mm = np.asarray(fi_mm, dtype=np.float64)
+
+    def alfy_23(fi, cd, sum_ast, alfa2, alfa3):
+        a2, a3, _ = AlfyOpcji(fi, "Proste", cd, sum_ast, 0.0, K, sum_ast_min)
+        return np.where(np.isnan(cd), alfa2, a2), np.where(np.isnan(sum_ast), alfa3, a3)
+
+    # --- σsd/fyd dla zadanej średnicy (postać zamknięta) ---
+    a2, a3 = alfy_23(fi_mm, np.asarray(cd, dtype=np.float64), np.asarray(sum_ast, dtype=np.float64), alfa2, alfa3)
+    w100 = ObliczDlugoscZakladuWektorowo(
+        fi_mm, klasa_betonu, stal_nazwa, 100.0, warunki_przyczepnosci,
+        rodzaj_preta, alfa6_proc, a2, a3, alfa5,
+    )
+    l_na_procent = np.maximum(w100["alfa_global"], 0.3 * w100["alfa6"]) * w100["lb_rqd"] / 100.0
+    l_min_stale = np.maximum(15.0 * fi_mm, 200.0)
+    mozliwe = l_dostepne >= l_min_stale
+    procent_max = np.where(mozliwe, np.minimum(l_dostepne / l_na_procent, 100.0), np.nan)
+
+    # --- Największa średnica dla zadanego σsd/fyd ---
+    srednice = np.asarray(srednice, dtype=np.float64)
+
+    def dodaj_os(x):
+        return np.asarray(x)[..., None]
+
+    a2, a3 = alfy_23(srednice, dodaj_os(np.asarray(cd, dtype=np.float64)),
+                     dodaj_os(np.asarray(sum_ast, dtype=np.float64)), dodaj_os(alfa2), dodaj_os(alfa3))
+    w_fi = ObliczDlugoscZakladuWektorowo(
+        srednice, dodaj_os(klasa_betonu), dodaj_os(stal_nazwa), dodaj_os(procent_naprezenia),
+        dodaj_os(warunki_przyczepnosci), dodaj_os(rodzaj_preta), dodaj_os(alfa6_proc),
+        a2, a3, dodaj_os(alfa5),
+    )
+    dlugosci = np.broadcast_to(w_fi["l0_final"], np.broadcast_shapes(w_fi["l0_final"].shape, l_dostepne.shape + (1,)))
+    fi_max = NajwiekszaSrednica(dlugosci, l_dostepne, srednice)
+
+    return {
+        "l_dostepne": l_dostepne,
+        "procent_max": procent_max,
+        "sigma_sd_max": procent_max / 100.0 * w100["fyd"],
+        "l_min_stale": l_min_stale,
+        "fi_max": fi_max,
     }
-    for k, v in replacements.items():
-        text = text.replace(k, v)
-    
-    tokens = re.split(r'(_\{[^}]+\}|_[a-zA-Z0-9,]+)', text)
-    
-    for token in tokens:
-        if not token: continue
-        
-        if token.startswith("_{") and token.endswith("}"):
-            sub_text = token[2:-1]
-            r = paragraph.add_run(sub_text)
-            r.font.subscript = True
-            if base_bold: r.bold = True
-        elif token.startswith("_"):
-            sub_text = token[1:]
-            r = paragraph.add_run(sub_text)
-            r.font.subscript = True
-            if base_bold: r.bold = True
-        else:
-            r = paragraph.add_run(token)
-            if base_bold: r.bold = True
 
-def create_docx_report(wynik: dict, inputs: dict) -> BytesIO:
-    doc = Document()
-    style = doc.styles["Normal"]
-    style.font.name = "Times New Roman"
-    style.font.size = Pt(11)
-
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    r = p.add_run("DŁUGOŚĆ ZAKŁADU PRĘTÓW ZBROJENIOWYCH")
-    r.bold = True
-    r.font.size = Pt(16)
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p.add_run("wg PN-EN 1992-1-1")
-    
-    doc.add_paragraph("_" * 70).alignment = WD_ALIGN_PARAGRAPH.CENTER
+# =============================================================================
+# RAPORT (PDF / DOCX)
+# =============================================================================
 
-    def add_line(txt, bold=False):
-        p = doc.add_paragraph()
-        add_docx_formatted(p, txt, base_bold=bold)
+# Wersja treści raportu - zwiększana przy zmianie raportu (unieważnia pliki NARZEDZIA.PamiecRaportow)
+WERSJA_RAPORTU = 1
+
+
+@pamietaj(maks_wpisow=256, klucz=KluczJSON)
+def RaportZakladu(wynik: dict, inputs: dict) -> Raport:
+    """Treść raportu (NARZEDZIA.RaportIR), wspólna dla PDF, DOCX i HTML."""
+    a, fi, eta, sigma, rho = SYM["alpha"], SYM["fi"], SYM["eta"], SYM["sigma"], SYM["rho"]
+
+    bloki = [
+        Tytul("DŁUGOŚĆ ZAKŁADU PRĘTÓW ZBROJENIOWYCH", "wg PN-EN 1992-1-1"),
+
+        # 1. PARAMETRY
+        Naglowek("1", Fr("Parametry materiałowe")),
+        Linia(Fr(f"- Średnica pręta: {fi} = {wynik['fi_mm']:.0f} mm"), 1),
+        Linia(Fr(f"- Beton: {wynik['klasa_betonu']} (f_{{ctd}} = {wynik['fctd']:.2f} MPa)"), 1),
+        Linia(Fr(f"- Stal: {wynik['stal_nazwa']} (f_{{yk}} = {wynik['fyk']:.0f} MPa, f_{{yd}} = {wynik['fyd']:.1f} MPa)"), 1),
+
+        # 2. PODSTAWOWA DŁUGOŚĆ
+        Naglowek("2", Fr("Podstawowa długość zakotwienia")),
+        Linia(Fr(f"- Warunki przyczepności: {inputs['warunki']} ({eta}_{{1}} = {wynik['eta1']})"), 1),
+        Linia(Fr(f"- Współczynnik średnicy: {eta}_{{2}} = {wynik['eta2']:.2f}"), 1),
+        Odstep(0.5),
+        Linia(Fr(f"Przyczepność graniczna: *f*_{{bd}} = 2.25 · {eta}_{{1}} · {eta}_{{2}} · f_{{ctd}} = {wynik['fbd']:.2f} MPa"), 2),
+        Linia(Fr(f"*l*_{{b,rqd}} = ({fi} / 4) · ({sigma}_{{sd}} / f_{{bd}}) = "
+                 f"({wynik['fi_mm']:.0f} / 4) · ({wynik['sigma_sd']:.1f} / {wynik['fbd']:.2f}) = {wynik['lb_rqd']:.1f} mm"), 2),
+
+        # 3. ALFY
+        Naglowek("3", Fr(f"Współczynniki wpływu {a}")),
+        *(Linia(Fr(f"*{a}*_{{{i}}} = {wynik[f'alfa{i}']:.2f}"), 2) for i in (1, 2, 3, 5)),
+        Linia(Fr(f"*{a}*_{{6}} = {wynik['alfa6']:.2f}   ({rho}_{{1}} = {inputs['alfa6_in']})"), 2),
+    ]
+    if wynik["warning_alfa"]:
+        bloki += [
+            Odstep(0.5),
+            Linia(Fr(f"Warunek EC2 8.4.4(1): *{a}*_{{2}} · *{a}*_{{3}} · *{a}*_{{5}} < 0.7 -> Przyjęto iloczyn = 0.7"), 2),
+        ]
+    bloki += [
+        Odstep(),
+        Linia(Fr(f"*{a}*_{{global}} = {wynik['alfa_global']:.2f}"), 2),
+
+        # 4. MINIMALNA
+        Naglowek("4", Fr("Minimalna długość zakładu")),
+        Linia(Fr(f"*l*_{{0,min}} = max(0.3 · {a}_{{6}} · l_{{b,rqd}}; 15{fi}; 200 mm)"), 2),
+        Linia(Fr(f"      = max({0.3 * wynik['alfa6'] * wynik['lb_rqd']:.1f} mm; {15.0 * wynik['fi_mm']:.1f} mm; 200 mm) = {wynik['l0_min']:.1f} mm"), 2),
+
+        # 5. WYNIK
+        Naglowek("5", Fr("Obliczenie długości zakładu")),
+        Linia(Fr(f"*l*_{{0}} = *{a}*_{{global}} · l_{{b,rqd}} = {wynik['alfa_global']:.2f} · {wynik['lb_rqd']:.1f} = {wynik['l0_calc']:.1f} mm"), 2),
+        Odstep(2.0),
+        Wynik("WYMAGANA DŁUGOŚĆ ZAKŁADU:", Fr(f"l_{{0,req}} = {wynik['l0_final']:.0f} mm")),
+    ]
+    return Raport("DlugoscZakladu", tuple(bloki))
 
-    doc.add_heading("1. Parametry materiałowe", level=1)
-    add_line(f"- Średnica pręta: \\Phi = {wynik['fi_mm']:.0f} mm")
-    add_line(f"- Beton: {wynik['klasa_betonu']} (f_{{ctd}} = {wynik['fctd']:.2f} MPa)")
-    add_line(f"- Stal: {wynik['stal_nazwa']} (f_{{yk}} = {wynik['fyk']:.0f} MPa, f_{{yd}} = {wynik['fyd']:.1f} MPa)")
 
-    h = doc.add_heading(level=1)
-    add_docx_formatted(h, "2. Podstawowa długość zakotwienia (l_{b,rqd})")
-    
-    add_line(f"- Warunki przyczepności: {inputs['warunki']} (\\eta_1 = {wynik['eta1']})")
-    add_line(f"- Współczynnik średnicy: \\eta_2 = {wynik['eta2']:.2f}")
-    add_line(f"- Przyczepność graniczna f_{{bd}} = {wynik['fbd']:.2f} MPa")
-    
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    add_docx_formatted(p, f"l_{{b,rqd}} = {wynik['lb_rqd']:.1f} mm", base_bold=False)
+@raport_na_dysku("pdf", wersja=WERSJA_RAPORTU)
+def create_pdf_report(wynik: dict, inputs: dict, pdf: "FPDF | None" = None) -> bytes | None:
+    """Raport PDF; z argumentem pdf dopisuje raport do istniejącego dokumentu (od nowej strony)."""
+    return Renderuj(RaportZakladu(wynik, inputs), "pdf", pdf=pdf)
 
-    h = doc.add_heading(level=1)
-    add_docx_formatted(h, "3. Współczynniki wpływu \\alpha")
-    
-    add_line(f"- \\alpha_1 = {wynik['alfa1']:.2f}")
-    add_line(f"- \\alpha_2 = {wynik['alfa2']:.2f}")
-    add_line(f"- \\alpha_3 = {wynik['alfa3']:.2f}")
-    add_line(f"- \\alpha_5 = {wynik['alfa5']:.2f}")
-    add_line(f"- \\alpha_6 = {wynik['alfa6']:.2f} (\\rho_1 = {inputs['alfa6_in']})")
-    
-    if wynik['warning_alfa']:
-        p = doc.add_paragraph()
-        r = p.add_run("Warunek EC2 8.4.4(1): ")
-        r.font.color.rgb = RGBColor(0, 0, 0)
-        add_docx_formatted(p, "\\alpha_2 \\cdot \\alpha_3 \\cdot \\alpha_5 < 0.7 -> Przyjęto iloczyn = 0.7")
-    
-    add_line(f"\\alpha_{{global}} = {wynik['alfa_global']:.2f}", bold=False)
 
-    h = doc.add_heading(level=1)
-    add_docx_formatted(h, "4. Minimalna długość zakładu (l_{0,min})")
-    add_line(f"l_{{0,min}} = {wynik['l0_min']:.1f} mm")
+@raport_na_dysku("docx", wersja=WERSJA_RAPORTU)
+def create_docx_report(wynik: dict, inputs: dict) -> BytesIO:
+    return Renderuj(RaportZakladu(wynik, inputs), "docx")
 
-    h = doc.add_heading(level=1)
-    add_docx_formatted(h, "5. Obliczenie długości zakładu (l_0)")
-    
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    add_docx_formatted(p, f"l_0 = {wynik['alfa_global'] * wynik['lb_rqd']:.1f} mm")
-    
-    # Wynik końcowy
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    p.paragraph_format.left_indent = Cm(1.0)
-    
-    r = p.add_run("WYMAGANA DŁUGOŚĆ ZAKŁADU: ")
-    r.bold = False
-    r.font.size = Pt(12)
-    
-    add_docx_formatted(p, f"l_{{0,req}} = {wynik['l0_final']:.0f} mm", base_bold=True)
-    p.runs[-1].font.size = Pt(12)
 
-    buffer = BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
-    return buffer
+def create_html_report(wynik: dict, inputs: dict, pelny: bool = False) -> str:
+    """Raport HTML bez fpdf i python-docx: podgląd na stronie lub plik .html (pelny=True)."""
+    return Renderuj(RaportZakladu(wynik, inputs), "html", pelny=pelny)
+
+
+def create_md_report(wynik: dict, inputs: dict) -> str:
+    return Renderuj(RaportZakladu(wynik, inputs), "md")
 
 # =============================================================================
 # STRONA STREAMLIT
@@ -527,9 +538,8 @@ def StronaDlugoscZakladu():
         with cr:
             warunki = st.radio("wp_label", ["Dobre", "Złe"], label_visibility="collapsed")
         with ce:
-            with st.expander("ℹ️ Pomoc: Warunki przyczepności (Rysunek 8.2)"):
-                img_path = SCIEZKA_FOLDERU_LOKALNEGO / "DlugoscZakladu_WarunkiPrzyczepnosci.png"
-                if img_path.exists(): st.image(str(img_path), use_container_width=True)
+            PomocZRysunkiem("ℹ️ Pomoc: Warunki przyczepności (Rysunek 8.2)",
+                            SCIEZKA_FOLDERU_LOKALNEGO / "DlugoscZakladu_WarunkiPrzyczepnosci.png")
 
     st.markdown("---")
 
@@ -539,6 +549,8 @@ def StronaDlugoscZakladu():
     rodzaj_preta = st.radio("Rodzaj pręta", ["Ściskany", "Rozciągany"], index=0, horizontal=True)
 
     a2_val, a3_val, a5_val = 1.0, 1.0, 1.0
+    # cd i ΣAst dla zadania odwrotnego (α2, α3 liczone dla każdej średnicy); NaN - nieuwzględnione
+    cd_odw, sum_ast_odw, K_in, sum_ast_min_in = np.nan, np.nan, 0.05, 2.5
 
     if rodzaj_preta == "Rozciągany":
         col_a2, col_a3, col_a5 = st.columns(3)
@@ -551,14 +563,11 @@ def StronaDlugoscZakladu():
             
             cd_in = 30.0
             if u_a2:
-                with st.expander("ℹ️ Pomoc: Rysunek $c_d$"):
-                    img_cd = SCIEZKA_FOLDERU_LOKALNEGO / "DlugoscZakladu_Wspolczynnik cd.png"
-                    if img_cd.exists(): st.image(str(img_cd), use_container_width=True)
+                PomocZRysunkiem("ℹ️ Pomoc: Rysunek $c_d$", SCIEZKA_FOLDERU_LOKALNEGO / "DlugoscZakladu_Wspolczynnik cd.png")
                 cd_in = st.number_input("Współczynnik $c_d$ [mm]", value=30.0, step=1.0)
                 
-            val = 1.0 - 0.15 * (cd_in - fi_mm) / fi_mm
-            if not u_a2: val = 1.0
-            a2_val = max(0.7, min(1.0, val))
+            a2_val = float(Alfa2(cd_in, fi_mm)) if u_a2 else 1.0
+            cd_odw = cd_in if u_a2 else np.nan
 
         with col_a3:
             st.markdown("""<b>$\\alpha_3$: Zbrojenie poprzeczne (nieprzyspojone)</b>""", unsafe_allow_html=True)
@@ -568,19 +577,13 @@ def StronaDlugoscZakladu():
             
             K_in, sum_ast_in, sum_ast_min_in = 0.05, 0.0, 2.5
             if u_a3:
-                with st.expander("ℹ️ Pomoc: Rysunek $K$"):
-                    img_k = SCIEZKA_FOLDERU_LOKALNEGO / "DlugoscZakladu_Wspolczynnik K.png"
-                    if img_k.exists(): st.image(str(img_k), use_container_width=True)
+                PomocZRysunkiem("ℹ️ Pomoc: Rysunek $K$", SCIEZKA_FOLDERU_LOKALNEGO / "DlugoscZakladu_Wspolczynnik K.png")
                 K_in = st.selectbox("Współczynnik $K$", [0.1, 0.05, 0.0], index=1)
                 sum_ast_in = st.number_input("$\\Sigma A_{st}$ [cm²]", value=0.0, step=0.1)
                 sum_ast_min_in = st.number_input("$\\Sigma A_{st,min}$ [cm²]", value=2.5, step=0.1)
             
-            As_1 = (math.pi * fi_mm**2)/400.0
-            val_a3 = 1.0
-            if u_a3 and As_1 > 0:
-                lamb = (sum_ast_in - sum_ast_min_in) / As_1
-                val_a3 = 1.0 - K_in * lamb
-            a3_val = max(0.7, min(1.0, val_a3))
+            a3_val = float(Alfa3(sum_ast_in, fi_mm, K_in, sum_ast_min_in)) if u_a3 else 1.0
+            sum_ast_odw = sum_ast_in if u_a3 else np.nan
 
         with col_a5:
             st.markdown("""<b>$\\alpha_5$: Nacisk poprzeczny</b>""", unsafe_allow_html=True)
@@ -593,10 +596,7 @@ def StronaDlugoscZakladu():
                 st.write("p - nacisk poprzeczny w [MPa] wzdłuż lbd w stanie granicznym nośności")
                 p_in = st.number_input("p_input_label", value=8.0, step=0.5, label_visibility="collapsed")
             
-            val_a5 = 1.0
-            if u_a5:
-                val_a5 = 1.0 - 0.04 * p_in
-            a5_val = max(0.7, min(1.0, val_a5))
+            a5_val = float(Alfa5(p_in)) if u_a5 else 1.0
 
     st.markdown("<br>", unsafe_allow_html=True)
 
@@ -611,14 +611,16 @@ def StronaDlugoscZakladu():
         label_visibility="collapsed"
     )
     
-    with st.expander("ℹ️ Pomoc: Wartości współczynników $\\alpha$ (Tablica 8.2 i 8.3)"):
-        c_h1, c_h2 = st.columns(2)
-        with c_h1:
-            img_a15 = SCIEZKA_FOLDERU_LOKALNEGO / "DlugoscZakladu_alfa1-alfa5.png"
-            if img_a15.exists(): st.image(str(img_a15), use_container_width=True)
-        with c_h2:
-            img_a6 = SCIEZKA_FOLDERU_LOKALNEGO / "DlugoscZakladu_alfa6.png"
-            if img_a6.exists(): st.image(str(img_a6), use_container_width=True)
+    # Treść pomocy (rysunki) wykonywana tylko po rozwinięciu (NARZEDZIA.Rysunki)
+    pomoc_alfa = st.expander("ℹ️ Pomoc: Wartości współczynników $\\alpha$ (Tablica 8.2 i 8.3)", key="pomoc_alfa_zakladu",
+                             on_change="rerun")
+    if pomoc_alfa.open:
+        with pomoc_alfa:
+            c_h1, c_h2 = st.columns(2)
+            with c_h1:
+                PokazRysunek(SCIEZKA_FOLDERU_LOKALNEGO / "DlugoscZakladu_alfa1-alfa5.png")
+            with c_h2:
+                PokazRysunek(SCIEZKA_FOLDERU_LOKALNEGO / "DlugoscZakladu_alfa6.png")
 
     st.markdown("---")
 
@@ -665,21 +667,41 @@ def StronaDlugoscZakladu():
         
         st.markdown("<div style='height: 20px;'></div>", unsafe_allow_html=True)
         
-        col_pdf, col_docx = st.columns(2)
-        with col_pdf:
-            data_pdf = create_pdf_report(res, inp)
+        format_raportu = st.radio(
+            "Raport", ["Podgląd HTML", "Markdown", "PDF", "Word"], index=0, horizontal=True, key="zakl_format_raportu"
+        )
+        # Tworzony jest tylko wybrany format; podgląd HTML i Markdown nie ładują fpdf / python-docx
+        if format_raportu == "Podgląd HTML":
+            st.markdown(create_html_report(res, inp), unsafe_allow_html=True)
+            st.download_button(
+                "🌐 POBIERZ RAPORT HTML",
+                create_html_report(res, inp, pelny=True),
+                file_name="DlugoscZakladu.html",
+                mime="text/html",
+                use_container_width=True
+            )
+        elif format_raportu == "Markdown":
+            data_md = create_md_report(res, inp)
+            st.code(data_md, language="markdown")
+            st.download_button(
+                "📋 POBIERZ RAPORT MARKDOWN",
+                data_md,
+                file_name="DlugoscZakladu.md",
+                mime="text/markdown",
+                use_container_width=True
+            )
+        elif format_raportu == "PDF":
             st.download_button(
                 "📄 POBIERZ RAPORT PDF",
-                data_pdf,
+                create_pdf_report(res, inp),
                 file_name="DlugoscZakladu.pdf",
                 mime="application/pdf",
                 use_container_width=True
             )
-        with col_docx:
-            data_docx = create_docx_report(res, inp)
+        else:
             st.download_button(
                 "📝 POBIERZ RAPORT WORD",
-                data_docx,
+                create_docx_report(res, inp),
                 file_name="DlugoscZakladu.docx",
                 mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                 use_container_width=True
@@ -730,5 +752,106 @@ def StronaDlugoscZakladu():
             st.latex(rf"l_0 = \alpha_{{global}} \cdot l_{{b,rqd}} = {res['alfa_global']:.2f} \cdot {res['lb_rqd']:.1f} = {l0_calc:.1f} \text{{ mm}}")
             st.latex(rf"l_{{0,req}} = \max(l_0; l_{{0,min}}) = \mathbf{{{res['l0_final']:.1f}}} \text{{ mm}}")
 
+    # WARIANTY MINIMALNEJ DŁUGOŚCI
+    st.markdown("---")
+    with st.expander("🔎 Warianty minimalnej długości (front Pareto)", expanded=False):
+        st.write(
+            "Przegląd wszystkich kombinacji środków zmniejszających długość zakładu l0 (α2, α3, α5, udział prętów łączonych α6). "
+            "Wysiłek detalowania jest umowny - pokazywane są tylko warianty, dla których "
+            "nie istnieje wariant jednocześnie krótszy i prostszy."
+        )
+        c_o1, c_o2, c_o3 = st.columns(3)
+        with c_o1:
+            cd_txt = st.text_input("Rozważane $c_d$ [mm] (rozdzielone przecinkami)", value="", key="zakl_cd_lista")
+            cd_akt = st.number_input("Obecne $c_d$ [mm]", value=float(fi_mm), step=1.0, key="zakl_cd_akt")
+        with c_o2:
+            ast_txt = st.text_input("Rozważane $\\Sigma A_{st}$ [cm²]", value="1.0, 2.0, 4.0", key="zakl_ast_lista")
+            K_opt = st.selectbox("Współczynnik $K$", [0.1, 0.05, 0.0], index=1, key="zakl_K")
+        with c_o3:
+            ast_min_opt = st.number_input("$\\Sigma A_{st,min}$ [cm²]", value=2.5, step=0.1, key="zakl_ast_min")
+            p_opt = st.number_input("Nacisk poprzeczny p [MPa] (0 - brak)", value=0.0, step=0.5, key="zakl_p")
+
+        if st.button("SZUKAJ WARIANTÓW", use_container_width=True, key="zakl_szukaj"):
+            try:
+                cd_lista = [float(x) for x in cd_txt.replace(";", ",").split(",") if x.strip()]
+                ast_lista = [float(x) for x in ast_txt.replace(";", ",").split(",") if x.strip()]
+                st.session_state["wynik_zakl_opt"] = OptymalizujZaklad(
+                    float(fi_mm), klasa_betonu, stal_nazwa, float(naprezenie), warunki,
+                    rodzaj_preta=rodzaj_preta,
+                    cd_lista=cd_lista,
+                    cd_aktualne=cd_akt,
+                    sum_ast_lista=ast_lista,
+                    K=K_opt,
+                    sum_ast_min=ast_min_opt,
+                    p=p_opt,
+                )
+                st.session_state["pokaz_zakl_opt"] = True
+            except (KeyError, ValueError) as e:
+                st.error(f"Wystąpił błąd podczas obliczeń: {e}")
+                st.session_state["pokaz_zakl_opt"] = False
+
+        if st.session_state.get("pokaz_zakl_opt", False):
+            opt = st.session_state["wynik_zakl_opt"]
+            idx = opt["pareto"]
+            st.caption(f"Przeanalizowano {opt['n_wariantow']} wariantów, front Pareto: {len(idx)}.")
+            st.dataframe(
+                {
+                    "l_0 [mm]": [int(math.ceil(opt["l0"][i] - 1e-9)) for i in idx],
+                    "α_global": [round(float(opt["alfa_global"][i]), 3) for i in idx],
+                    "Wysiłek": [round(float(opt["wysilek"][i]), 2) for i in idx],
+                    "Środki": [opt["opis"][i] for i in idx],
+                },
+                use_container_width=True,
+                hide_index=True,
+            )
+
+    # ZADANIE ODWROTNE
+    with st.expander("↩️ Zadanie odwrotne: dostępna długość zakładu", expanded=False):
+        st.write(
+            "Dla każdej dostępnej długości: największe $\\sigma_{sd}/f_{yd}$ dla wybranej średnicy "
+            "oraz największa średnica przy zadanym $\\sigma_{sd}/f_{yd}$. "
+            "Współczynniki $\\alpha$ jak w danych powyżej; $\\alpha_2$ i $\\alpha_3$ liczone dla każdej "
+            "średnicy z $c_d$ i $\\Sigma A_{st}$."
+        )
+        c_i1, c_i2, c_i3 = st.columns(3)
+        with c_i1:
+            l_od = st.number_input("Długość od [mm]", value=200.0, step=50.0, key="zakl_inv_od")
+        with c_i2:
+            l_do = st.number_input("Długość do [mm]", value=1000.0, step=50.0, key="zakl_inv_do")
+        with c_i3:
+            l_krok = st.number_input("Krok [mm]", value=50.0, min_value=1.0, step=10.0, key="zakl_inv_krok")
+
+        if st.button("ROZWIĄŻ ZADANIE ODWROTNE", use_container_width=True, key="zakl_inv_btn"):
+            try:
+                if l_do < l_od:
+                    raise ValueError("Długość końcowa mniejsza od początkowej.")
+                l_tab = np.arange(l_od, l_do + 0.5 * l_krok, l_krok)
+                st.session_state["wynik_zakl_inv"] = OdwrotnyZaklad(
+                    l_tab, float(fi_mm), klasa_betonu, stal_nazwa, float(naprezenie), warunki,
+                    rodzaj_preta, alfa6_proc, a2_val, a3_val, a5_val,
+                    cd=cd_odw, sum_ast=sum_ast_odw, K=K_in, sum_ast_min=sum_ast_min_in,
+                )
+                st.session_state["pokaz_zakl_inv"] = True
+            except (KeyError, ValueError) as e:
+                st.error(f"Wystąpił błąd podczas obliczeń: {e}")
+                st.session_state["pokaz_zakl_inv"] = False
+
+        if st.session_state.get("pokaz_zakl_inv", False):
+            inv = st.session_state["wynik_zakl_inv"]
+            st.dataframe(
+                {
+                    "l_0,dost [mm]": [f"{x:.0f}" for x in inv["l_dostepne"]],
+                    f"max σsd/fyd dla Φ{fi_mm} [%]": [
+                        "—" if np.isnan(x) else f"{x:.1f}" for x in inv["procent_max"]
+                    ],
+                    "max σsd [MPa]": ["—" if np.isnan(x) else f"{x:.1f}" for x in inv["sigma_sd_max"]],
+                    f"max Φ przy {naprezenie}% [mm]": [
+                        "—" if np.isnan(x) else f"{x:.0f}" for x in inv["fi_max"]
+                    ],
+                },
+                use_container_width=True,
+                hide_index=True,
+            )
+
 if __name__ == "__main__":
     StronaDlugoscZakladu()
\ No newline at end of file
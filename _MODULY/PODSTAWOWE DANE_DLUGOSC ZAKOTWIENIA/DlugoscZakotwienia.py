@@ -6,17 +6,19 @@ Wersja: ENGINEERING_STANDARD_V33 (Horizontal Alpha 4 Compression Input)
 import streamlit as st
 from pathlib import Path
 from io import BytesIO
+import os
 import sys
 import math
-import re
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+from typing import TYPE_CHECKING
 
-# Biblioteki do PDF
-from fpdf import FPDF
+import numpy as np
+import matplotlib.pyplot as plt
 
-# Biblioteki do DOCX
-from docx import Document
-from docx.shared import Pt, Cm, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+if TYPE_CHECKING:
+    from fpdf import FPDF
 
 # --- KONFIGURACJA ŚCIEŻEK ---
 SCIEZKA_PLIKU = Path(__file__).resolve()
@@ -31,8 +33,6 @@ for parent in SCIEZKA_PLIKU.parents:
 if SCIEZKA_BAZOWA is None:
     SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
 
-SCIEZKA_CZCIONKI = SCIEZKA_BAZOWA / "CZCIONKI"
-
 if str(SCIEZKA_BAZOWA) not in sys.path:
     sys.path.append(str(SCIEZKA_BAZOWA))
 
@@ -53,6 +53,16 @@ try:
 except ImportError:
     STAL_DATA = STAL_DATA_FALLBACK
 
+from NARZEDZIA.GrafZaleznosci import GrafZaleznosci
+from NARZEDZIA.Pamiec import KluczJSON, pamietaj
+from NARZEDZIA.PamiecRaportow import raport_na_dysku
+from NARZEDZIA.RaportIR import Fr, Linia, Naglowek, Odstep, Raport, Renderuj, Tytul, Wynik
+from NARZEDZIA.PrzegladParametrow import PrzegladParametrow
+from NARZEDZIA.Rysunki import PomocZRysunkiem
+from NARZEDZIA.WspolczynnikiAlfa import (
+    Alfa2, Alfa3, Alfa5, AlfyOpcji, FrontPareto, NajwiekszaSrednica, PoziomyAlfa, SiatkaOpcji, ZTabeli,
+)
+
 BETON_DATA = {
     "C12/15":  [12, 1.6],
     "C16/20":  [16, 1.9],
@@ -83,6 +93,84 @@ SYM = {
 # LOGIKA OBLICZENIOWA
 # =============================================================================
 
+GAMMA_C = 1.4
+GAMMA_S = 1.15
+
+# --- Kroki obliczeń: jedna implementacja dla wersji skalarnej, wektorowej i grafu ---
+# (argumenty - liczby lub tablice numpy; dla skalarów wynik skalarny)
+
+
+def _fctm(klasa_betonu):
+    return ZTabeli(klasa_betonu, {k: v[1] for k, v in BETON_DATA.items()}, "klasa betonu")
+
+
+def _fyk(stal_nazwa):
+    return ZTabeli(stal_nazwa, STAL_DATA, "klasa stali")
+
+
+def _fctd(fctm):
+    return 0.7 * fctm / GAMMA_C
+
+
+def _fyd(fyk):
+    return fyk / GAMMA_S
+
+
+def _eta1(warunki_przyczepnosci):
+    return np.where(np.asarray(warunki_przyczepnosci) == "Dobre", 1.0, 0.7)[()]
+
+
+def _eta2(fi_mm):
+    fi_mm = np.asarray(fi_mm, dtype=np.float64)
+    return np.where(fi_mm > 32, (132 - fi_mm) / 100.0, 1.0)[()]
+
+
+def _fbd(eta1, eta2, fctd):
+    return 2.25 * eta1 * eta2 * fctd
+
+
+def _sigma_sd(procent_naprezenia, fyd):
+    return (np.asarray(procent_naprezenia, dtype=np.float64) / 100.0 * fyd)[()]
+
+
+def _lb_rqd(fi_mm, sigma_sd, fbd):
+    return (np.asarray(fi_mm, dtype=np.float64) / 4.0 * (sigma_sd / fbd))[()]
+
+
+def _rozciagany(rodzaj_preta):
+    return (np.asarray(rodzaj_preta) == "Rozciągany")[()]
+
+
+def _alfa1(rodzaj_preta, ksztalt_preta):
+    return np.where(_rozciagany(rodzaj_preta) & (np.asarray(ksztalt_preta) != "Proste"), 0.7, 1.0)[()]
+
+
+def _alfy_235(rodzaj_preta, alfa2, alfa3, alfa5) -> tuple:
+    """(α2, α3, α5); pręt inny niż rozciągany (ściskany): α2 = α3 = α5 = 1.0."""
+    rozciagany = _rozciagany(rodzaj_preta)
+    return tuple(np.where(rozciagany, np.asarray(a, dtype=np.float64), 1.0)[()] for a in (alfa2, alfa3, alfa5))
+
+
+def _warning_alfa(rodzaj_preta, alfy_235):
+    return (_rozciagany(rodzaj_preta) & (alfy_235[0] * alfy_235[1] * alfy_235[2] < 0.7))[()]
+
+
+def _alfa_global(alfa1, alfa4, alfy_235, warning_alfa):
+    prod_a235 = np.where(warning_alfa, 0.7, alfy_235[0] * alfy_235[1] * alfy_235[2])
+    return (alfa1 * np.asarray(alfa4, dtype=np.float64) * prod_a235)[()]
+
+
+def _lb_min(rodzaj_preta, lb_rqd, fi_mm):
+    wsp = np.where(_rozciagany(rodzaj_preta), 0.3, 0.6)
+    return np.maximum(np.maximum(wsp * lb_rqd, 10.0 * np.asarray(fi_mm, dtype=np.float64)), 100.0)[()]
+
+
+def _jako_python(wynik: dict) -> dict:
+    """Skalary numpy -> float/bool (raporty, klucze JSON, porównania w interfejsie)."""
+    return {k: v.item() if isinstance(v, (np.generic, np.ndarray)) and np.ndim(v) == 0 else v for k, v in wynik.items()}
+
+
+@pamietaj
 def ObliczDlugoscZakotwienia(
     fi_mm: float,
     klasa_betonu: str,
@@ -96,62 +184,81 @@ def ObliczDlugoscZakotwienia(
     alfa4: float = 1.0,
     alfa5: float = 1.0
 ) -> dict:
-    
-    fck, fctm = BETON_DATA.get(klasa_betonu, [20, 2.2])
-    fyk = STAL_DATA.get(stal_nazwa, 500)
-    
-    gamma_c = 1.4
-    gamma_s = 1.15
-    
-    fctk_005 = 0.7 * fctm
-    fctd = fctk_005 / gamma_c
-    
-    eta1 = 1.0 if warunki_przyczepnosci == "Dobre" else 0.7
-    eta2 = 1.0
-    if fi_mm > 32:
-        eta2 = (132 - fi_mm) / 100.0
-        
-    fbd = 2.25 * eta1 * eta2 * fctd
-    
-    fyd = fyk / gamma_s
-    sigma_sd = (procent_naprezenia / 100.0) * fyd
-    lb_rqd = (fi_mm / 4.0) * (sigma_sd / fbd)
-    
-    alfa1 = 1.0
-    if rodzaj_preta == "Rozciągany":
-        if ksztalt_preta != "Proste":
-            alfa1 = 0.7
-    
-    if rodzaj_preta == "Ściskany":
-        alfa1 = 1.0
-        alfa2 = 1.0
-        alfa3 = 1.0
-        alfa5 = 1.0
+    """Długość zakotwienia lbd (PN-EN 1992-1-1, 8.4) - wynik wersji wektorowej dla skalarów."""
+    wynik = _jako_python(ObliczDlugoscZakotwieniaWektorowo(
+        fi_mm, klasa_betonu, stal_nazwa, procent_naprezenia, warunki_przyczepnosci,
+        rodzaj_preta, ksztalt_preta, alfa2, alfa3, alfa4, alfa5,
+    ))
+    wynik["fi_mm"] = fi_mm
+    return {
+        **wynik,
+        "klasa_betonu": klasa_betonu,
+        "stal_nazwa": stal_nazwa,
+        "rodzaj_preta": rodzaj_preta,
+        "ksztalt_preta": ksztalt_preta,
+    }
+
+def ObliczDlugoscZakotwieniaWektorowo(
+    fi_mm,
+    klasa_betonu,
+    stal_nazwa,
+    procent_naprezenia,
+    warunki_przyczepnosci,
+    rodzaj_preta,
+    ksztalt_preta,
+    alfa2=1.0,
+    alfa3=1.0,
+    alfa4=1.0,
+    alfa5=1.0
+) -> dict:
+    """
+    Wersja wektorowa ObliczDlugoscZakotwienia - te same wzory, ale każdy
+    argument może być tablicą numpy (broadcast). Zwraca słownik tablic
+    z kluczami liczbowymi jak wersja skalarna.
+    """
+    fyk = _fyk(stal_nazwa)
+    wynik = _ZakotwienieZMaterialow(
+        fi_mm, _fctd(_fctm(klasa_betonu)), _fyd(fyk), procent_naprezenia, warunki_przyczepnosci,
+        rodzaj_preta, ksztalt_preta, alfa2, alfa3, alfa4, alfa5,
+    )
+    wynik["fyk"] = fyk
+    return wynik
+
+
+def _ZakotwienieZMaterialow(
+    fi_mm,
+    fctd,
+    fyd,
+    procent_naprezenia,
+    warunki_przyczepnosci,
+    rodzaj_preta,
+    ksztalt_preta,
+    alfa2=1.0,
+    alfa3=1.0,
+    alfa4=1.0,
+    alfa5=1.0
+) -> dict:
+    """Wzory 8.2 - 8.6 dla zadanych wytrzymałości fctd, fyd [MPa] (tablice numpy)."""
+    fi_mm = np.asarray(fi_mm, dtype=np.float64)
+    eta1 = _eta1(warunki_przyczepnosci)
+    eta2 = _eta2(fi_mm)
+    fbd = _fbd(eta1, eta2, fctd)
+
+    sigma_sd = _sigma_sd(procent_naprezenia, fyd)
+    lb_rqd = _lb_rqd(fi_mm, sigma_sd, fbd)
+
+    alfa1 = _alfa1(rodzaj_preta, ksztalt_preta)
+    alfy_235 = _alfy_235(rodzaj_preta, alfa2, alfa3, alfa5)
+    warning_alfa = _warning_alfa(rodzaj_preta, alfy_235)
+    alfa_global = _alfa_global(alfa1, alfa4, alfy_235, warning_alfa)
 
-    alfa_global = alfa1 * alfa2 * alfa3 * alfa4 * alfa5
-    
-    warning_alfa = False
-    if rodzaj_preta == "Rozciągany":
-        prod_a235 = alfa2 * alfa3 * alfa5
-        if prod_a235 < 0.7:
-            alfa_global = alfa1 * alfa4 * 0.7
-            warning_alfa = True
-            
     lb_calc = alfa_global * lb_rqd
-    
-    if rodzaj_preta == "Rozciągany":
-        lb_min_val = max(0.3 * lb_rqd, 10.0 * fi_mm, 100.0)
-    else:
-        lb_min_val = max(0.6 * lb_rqd, 10.0 * fi_mm, 100.0)
-        
-    lb_final = max(lb_calc, lb_min_val)
-    
+    lb_min_val = _lb_min(rodzaj_preta, lb_rqd, fi_mm)
+    lb_final = np.maximum(lb_calc, lb_min_val)
+
     return {
         "fi_mm": fi_mm,
-        "klasa_betonu": klasa_betonu,
         "fctd": fctd,
-        "stal_nazwa": stal_nazwa,
-        "fyk": fyk,
         "fyd": fyd,
         "sigma_sd": sigma_sd,
         "eta1": eta1,
@@ -159,311 +266,529 @@ def ObliczDlugoscZakotwienia(
         "fbd": fbd,
         "lb_rqd": lb_rqd,
         "alfa1": alfa1,
-        "alfa2": alfa2,
-        "alfa3": alfa3,
-        "alfa4": alfa4,
-        "alfa5": alfa5,
+        "alfa2": alfy_235[0],
+        "alfa3": alfy_235[1],
+        "alfa4": np.asarray(alfa4, dtype=np.float64)[()],
+        "alfa5": alfy_235[2],
         "alfa_global": alfa_global,
         "warning_alfa": warning_alfa,
         "lb_calc": lb_calc,
         "lb_min": lb_min_val,
         "lb_final": lb_final,
-        "rodzaj_preta": rodzaj_preta,
-        "ksztalt_preta": ksztalt_preta
     }
 
 # =============================================================================
-# GENERATOR PDF
+# OPTYMALIZACJA WSPÓŁCZYNNIKÓW ALFA (FRONT PARETO)
 # =============================================================================
 
-def create_pdf_report(wynik: dict, inputs: dict) -> bytes:
-    pdf = FPDF()
-    pdf.add_page()
-    
-    font_regular = SCIEZKA_CZCIONKI / "ArialUnicode.ttf"
-    font_bold = SCIEZKA_CZCIONKI / "ArialUnicode-Bold.ttf"
-    
-    main_font = "Arial"
-    use_unicode = False
-    
-    if font_regular.exists():
-        try:
-            pdf.add_font("ArialUni", "", str(font_regular), uni=True)
-            if font_bold.exists():
-                pdf.add_font("ArialUni", "B", str(font_bold), uni=True)
-            else:
-                pdf.add_font("ArialUni", "B", str(font_regular), uni=True)
-            pdf.add_font("ArialUni", "I", str(font_regular), uni=True)
-            main_font = "ArialUni"
-            use_unicode = True
-        except Exception:
-            use_unicode = False
-
-    def fix_txt(text: str) -> str:
-        if use_unicode:
-            return str(text)
-        replacements = {
-            "ą": "a", "ć": "c", "ę": "e", "ł": "l", "ń": "n", "ó": "o", "ś": "s", "ź": "z", "ż": "z",
-            "Ą": "A", "Ć": "C", "Ę": "E", "Ł": "L", "Ń": "N", "Ó": "O", "Ś": "S", "Ź": "S", "Ż": "Z",
-            "Φ": SYM["fi"], "α": SYM["alpha"], "η": SYM["eta"], "ρ": SYM["rho"], "σ": SYM["sigma"]
-        }
-        text = str(text)
-        for k, v in replacements.items():
-            text = text.replace(k, v)
-        return text
-
-    LINE_H = 6
-    MARGIN_LEFT = 15
-    MARGIN_TOP = 15
-    X_INDENT = 20
-    X_EQ = 25
-    
-    pdf.set_margins(MARGIN_LEFT, MARGIN_TOP, 10)
-    pdf.set_auto_page_break(True, margin=15)
-
-    def new_line(mult: float = 1.0):
-        pdf.ln(LINE_H * mult)
-
-    def w_txt(text: str, bold: bool = False, italic: bool = False, size: int = 11):
-        style = ""
-        if bold: style += "B"
-        if italic: style += "I"
-        pdf.set_font(main_font, style, size)
-        pdf.write(LINE_H, fix_txt(text))
-
-    def w_sub(text: str, size: int = 7, move_down: float = 2.0):
-        orig_y, orig_x = pdf.get_y(), pdf.get_x()
-        pdf.set_font(main_font, "", size)
-        pdf.set_xy(orig_x, orig_y + move_down)
-        pdf.write(LINE_H, fix_txt(text))
-        pdf.set_xy(pdf.get_x(), orig_y)
-        pdf.set_font(main_font, "", 11)
-
-    def header_sec(text: str, num: str):
-        new_line(1.2)
-        pdf.set_font(main_font, "B", 12)
-        pdf.cell(0, 8, fix_txt(f"{num}. {text}"), ln=True, border="B")
-        new_line(0.3)
-
-    def build_line(segments, indent=0):
-        if indent > 0:
-            pdf.set_x(indent)
-        for item in segments:
-            text = str(item[0])
-            type_ = item[1]
-            if type_ == 'txt': w_txt(text)
-            elif type_ == 'bold': w_txt(text, bold=True)
-            elif type_ == 'italic': w_txt(text, italic=True)
-            elif type_ == 'sub': w_sub(text)
-            elif type_ == 'sym': w_txt(text)
-        new_line()
-
-    # --- NAGŁÓWEK ---
-    pdf.set_font(main_font, "B", 16)
-    pdf.cell(0, 8, fix_txt("DŁUGOŚĆ ZAKOTWIENIA PRĘTÓW ZBROJENIOWYCH"), ln=True, align="C")
-    pdf.set_font(main_font, "", 10)
-    pdf.cell(0, 5, fix_txt("wg PN-EN 1992-1-1"), ln=True, align="C")
-    new_line(1.0)
-
-    # 1. PARAMETRY
-    header_sec("Parametry materiałowe", "1")
-    build_line([("- Średnica pręta: ", 'txt'), (f"{SYM['fi']} = {wynik['fi_mm']:.0f} mm", 'txt')], X_INDENT)
-    build_line([(f"- Beton: {wynik['klasa_betonu']} (f", 'txt'), ("ctd", 'sub'), (f" = {wynik['fctd']:.2f} MPa)", 'txt')], X_INDENT)
-    build_line([(f"- Stal: {wynik['stal_nazwa']} (f", 'txt'), ("yk", 'sub'), (f" = {wynik['fyk']:.0f} MPa, f", 'txt'), ("yd", 'sub'), (f" = {wynik['fyd']:.1f} MPa)", 'txt')], X_INDENT)
-    build_line([("- Typ pręta: ", 'txt'), (f"{wynik['rodzaj_preta']} ({wynik['ksztalt_preta']})", 'txt')], X_INDENT)
-
-    # 2. PODSTAWOWA DŁUGOŚĆ
-    header_sec("Podstawowa długość zakotwienia", "2")
-    build_line([(f"- Warunki przyczepności: {inputs['warunki']} (", 'txt'), (SYM['eta'], 'sym'), ("1", 'sub'), (f" = {wynik['eta1']})", 'txt')], X_INDENT)
-    build_line([(f"- Współczynnik średnicy: ", 'txt'), (SYM['eta'], 'sym'), ("2", 'sub'), (f" = {wynik['eta2']:.2f}", 'txt')], X_INDENT)
-    new_line(0.5)
-
-    # fbd
-    build_line([("Przyczepność graniczna: ", 'txt'), ("f", 'italic'), ("bd", 'sub'), (" = 2.25 · ", 'txt'), (SYM['eta'], 'sym'), ("1", 'sub'), (" · ", 'txt'), (SYM['eta'], 'sym'), ("2", 'sub'), (" · f", 'txt'), ("ctd", 'sub'), (f" = {wynik['fbd']:.2f} MPa", 'txt')], X_EQ)
-    
-    # lb,rqd
-    fi_str = f"{wynik['fi_mm']:.0f}"
-    build_line([("l", 'italic'), ("b,rqd", 'sub'), (" = (", 'txt'), (SYM['fi'], 'txt'), (" / 4) · (", 'txt'), (SYM['sigma'], 'sym'), ("sd", 'sub'), (" / f", 'txt'), ("bd", 'sub'), (") = ", 'txt'), (f"({fi_str} / 4) · ({wynik['sigma_sd']:.1f} / {wynik['fbd']:.2f}) = ", 'txt'), (f"{wynik['lb_rqd']:.1f} mm", 'bold')], X_EQ)
-
-    # 3. ALFY
-    header_sec(f"Współczynniki wpływu {SYM['alpha']}", "3")
-    alphas = [
-        (1, wynik['alfa1']),
-        (2, wynik['alfa2']),
-        (3, wynik['alfa3']),
-        (4, wynik['alfa4']),
-        (5, wynik['alfa5'])
-    ]
-    for item in alphas:
-        segments = [(SYM['alpha'], 'italic'), (str(item[0]), 'sub'), (f" = {item[1]:.2f}", 'txt')]
-        build_line(segments, X_EQ)
-
-    if wynik['warning_alfa']:
-        new_line(0.5)
-        pdf.set_text_color(0, 0, 0)
-        build_line([("Warunek EC2 8.4.4(1): ", 'txt'), (SYM['alpha'], 'txt'), ("2", 'sub'), (" · ", 'txt'), (SYM['alpha'], 'txt'), ("3", 'sub'), (" · ", 'txt'), (SYM['alpha'], 'txt'), ("5", 'sub'), (" < 0.7 -> Przyjęto iloczyn = 0.7", 'txt')], X_EQ)
-        pdf.set_text_color(0, 0, 0)
-    
-    new_line()
-    build_line([(SYM['alpha'], 'italic'), ("global", 'sub'), (f" = {wynik['alfa_global']:.2f}", 'txt')], X_EQ)
+# Umowny "wysiłek" detalowania: stała za użycie środka + składnik za jego wielkość
+WYSILEK_OPCJI = {
+    "hak": 2.0,        # odgięcie haka / pętli
+    "alfa2": 0.5,      # wykazanie otuliny cd
+    "alfa2_cd": 1.0,   # za każde Φ zwiększenia cd ponad obecne
+    "alfa3": 0.5,      # uwzględnienie zbrojenia poprzecznego
+    "alfa3_ast": 1.0,  # za każdy cm² zbrojenia poprzecznego
+    "alfa4": 3.0,      # przyspojenie pręta poprzecznego
+    "alfa5": 0.5,      # wykazanie nacisku poprzecznego p
+}
 
-    # 4. MINIMALNA
-    header_sec("Minimalna długość zakotwienia", "4")
-    
-    wsp_min = 0.3 if wynik['rodzaj_preta'] == "Rozciągany" else 0.6
-    build_line([("l", 'italic'), ("b,min", 'sub'), (f" = max({wsp_min} · l", 'txt'), ("b,rqd", 'sub'), (f"; 10{SYM['fi']}; 100 mm)", 'txt')], X_EQ)
-    
-    val1 = wsp_min * wynik['lb_rqd']
-    val2 = 10.0 * wynik['fi_mm']
-    build_line([("      = max(", 'txt'), (f"{val1:.1f} mm; {val2:.1f} mm; 100 mm", 'txt'), (") = ", 'txt'), (f"{wynik['lb_min']:.1f} mm", 'txt')], X_EQ)
 
-    # 5. WYNIK
-    header_sec("Obliczenie długości zakotwienia", "5")
-    build_line([("l", 'italic'), ("bd", 'sub'), (" = ", 'txt'), (SYM['alpha'], 'italic'), ("global", 'sub'), (" · l", 'txt'), ("b,rqd", 'sub'), (f" = {wynik['alfa_global']:.2f} · {wynik['lb_rqd']:.1f} = {wynik['lb_calc']:.1f} mm", 'txt')], X_EQ)
-    
-    new_line(2.0)
-    
-    # RAMKA WYNIKU
-    pdf.set_fill_color(235, 235, 235)
-    pdf.rect(MARGIN_LEFT, pdf.get_y(), 180, 14, 'F')
-    pdf.set_y(pdf.get_y() + 4)
-    pdf.set_x(MARGIN_LEFT + 5)
-    
-    # Etykieta: DUŻE LITERY, bez pogrubienia
-    pdf.set_font(main_font, "", 12)
-    pdf.write(LINE_H, fix_txt("WYMAGANA DŁUGOŚĆ ZAKOTWIENIA:  "))
-    
-    # Symbol: POGRUBIONY
-    pdf.set_font(main_font, "B", 12)
-    pdf.write(LINE_H, fix_txt("l"))
-    
-    curr_x, curr_y = pdf.get_x(), pdf.get_y()
-    pdf.set_xy(curr_x, curr_y + 2)
-    pdf.set_font(main_font, "B", 8)
-    pdf.write(LINE_H, fix_txt("bd,req"))
-    
-    # Wynik: POGRUBIONY
-    pdf.set_xy(pdf.get_x(), curr_y)
-    pdf.set_font(main_font, "B", 14)
-    pdf.write(LINE_H, fix_txt(f" = {wynik['lb_final']:.0f} mm"))
+def OptymalizujZakotwienie(
+    fi_mm: float,
+    klasa_betonu: str,
+    stal_nazwa: str,
+    procent_naprezenia: float,
+    warunki_przyczepnosci: str,
+    rodzaj_preta: str = "Rozciągany",
+    cd_lista=(),
+    cd_aktualne: float | None = None,
+    sum_ast_lista=(),
+    K: float = 0.05,
+    sum_ast_min: float = 2.5,
+    p: float = 0.0,
+    dopusc_haki: bool = True,
+    wysilek: dict | None = None,
+) -> dict:
+    """
+    Przegląd wszystkich dopuszczalnych kombinacji środków zmniejszających lbd
+    (kształt pręta, cd z listy dla α2, ΣAst z listy dla α3, α4, nacisk p dla α5)
+    jednym wywołaniem wersji wektorowej. α2 liczone dla kształtu pręta
+    w wariancie (NARZEDZIA.WspolczynnikiAlfa.Alfa2). Zwraca wszystkie
+    warianty oraz indeksy frontu Pareto (lbd, wysiłek detalowania).
+    """
+    w = {**WYSILEK_OPCJI, **(wysilek or {})}
+    rozciagany = rodzaj_preta == "Rozciągany"
+    alfy = PoziomyAlfa(fi_mm, w, cd_lista, cd_aktualne, sum_ast_lista, p)
+
+    poziomy = {
+        "ksztalt": [("Proste", 0.0, "")]
+        + ([("Inne (haki, pętle)", w["hak"], "hak/pętla")] if rozciagany and dopusc_haki else []),
+        # Pręt ściskany: α2 = α3 = α5 = 1.0 - tylko poziomy "bez środka"
+        "cd": alfy["cd"] if rozciagany else alfy["cd"][:1],
+        "sum_ast": alfy["sum_ast"] if rozciagany else alfy["sum_ast"][:1],
+        "alfa4": [(1.0, 0.0, ""), (0.7, w["alfa4"], "α4: pręt przyspojony")],
+        "p": alfy["p"] if rozciagany else alfy["p"][:1],
+    }
 
-    return pdf.output(dest="S").encode("latin-1", "replace")
+    warianty = SiatkaOpcji(poziomy)
+    ksztalt = warianty["ksztalt"].astype(str)
+    alfa2, alfa3, alfa5 = AlfyOpcji(
+        fi_mm, ksztalt, warianty["cd"].astype(float), warianty["sum_ast"].astype(float),
+        warianty["p"].astype(float), K, sum_ast_min,
+    )
+    wynik = ObliczDlugoscZakotwieniaWektorowo(
+        fi_mm, klasa_betonu, stal_nazwa, procent_naprezenia, warunki_przyczepnosci,
+        rodzaj_preta, ksztalt, alfa2, alfa3, warianty["alfa4"].astype(float), alfa5,
+    )
+    lbd = wynik["lb_final"]
+    return {
+        "lbd": lbd,
+        "wysilek": warianty["wysilek"],
+        "opis": warianty["opis"],
+        "alfa_global": wynik["alfa_global"],
+        "pareto": FrontPareto(lbd, warianty["wysilek"]),
+        "n_wariantow": lbd.size,
+    }
 
 # =============================================================================
-# GENERATOR DOCX
+# ZADANIE ODWROTNE (DOSTĘPNA DŁUGOŚĆ ZAKOTWIENIA)
 # =============================================================================
 
-def add_docx_formatted(paragraph, text, base_bold=False):
-    replacements = {
-        r"\Phi": "Φ", r"\sigma": "σ", r"\alpha": "α", r"\eta": "η", 
-        r"\rho": "ρ", r"\cdot": "·", r"\le": "≤", r"\ge": "≥"
+def OdwrotneZakotwienie(
+    l_dostepne,
+    fi_mm,
+    klasa_betonu,
+    stal_nazwa,
+    procent_naprezenia,
+    warunki_przyczepnosci,
+    rodzaj_preta,
+    ksztalt_preta,
+    alfa2=1.0,
+    alfa3=1.0,
+    alfa4=1.0,
+    alfa5=1.0,
+    srednice=FI_LIST,
+    cd=np.nan,
+    sum_ast=np.nan,
+    K: float = 0.05,
+    sum_ast_min: float = 2.5,
+) -> dict:
+    """
+    Zadanie odwrotne dla danej (dostępnej) długości zakotwienia l_dostepne [mm]:
+    - "procent_max" - największe σsd/fyd [%] dla średnicy fi_mm, wprost
+      z odwrócenia lbd = max(α·lb,rqd; lb,min), bo lb,rqd jest liniowe w σsd,
+    - "fi_max" - największa średnica z listy srednice przy procent_naprezenia
+      (przedziały wyznaczane wektorowo dla całej tablicy l_dostepne).
+    α2 i α3 zależą od średnicy: podane cd [mm] i ΣAst [cm²] (K, ΣAst,min)
+    - liczone dla każdej średnicy; NaN - stałe alfa2, alfa3 dla wszystkich
+    średnic (np. α = 1.0, bez redukcji).
+    Argumenty podlegają broadcastowi. NaN oznacza brak rozwiązania.
+    """
+    l_dostepne = np.asarray(l_dostepne, dtype=np.float64)
+    fi_mm = np.asarray(fi_mm, dtype=np.float64)
+    rozciagany = np.asarray(rodzaj_preta) == "Rozciągany"
+
+    def alfy_23(fi, ksztalt, cd, sum_ast, alfa2, alfa3):
+        a2, a3, _ = AlfyOpcji(fi, ksztalt, cd, sum_ast, 0.0, K, sum_ast_min)
+        return np.where(np.isnan(cd), alfa2, a2), np.where(np.isnan(sum_ast), alfa3, a3)
+
+    # --- σsd/fyd dla zadanej średnicy (postać zamknięta) ---
+    a2, a3 = alfy_23(fi_mm, ksztalt_preta, np.asarray(cd, dtype=np.float64), np.asarray(sum_ast, dtype=np.float64),
+                     alfa2, alfa3)
+    w100 = ObliczDlugoscZakotwieniaWektorowo(
+        fi_mm, klasa_betonu, stal_nazwa, 100.0, warunki_przyczepnosci,
+        rodzaj_preta, ksztalt_preta, a2, a3, alfa4, alfa5,
+    )
+    wsp_min = np.where(rozciagany, 0.3, 0.6)
+    l_na_procent = np.maximum(w100["alfa_global"], wsp_min) * w100["lb_rqd"] / 100.0
+    l_min_stale = np.maximum(10.0 * fi_mm, 100.0)
+    mozliwe = l_dostepne >= l_min_stale
+    procent_max = np.where(mozliwe, np.minimum(l_dostepne / l_na_procent, 100.0), np.nan)
+
+    # --- Największa średnica dla zadanego σsd/fyd ---
+    srednice = np.asarray(srednice, dtype=np.float64)
+
+    def dodaj_os(x):
+        return np.asarray(x)[..., None]
+
+    a2, a3 = alfy_23(srednice, dodaj_os(ksztalt_preta), dodaj_os(np.asarray(cd, dtype=np.float64)),
+                     dodaj_os(np.asarray(sum_ast, dtype=np.float64)), dodaj_os(alfa2), dodaj_os(alfa3))
+    w_fi = ObliczDlugoscZakotwieniaWektorowo(
+        srednice, dodaj_os(klasa_betonu), dodaj_os(stal_nazwa), dodaj_os(procent_naprezenia),
+        dodaj_os(warunki_przyczepnosci), dodaj_os(rodzaj_preta), dodaj_os(ksztalt_preta),
+        a2, a3, dodaj_os(alfa4), dodaj_os(alfa5),
+    )
+    dlugosci = np.broadcast_to(w_fi["lb_final"], np.broadcast_shapes(w_fi["lb_final"].shape, l_dostepne.shape + (1,)))
+    fi_max = NajwiekszaSrednica(dlugosci, l_dostepne, srednice)
+
+    return {
+        "l_dostepne": l_dostepne,
+        "procent_max": procent_max,
+        "sigma_sd_max": procent_max / 100.0 * w100["fyd"],
+        "l_min_stale": l_min_stale,
+        "fi_max": fi_max,
     }
-    for k, v in replacements.items():
-        text = text.replace(k, v)
-    
-    tokens = re.split(r'(_\{[^}]+\}|_[a-zA-Z0-9,]+)', text)
-    
-    for token in tokens:
-        if not token: continue
-        
-        if token.startswith("_{") and token.endswith("}"):
-            sub_text = token[2:-1]
-            r = paragraph.add_run(sub_text)
-            r.font.subscript = True
-            if base_bold: r.bold = True
-        elif token.startswith("_"):
-            sub_text = token[1:]
-            r = paragraph.add_run(sub_text)
-            r.font.subscript = True
-            if base_bold: r.bold = True
-        else:
-            r = paragraph.add_run(token)
-            if base_bold: r.bold = True
 
-def create_docx_report(wynik: dict, inputs: dict) -> BytesIO:
-    doc = Document()
-    style = doc.styles["Normal"]
-    style.font.name = "Times New Roman"
-    style.font.size = Pt(11)
-
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    r = p.add_run("DŁUGOŚĆ ZAKOTWIENIA PRĘTÓW ZBROJENIOWYCH")
-    r.bold = True
-    r.font.size = Pt(16)
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    p.add_run("wg PN-EN 1992-1-1")
-    
-    doc.add_paragraph("_" * 70).alignment = WD_ALIGN_PARAGRAPH.CENTER
+# =============================================================================
+# PRZEGLĄD PARAMETRÓW (SIATKI 1-D / 2-D)
+# =============================================================================
 
-    def add_line(txt, bold=False):
-        p = doc.add_paragraph()
-        add_docx_formatted(p, txt, base_bold=bold)
+# Osie przeglądu: etykieta -> argument ObliczDlugoscZakotwieniaWektorowo
+OSIE_PRZEGLADU = {
+    "Średnica Φ [mm]": "fi_mm",
+    "Klasa betonu": "klasa_betonu",
+    "Naprężenia σsd/fyd [%]": "procent_naprezenia",
+}
 
-    doc.add_heading("1. Parametry materiałowe", level=1)
-    add_line(f"- Średnica pręta: \\Phi = {wynik['fi_mm']:.0f} mm")
-    add_line(f"- Beton: {wynik['klasa_betonu']} (f_{{ctd}} = {wynik['fctd']:.2f} MPa)")
-    add_line(f"- Stal: {wynik['stal_nazwa']} (f_{{yk}} = {wynik['fyk']:.0f} MPa, f_{{yd}} = {wynik['fyd']:.1f} MPa)")
-    add_line(f"- Typ pręta: {wynik['rodzaj_preta']} ({wynik['ksztalt_preta']})", bold=False)
 
-    h = doc.add_heading(level=1)
-    add_docx_formatted(h, "2. Podstawowa długość zakotwienia (l_{b,rqd})")
-    
-    add_line(f"- Warunki przyczepności: {inputs['warunki']} (\\eta_1 = {wynik['eta1']})")
-    add_line(f"- Współczynnik średnicy: \\eta_2 = {wynik['eta2']:.2f}")
-    add_line(f"- Przyczepność graniczna f_{{bd}} = {wynik['fbd']:.2f} MPa")
-    
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    add_docx_formatted(p, f"l_{{b,rqd}} = {wynik['lb_rqd']:.1f} mm", base_bold=False)
+def PrzegladZakotwienia() -> PrzegladParametrow:
+    """Przegląd lbd [mm] po siatkach parametrów (pamięć wycinków siatki)."""
+    return PrzegladParametrow(ObliczDlugoscZakotwieniaWektorowo, "lb_final")
 
-    h = doc.add_heading(level=1)
-    add_docx_formatted(h, "3. Współczynniki wpływu \\alpha")
-    
-    add_line(f"- \\alpha_1 = {wynik['alfa1']:.2f}")
-    add_line(f"- \\alpha_2 = {wynik['alfa2']:.2f}")
-    add_line(f"- \\alpha_3 = {wynik['alfa3']:.2f}")
-    add_line(f"- \\alpha_4 = {wynik['alfa4']:.2f}")
-    add_line(f"- \\alpha_5 = {wynik['alfa5']:.2f}")
-    
-    if wynik['warning_alfa']:
-        p = doc.add_paragraph()
-        r = p.add_run("Warunek EC2 8.4.4(1): ")
-        r.font.color.rgb = RGBColor(0, 0, 0)
-        add_docx_formatted(p, "\\alpha_2 \\cdot \\alpha_3 \\cdot \\alpha_5 < 0.7 -> Przyjęto iloczyn = 0.7")
-    
-    add_line(f"\\alpha_{{global}} = {wynik['alfa_global']:.2f}", bold=False)
+# =============================================================================
+# ANALIZA NIEZAWODNOŚCI (MONTE CARLO)
+# =============================================================================
 
-    h = doc.add_heading(level=1)
-    add_docx_formatted(h, "4. Minimalna długość zakotwienia (l_{b,min})")
-    add_line(f"l_{{b,min}} = {wynik['lb_min']:.1f} mm")
+# Rozkłady zmiennych losowych do oceny istniejących konstrukcji (V - współczynnik zmienności)
+ROZKLADY_MC = {
+    "V_fct": 0.18,    # wytrzymałość betonu na rozciąganie, log-normalny, średnia fctm
+    "V_fy": 0.05,     # granica plastyczności, log-normalny, fyk = kwantyl 5%
+    "V_fi": 0.015,    # średnica pręta, normalny (tolerancja masy ±4.5% -> średnicy ok. ±2.2%)
+    "sigma_cd": 5.0,  # otulina c_d [mm], normalny ucięty (c_d > 0, próbki ujemne losowane ponownie)
+}
 
-    h = doc.add_heading(level=1)
-    add_docx_formatted(h, "5. Obliczenie długości zakotwienia (l_{bd})")
-    
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    add_docx_formatted(p, f"l_{{bd}} = {wynik['alfa_global'] * wynik['lb_rqd']:.1f} mm")
-    
-    # Wynik końcowy
-    p = doc.add_paragraph()
-    p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    p.paragraph_format.left_indent = Cm(1.0)
-    
-    # Etykieta bez pogrubienia, wielkie litery
-    r = p.add_run("WYMAGANA DŁUGOŚĆ ZAKOTWIENIA: ")
-    r.bold = False
-    r.font.size = Pt(12)
-    
-    # Symbol i wynik POGRUBIONE
-    add_docx_formatted(p, f"l_{{bd,req}} = {wynik['lb_final']:.0f} mm", base_bold=True)
-    p.runs[-1].font.size = Pt(12)
+# Liczba próbek w jednej paczce (ogranicza pamięć do ok. 100 MB)
+ROZMIAR_PACZKI_MC = 500_000
+
+# Liczba przedziałów histogramu wymaganej długości
+PRZEDZIALY_MC = 200
+
+
+def _lognormalny(rng, srednia: float, V: float, n: int) -> np.ndarray:
+    s = math.sqrt(math.log1p(V ** 2))
+    return rng.lognormal(math.log(srednia) - 0.5 * s ** 2, s, n)
+
+
+def _normalny_uciety(rng, srednia: float, sigma: float, n: int) -> np.ndarray:
+    """Rozkład normalny ucięty do wartości dodatnich (odrzucanie; srednia > 0 - akceptacja powyżej 50%)."""
+    x = srednia + sigma * rng.standard_normal(n)
+    odrzucone = np.flatnonzero(x <= 0.0)
+    while odrzucone.size:
+        x[odrzucone] = srednia + sigma * rng.standard_normal(odrzucone.size)
+        odrzucone = odrzucone[x[odrzucone] <= 0.0]
+    return x
+
+
+def _paczka_mc(zadanie: tuple) -> tuple:
+    """Jedna paczka próbek: (liczba niespełnień, Σl, Σl², histogram l)."""
+    ziarno, n, p = zadanie
+    rng = np.random.default_rng(ziarno)
+    r = p["rozklady"]
+
+    fct = _lognormalny(rng, p["fctm"], r["V_fct"], n)
+    fy = _lognormalny(rng, p["fyk"] / (1.0 - 1.645 * r["V_fy"]), r["V_fy"], n)
+    fi = p["fi_mm"] * (1.0 + r["V_fi"] * rng.standard_normal(n))
+    if p["c_d"] is None:
+        alfa2 = p["alfa2"]
+    else:
+        c_d = _normalny_uciety(rng, p["c_d"], r["sigma_cd"], n)
+        alfa2 = Alfa2(c_d, fi, p["ksztalt_preta"])
+
+    # Wartości rzeczywiste (bez γ i kwantyla 0.7·fctm); bez lb,min - to wymaganie konstrukcyjne
+    l_wym = _ZakotwienieZMaterialow(
+        fi, fct, fy, p["procent_naprezenia"], p["warunki_przyczepnosci"], p["rodzaj_preta"],
+        p["ksztalt_preta"], alfa2, p["alfa3"], p["alfa4"], p["alfa5"],
+    )["lb_calc"]
+
+    histogram = np.bincount(
+        np.minimum((l_wym / p["dl_przedzialu"]).astype(np.int64), PRZEDZIALY_MC - 1),
+        minlength=PRZEDZIALY_MC,
+    )
+    return (
+        int(np.count_nonzero(l_wym > p["l_dostepne"])),
+        float(l_wym.sum()),
+        float(np.dot(l_wym, l_wym)),
+        histogram,
+    )
+
+
+def NiezawodnoscZakotwienia(
+    l_dostepne: float,
+    fi_mm: float,
+    klasa_betonu: str,
+    stal_nazwa: str,
+    procent_naprezenia: float,
+    warunki_przyczepnosci: str,
+    rodzaj_preta: str,
+    ksztalt_preta: str,
+    c_d: float | None = None,
+    alfa2: float = 1.0,
+    alfa3: float = 1.0,
+    alfa4: float = 1.0,
+    alfa5: float = 1.0,
+    n_probek: int = 1_000_000,
+    seed: int | None = None,
+    rozmiar_paczki: int = ROZMIAR_PACZKI_MC,
+    procesy: int = 1,
+    rozklady: dict | None = None,
+) -> dict:
+    """
+    Prawdopodobieństwo, że istniejąca długość zakotwienia l_dostepne [mm]
+    jest mniejsza od wymaganej α·(Φ/4)·σs/fb przy losowych fct, fy, Φ i c_d
+    (rozkłady wg ROZKLADY_MC, nadpisywane argumentem rozklady).
+    c_d - średnia otulina do α2 (None: α2 jak podano, bez losowania otuliny);
+    α2 dla każdej próbki wg Tablicy 8.2 dla kształtu pręta, c_d z rozkładu
+    normalnego uciętego do wartości dodatnich.
+    Próbki generowane paczkami z ziaren SeedSequence(seed).spawn, więc wynik
+    dla danego seed nie zależy od liczby procesów.
+    """
+    if n_probek < 1 or rozmiar_paczki < 1:
+        raise ValueError("Liczba próbek i rozmiar paczki muszą być dodatnie.")
+    if rodzaj_preta != "Rozciągany":
+        c_d = None
+    if c_d is not None and c_d <= 0.0:
+        raise ValueError("Średnia otulina c_d musi być dodatnia.")
+    rozklady = {**ROZKLADY_MC, **(rozklady or {})}
+
+    deterministycznie = ObliczDlugoscZakotwieniaWektorowo(
+        fi_mm, klasa_betonu, stal_nazwa, procent_naprezenia, warunki_przyczepnosci,
+        rodzaj_preta, ksztalt_preta, alfa2, alfa3, alfa4, alfa5,
+    )
+    l_det = float(deterministycznie["lb_final"])
+    dl_przedzialu = 3.0 * max(l_dostepne, l_det) / PRZEDZIALY_MC
+
+    parametry = {
+        "l_dostepne": float(l_dostepne),
+        "fi_mm": float(fi_mm),
+        "fctm": float(_fctm(klasa_betonu)),
+        "fyk": float(_fyk(stal_nazwa)),
+        "procent_naprezenia": float(procent_naprezenia),
+        "warunki_przyczepnosci": warunki_przyczepnosci,
+        "rodzaj_preta": rodzaj_preta,
+        "ksztalt_preta": ksztalt_preta,
+        "c_d": None if c_d is None else float(c_d),
+        "alfa2": alfa2,
+        "alfa3": alfa3,
+        "alfa4": alfa4,
+        "alfa5": alfa5,
+        "rozklady": rozklady,
+        "dl_przedzialu": dl_przedzialu,
+    }
+    n_paczek = -(-n_probek // rozmiar_paczki)
+    rozmiary = [rozmiar_paczki] * (n_paczek - 1) + [n_probek - rozmiar_paczki * (n_paczek - 1)]
+    zadania = [(z, n, parametry) for z, n in zip(np.random.SeedSequence(seed).spawn(n_paczek), rozmiary)]
+
+    if procesy > 1 and n_paczek > 1:
+        # "spawn": fork procesu wielowątkowego serwera Streamlit może skopiować zajęte blokady
+        kontekst = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(procesy, n_paczek), mp_context=kontekst) as pula:
+            wyniki = list(pula.map(_paczka_mc, zadania))
+    else:
+        wyniki = [_paczka_mc(z) for z in zadania]
+
+    n_niesp = sum(w[0] for w in wyniki)
+    srednia = sum(w[1] for w in wyniki) / n_probek
+    wariancja = max(sum(w[2] for w in wyniki) / n_probek - srednia ** 2, 0.0)
+    histogram = np.sum([w[3] for w in wyniki], axis=0)
+
+    p_f = n_niesp / n_probek
+    krawedzie = np.arange(PRZEDZIALY_MC + 1) * dl_przedzialu
+    dystrybuanta = np.concatenate([[0.0], np.cumsum(histogram) / n_probek])
+    kwantyle = {q: float(np.interp(q, dystrybuanta, krawedzie)) for q in (0.05, 0.50, 0.95)}
+
+    return {
+        "p_f": p_f,
+        "blad_std": math.sqrt(p_f * (1.0 - p_f) / n_probek),
+        "beta": -NormalDist().inv_cdf(p_f) if 0.0 < p_f < 1.0 else (math.inf if p_f == 0.0 else -math.inf),
+        "n_probek": n_probek,
+        "n_niespelnien": n_niesp,
+        "l_dostepne": float(l_dostepne),
+        "l_deterministyczna": l_det,
+        "l_srednia": srednia,
+        "l_odchylenie": math.sqrt(wariancja),
+        "kwantyle": kwantyle,
+        "histogram": histogram,
+        "krawedzie": krawedzie,
+        "rozklady": rozklady,
+    }
+
+# =============================================================================
+# GRAF ZALEŻNOŚCI (OBLICZENIA PRZYROSTOWE W INTERFEJSIE)
+# =============================================================================
+
+WEJSCIA_GRAFU = (
+    "fi_mm", "klasa_betonu", "stal_nazwa", "procent_naprezenia", "warunki_przyczepnosci",
+    "rodzaj_preta", "ksztalt_preta", "alfa2", "alfa3", "alfa4", "alfa5",
+)
+
+
+def GrafZakotwienia() -> GrafZaleznosci:
+    """
+    Graf węzłów ObliczDlugoscZakotwienia (fctd, fbd, lb_rqd, alfa_global, ...)
+    - węzły wywołują te same kroki co wersja skalarna i wektorowa.
+    Zmiana samych współczynników α przelicza tylko węzły α i długości.
+    """
+    graf = GrafZaleznosci(WEJSCIA_GRAFU)
+
+    @graf.wezel
+    def fctm(klasa_betonu):
+        return _fctm(klasa_betonu)
+
+    @graf.wezel
+    def fyk(stal_nazwa):
+        return _fyk(stal_nazwa)
+
+    @graf.wezel
+    def fctd(fctm):
+        return _fctd(fctm)
+
+    @graf.wezel
+    def eta1(warunki_przyczepnosci):
+        return _eta1(warunki_przyczepnosci)
+
+    @graf.wezel
+    def eta2(fi_mm):
+        return _eta2(fi_mm)
+
+    @graf.wezel
+    def fbd(eta1, eta2, fctd):
+        return _fbd(eta1, eta2, fctd)
 
-    buffer = BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
-    return buffer
+    @graf.wezel
+    def fyd(fyk):
+        return _fyd(fyk)
+
+    @graf.wezel
+    def sigma_sd(procent_naprezenia, fyd):
+        return _sigma_sd(procent_naprezenia, fyd)
+
+    @graf.wezel
+    def lb_rqd(fi_mm, sigma_sd, fbd):
+        return _lb_rqd(fi_mm, sigma_sd, fbd)
+
+    @graf.wezel
+    def alfa1(rodzaj_preta, ksztalt_preta):
+        return _alfa1(rodzaj_preta, ksztalt_preta)
+
+    @graf.wezel
+    def alfy_235(rodzaj_preta, alfa2, alfa3, alfa5):
+        return _alfy_235(rodzaj_preta, alfa2, alfa3, alfa5)
+
+    @graf.wezel
+    def warning_alfa(rodzaj_preta, alfy_235):
+        return _warning_alfa(rodzaj_preta, alfy_235)
+
+    @graf.wezel
+    def alfa_global(alfa1, alfa4, alfy_235, warning_alfa):
+        return _alfa_global(alfa1, alfa4, alfy_235, warning_alfa)
+
+    @graf.wezel
+    def lb_calc(alfa_global, lb_rqd):
+        return alfa_global * lb_rqd
+
+    @graf.wezel
+    def lb_min(rodzaj_preta, lb_rqd, fi_mm):
+        return _lb_min(rodzaj_preta, lb_rqd, fi_mm)
+
+    @graf.wezel
+    def lb_final(lb_calc, lb_min):
+        return np.maximum(lb_calc, lb_min)[()]
+
+    return graf
+
+
+def WynikGrafuZakotwienia(graf: GrafZaleznosci) -> dict:
+    """Słownik wyników w postaci zwracanej przez ObliczDlugoscZakotwienia."""
+    wynik = graf.wartosci((
+        "fi_mm", "klasa_betonu", "fctd", "stal_nazwa", "fyk", "fyd", "sigma_sd", "eta1", "eta2",
+        "fbd", "lb_rqd", "alfa1", "alfa4", "alfa_global", "warning_alfa", "lb_calc", "lb_min", "lb_final",
+        "rodzaj_preta", "ksztalt_preta",
+    ))
+    wynik["alfa2"], wynik["alfa3"], wynik["alfa5"] = graf["alfy_235"]
+    return _jako_python(wynik)
+
+# =============================================================================
+# RAPORT (PDF / DOCX)
+# =============================================================================
+
+# Wersja treści raportu - zwiększana przy zmianie raportu (unieważnia pliki NARZEDZIA.PamiecRaportow)
+WERSJA_RAPORTU = 1
+
+
+@pamietaj(maks_wpisow=256, klucz=KluczJSON)
+def RaportZakotwienia(wynik: dict, inputs: dict) -> Raport:
+    """Treść raportu (NARZEDZIA.RaportIR), wspólna dla PDF, DOCX i HTML."""
+    a, fi, eta, sigma = SYM["alpha"], SYM["fi"], SYM["eta"], SYM["sigma"]
+    wsp_min = 0.3 if wynik["rodzaj_preta"] == "Rozciągany" else 0.6
+
+    bloki = [
+        Tytul("DŁUGOŚĆ ZAKOTWIENIA PRĘTÓW ZBROJENIOWYCH", "wg PN-EN 1992-1-1"),
+
+        # 1. PARAMETRY
+        Naglowek("1", Fr("Parametry materiałowe")),
+        Linia(Fr(f"- Średnica pręta: {fi} = {wynik['fi_mm']:.0f} mm"), 1),
+        Linia(Fr(f"- Beton: {wynik['klasa_betonu']} (f_{{ctd}} = {wynik['fctd']:.2f} MPa)"), 1),
+        Linia(Fr(f"- Stal: {wynik['stal_nazwa']} (f_{{yk}} = {wynik['fyk']:.0f} MPa, f_{{yd}} = {wynik['fyd']:.1f} MPa)"), 1),
+        Linia(Fr(f"- Typ pręta: {wynik['rodzaj_preta']} ({wynik['ksztalt_preta']})"), 1),
+
+        # 2. PODSTAWOWA DŁUGOŚĆ
+        Naglowek("2", Fr("Podstawowa długość zakotwienia")),
+        Linia(Fr(f"- Warunki przyczepności: {inputs['warunki']} ({eta}_{{1}} = {wynik['eta1']})"), 1),
+        Linia(Fr(f"- Współczynnik średnicy: {eta}_{{2}} = {wynik['eta2']:.2f}"), 1),
+        Odstep(0.5),
+        Linia(Fr(f"Przyczepność graniczna: *f*_{{bd}} = 2.25 · {eta}_{{1}} · {eta}_{{2}} · f_{{ctd}} = {wynik['fbd']:.2f} MPa"), 2),
+        Linia(
+            Fr(f"*l*_{{b,rqd}} = ({fi} / 4) · ({sigma}_{{sd}} / f_{{bd}}) = "
+               f"({wynik['fi_mm']:.0f} / 4) · ({wynik['sigma_sd']:.1f} / {wynik['fbd']:.2f}) = ")
+            + Fr(f"{wynik['lb_rqd']:.1f} mm", "B"),
+            2,
+        ),
+
+        # 3. ALFY
+        Naglowek("3", Fr(f"Współczynniki wpływu {a}")),
+        *(Linia(Fr(f"*{a}*_{{{i}}} = {wynik[f'alfa{i}']:.2f}"), 2) for i in range(1, 6)),
+    ]
+    if wynik["warning_alfa"]:
+        bloki += [
+            Odstep(0.5),
+            Linia(Fr(f"Warunek EC2 8.4.4(1): {a}_{{2}} · {a}_{{3}} · {a}_{{5}} < 0.7 -> Przyjęto iloczyn = 0.7"), 2),
+        ]
+    bloki += [
+        Odstep(),
+        Linia(Fr(f"*{a}*_{{global}} = {wynik['alfa_global']:.2f}"), 2),
+
+        # 4. MINIMALNA
+        Naglowek("4", Fr("Minimalna długość zakotwienia")),
+        Linia(Fr(f"*l*_{{b,min}} = max({wsp_min} · l_{{b,rqd}}; 10{fi}; 100 mm)"), 2),
+        Linia(Fr(f"      = max({wsp_min * wynik['lb_rqd']:.1f} mm; {10.0 * wynik['fi_mm']:.1f} mm; 100 mm) = {wynik['lb_min']:.1f} mm"), 2),
+
+        # 5. WYNIK
+        Naglowek("5", Fr("Obliczenie długości zakotwienia")),
+        Linia(Fr(f"*l*_{{bd}} = *{a}*_{{global}} · l_{{b,rqd}} = {wynik['alfa_global']:.2f} · {wynik['lb_rqd']:.1f} = {wynik['lb_calc']:.1f} mm"), 2),
+        Odstep(2.0),
+        Wynik("WYMAGANA DŁUGOŚĆ ZAKOTWIENIA:", Fr(f"l_{{bd,req}} = {wynik['lb_final']:.0f} mm")),
+    ]
+    return Raport("DlugoscZakotwienia", tuple(bloki))
+
+
+@raport_na_dysku("pdf", wersja=WERSJA_RAPORTU)
+def create_pdf_report(wynik: dict, inputs: dict, pdf: "FPDF | None" = None) -> bytes | None:
+    """Raport PDF; z argumentem pdf dopisuje raport do istniejącego dokumentu (od nowej strony)."""
+    return Renderuj(RaportZakotwienia(wynik, inputs), "pdf", pdf=pdf)
+
+
+@raport_na_dysku("docx", wersja=WERSJA_RAPORTU)
+def create_docx_report(wynik: dict, inputs: dict) -> BytesIO:
+    return Renderuj(RaportZakotwienia(wynik, inputs), "docx")
+
+
+def create_html_report(wynik: dict, inputs: dict, pelny: bool = False) -> str:
+    """Raport HTML bez fpdf i python-docx: podgląd na stronie lub plik .html (pelny=True)."""
+    return Renderuj(RaportZakotwienia(wynik, inputs), "html", pelny=pelny)
+
+
+def create_md_report(wynik: dict, inputs: dict) -> str:
+    return Renderuj(RaportZakotwienia(wynik, inputs), "md")
 
 # =============================================================================
 # STRONA STREAMLIT
@@ -536,11 +861,8 @@ def StronaDlugoscZakotwienia():
             st.write("Kształt pręta")
             ksztalt_preta = st.radio("ksztalt_label", ["Proste", "Inne (haki, pętle)"], label_visibility="collapsed")
             
-    with st.expander("ℹ️ Pomoc: Warunki przyczepności (Rysunek 8.2)"):
-        c_l, c_c, c_r = st.columns([1, 8, 1])
-        with c_c:
-            img_path = SCIEZKA_FOLDERU_LOKALNEGO / "DlugoscZakotwienia_WarunkiPrzyczepnosci.png"
-            if img_path.exists(): st.image(str(img_path), width=550)
+    PomocZRysunkiem("ℹ️ Pomoc: Warunki przyczepności (Rysunek 8.2)",
+                    SCIEZKA_FOLDERU_LOKALNEGO / "DlugoscZakotwienia_WarunkiPrzyczepnosci.png", 550, kolumny=[1, 8, 1])
 
     st.markdown("---")
 
@@ -550,6 +872,8 @@ def StronaDlugoscZakotwienia():
     rodzaj_preta = st.radio("Rodzaj pręta", ["Ściskany", "Rozciągany"], index=0, horizontal=True)
 
     a2_val, a3_val, a4_val, a5_val = 1.0, 1.0, 1.0, 1.0
+    # cd i ΣAst dla zadania odwrotnego (α2, α3 liczone dla każdej średnicy); NaN - nieuwzględnione
+    cd_odw, sum_ast_odw, K_in, sum_ast_min_in = np.nan, np.nan, 0.05, 2.5
 
     if rodzaj_preta == "Rozciągany":
         # 4 kolumny: alfa2, alfa3, alfa4, alfa5
@@ -563,14 +887,11 @@ def StronaDlugoscZakotwienia():
             
             cd_in = 30.0
             if u_a2:
-                with st.expander("ℹ️ Pomoc: Rysunek $c_d$"):
-                    img_cd = SCIEZKA_FOLDERU_LOKALNEGO / "DlugoscZakotwienia_Wspolczynnik cd.png"
-                    if img_cd.exists(): st.image(str(img_cd), use_container_width=True)
+                PomocZRysunkiem("ℹ️ Pomoc: Rysunek $c_d$", SCIEZKA_FOLDERU_LOKALNEGO / "DlugoscZakotwienia_Wspolczynnik cd.png")
                 cd_in = st.number_input("$c_d$ [mm]", value=30.0, step=1.0)
                 
-            val = 1.0 - 0.15 * (cd_in - fi_mm) / fi_mm
-            if not u_a2: val = 1.0
-            a2_val = max(0.7, min(1.0, val))
+            a2_val = float(Alfa2(cd_in, fi_mm, ksztalt_preta)) if u_a2 else 1.0
+            cd_odw = cd_in if u_a2 else np.nan
 
         with col_a3:
             st.markdown("""<b>$\\alpha_3$: Zbrojenie poprzeczne (nieprzyspojone)</b>""", unsafe_allow_html=True)
@@ -580,19 +901,13 @@ def StronaDlugoscZakotwienia():
             
             K_in, sum_ast_in, sum_ast_min_in = 0.05, 0.0, 2.5
             if u_a3:
-                with st.expander("ℹ️ Pomoc: Rysunek $K$"):
-                    img_k = SCIEZKA_FOLDERU_LOKALNEGO / "DlugoscZakotwienia_Wspolczynnik K.png"
-                    if img_k.exists(): st.image(str(img_k), use_container_width=True)
+                PomocZRysunkiem("ℹ️ Pomoc: Rysunek $K$", SCIEZKA_FOLDERU_LOKALNEGO / "DlugoscZakotwienia_Wspolczynnik K.png")
                 K_in = st.selectbox("Współczynnik $K$", [0.1, 0.05, 0.0], index=1)
                 sum_ast_in = st.number_input("$\\Sigma A_{st}$ [cm²]", value=0.0, step=0.1)
                 sum_ast_min_in = st.number_input("$\\Sigma A_{st,min}$", value=2.5, step=0.1)
             
-            As_1 = (math.pi * fi_mm**2)/400.0
-            val_a3 = 1.0
-            if u_a3 and As_1 > 0:
-                lamb = (sum_ast_in - sum_ast_min_in) / As_1
-                val_a3 = 1.0 - K_in * lamb
-            a3_val = max(0.7, min(1.0, val_a3))
+            a3_val = float(Alfa3(sum_ast_in, fi_mm, K_in, sum_ast_min_in)) if u_a3 else 1.0
+            sum_ast_odw = sum_ast_in if u_a3 else np.nan
 
         with col_a4:
             st.markdown("""<b>$\\alpha_4$: Zbrojenie poprzeczne (przyspojone)</b>""", unsafe_allow_html=True)
@@ -614,10 +929,7 @@ def StronaDlugoscZakotwienia():
                 st.write("p - nacisk poprzeczny w [MPa] wzdłuż lbd w stanie granicznym nośności")
                 p_in = st.number_input("p_input", value=8.0, step=0.5, label_visibility="collapsed")
             
-            val_a5 = 1.0
-            if u_a5:
-                val_a5 = 1.0 - 0.04 * p_in
-            a5_val = max(0.7, min(1.0, val_a5))
+            a5_val = float(Alfa5(p_in)) if u_a5 else 1.0
 
     else: # Pręt ściskany
         # Użycie kolumn do ułożenia elementów w jednej linii
@@ -640,11 +952,8 @@ def StronaDlugoscZakotwienia():
 
     
     # UI CLEANUP - Usunięto zbędne nagłówki nad rysunkami
-    with st.expander("ℹ️ Pomoc: Wartości współczynników $\\alpha$ (Tablica 8.2)"):
-        c_l, c_c, c_r = st.columns([1, 10, 1])
-        with c_c:
-            img_a15 = SCIEZKA_FOLDERU_LOKALNEGO / "DlugoscZakotwienia_alfa1-alfa5.png"
-            if img_a15.exists(): st.image(str(img_a15), width=650)
+    PomocZRysunkiem("ℹ️ Pomoc: Wartości współczynników $\\alpha$ (Tablica 8.2)",
+                    SCIEZKA_FOLDERU_LOKALNEGO / "DlugoscZakotwienia_alfa1-alfa5.png", 650, kolumny=[1, 10, 1])
 
     st.markdown("---")
 
@@ -653,22 +962,28 @@ def StronaDlugoscZakotwienia():
     with c_btn:
         oblicz = st.button("OBLICZ DŁUGOŚĆ ZAKOTWIENIA", type="primary", use_container_width=True)
 
+    # Graf zależności - przy każdej interakcji przeliczane są tylko węzły o zmienionych wejściach
+    if "kotw_graf" not in st.session_state:
+        st.session_state["kotw_graf"] = GrafZakotwienia()
+    graf = st.session_state["kotw_graf"]
+    graf.ustaw(
+        fi_mm=float(fi_mm),
+        klasa_betonu=klasa_betonu,
+        stal_nazwa=stal_nazwa,
+        procent_naprezenia=float(naprezenie),
+        warunki_przyczepnosci=warunki,
+        rodzaj_preta=rodzaj_preta,
+        ksztalt_preta=ksztalt_preta,
+        alfa2=a2_val,
+        alfa3=a3_val,
+        alfa4=a4_val,
+        alfa5=a5_val
+    )
+    wynik_grafu = WynikGrafuZakotwienia(graf)
+    przeliczone_wezly = list(graf.przeliczone)
+
     if oblicz:
-        wynik = ObliczDlugoscZakotwienia(
-            fi_mm=float(fi_mm),
-            klasa_betonu=klasa_betonu,
-            stal_nazwa=stal_nazwa,
-            procent_naprezenia=float(naprezenie),
-            warunki_przyczepnosci=warunki,
-            rodzaj_preta=rodzaj_preta,
-            ksztalt_preta=ksztalt_preta,
-            alfa2=a2_val,
-            alfa3=a3_val,
-            alfa4=a4_val,
-            alfa5=a5_val
-        )
-        
-        st.session_state["wynik_kotw"] = wynik
+        st.session_state["wynik_kotw"] = wynik_grafu
         st.session_state["inputs_kotw"] = {
             "naprezenie": naprezenie,
             "warunki": warunki,
@@ -692,21 +1007,41 @@ def StronaDlugoscZakotwienia():
         
         st.markdown("<div style='height: 20px;'></div>", unsafe_allow_html=True)
         
-        col_pdf, col_docx = st.columns(2)
-        with col_pdf:
-            data_pdf = create_pdf_report(res, inp)
+        format_raportu = st.radio(
+            "Raport", ["Podgląd HTML", "Markdown", "PDF", "Word"], index=0, horizontal=True, key="kotw_format_raportu"
+        )
+        # Tworzony jest tylko wybrany format; podgląd HTML i Markdown nie ładują fpdf / python-docx
+        if format_raportu == "Podgląd HTML":
+            st.markdown(create_html_report(res, inp), unsafe_allow_html=True)
+            st.download_button(
+                "🌐 POBIERZ RAPORT HTML",
+                create_html_report(res, inp, pelny=True),
+                file_name="DlugoscZakotwienia.html",
+                mime="text/html",
+                use_container_width=True
+            )
+        elif format_raportu == "Markdown":
+            data_md = create_md_report(res, inp)
+            st.code(data_md, language="markdown")
+            st.download_button(
+                "📋 POBIERZ RAPORT MARKDOWN",
+                data_md,
+                file_name="DlugoscZakotwienia.md",
+                mime="text/markdown",
+                use_container_width=True
+            )
+        elif format_raportu == "PDF":
             st.download_button(
                 "📄 POBIERZ RAPORT PDF",
-                data_pdf,
+                create_pdf_report(res, inp),
                 file_name="DlugoscZakotwienia.pdf",
                 mime="application/pdf",
                 use_container_width=True
             )
-        with col_docx:
-            data_docx = create_docx_report(res, inp)
+        else:
             st.download_button(
                 "📝 POBIERZ RAPORT WORD",
-                data_docx,
+                create_docx_report(res, inp),
                 file_name="DlugoscZakotwienia.docx",
                 mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                 use_container_width=True
@@ -757,5 +1092,301 @@ def StronaDlugoscZakotwienia():
             st.latex(rf"l_{{bd}} = \alpha_{{global}} \cdot l_{{b,rqd}} = {res['alfa_global']:.2f} \cdot {res['lb_rqd']:.1f} = {res['lb_calc']:.1f} \text{{ mm}}")
             st.latex(rf"l_{{bd,req}} = \max(l_{{bd}}; l_{{b,min}}) = \mathbf{{{res['lb_final']:.1f}}} \text{{ mm}}")
 
+    # WARIANTY MINIMALNEJ DŁUGOŚCI
+    st.markdown("---")
+    with st.expander("🔎 Warianty minimalnej długości (front Pareto)", expanded=False):
+        st.write(
+            "Przegląd wszystkich kombinacji środków zmniejszających długość zakotwienia lbd (kształt pręta, α2, α3, α4, α5). "
+            "Wysiłek detalowania jest umowny - pokazywane są tylko warianty, dla których "
+            "nie istnieje wariant jednocześnie krótszy i prostszy."
+        )
+        c_o1, c_o2, c_o3 = st.columns(3)
+        with c_o1:
+            cd_txt = st.text_input("Rozważane $c_d$ [mm] (rozdzielone przecinkami)", value="", key="kotw_cd_lista")
+            cd_akt = st.number_input("Obecne $c_d$ [mm]", value=float(fi_mm), step=1.0, key="kotw_cd_akt")
+        with c_o2:
+            ast_txt = st.text_input("Rozważane $\\Sigma A_{st}$ [cm²]", value="1.0, 2.0, 4.0", key="kotw_ast_lista")
+            K_opt = st.selectbox("Współczynnik $K$", [0.1, 0.05, 0.0], index=1, key="kotw_K")
+        with c_o3:
+            ast_min_opt = st.number_input("$\\Sigma A_{st,min}$ [cm²]", value=2.5, step=0.1, key="kotw_ast_min")
+            p_opt = st.number_input("Nacisk poprzeczny p [MPa] (0 - brak)", value=0.0, step=0.5, key="kotw_p")
+
+        if st.button("SZUKAJ WARIANTÓW", use_container_width=True, key="kotw_szukaj"):
+            try:
+                cd_lista = [float(x) for x in cd_txt.replace(";", ",").split(",") if x.strip()]
+                ast_lista = [float(x) for x in ast_txt.replace(";", ",").split(",") if x.strip()]
+                st.session_state["wynik_kotw_opt"] = OptymalizujZakotwienie(
+                    float(fi_mm), klasa_betonu, stal_nazwa, float(naprezenie), warunki,
+                    rodzaj_preta=rodzaj_preta,
+                    cd_lista=cd_lista,
+                    cd_aktualne=cd_akt,
+                    sum_ast_lista=ast_lista,
+                    K=K_opt,
+                    sum_ast_min=ast_min_opt,
+                    p=p_opt,
+                )
+                st.session_state["pokaz_kotw_opt"] = True
+            except (KeyError, ValueError) as e:
+                st.error(f"Wystąpił błąd podczas obliczeń: {e}")
+                st.session_state["pokaz_kotw_opt"] = False
+
+        if st.session_state.get("pokaz_kotw_opt", False):
+            opt = st.session_state["wynik_kotw_opt"]
+            idx = opt["pareto"]
+            st.caption(f"Przeanalizowano {opt['n_wariantow']} wariantów, front Pareto: {len(idx)}.")
+            st.dataframe(
+                {
+                    "l_bd [mm]": [int(math.ceil(opt["lbd"][i] - 1e-9)) for i in idx],
+                    "α_global": [round(float(opt["alfa_global"][i]), 3) for i in idx],
+                    "Wysiłek": [round(float(opt["wysilek"][i]), 2) for i in idx],
+                    "Środki": [opt["opis"][i] for i in idx],
+                },
+                use_container_width=True,
+                hide_index=True,
+            )
+
+    # ZADANIE ODWROTNE
+    with st.expander("↩️ Zadanie odwrotne: dostępna długość zakotwienia", expanded=False):
+        st.write(
+            "Dla każdej dostępnej długości: największe $\\sigma_{sd}/f_{yd}$ dla wybranej średnicy "
+            "oraz największa średnica przy zadanym $\\sigma_{sd}/f_{yd}$. "
+            "Współczynniki $\\alpha$ jak w danych powyżej; $\\alpha_2$ i $\\alpha_3$ liczone dla każdej "
+            "średnicy z $c_d$ i $\\Sigma A_{st}$."
+        )
+        c_i1, c_i2, c_i3 = st.columns(3)
+        with c_i1:
+            l_od = st.number_input("Długość od [mm]", value=200.0, step=50.0, key="kotw_inv_od")
+        with c_i2:
+            l_do = st.number_input("Długość do [mm]", value=1000.0, step=50.0, key="kotw_inv_do")
+        with c_i3:
+            l_krok = st.number_input("Krok [mm]", value=50.0, min_value=1.0, step=10.0, key="kotw_inv_krok")
+
+        if st.button("ROZWIĄŻ ZADANIE ODWROTNE", use_container_width=True, key="kotw_inv_btn"):
+            try:
+                if l_do < l_od:
+                    raise ValueError("Długość końcowa mniejsza od początkowej.")
+                l_tab = np.arange(l_od, l_do + 0.5 * l_krok, l_krok)
+                st.session_state["wynik_kotw_inv"] = OdwrotneZakotwienie(
+                    l_tab, float(fi_mm), klasa_betonu, stal_nazwa, float(naprezenie), warunki,
+                    rodzaj_preta, ksztalt_preta, a2_val, a3_val, a4_val, a5_val,
+                    cd=cd_odw, sum_ast=sum_ast_odw, K=K_in, sum_ast_min=sum_ast_min_in,
+                )
+                st.session_state["pokaz_kotw_inv"] = True
+            except (KeyError, ValueError) as e:
+                st.error(f"Wystąpił błąd podczas obliczeń: {e}")
+                st.session_state["pokaz_kotw_inv"] = False
+
+        if st.session_state.get("pokaz_kotw_inv", False):
+            inv = st.session_state["wynik_kotw_inv"]
+            st.dataframe(
+                {
+                    "l_bd,dost [mm]": [f"{x:.0f}" for x in inv["l_dostepne"]],
+                    f"max σsd/fyd dla Φ{fi_mm} [%]": [
+                        "—" if np.isnan(x) else f"{x:.1f}" for x in inv["procent_max"]
+                    ],
+                    "max σsd [MPa]": ["—" if np.isnan(x) else f"{x:.1f}" for x in inv["sigma_sd_max"]],
+                    f"max Φ przy {naprezenie}% [mm]": [
+                        "—" if np.isnan(x) else f"{x:.0f}" for x in inv["fi_max"]
+                    ],
+                },
+                use_container_width=True,
+                hide_index=True,
+            )
+
+    # PRZEGLĄD PARAMETRÓW
+    with st.expander("📈 Przegląd parametrów (krzywe l_bd)", expanded=False):
+        st.write(
+            "$l_{bd}$ w funkcji jednego parametru (oś X) i opcjonalnie drugiego (serie krzywych). "
+            "Pozostałe dane jak powyżej. Po zmianie zakresu jednej osi liczone są tylko nowe punkty siatki."
+        )
+        osie = list(OSIE_PRZEGLADU)
+        c_p1, c_p2 = st.columns(2)
+        with c_p1:
+            os_x = st.selectbox("Oś X", osie, index=0, key="kotw_prz_x")
+        with c_p2:
+            os_y = st.selectbox("Serie", ["Brak"] + [o for o in osie if o != os_x], index=0, key="kotw_prz_y")
+
+        wartosci_osi = {}
+        for os_nazwa, rola in ((os_x, "x"), (os_y, "y")):
+            arg = OSIE_PRZEGLADU.get(os_nazwa)
+            if arg == "fi_mm":
+                domyslne = FI_LIST if rola == "x" else [12, 20, 32]
+                wartosci_osi[arg] = st.multiselect(os_nazwa, FI_LIST, default=domyslne, key=f"kotw_prz_fi_{rola}")
+            elif arg == "klasa_betonu":
+                klasy = list(BETON_DATA.keys())
+                domyslne = klasy if rola == "x" else ["C20/25", "C30/37", "C40/50"]
+                wartosci_osi[arg] = st.multiselect(os_nazwa, klasy, default=domyslne, key=f"kotw_prz_beton_{rola}")
+            elif arg == "procent_naprezenia":
+                domyslne = (20, 100) if rola == "x" else (50, 100)
+                zakres = st.slider(os_nazwa, 0, 100, domyslne, 5, key=f"kotw_prz_sigma_{rola}")
+                krok = 5 if rola == "x" else 25
+                wartosci_osi[arg] = list(range(zakres[0], zakres[1] + 1, krok))
+
+        if st.button("PRZELICZ PRZEGLĄD", use_container_width=True, key="kotw_prz_btn"):
+            try:
+                arg_x = OSIE_PRZEGLADU[os_x]
+                arg_y = OSIE_PRZEGLADU.get(os_y)
+                x_vals = wartosci_osi[arg_x]
+                y_vals = wartosci_osi[arg_y] if arg_y else [None]
+                if not x_vals or not y_vals:
+                    raise ValueError("Wybierz co najmniej jedną wartość na każdej osi.")
+                stale = {
+                    "fi_mm": float(fi_mm),
+                    "klasa_betonu": klasa_betonu,
+                    "stal_nazwa": stal_nazwa,
+                    "procent_naprezenia": float(naprezenie),
+                    "warunki_przyczepnosci": warunki,
+                    "rodzaj_preta": rodzaj_preta,
+                    "ksztalt_preta": ksztalt_preta,
+                    "alfa2": a2_val,
+                    "alfa3": a3_val,
+                    "alfa4": a4_val,
+                    "alfa5": a5_val,
+                }
+                for arg in (arg_x, arg_y):
+                    stale.pop(arg, None)
+
+                if "kotw_przeglad" not in st.session_state:
+                    st.session_state["kotw_przeglad"] = PrzegladZakotwienia()
+                przeglad = st.session_state["kotw_przeglad"]
+                lb = przeglad.oblicz(arg_x, x_vals, stale, arg_y, y_vals)
+                st.session_state["wynik_kotw_przeglad"] = {
+                    "os_x": os_x,
+                    "os_y": os_y if arg_y else None,
+                    "x": list(x_vals),
+                    "y": list(y_vals),
+                    "lb": lb,
+                    "obliczone": przeglad.punkty_obliczone,
+                    "wszystkie": przeglad.punkty_wszystkie,
+                }
+                st.session_state["pokaz_kotw_przeglad"] = True
+            except (KeyError, ValueError) as e:
+                st.error(f"Wystąpił błąd podczas obliczeń: {e}")
+                st.session_state["pokaz_kotw_przeglad"] = False
+
+        if st.session_state.get("pokaz_kotw_przeglad", False):
+            prz = st.session_state["wynik_kotw_przeglad"]
+            pozycje = np.arange(len(prz["x"]))
+            fig, ax = plt.subplots(figsize=(9, 3.8))
+            for j, y_val in enumerate(prz["y"]):
+                etykieta = None if prz["os_y"] is None else f"{prz['os_y']}: {y_val}"
+                ax.plot(pozycje, prz["lb"][j], marker="o", markersize=3, linewidth=1.8, label=etykieta)
+            ax.set_xticks(pozycje)
+            ax.set_xticklabels([str(v) for v in prz["x"]], rotation=45 if len(prz["x"]) > 12 else 0, fontsize=8)
+            ax.set_xlabel(prz["os_x"], fontsize=11)
+            ax.set_ylabel("l_bd [mm]", fontsize=11)
+            ax.grid(True, linestyle="--", alpha=0.4)
+            ax.spines["top"].set_visible(False)
+            ax.spines["right"].set_visible(False)
+            if prz["os_y"] is not None:
+                ax.legend(fontsize=8)
+            fig.tight_layout()
+            st.pyplot(fig)
+
+            kolumny = {prz["os_x"]: [str(v) for v in prz["x"]]}
+            for j, y_val in enumerate(prz["y"]):
+                nazwa = "l_bd [mm]" if prz["os_y"] is None else f"{prz['os_y']}: {y_val}"
+                kolumny[nazwa] = [f"{v:.0f}" for v in prz["lb"][j]]
+            st.dataframe(kolumny, use_container_width=True, hide_index=True)
+            st.caption(
+                f"Przeliczono {prz['obliczone']} z {prz['wszystkie']} punktów siatki "
+                "(pozostałe z pamięci poprzednich przeglądów)."
+            )
+
+    # ANALIZA NIEZAWODNOŚCI
+    with st.expander("🎲 Analiza niezawodności istniejącego zakotwienia (Monte Carlo)", expanded=False):
+        st.write(
+            "Prawdopodobieństwo, że istniejąca długość zakotwienia jest mniejsza od wymaganej, "
+            "przy losowych $f_{ct}$, $f_y$, $\\Phi$ i $c_d$. Wartości średnie i dane jak powyżej, "
+            "bez współczynników częściowych i bez $l_{b,min}$."
+        )
+        c_mc1, c_mc2, c_mc3 = st.columns(3)
+        with c_mc1:
+            l_mc = st.number_input("Istniejąca długość zakotwienia [mm]", value=400.0, min_value=1.0, step=10.0, key="kotw_mc_l")
+        with c_mc2:
+            n_mc = st.selectbox("Liczba próbek", [100_000, 1_000_000, 10_000_000], index=1, key="kotw_mc_n",
+                                format_func=lambda n: f"{n:,}".replace(",", " "))
+        with c_mc3:
+            seed_mc = st.number_input("Ziarno generatora", value=0, min_value=0, step=1, key="kotw_mc_seed")
+
+        c_mc4, c_mc5, c_mc6, c_mc7 = st.columns(4)
+        with c_mc4:
+            V_fct = st.number_input("V f_ct [-]", value=ROZKLADY_MC["V_fct"], min_value=0.0, step=0.01, key="kotw_mc_vfct")
+        with c_mc5:
+            V_fy = st.number_input("V f_y [-]", value=ROZKLADY_MC["V_fy"], min_value=0.0, step=0.01, key="kotw_mc_vfy")
+        with c_mc6:
+            V_fi = st.number_input("V Φ [-]", value=ROZKLADY_MC["V_fi"], min_value=0.0, step=0.005, format="%.3f", key="kotw_mc_vfi")
+        with c_mc7:
+            sigma_cd = st.number_input("σ c_d [mm]", value=ROZKLADY_MC["sigma_cd"], min_value=0.0, step=1.0, key="kotw_mc_scd")
+        procesy_mc = st.number_input("Liczba procesów", value=1, min_value=1, max_value=max(1, os.cpu_count() or 1), step=1, key="kotw_mc_proc")
+
+        if st.button("URUCHOM SYMULACJĘ", use_container_width=True, key="kotw_mc_btn"):
+            try:
+                with st.spinner("Symulacja Monte Carlo..."):
+                    st.session_state["wynik_kotw_mc"] = NiezawodnoscZakotwienia(
+                        l_mc, float(fi_mm), klasa_betonu, stal_nazwa, float(naprezenie), warunki,
+                        rodzaj_preta, ksztalt_preta,
+                        c_d=cd_in if rodzaj_preta == "Rozciągany" and u_a2 else None,
+                        alfa2=a2_val, alfa3=a3_val, alfa4=a4_val, alfa5=a5_val,
+                        n_probek=int(n_mc), seed=int(seed_mc), procesy=int(procesy_mc),
+                        rozklady={"V_fct": V_fct, "V_fy": V_fy, "V_fi": V_fi, "sigma_cd": sigma_cd},
+                    )
+                st.session_state["pokaz_kotw_mc"] = True
+            except (KeyError, ValueError) as e:
+                st.error(f"Wystąpił błąd podczas obliczeń: {e}")
+                st.session_state["pokaz_kotw_mc"] = False
+
+        if st.session_state.get("pokaz_kotw_mc", False):
+            mc = st.session_state["wynik_kotw_mc"]
+            st.markdown(
+                f"""
+                <div class="big-result">
+                    P(l<sub>dost</sub> &lt; l<sub>wym</sub>) = {mc['p_f']:.2e} &nbsp;&nbsp;|&nbsp;&nbsp; β = {mc['beta']:.2f}
+                </div>
+                """,
+                unsafe_allow_html=True,
+            )
+            st.markdown("<div style='height: 12px;'></div>", unsafe_allow_html=True)
+            m1, m2, m3, m4 = st.columns(4)
+            m1.metric("l_bd (projektowa) [mm]", f"{mc['l_deterministyczna']:.0f}")
+            m2.metric("Średnia l_wym [mm]", f"{mc['l_srednia']:.0f}")
+            m3.metric("Kwantyl 95% l_wym [mm]", f"{mc['kwantyle'][0.95]:.0f}")
+            m4.metric("Błąd standardowy P", f"{mc['blad_std']:.1e}")
+
+            srodki = 0.5 * (mc["krawedzie"][1:] + mc["krawedzie"][:-1])
+            fig, ax = plt.subplots(figsize=(9, 3.5))
+            ax.bar(srodki, mc["histogram"] / mc["n_probek"], width=np.diff(mc["krawedzie"]), color="#4C72B0", alpha=0.8)
+            ax.axvline(mc["l_dostepne"], color="#C44E52", linewidth=2.0, label="l istniejąca")
+            ax.axvline(mc["l_deterministyczna"], color="#2E8B57", linewidth=1.5, linestyle="--", label="l_bd projektowa")
+            ax.set_xlabel("Wymagana długość zakotwienia [mm]", fontsize=11)
+            ax.set_ylabel("Udział próbek [-]", fontsize=11)
+            ax.grid(True, linestyle="--", alpha=0.4)
+            ax.spines["top"].set_visible(False)
+            ax.spines["right"].set_visible(False)
+            ax.legend(fontsize=8)
+            fig.tight_layout()
+            st.pyplot(fig)
+            st.caption(
+                f"{mc['n_probek']:,} próbek, niespełnień: {mc['n_niespelnien']:,}. ".replace(",", " ")
+                + "Ostatni przedział histogramu zawiera również wartości większe."
+            )
+
+    # GRAF ZALEŻNOŚCI
+    with st.expander("⚙️ Graf zależności: węzły przeliczone w ostatniej interakcji", expanded=False):
+        if przeliczone_wezly:
+            st.write("Przeliczone: " + ", ".join(f"`{n}`" for n in przeliczone_wezly))
+        else:
+            st.write("Brak zmian danych - wszystkie węzły z pamięci.")
+        liczniki = graf.liczniki
+        st.dataframe(
+            {
+                "Węzeł": list(liczniki),
+                "W tej interakcji": ["✔" if n in przeliczone_wezly else "" for n in liczniki],
+                "Obliczeń łącznie": list(liczniki.values()),
+            },
+            use_container_width=True,
+            hide_index=True,
+        )
+
 if __name__ == "__main__":
     StronaDlugoscZakotwienia()
\ No newline at end of file
@@ -0,0 +1,268 @@
+"""
+PROGRAMY/DoborPretow.py
+Dobór zbrojenia n×Φ (jedna lub dwie średnice) dla wymaganego pola As,req
+z kontrolą mieszczenia się prętów w jednym rzędzie (PN-EN 1992-1-1, 8.2)
+oraz dobór Φ / rozstawu dla płyt (na 1 m szerokości).
+
+Wszystkie kombinacje budowane są raz (lru_cache) jako tablice posortowane
+rosnąco wg pola. Zapytanie "najmniejsze As >= As,req mieszczące się w
+szerokości" to searchsorted po polu i zejście po tablicy rzadkiej minimów
+wymaganej szerokości (binary lifting) - oba kroki wektorowe, więc tysiące
+przekrojów obsługiwane są jednym wywołaniem.
+Jednostki: As [mm²], wymiary [mm].
+"""
+
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+# --- KONFIGURACJA ŚCIEŻEK (SZUKAMY KATALOGU KALKULATORY) ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+if SCIEZKA_BAZOWA is None:
+    # Fallback – dwa poziomy wyżej
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+if str(SCIEZKA_BAZOWA) not in sys.path:
+    sys.path.append(str(SCIEZKA_BAZOWA))
+
+from TABLICE.ParametryPretowZbrojeniowych import get_bar_arrays
+
+# Minimalny odstęp w świetle (8.2(2), wartości zalecane): max(k1·Φ, dg + k2, 20 mm)
+K1_ODSTEP = 1.0
+K2_ODSTEP = 5.0
+ODSTEP_MIN = 20.0
+
+# Kombinacje dwóch średnic: Φ2 co najwyżej tyle pozycji niżej w tablicy średnic niż Φ1
+MAKS_ROZNICA_SREDNIC = 2
+
+# Domyślne rozstawy prętów w płytach [mm]
+ROZSTAWY_PLYT = tuple(range(50, 305, 5))
+
+# =============================================================================
+# TABLICA RZADKA MINIMÓW (WYSZUKIWANIE PIERWSZEGO PASUJĄCEGO ELEMENTU)
+# =============================================================================
+
+def _tablica_minimow(wartosci: np.ndarray) -> np.ndarray:
+    """Wiersz k: minimum z wartości w oknie [i, i + 2^k) (poza końcem: +inf)."""
+    n = wartosci.size
+    poziomy = [wartosci.astype(np.float64)]
+    krok = 1
+    while 2 * krok <= n:
+        poprzedni = poziomy[-1]
+        nastepny = np.full(n, np.inf)
+        nastepny[: n - krok] = np.minimum(poprzedni[: n - krok], poprzedni[krok:])
+        poziomy.append(nastepny)
+        krok *= 2
+    tablica = np.vstack(poziomy)
+    tablica.setflags(write=False)
+    return tablica
+
+
+def _pierwszy_nie_wiekszy(minima: np.ndarray, start, limit) -> np.ndarray:
+    """
+    Dla każdej pary (start, limit): najmniejszy indeks i >= start, dla którego
+    wartosci[i] <= limit; -1 gdy brak. Zejście od najwyższego poziomu tablicy
+    rzadkiej pomija całe bloki z minimum > limit.
+    """
+    n = minima.shape[1]
+    p = np.array(start, dtype=np.int64, copy=True)
+    limit = np.asarray(limit, dtype=np.float64) + 1e-9
+    for k in range(minima.shape[0] - 1, -1, -1):
+        dl = 1 << k
+        mozna = p + dl <= n
+        blok = minima[k, np.minimum(p, n - 1)]
+        p = np.where(mozna & (blok > limit), p + dl, p)
+    wartosc = minima[0, np.minimum(p, n - 1)]
+    return np.where((p < n) & (wartosc <= limit), p, -1)
+
+# =============================================================================
+# KOMBINACJE PRĘTÓW (BELKI, SŁUPY)
+# =============================================================================
+
+def OdstepMinimalny(fi_max, dg: float = 16.0) -> np.ndarray:
+    """Minimalny odstęp prętów w świetle a_min [mm] wg 8.2(2)."""
+    return np.maximum(np.maximum(K1_ODSTEP * np.asarray(fi_max, dtype=np.float64), dg + K2_ODSTEP), ODSTEP_MIN)
+
+
+@lru_cache(maxsize=16)
+def KombinacjePretow(
+    n_max: int = 10,
+    dg: float = 16.0,
+    dwie_srednice: bool = True,
+    n_min: int = 2,
+    srednice: tuple | None = None,
+) -> dict:
+    """
+    Wszystkie kombinacje n1×Φ1 (+ n2×Φ2, Φ2 < Φ1 o najwyżej MAKS_ROZNICA_SREDNIC
+    pozycji w tablicy średnic), n_min <= n1 + n2 <= n_max,
+    posortowane rosnąco wg pola (przy równym polu - mniej prętów).
+    "szerokosc" - wymagana szerokość w świetle strzemion dla jednego rzędu:
+    ΣΦ + (n - 1)·a_min(Φmax). Tablice tylko do odczytu.
+    """
+    prety = get_bar_arrays()
+    fi_tab = prety["fi"] if srednice is None else np.sort(np.asarray(srednice, dtype=np.int64))
+    As_tab = np.pi * fi_tab.astype(np.float64) ** 2 / 4.0
+
+    n = np.arange(1, n_max + 1)
+    i1, n1 = np.meshgrid(np.arange(fi_tab.size), n, indexing="ij")
+    maska = n1 >= n_min
+    czesci = [(i1[maska], n1[maska], np.zeros(maska.sum(), dtype=np.int64), np.zeros(maska.sum(), dtype=np.int64))]
+    if dwie_srednice:
+        i1, i2, n1, n2 = np.meshgrid(np.arange(fi_tab.size), np.arange(fi_tab.size), n, n, indexing="ij")
+        maska = (i2 < i1) & (i1 - i2 <= MAKS_ROZNICA_SREDNIC) & (n1 + n2 >= n_min) & (n1 + n2 <= n_max)
+        czesci.append((i1[maska], n1[maska], i2[maska], n2[maska]))
+    i1, n1, i2, n2 = (np.concatenate(c) for c in zip(*czesci))
+
+    fi1 = fi_tab[i1]
+    fi2 = np.where(n2 > 0, fi_tab[i2], 0)
+    pole = n1 * As_tab[i1] + n2 * As_tab[i2]
+    liczba = n1 + n2
+    szerokosc = n1 * fi1 + n2 * fi2 + (liczba - 1) * OdstepMinimalny(fi1, dg)
+
+    kolejnosc = np.lexsort((szerokosc, liczba, np.round(pole, 6)))
+    tablice = {
+        "As": pole[kolejnosc],
+        "n": liczba[kolejnosc],
+        "fi1": fi1[kolejnosc],
+        "n1": n1[kolejnosc],
+        "fi2": fi2[kolejnosc],
+        "n2": n2[kolejnosc],
+        "szerokosc": szerokosc[kolejnosc].astype(np.float64),
+    }
+    for t in tablice.values():
+        t.setflags(write=False)
+    tablice["minima"] = _tablica_minimow(tablice["szerokosc"])
+    return tablice
+
+
+def OpisKombinacji(n1: int, fi1: int, n2: int = 0, fi2: int = 0) -> str:
+    """Zapis kombinacji, np. "3Φ20 + 2Φ16"."""
+    opis = f"{int(n1)}Φ{int(fi1)}"
+    if n2:
+        opis += f" + {int(n2)}Φ{int(fi2)}"
+    return opis
+
+
+def DobierzPrety(
+    As_req,
+    b,
+    c,
+    fi_strzemion=0.0,
+    n_max: int = 10,
+    dg: float = 16.0,
+    dwie_srednice: bool = True,
+    n_min: int = 2,
+) -> dict:
+    """
+    Najmniejsze pole As >= As_req z kombinacji mieszczącej się w jednym rzędzie
+    przekroju o szerokości b przy otulinie c (do strzemion) i strzemionach Φs.
+    Argumenty podlegają broadcastowi; "idx" = -1 (i NaN w polach) gdy brak
+    rozwiązania. Pozostałe klucze - parametry kombinacji jak w KombinacjePretow.
+    """
+    tab = KombinacjePretow(int(n_max), float(dg), bool(dwie_srednice), int(n_min))
+    As_req, b, c, fi_strzemion = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (As_req, b, c, fi_strzemion))
+    )
+    szer_dostepna = b - 2.0 * (c + fi_strzemion)
+
+    start = np.searchsorted(tab["As"], As_req - 1e-9, side="left")
+    idx = _pierwszy_nie_wiekszy(tab["minima"], start, szer_dostepna)
+    jest = idx >= 0
+    i = np.maximum(idx, 0)
+    return {
+        "idx": idx,
+        "ok": jest,
+        "As": np.where(jest, tab["As"][i], np.nan),
+        "n": np.where(jest, tab["n"][i], 0),
+        "fi1": np.where(jest, tab["fi1"][i], 0),
+        "n1": np.where(jest, tab["n1"][i], 0),
+        "fi2": np.where(jest, tab["fi2"][i], 0),
+        "n2": np.where(jest, tab["n2"][i], 0),
+        "szerokosc_wymagana": np.where(jest, tab["szerokosc"][i] + 2.0 * (c + fi_strzemion), np.nan),
+    }
+
+# =============================================================================
+# PŁYTY (ROZSTAW NA 1 M)
+# =============================================================================
+
+@lru_cache(maxsize=16)
+def KombinacjePlyt(dg: float = 16.0, srednice: tuple | None = None, rozstawy: tuple = ROZSTAWY_PLYT) -> dict:
+    """
+    Wszystkie pary (Φ, s) z s - Φ >= a_min, posortowane rosnąco wg pola na 1 m
+    As = AΦ·1000/s [mm²/m] (przy równym polu - większy rozstaw).
+    """
+    fi_tab = get_bar_arrays()["fi"] if srednice is None else np.asarray(srednice, dtype=np.int64)
+    fi, s = np.meshgrid(fi_tab, np.asarray(rozstawy, dtype=np.float64), indexing="ij")
+    fi, s = fi.ravel(), s.ravel()
+    maska = s - fi >= OdstepMinimalny(fi, dg)
+    fi, s = fi[maska], s[maska]
+    pole = np.pi * fi.astype(np.float64) ** 2 / 4.0 * 1000.0 / s
+
+    kolejnosc = np.lexsort((-s, np.round(pole, 6)))
+    tablice = {"As": pole[kolejnosc], "fi": fi[kolejnosc], "s": s[kolejnosc]}
+    for t in tablice.values():
+        t.setflags(write=False)
+    tablice["minima"] = _tablica_minimow(tablice["s"])
+    return tablice
+
+
+def DobierzPretyPlyty(As_req, s_max=250.0, dg: float = 16.0) -> dict:
+    """
+    Najmniejsze As [mm²/m] >= As_req przy rozstawie s <= s_max (np. wg 9.3.1.1(3)).
+    Rozstaw minimalny wynika z a_min (KombinacjePlyt). Argumenty wektorowe;
+    "idx" = -1 (i NaN w polach) gdy brak rozwiązania.
+    """
+    As_req, s_max = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (As_req, s_max)))
+    tab = KombinacjePlyt(float(dg))
+    start = np.searchsorted(tab["As"], As_req - 1e-9, side="left")
+    idx = _pierwszy_nie_wiekszy(tab["minima"], start, s_max)
+    jest = idx >= 0
+    i = np.maximum(idx, 0)
+    return {
+        "idx": idx,
+        "ok": jest,
+        "As": np.where(jest, tab["As"][i], np.nan),
+        "fi": np.where(jest, tab["fi"][i], 0),
+        "s": np.where(jest, tab["s"][i], np.nan),
+    }
+
+
+if __name__ == "__main__":
+    import time
+
+    w = DobierzPrety(1500.0, 300.0, 30.0, fi_strzemion=8.0)
+    print(f"As,req = 1500 mm², b = 300 mm: {OpisKombinacji(w['n1'], w['fi1'], w['n2'], w['fi2'])} "
+          f"= {float(w['As']):.0f} mm² (szer. wymagana {float(w['szerokosc_wymagana']):.0f} mm)")
+    p = DobierzPretyPlyty(565.0, 250.0)
+    print(f"Płyta As,req = 565 mm²/m: Φ{int(p['fi'])} co {float(p['s']):.0f} mm = {float(p['As']):.0f} mm²/m")
+
+    # Wszystkie przekroje modelu naraz
+    rng = np.random.default_rng(0)
+    n = 100_000
+    As_req = rng.uniform(100.0, 8000.0, n)
+    b = rng.choice([200.0, 250.0, 300.0, 350.0, 400.0, 500.0], n)
+    KombinacjePretow()
+    KombinacjePlyt()
+
+    t0 = time.perf_counter()
+    w = DobierzPrety(As_req, b, 30.0, fi_strzemion=8.0)
+    t1 = time.perf_counter()
+    p = DobierzPretyPlyty(As_req / 4.0, 250.0)
+    t2 = time.perf_counter()
+
+    # Kontrola pełnym przeglądem
+    tab = KombinacjePretow()
+    for k in range(0, n, 997):
+        pasuje = (tab["As"] >= As_req[k] - 1e-9) & (tab["szerokosc"] <= b[k] - 76.0 + 1e-9)
+        oczekiwane = tab["As"][pasuje].min() if pasuje.any() else np.nan
+        assert np.isclose(w["As"][k], oczekiwane, equal_nan=True)
+    print(f"{n} przekrojów belek: {(t1 - t0) * 1000:.0f} ms (brak rozwiązania: {(~w['ok']).sum()}), "
+          f"{n} pasm płyt: {(t2 - t1) * 1000:.0f} ms")
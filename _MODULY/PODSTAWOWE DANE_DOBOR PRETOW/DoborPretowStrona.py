@@ -0,0 +1,210 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# --- KONFIGURACJA ŚCIEŻEK (SZUKAMY KATALOGU KALKULATORY) ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+SCIEZKA_FOLDERU_LOKALNEGO = SCIEZKA_PLIKU.parent
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+if SCIEZKA_BAZOWA is None:
+    # Fallback – dwa poziomy wyżej
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+for sciezka in (SCIEZKA_BAZOWA, SCIEZKA_FOLDERU_LOKALNEGO):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+try:
+    from DoborPretow import (
+        DobierzPrety,
+        DobierzPretyPlyty,
+        KombinacjePlyt,
+        KombinacjePretow,
+        OdstepMinimalny,
+        OpisKombinacji,
+    )
+except ImportError as e:
+    st.error(f"⚠️ Błąd importu modułu doboru prętów: {e}. Sprawdź strukturę folderów.")
+    st.stop()
+
+LICZBA_ALTERNATYW = 10
+
+
+def StronaDoborPretow():
+    # --- STYL (spójny z pozostałymi kalkulatorami) ---
+    st.markdown(
+        """
+        <style>
+        .block-container { padding-top: 1.5rem; padding-bottom: 1.5rem; }
+        h3 { margin-top: 1.0rem !important; margin-bottom: 0.4rem !important; font-size: 1.1rem; }
+        .big-result {
+            font-size: 22px; font-weight: bold; color: #2E8B57; background-color: #f0f2f6;
+            padding: 15px; border-radius: 8px; text-align: center; margin-top: 20px; border: 2px solid #2E8B57;
+        }
+        .big-result-bad {
+            font-size: 22px; font-weight: bold; color: #B22222; background-color: #f0f2f6;
+            padding: 15px; border-radius: 8px; text-align: center; margin-top: 20px; border: 2px solid #B22222;
+        }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # --- TYTUŁ GŁÓWNY ---
+    st.markdown(
+        """
+        <div style="text-align:center; margin-top:0.4rem; margin-bottom:0rem;">
+            <span style="font-size:42px; font-weight:800; letter-spacing:1px; color:#dddddd;">
+                DOBÓR PRĘTÓW ZBROJENIOWYCH
+            </span>
+        </div>
+        <div style="text-align:center; font-size:14px; color:#aaaaaa; margin-top:-12px; margin-bottom:0.6rem;">
+            wg PN-EN 1992-1-1, pkt 8.2 i 9.3.1.1
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    tryb = st.radio(
+        "Rodzaj elementu",
+        ["Belka / słup (liczba prętów)", "Płyta (rozstaw na 1 m)"],
+        horizontal=True,
+    )
+
+    # 1. DANE WEJŚCIOWE
+    st.markdown("### DANE WEJŚCIOWE")
+    if tryb.startswith("Belka"):
+        c1, c2, c3, c4 = st.columns(4)
+        with c1:
+            As_req = st.number_input("A_s,req [cm²]", 0.1, 500.0, 15.0, 0.5)
+        with c2:
+            b = st.number_input("Szerokość b [mm]", 100.0, 3000.0, 300.0, 10.0)
+        with c3:
+            c = st.number_input("Otulina c_nom [mm]", 10.0, 100.0, 30.0, 5.0)
+        with c4:
+            fi_s = st.number_input("Średnica strzemion Φ_s [mm]", 0.0, 16.0, 8.0, 2.0)
+        c1, c2, c3, c4 = st.columns(4)
+        with c1:
+            dg = st.number_input("Wymiar kruszywa d_g [mm]", 8.0, 63.0, 16.0, 1.0)
+        with c2:
+            n_min = st.number_input("Liczba prętów min.", 1, 20, 2, 1)
+        with c3:
+            n_max = st.number_input("Liczba prętów maks.", 1, 20, 10, 1)
+        with c4:
+            dwie = st.checkbox("Dopuść dwie średnice", value=True)
+    else:
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            As_req = st.number_input("A_s,req [cm²/m]", 0.1, 100.0, 5.65, 0.05)
+        with c2:
+            s_max = st.number_input("Rozstaw maks. s_max [mm]", 50.0, 400.0, 250.0, 5.0)
+        with c3:
+            dg = st.number_input("Wymiar kruszywa d_g [mm]", 8.0, 63.0, 16.0, 1.0)
+
+    st.markdown("---")
+
+    _, c_btn, _ = st.columns([1, 2, 1])
+    with c_btn:
+        oblicz = st.button("OBLICZ", type="primary", use_container_width=True)
+
+    if oblicz:
+        try:
+            if tryb.startswith("Belka"):
+                if n_min > n_max:
+                    raise ValueError("Minimalna liczba prętów większa od maksymalnej.")
+                w = DobierzPrety(As_req * 100.0, b, c, fi_s, n_max=n_max, dg=dg, dwie_srednice=dwie, n_min=n_min)
+                tab = KombinacjePretow(int(n_max), float(dg), bool(dwie), int(n_min))
+                pasuje = np.flatnonzero(
+                    (tab["As"] >= As_req * 100.0 - 1e-9) & (tab["szerokosc"] <= b - 2.0 * (c + fi_s) + 1e-9)
+                )[:LICZBA_ALTERNATYW]
+                alternatywy = pd.DataFrame({
+                    "Zbrojenie": [OpisKombinacji(tab["n1"][i], tab["fi1"][i], tab["n2"][i], tab["fi2"][i]) for i in pasuje],
+                    "A_s [cm²]": np.round(tab["As"][pasuje] / 100.0, 2),
+                    "Nadmiar [%]": np.round((tab["As"][pasuje] / (As_req * 100.0) - 1.0) * 100.0, 1),
+                    "Szerokość wymagana [mm]": np.round(tab["szerokosc"][pasuje] + 2.0 * (c + fi_s), 0),
+                })
+                st.session_state["wynik_dobor"] = {
+                    "tryb": "belka",
+                    "ok": bool(w["ok"]),
+                    "opis": OpisKombinacji(w["n1"], w["fi1"], w["n2"], w["fi2"]) if w["ok"] else "",
+                    "As": float(w["As"]),
+                    "As_req": As_req,
+                    "szerokosc": float(w["szerokosc_wymagana"]),
+                    "a_min": float(OdstepMinimalny(w["fi1"], dg)),
+                    "b": b,
+                    "alternatywy": alternatywy,
+                }
+            else:
+                w = DobierzPretyPlyty(As_req * 100.0, s_max, dg=dg)
+                tab = KombinacjePlyt(float(dg))
+                pasuje = np.flatnonzero((tab["As"] >= As_req * 100.0 - 1e-9) & (tab["s"] <= s_max + 1e-9))
+                # Pierwsza (najmniejsza) para dla każdej średnicy
+                _, pierwsze = np.unique(tab["fi"][pasuje], return_index=True)
+                pasuje = pasuje[pierwsze]
+                alternatywy = pd.DataFrame({
+                    "Zbrojenie": [f"Φ{tab['fi'][i]} co {tab['s'][i]:.0f} mm" for i in pasuje],
+                    "A_s [cm²/m]": np.round(tab["As"][pasuje] / 100.0, 2),
+                    "Nadmiar [%]": np.round((tab["As"][pasuje] / (As_req * 100.0) - 1.0) * 100.0, 1),
+                })
+                st.session_state["wynik_dobor"] = {
+                    "tryb": "plyta",
+                    "ok": bool(w["ok"]),
+                    "opis": f"Φ{int(w['fi'])} co {float(w['s']):.0f} mm" if w["ok"] else "",
+                    "As": float(w["As"]),
+                    "As_req": As_req,
+                    "alternatywy": alternatywy,
+                }
+            st.session_state["pokaz_dobor"] = True
+        except (KeyError, ValueError) as e:
+            st.error(f"Wystąpił błąd podczas obliczeń: {e}")
+            st.session_state["pokaz_dobor"] = False
+
+    # WYNIKI
+    if st.session_state.get("pokaz_dobor", False):
+        res = st.session_state["wynik_dobor"]
+        jednostka = "cm²" if res["tryb"] == "belka" else "cm²/m"
+
+        if res["ok"]:
+            st.markdown(
+                f"""
+                <div class="big-result">
+                    {res['opis']} &nbsp;|&nbsp; A<sub>s,prov</sub> = {res['As'] / 100.0:.2f} {jednostka}
+                    &nbsp;(A<sub>s,req</sub> = {res['As_req']:.2f} {jednostka})
+                </div>
+                """,
+                unsafe_allow_html=True,
+            )
+        else:
+            st.markdown(
+                """
+                <div class="big-result-bad">
+                    Brak kombinacji prętów spełniającej warunki
+                </div>
+                """,
+                unsafe_allow_html=True,
+            )
+        st.markdown("<div style='height: 12px;'></div>", unsafe_allow_html=True)
+
+        if res["ok"] and res["tryb"] == "belka":
+            m1, m2, m3 = st.columns(3)
+            m1.metric("Nadmiar A_s [%]", f"{(res['As'] / (res['As_req'] * 100.0) - 1.0) * 100.0:.1f}")
+            m2.metric("Szerokość wymagana [mm]", f"{res['szerokosc']:.0f} / {res['b']:.0f}")
+            m3.metric("a_min w świetle [mm]", f"{res['a_min']:.0f}")
+        elif res["ok"]:
+            m1, _ = st.columns(2)
+            m1.metric("Nadmiar A_s [%]", f"{(res['As'] / (res['As_req'] * 100.0) - 1.0) * 100.0:.1f}")
+
+        if len(res["alternatywy"]):
+            st.markdown("#### Warianty alternatywne")
+            st.dataframe(res["alternatywy"], use_container_width=True, hide_index=True)
+
+
+if __name__ == "__main__":
+    StronaDoborPretow()
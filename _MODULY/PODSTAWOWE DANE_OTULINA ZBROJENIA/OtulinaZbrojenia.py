@@ -6,15 +6,15 @@ Wersja: ENGINEERING_STANDARD_V57 (Button Fix)
 import streamlit as st
 from pathlib import Path
 from io import BytesIO
+from functools import lru_cache
 import sys
+from typing import TYPE_CHECKING
 
-# Biblioteki do PDF
-from fpdf import FPDF
+import numpy as np
+import matplotlib.pyplot as plt
 
-# Biblioteki do DOCX
-from docx import Document
-from docx.shared import Pt, Cm, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+if TYPE_CHECKING:
+    from fpdf import FPDF
 
 # --- KONFIGURACJA ŚCIEŻEK ---
 SCIEZKA_PLIKU = Path(__file__).resolve()
@@ -29,33 +29,46 @@ for parent in SCIEZKA_PLIKU.parents:
 if SCIEZKA_BAZOWA is None:
     SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
 
-SCIEZKA_CZCIONKI = SCIEZKA_BAZOWA / "CZCIONKI"
-
 if str(SCIEZKA_BAZOWA) not in sys.path:
     sys.path.append(str(SCIEZKA_BAZOWA))
 
+# Klasy betonu wg Tablicy 3.1 - zapas, gdy TABLICE niedostępne
+KLASY_BETONU_FALLBACK = [
+    "C12/15", "C16/20", "C20/25", "C25/30", "C30/37", "C35/45", "C40/50",
+    "C45/55", "C50/60", "C55/67", "C60/75", "C70/85", "C80/95", "C90/105",
+]
+
 try:
     from TABLICE.ParametryBetonu import list_concrete_classes
+    KLASY_BETONU = list_concrete_classes()
 except ImportError:
-    pass
+    KLASY_BETONU = KLASY_BETONU_FALLBACK
+
+from NARZEDZIA.GrafZaleznosci import GrafZaleznosci
+from NARZEDZIA.Pamiec import KluczJSON, pamietaj
+from NARZEDZIA.PamiecRaportow import raport_na_dysku
+from NARZEDZIA.RaportIR import Fr, Linia, Naglowek, Odstep, Raport, Renderuj, Tabela, Tytul, Wynik
+from NARZEDZIA.PrzegladParametrow import PrzegladParametrow
+from NARZEDZIA.Rysunki import PomocZRysunkiem
 
 
 # =============================================================================
 # MODUŁ OBLICZENIOWY
 # =============================================================================
 
-def get_structural_class_adjustment(
+def _skladniki_zmiany_klasy(
     klasa_betonu: str,
     klasa_ekspozycji: str,
     zywotnosc_100_lat: bool,
     element_plytowy: bool,
     kontrola_jakosci: bool,
-) -> int:
-    zmiana = 0
+) -> list[tuple[int, str]]:
+    """Składniki ΔS modyfikacji klasy konstrukcji (Tablica 4.3N): [(ΔS, opis), ...]."""
+    skladniki = []
 
     # +2 za okres 100 lat
     if zywotnosc_100_lat:
-        zmiana += 2
+        skladniki.append((2, "Zwiększenie okresu użytkowania (100 lat)"))
 
     # fck z klasy betonu
     try:
@@ -78,17 +91,30 @@ def get_structural_class_adjustment(
         redukcja_wytrzymalosc = True
 
     if redukcja_wytrzymalosc:
-        zmiana -= 1
+        skladniki.append((-1, f"Redukcja ze względu na klasę wytrzymałości ({klasa_betonu})"))
 
     # -1 za płytę w XC1
     if element_plytowy and klasa_ekspozycji == "XC1":
-        zmiana -= 1
+        skladniki.append((-1, "Element płytowy w klasie ekspozycji XC1"))
 
     # -1 za specjalną kontrolę
     if kontrola_jakosci:
-        zmiana -= 1
+        skladniki.append((-1, "Specjalna kontrola jakości produkcji betonu"))
 
-    return zmiana
+    return skladniki
+
+
+def get_structural_class_adjustment(
+    klasa_betonu: str,
+    klasa_ekspozycji: str,
+    zywotnosc_100_lat: bool,
+    element_plytowy: bool,
+    kontrola_jakosci: bool,
+) -> int:
+    skladniki = _skladniki_zmiany_klasy(
+        klasa_betonu, klasa_ekspozycji, zywotnosc_100_lat, element_plytowy, kontrola_jakosci,
+    )
+    return sum(delta for delta, _ in skladniki)
 
 
 def get_c_min_dur_value(klasa_ekspozycji: str, klasa_konstrukcji: str) -> float:
@@ -123,6 +149,38 @@ def get_c_min_dur_value(klasa_ekspozycji: str, klasa_konstrukcji: str) -> float:
     return float(tabela_4_4N[idx][col_idx])
 
 
+# Minimalna otulina przy betonowaniu na gruncie [mm] (pkt 4.4.1.3(4))
+LIMITY_GRUNTU = {"Nie": 0.0, "Na przygotowanym podłożu": 40.0, "Bezpośrednio na gruncie": 75.0}
+
+
+# Kroki klasa konstrukcji -> c_min,b -> c_min -> c_nom wspólne dla ObliczOtuline,
+# grafu, macierzy i wersji wektorowej (argumenty liczbowe mogą być tablicami numpy)
+
+def _klasa_konstrukcji(zmiana_klasy: int) -> int:
+    """Numer klasy konstrukcji (S4 + modyfikacje wg Tablicy 4.3N, w granicach S1 - S6)."""
+    return max(1, min(6, 4 + zmiana_klasy))
+
+
+def _c_min_b(fi_mm, dg_gt_32: bool):
+    return fi_mm + 5.0 if dg_gt_32 else fi_mm
+
+
+def _c_min(c_min_b, c_min_dur, delta_dur_gamma, delta_dur_st, delta_dur_add):
+    return np.maximum(np.maximum(c_min_b, c_min_dur + delta_dur_gamma - delta_dur_st - delta_dur_add), 10.0)
+
+
+def _limit_gruntu(beton_na_gruncie: str) -> float:
+    try:
+        return LIMITY_GRUNTU[beton_na_gruncie]
+    except KeyError:
+        raise ValueError(f"Nieznana wartość (betonowanie na gruncie): {beton_na_gruncie!r}") from None
+
+
+def _c_nom(c_min, delta_dev, limit_gruntu):
+    return np.maximum(c_min + delta_dev, limit_gruntu)
+
+
+@pamietaj
 def ObliczOtuline(
     klasa_ekspozycji: str,
     fi_mm: float,
@@ -144,29 +202,15 @@ def ObliczOtuline(
         element_plytowy,
         kontrola_jakosci,
     )
-    final_num = max(1, min(6, 4 + zmiana))
-    klasa_konstrukcji_final = f"S{final_num}"
+    klasa_konstrukcji_final = f"S{_klasa_konstrukcji(zmiana)}"
 
     c_min_dur = get_c_min_dur_value(klasa_ekspozycji, klasa_konstrukcji_final)
 
-    c_min_b = fi_mm
-    if dg_gt_32:
-        c_min_b += 5.0
-
-    c_min_dur_mod = c_min_dur + delta_dur_gamma - delta_dur_st - delta_dur_add
-    c_min = max(c_min_b, c_min_dur_mod, 10.0)
+    c_min_b = _c_min_b(fi_mm, dg_gt_32)
+    c_min = float(_c_min(c_min_b, c_min_dur, delta_dur_gamma, delta_dur_st, delta_dur_add))
 
-    c_nom = c_min + delta_dev
-
-    k1 = 40.0
-    k2 = 75.0
-    limit_gruntu = 0.0
-    if beton_na_gruncie == "Na przygotowanym podłożu":
-        limit_gruntu = k1
-    elif beton_na_gruncie == "Bezpośrednio na gruncie":
-        limit_gruntu = k2
-
-    c_nom = max(c_nom, limit_gruntu)
+    limit_gruntu = _limit_gruntu(beton_na_gruncie)
+    c_nom = float(_c_nom(c_min, delta_dev, limit_gruntu))
 
     return {
         "klasa_ekspozycji": klasa_ekspozycji,
@@ -181,500 +225,332 @@ def ObliczOtuline(
 
 
 # =============================================================================
-# GENERATOR PDF (RAPORT INŻYNIERSKI)
+# MACIERZ OTULIN (EKSPOZYCJA x BETON x WARUNKI) I DOBÓR KLASY BETONU
 # =============================================================================
 
-def create_pdf_report(wynik: dict, inputs: dict) -> bytes:
-    pdf = FPDF()
-    pdf.add_page()
+KLASY_EKSPOZYCJI = ["X0", "XC1", "XC2", "XC3", "XC4", "XD1", "XD2", "XD3", "XS1", "XS2", "XS3"]
+ELEMENTY = ["Płyta", "Belka / Słup / Inne"]
+
+
+@lru_cache(maxsize=8)
+def MacierzOtulin(klasy_betonu: tuple) -> dict:
+    """
+    c_min,dur [mm] dla wszystkich kombinacji, zbudowane raz z reguł
+    get_structural_class_adjustment i get_c_min_dur_value.
+    Osie tablicy "c_min_dur": [ekspozycja, beton, 100 lat (0/1),
+    płyta (0/1), kontrola jakości (0/1)]. Tablice tylko do odczytu.
+    """
+    ksztalt = (len(KLASY_EKSPOZYCJI), len(klasy_betonu), 2, 2, 2)
+    c_min_dur = np.empty(ksztalt)
+    klasa_konstr = np.empty(ksztalt, dtype=np.int8)
+    for i, eksp in enumerate(KLASY_EKSPOZYCJI):
+        for j, beton in enumerate(klasy_betonu):
+            for z100, plyta, kontrola in np.ndindex(2, 2, 2):
+                zmiana = get_structural_class_adjustment(beton, eksp, bool(z100), bool(plyta), bool(kontrola))
+                s = _klasa_konstrukcji(zmiana)
+                klasa_konstr[i, j, z100, plyta, kontrola] = s
+                c_min_dur[i, j, z100, plyta, kontrola] = get_c_min_dur_value(eksp, f"S{s}")
+    c_min_dur.setflags(write=False)
+    klasa_konstr.setflags(write=False)
+    return {
+        "ekspozycje": tuple(KLASY_EKSPOZYCJI),
+        "betony": tuple(klasy_betonu),
+        "c_min_dur": c_min_dur,
+        "klasa_konstrukcji": klasa_konstr,
+    }
 
-    font_regular = SCIEZKA_CZCIONKI / "ArialUnicode.ttf"
-    font_bold = SCIEZKA_CZCIONKI / "ArialUnicode-Bold.ttf"
 
-    use_unicode = False
-    main_font = "Arial"
+def OtulinaZMacierzy(
+    klasy_betonu,
+    fi_mm: float,
+    zywotnosc_100_lat: bool,
+    kontrola_jakosci: bool,
+    beton_na_gruncie: str = "Nie",
+    dg_gt_32: bool = False,
+    delta_dur_gamma: float = 0.0,
+    delta_dur_st: float = 0.0,
+    delta_dur_add: float = 0.0,
+    delta_dev: float = 10.0,
+) -> np.ndarray:
+    """
+    c_nom [mm] dla całej macierzy [ekspozycja, beton, element] (element wg
+    ELEMENTY: płyta, belka/słup) - ObliczOtulineWektorowo na osiach macierzy.
+    """
+    klasy_betonu = tuple(klasy_betonu)
+    return ObliczOtulineWektorowo(
+        np.array(KLASY_EKSPOZYCJI)[:, None, None],
+        fi_mm,
+        np.array(klasy_betonu)[None, :, None],
+        zywotnosc_100_lat,
+        np.array([True, False])[None, None, :],
+        kontrola_jakosci,
+        beton_na_gruncie,
+        dg_gt_32,
+        delta_dur_gamma,
+        delta_dur_st,
+        delta_dur_add,
+        delta_dev,
+        klasy_betonu=klasy_betonu,
+    )
 
-    if font_regular.exists():
-        try:
-            pdf.add_font("ArialUni", "", str(font_regular), uni=True)
-            if font_bold.exists():
-                pdf.add_font("ArialUni", "B", str(font_bold), uni=True)
-            else:
-                pdf.add_font("ArialUni", "B", str(font_regular), uni=True)
-            pdf.add_font("ArialUni", "I", str(font_regular), uni=True)
-            main_font = "ArialUni"
-            use_unicode = True
-        except Exception:
-            use_unicode = False
-
-    def fix_txt(text: str) -> str:
-        if use_unicode:
-            return str(text)
-        replacements = {
-            "ą": "a", "ć": "c", "ę": "e", "ł": "l", "ń": "n", "ó": "o", "ś": "s", "ź": "z", "ż": "z",
-            "Ą": "A", "Ć": "C", "Ę": "E", "Ł": "L", "Ń": "N", "Ó": "O", "Ś": "S", "Ź": "S", "Ż": "Z",
-        }
-        text = str(text)
-        for k, v in replacements.items():
-            text = text.replace(k, v)
-        return text
-
-    LINE_H = 5.5
-    MARGIN_LEFT = 15
-    MARGIN_TOP = 15
-
-    pdf.set_margins(MARGIN_LEFT, MARGIN_TOP, 10)
-    pdf.set_auto_page_break(True, margin=15)
-
-    def new_line(mult: float = 1.0):
-        pdf.ln(LINE_H * mult)
-
-    def w_txt(text: str, bold: bool = False, size: int = 10):
-        style = "B" if bold else ""
-        pdf.set_font(main_font, style, size)
-        pdf.write(LINE_H, fix_txt(text))
-
-    def w_txt_ln(text: str, bold: bool = False, size: int = 10):
-        w_txt(text, bold, size)
-        new_line()
-
-    def w_symbol_sub(main_char: str, sub_char: str, value_str: str = "", bold: bool = False):
-        pdf.set_font(main_font, "B" if bold else "", 10)
-        pdf.write(LINE_H, fix_txt(main_char))
-
-        x = pdf.get_x()
-        y = pdf.get_y()
-        pdf.set_xy(x, y + 1.5)
-        pdf.set_font(main_font, "B" if bold else "", 7)
-        pdf.write(LINE_H, fix_txt(sub_char))
-
-        new_x = pdf.get_x()
-        pdf.set_xy(new_x, y)
-        pdf.set_font(main_font, "B" if bold else "", 10)
-        if value_str:
-            pdf.write(LINE_H, fix_txt(value_str))
-
-    def header_sec(text: str, num: str):
-        new_line(1.2)
-        pdf.set_font(main_font, "B", 11)
-        pdf.cell(0, 7, fix_txt(f"{num}. {text}"), ln=True, border="B")
-        new_line(0.3)
-
-    def add_space_before_mm(text: str) -> str:
-        text = str(text)
-        text = text.replace("mm", " mm")
-        text = text.replace("  mm", " mm")
-        return text
-
-    # --- NAGŁÓWEK ---
-    pdf.set_font(main_font, "B", 16)
-    pdf.cell(0, 8, fix_txt("OTULINA PRĘTÓW ZBROJENIOWYCH"), ln=True, align="C")
-    pdf.set_font(main_font, "", 10)
-    pdf.cell(0, 5, fix_txt("wg PN-EN 1992-1-1"), ln=True, align="C")
-    new_line(1.0)
-
-    # 1. DANE PROJEKTOWE
-    header_sec("Dane projektowe i założenia", "1")
-
-    pdf.set_font(main_font, "", 10)
-    col_w = 90
-
-    def row_data(lbl, val):
-        pdf.cell(col_w, LINE_H, fix_txt(lbl), border=0)
-        if "d_g" in val:
-            clean_val = val.replace("$", "").replace("d_g", "").strip()
-            clean_val = add_space_before_mm(clean_val)
-            pdf.set_font(main_font, "", 10)
-            pdf.write(LINE_H, fix_txt("d"))
-            curr_x = pdf.get_x()
-            curr_y = pdf.get_y()
-            pdf.set_xy(curr_x, curr_y + 1.5)
-            pdf.set_font(main_font, "", 7)
-            pdf.write(LINE_H, fix_txt("g"))
-            pdf.set_xy(pdf.get_x(), curr_y)
-            pdf.set_font(main_font, "", 10)
-            pdf.write(LINE_H, fix_txt(f" {clean_val}"))
-            pdf.ln()
-            pdf.set_font(main_font, "", 10)
-        else:
-            pdf.set_font(main_font, "", 10)
-            val = add_space_before_mm(val)
-            pdf.cell(0, LINE_H, fix_txt(val), border=0, ln=1)
-            pdf.set_font(main_font, "", 10)
 
-    row_data("Klasa ekspozycji:", inputs["klasa_ekspozycji"])
-    row_data("Klasa betonu:", inputs["klasa_betonu"])
-    row_data("Średnica pręta zbrojeniowego:", f'{inputs["fi_mm"]} mm')
-    row_data("Uziarnienie kruszywa:", inputs["kruszywo_opis"])
+def NajtanszaKlasaBetonu(
+    c_nom_cel: float,
+    klasy_betonu,
+    fi_mm: float,
+    zywotnosc_100_lat: bool,
+    kontrola_jakosci: bool,
+    koszt=None,
+    **kwargs,
+) -> dict:
+    """
+    Dla każdej klasy ekspozycji i rodzaju elementu: najtańsza klasa betonu,
+    przy której c_nom <= c_nom_cel. koszt - koszty względne klas w kolejności
+    klasy_betonu (domyślnie rosnąco wg listy). Brak rozwiązania: None.
+    Pozostałe argumenty (kwargs) jak w OtulinaZMacierzy.
+    """
+    klasy_betonu = list(klasy_betonu)
+    c_nom = OtulinaZMacierzy(klasy_betonu, fi_mm, zywotnosc_100_lat, kontrola_jakosci, **kwargs)
+    koszt = np.arange(len(klasy_betonu), dtype=np.float64) if koszt is None else np.asarray(koszt, dtype=np.float64)
+
+    spelnia = c_nom <= c_nom_cel + 1e-9
+    koszt_warunkowy = np.where(spelnia, koszt[None, :, None], np.inf)
+    idx = np.argmin(koszt_warunkowy, axis=1)
+    jest = np.any(spelnia, axis=1)
+    klasa = np.where(jest, np.array(klasy_betonu, dtype=object)[idx], None)
+    c_osiagniete = np.where(jest, np.take_along_axis(c_nom, idx[:, None, :], axis=1)[:, 0, :], np.nan)
+    return {
+        "ekspozycje": list(KLASY_EKSPOZYCJI),
+        "elementy": list(ELEMENTY),
+        "klasa": klasa,
+        "c_nom": c_osiagniete,
+        "macierz": c_nom,
+    }
 
-    if inputs.get("betonowanie_grunt") != "Nie":
-        row_data("Betonowanie na gruncie:", inputs["betonowanie_grunt"])
 
-    # 2. KLASYFIKACJA
-    header_sec("Klasa konstrukcji", "2")
-    w_txt_ln("Bazowa klasa konstrukcji: S4")
-    w_txt_ln("Modyfikacja klasy konstrukcji ze względu na warunki projektowe:")
+def _indeksy(wartosci, lista: list, nazwa: str) -> np.ndarray:
+    wartosci = np.asarray(wartosci)
+    mapa = {k: i for i, k in enumerate(lista)}
+    unikalne, odwr = np.unique(wartosci, return_inverse=True)
+    try:
+        kody = np.array([mapa[str(k)] for k in unikalne], dtype=np.int64)
+    except KeyError as exc:
+        raise KeyError(f"Nieznana wartość ({nazwa}): {exc.args[0]!r}") from exc
+    return kody[odwr].reshape(wartosci.shape)
 
-    zmiana = wynik["zmiana_klasy"]
-    if zmiana == 0:
-        w_txt_ln("- Brak modyfikacji klasy konstrukcji.", size=10)
-    else:
-        if inputs["zywotnosc_100"]:
-            w_txt_ln("    ΔS = +2: Zwiększenie okresu użytkowania (100 lat)")
 
-        try:
-            fck = int(inputs["klasa_betonu"].split("/")[0].replace("C", ""))
-        except Exception:
-            fck = 20
-        eksp = inputs["klasa_ekspozycji"]
-        red_wytrz = False
-        if eksp == "XC1" and fck >= 30:
-            red_wytrz = True
-        elif eksp in ["XC2", "XC3"] and fck >= 35:
-            red_wytrz = True
-        elif eksp == "XC4" and fck >= 40:
-            red_wytrz = True
-        elif eksp in ["XD1", "XD2", "XS1"] and fck >= 40:
-            red_wytrz = True
-        elif eksp in ["XD3", "XS2", "XS3"] and fck >= 45:
-            red_wytrz = True
-
-        if red_wytrz:
-            w_txt_ln(
-                f"    ΔS = -1: Redukcja ze względu na klasę wytrzymałości ({inputs['klasa_betonu']})"
-            )
+def ObliczOtulineWektorowo(
+    klasa_ekspozycji,
+    fi_mm,
+    klasa_betonu,
+    zywotnosc_100_lat: bool,
+    element_plytowy,
+    kontrola_jakosci: bool,
+    beton_na_gruncie: str = "Nie",
+    dg_gt_32: bool = False,
+    delta_dur_gamma: float = 0.0,
+    delta_dur_st: float = 0.0,
+    delta_dur_add: float = 0.0,
+    delta_dev: float = 10.0,
+    klasy_betonu: tuple | None = None,
+) -> np.ndarray:
+    """
+    c_nom [mm] - wersja wektorowa ObliczOtuline: klasa_ekspozycji, fi_mm,
+    klasa_betonu i element_plytowy mogą być tablicami (broadcast), c_min,dur
+    z MacierzOtulin. klasy_betonu - lista klas macierzy (domyślnie KLASY_BETONU).
+    """
+    klasy_betonu = tuple(klasy_betonu if klasy_betonu is not None else KLASY_BETONU)
+    m = MacierzOtulin(klasy_betonu)
+    i_eksp = _indeksy(klasa_ekspozycji, KLASY_EKSPOZYCJI, "klasa ekspozycji")
+    i_bet = _indeksy(klasa_betonu, list(klasy_betonu), "klasa betonu")
+    i_plyta = np.asarray(element_plytowy, dtype=np.int64)
+    c_min_dur = m["c_min_dur"][i_eksp, i_bet, int(zywotnosc_100_lat), i_plyta, int(kontrola_jakosci)]
+
+    c_min = _c_min(
+        _c_min_b(np.asarray(fi_mm, dtype=np.float64), dg_gt_32), c_min_dur, delta_dur_gamma, delta_dur_st, delta_dur_add,
+    )
+    return _c_nom(c_min, delta_dev, _limit_gruntu(beton_na_gruncie))
 
-        if inputs["plyta"] and eksp == "XC1":
-            w_txt_ln("    ΔS = -1: Element płytowy w klasie ekspozycji XC1")
 
-        if inputs["kontrola_jakosci_str"] == "Tak":
-            w_txt_ln("    ΔS = -1: Specjalna kontrola jakości produkcji betonu")
+# Osie przeglądu: etykieta -> argument ObliczOtulineWektorowo
+OSIE_PRZEGLADU = {
+    "Średnica Φ [mm]": "fi_mm",
+    "Klasa betonu": "klasa_betonu",
+    "Klasa ekspozycji": "klasa_ekspozycji",
+}
 
-    new_line(0.5)
-    w_txt("Obliczeniowa klasa konstrukcji: ")
-    w_txt(f"{wynik['klasa_konstrukcji_final']}", bold=True)
-    new_line()
 
-    # 3. WYZNACZENIE OTULINY
-    header_sec("Wyznaczenie otuliny minimalnej", "3")
+# =============================================================================
+# GRAF ZALEŻNOŚCI (OBLICZENIA PRZYROSTOWE W INTERFEJSIE)
+# =============================================================================
 
-    w_txt("Ze względu na przyczepność: ", bold=False)
-    w_symbol_sub("c", "min,b", bold=False)
-    new_line()
-    w_txt("     Wymagane: ")
-    w_symbol_sub("c", "min,b", f" ≥ {inputs['fi_mm']} mm")
-    if inputs["kruszywo_opis"] == "d_g > 32 mm":
-        w_txt(" (+ 5 mm ze względu na ")
-        w_symbol_sub("d", "g", " > 32 mm)")
-    new_line()
-    w_txt("     Przyjęto: ")
-    w_symbol_sub("c", "min,b", f" = {wynik['c_min_b']:.0f} mm", bold=True)
-    new_line(1.5)
-
-    w_txt("Ze względu na warunki środowiskowe: ", bold=False)
-    w_symbol_sub("c", "min,dur", bold=False)
-    new_line()
-    w_txt(
-        f"     Dla klasy ekspozycji {inputs['klasa_ekspozycji']} i klasy konstrukcji {wynik['klasa_konstrukcji_final']} wg Tablicy 4.4N:"
-    )
-    new_line()
-    w_txt("     Wartość bazowa: ")
-    w_symbol_sub("c", "min,dur", f" = {wynik['c_min_dur']:.0f} mm", bold=True)
-    new_line(1.5)
-
-    w_txt("Całkowita otulina minimalna ", bold=False)
-    w_symbol_sub("c", "min", bold=False)
-    new_line()
-    w_txt("     Wzór normowy: ")
-    w_symbol_sub("c", "min", " = max( ")
-    w_symbol_sub("c", "min,b", "; ")
-    w_symbol_sub("c", "min,dur", " + ")
-    w_symbol_sub("Δc", "dur,γ", " - ")
-    w_symbol_sub("Δc", "dur,st", " - ")
-    w_symbol_sub("Δc", "dur,add", "; 10 mm )")
-    new_line()
-
-    w_txt("     Obliczenie: ")
-    w_symbol_sub(
-        "c",
-        "min",
-        f" = max( {wynik['c_min_b']:.0f} mm; {wynik['c_min_dur']:.0f} mm + {inputs['dc_gamma']:.0f} mm - {inputs['dc_st']:.0f} mm - {inputs['dc_add']:.0f} mm; 10 mm )",
-    )
-    new_line()
-    w_txt("     Wynik: ")
-    w_symbol_sub("c", "min", f" = {wynik['c_min']:.0f} mm", bold=True)
-    new_line()
+WEJSCIA_GRAFU = (
+    "klasa_ekspozycji", "fi_mm", "klasa_betonu", "zywotnosc_100_lat", "element_plytowy",
+    "kontrola_jakosci", "beton_na_gruncie", "dg_gt_32", "delta_dur_gamma", "delta_dur_st",
+    "delta_dur_add", "delta_dev",
+)
+
+
+def GrafOtuliny() -> GrafZaleznosci:
+    """
+    Graf węzłów ObliczOtuline: klasa konstrukcji, c_min,dur, c_min,b, c_min,
+    warunek gruntowy i c_nom (te same kroki co ObliczOtuline). Np. zmiana
+    Δc_dev przelicza tylko c_nom.
+    """
+    graf = GrafZaleznosci(WEJSCIA_GRAFU)
+
+    @graf.wezel
+    def zmiana_klasy(klasa_betonu, klasa_ekspozycji, zywotnosc_100_lat, element_plytowy, kontrola_jakosci):
+        return get_structural_class_adjustment(
+            klasa_betonu, klasa_ekspozycji, zywotnosc_100_lat, element_plytowy, kontrola_jakosci,
+        )
 
-    # 4. OTULINA NOMINALNA
-    header_sec("Wyznaczenie otuliny nominalnej", "4")
+    @graf.wezel
+    def klasa_konstrukcji_final(zmiana_klasy):
+        return f"S{_klasa_konstrukcji(zmiana_klasy)}"
 
-    w_txt("Otulinę nominalną wyznacza się przez dodanie odchyłki wykonawczej: ")
-    w_symbol_sub("c", "nom", " = ")
-    w_symbol_sub("c", "min", " + ")
-    w_symbol_sub("Δc", "dev")
-    new_line(1.5)
+    @graf.wezel
+    def c_min_dur(klasa_ekspozycji, klasa_konstrukcji_final):
+        return get_c_min_dur_value(klasa_ekspozycji, klasa_konstrukcji_final)
 
-    w_txt(f"Przyjęta odchyłka wykonawcza: ")
-    w_symbol_sub("Δc", "dev", f" = {inputs['delta_dev']} mm")
-    new_line()
+    @graf.wezel
+    def c_min_b(fi_mm, dg_gt_32):
+        return _c_min_b(fi_mm, dg_gt_32)
 
-    if wynik["limit_gruntu"] > 0:
-        w_txt(f"Uwzględniono warunek betonowania na gruncie: ")
-        w_symbol_sub("c", "nom", f" ≥ {wynik['limit_gruntu']:.0f} mm")
-        new_line()
-
-    new_line(0.5)
-    w_txt("Obliczona wartość: ")
-    val = wynik["c_min"] + float(inputs["delta_dev"])
-    if wynik["limit_gruntu"] > val:
-        val = wynik["limit_gruntu"]
-
-    w_symbol_sub("c", "nom", f" = {val:.0f} mm", bold=True)
-    new_line(2.0)
-
-    # 5. PODSUMOWANIE
-    pdf.set_fill_color(235, 235, 235)
-    pdf.rect(MARGIN_LEFT, pdf.get_y(), 180, 12, "F")
-    pdf.set_y(pdf.get_y() + 3)
-    pdf.set_x(MARGIN_LEFT + 5)
-
-    # WIELKIE LITERY, BEZ POGRUBIENIA
-    pdf.set_font(main_font, "", 12)
-    w_txt("WYMAGANA OTULINA NOMINALNA:  ")
-    
-    # SYMBOL I WYNIK POGRUBIONE
-    w_symbol_sub("c", "nom", f" = {wynik['c_nom']:.0f} mm", bold=True)
+    @graf.wezel
+    def c_min(c_min_b, c_min_dur, delta_dur_gamma, delta_dur_st, delta_dur_add):
+        return float(_c_min(c_min_b, c_min_dur, delta_dur_gamma, delta_dur_st, delta_dur_add))
 
-    return pdf.output(dest="S").encode("latin-1", "replace")
+    @graf.wezel
+    def limit_gruntu(beton_na_gruncie):
+        return _limit_gruntu(beton_na_gruncie)
 
+    @graf.wezel
+    def c_nom(c_min, delta_dev, limit_gruntu):
+        return float(_c_nom(c_min, delta_dev, limit_gruntu))
 
-# =============================================================================
-# GENERATOR DOCX (RAPORT INŻYNIERSKI)
-# =============================================================================
+    return graf
 
 
-def create_docx_report(wynik: dict, inputs: dict) -> BytesIO:
-    doc = Document()
-
-    style = doc.styles["Normal"]
-    style.font.name = "Times New Roman"
-    style.font.size = Pt(11)
-
-    if "Heading 1" in doc.styles:
-        h1 = doc.styles["Heading 1"]
-        h1.font.name = "Times New Roman"
-        h1.font.size = Pt(12)
-        h1.font.bold = True
-        h1.font.color.rgb = RGBColor(0, 0, 0)
-        h1.paragraph_format.space_after = Pt(6)
-        h1.paragraph_format.space_before = Pt(12)
-
-    def add_p(text="", bold=False, indent=0, space_after=6):
-        p = doc.add_paragraph()
-        if indent > 0:
-            p.paragraph_format.left_indent = Cm(indent)
-        p.paragraph_format.space_after = Pt(space_after)
-        if text:
-            r = p.add_run(text)
-            r.font.bold = bold
-        return p
-
-    def run(p, text, bold=False, sub=False):
-        r = p.add_run(text)
-        r.font.bold = bold
-        if sub:
-            r.font.subscript = True
-        return r
-
-    def add_space_before_mm(text: str) -> str:
-        text = str(text)
-        text = text.replace("mm", " mm")
-        text = text.replace("  mm", " mm")
-        return text
-
-    # Tytuł
-    p = add_p()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run(p, "OTULINA PRĘTÓW ZBROJENIOWYCH", bold=True).font.size = Pt(16)
-    p = add_p()
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run(p, "wg PN-EN 1992-1-1")
-
-    doc.add_paragraph("_" * 75).alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-    # 1. Dane projektowe
-    doc.add_heading("1. Dane projektowe i założenia", level=1)
-
-    def list_item(label, val):
-        p = add_p(indent=0.5, space_after=2)
-        run(p, label + " ")
-        val_str = add_space_before_mm(val)
-        if "d_g" in val_str:
-            clean_val = val_str.replace("$", "").replace("d_g", "").strip()
-            clean_val = add_space_before_mm(clean_val)
-            run(p, "d", bold=False)
-            run(p, "g", bold=False, sub=True)
-            run(p, f" {clean_val}", bold=False)
-        else:
-            run(p, val_str, bold=False)
+def WynikGrafuOtuliny(graf: GrafZaleznosci) -> dict:
+    """Słownik wyników w postaci zwracanej przez ObliczOtuline."""
+    return graf.wartosci((
+        "klasa_ekspozycji", "klasa_konstrukcji_final", "c_min_dur", "c_min_b", "c_min", "c_nom",
+        "zmiana_klasy", "limit_gruntu",
+    ))
 
-    list_item("Klasa ekspozycji:", inputs["klasa_ekspozycji"])
-    list_item("Klasa betonu:", inputs["klasa_betonu"])
-    list_item("Średnica pręta:", f"{inputs['fi_mm']} mm")
-    list_item("Uziarnienie kruszywa:", inputs["kruszywo_opis"])
+# =============================================================================
+# RAPORT INŻYNIERSKI (PDF / DOCX)
+# =============================================================================
 
-    if inputs.get("betonowanie_grunt") != "Nie":
-        list_item("Betonowanie na gruncie:", inputs["betonowanie_grunt"])
+def _mm(tekst: str) -> str:
+    """Spacja przed jednostką ("16mm" -> "16 mm") i indeks d_g w zapisie RaportIR."""
+    tekst = str(tekst).replace("$", "").replace("mm", " mm").replace("  mm", " mm")
+    return tekst.replace("d_g", "d_{g}")
 
-    # 2. Klasyfikacja
-    doc.add_heading("2. Klasa konstrukcji", level=1)
-    p = add_p("Bazowa klasa konstrukcji: S4", space_after=6)
-    p = add_p("Modyfikacja klasy konstrukcji ze względu na warunki projektowe:", space_after=2)
 
-    zmiana = wynik["zmiana_klasy"]
-    if zmiana == 0:
-        add_p("- Brak modyfikacji.", indent=1.0)
-    else:
-        if inputs["zywotnosc_100"]:
-            add_p("ΔS = +2: Zwiększenie okresu użytkowania (100 lat)", indent=1.0)
+# Wersja treści raportu - zwiększana przy zmianie raportu (unieważnia pliki NARZEDZIA.PamiecRaportow)
+WERSJA_RAPORTU = 2
 
-        try:
-            fck = int(inputs["klasa_betonu"].split("/")[0].replace("C", ""))
-        except Exception:
-            fck = 20
-        eksp = inputs["klasa_ekspozycji"]
-        red_wytrz = False
-        if eksp == "XC1" and fck >= 30:
-            red_wytrz = True
-        elif eksp in ["XC2", "XC3"] and fck >= 35:
-            red_wytrz = True
-        elif eksp == "XC4" and fck >= 40:
-            red_wytrz = True
-        elif eksp in ["XD1", "XD2", "XS1"] and fck >= 40:
-            red_wytrz = True
-        elif eksp in ["XD3", "XS2", "XS3"] and fck >= 45:
-            red_wytrz = True
-
-        if red_wytrz:
-            add_p(
-                f"ΔS = -1: Redukcja ze względu na klasę wytrzymałości ({inputs['klasa_betonu']})",
-                indent=1.0,
-            )
 
-        if inputs["plyta"] and eksp == "XC1":
-            add_p("ΔS = -1: Element płytowy w klasie ekspozycji XC1", indent=1.0)
+@pamietaj(maks_wpisow=256, klucz=KluczJSON)
+def RaportOtuliny(wynik: dict, inputs: dict) -> Raport:
+    """Treść raportu (NARZEDZIA.RaportIR), wspólna dla PDF, DOCX i HTML."""
+    dane = [
+        ("Klasa ekspozycji:", inputs["klasa_ekspozycji"]),
+        ("Klasa betonu:", inputs["klasa_betonu"]),
+        ("Średnica pręta zbrojeniowego:", f'{inputs["fi_mm"]} mm'),
+        ("Uziarnienie kruszywa:", inputs["kruszywo_opis"]),
+    ]
+    if inputs.get("betonowanie_grunt") != "Nie":
+        dane.append(("Betonowanie na gruncie:", inputs["betonowanie_grunt"]))
 
-        if inputs["kontrola_jakosci_str"] == "Tak":
-            add_p("ΔS = -1: Specjalna kontrola jakości produkcji betonu", indent=1.0)
+    bloki = [
+        Tytul("OTULINA PRĘTÓW ZBROJENIOWYCH", "wg PN-EN 1992-1-1"),
 
-    p = add_p(space_after=12)
-    p.paragraph_format.space_before = Pt(6)
-    run(p, "Obliczeniowa klasa konstrukcji: ")
-    run(p, f"{wynik['klasa_konstrukcji_final']}", bold=True)
+        # 1. DANE PROJEKTOWE
+        Naglowek("1", Fr("Dane projektowe i założenia")),
+        Tabela(tuple((Fr(etykieta), Fr(_mm(wartosc))) for etykieta, wartosc in dane)),
 
-    # 3. Otulina minimalna
-    doc.add_heading("3. Wyznaczenie otuliny minimalnej", level=1)
+        # 2. KLASYFIKACJA
+        Naglowek("2", Fr("Klasa konstrukcji")),
+        Linia(Fr("Bazowa klasa konstrukcji: S4")),
+        Linia(Fr("Modyfikacja klasy konstrukcji ze względu na warunki projektowe:")),
+    ]
 
-    p = add_p("Ze względu na przyczepność:", indent=0.5, space_after=2)
-    run(p, " c", bold=False)
-    run(p, "min,b", bold=False, sub=True)
+    skladniki = _skladniki_zmiany_klasy(
+        inputs["klasa_betonu"], inputs["klasa_ekspozycji"], inputs["zywotnosc_100"], inputs["plyta"],
+        inputs["kontrola_jakosci_str"] == "Tak",
+    )
+    if not skladniki:
+        bloki.append(Linia(Fr("- Brak modyfikacji klasy konstrukcji.")))
+    for delta, opis in skladniki:
+        bloki.append(Linia(Fr(f"ΔS = {delta:+d}: {opis}"), 1))
 
-    p = add_p(indent=1.5)
-    run(p, "Wymagane c")
-    run(p, "min,b", sub=True)
-    run(p, f" ≥ {inputs['fi_mm']} mm")
+    wymagane = Fr(f"Wymagane: c_{{min,b}} ≥ {inputs['fi_mm']} mm")
     if inputs["kruszywo_opis"] == "d_g > 32 mm":
-        run(p, " (+5 mm ze względu na d")
-        run(p, "g", sub=True)
-        run(p, " > 32 mm)")
-
-    p = add_p(indent=1.5)
-    run(p, "Przyjęto: ")
-    run(p, f"{wynik['c_min_b']:.0f} mm", bold=True)
-
-    p = add_p("Ze względu na warunki środowiskowe:", indent=0.5, space_after=2)
-    run(p, " c", bold=False)
-    run(p, "min,dur", bold=False, sub=True)
-
-    p = add_p(indent=1.5)
-    run(p, f"Dla {inputs['klasa_ekspozycji']} i klasy {wynik['klasa_konstrukcji_final']} (Tablica 4.4N):")
-    p = add_p(indent=1.5)
-    run(p, "Wartość: ")
-    run(p, f"{wynik['c_min_dur']:.0f} mm", bold=True)
-
-    p = add_p("Całkowita otulina minimalna:", indent=0.5, space_after=2)
-    run(p, " c", bold=False)
-    run(p, "min", bold=False, sub=True)
-
-    p = add_p(indent=1.5)
-    run(p, "c")
-    run(p, "min", sub=True)
-    run(p, " = max( c")
-    run(p, "min,b", sub=True)
-    run(p, "; c")
-    run(p, "min,dur", sub=True)
-    run(p, " + Δc")
-    run(p, "dur,γ", sub=True)
-    run(p, " - Δc")
-    run(p, "dur,st", sub=True)
-    run(p, " - Δc")
-    run(p, "dur,add", sub=True)
-    run(p, "; 10 mm )")
-
-    p = add_p(indent=1.5)
-    run(p, "Wynik: ")
-    run(p, "c")
-    run(p, "min", sub=True)
-    run(
-        p,
-        f" = max( {wynik['c_min_b']:.0f} mm; {wynik['c_min_dur']:.0f} mm + {inputs['dc_gamma']:.0f} mm - {inputs['dc_st']:.0f} mm - {inputs['dc_add']:.0f} mm; 10 mm )",
-    )
+        wymagane += Fr(" (+ 5 mm ze względu na d_{g} > 32 mm)")
+
+    c_nom = float(_c_nom(wynik["c_min"], float(inputs["delta_dev"]), wynik["limit_gruntu"]))
+
+    bloki += [
+        Odstep(0.5),
+        Linia(Fr("Obliczeniowa klasa konstrukcji: ") + Fr(f"{wynik['klasa_konstrukcji_final']}", "B")),
+
+        # 3. WYZNACZENIE OTULINY
+        Naglowek("3", Fr("Wyznaczenie otuliny minimalnej")),
+        Linia(Fr("Ze względu na przyczepność: c_{min,b}")),
+        Linia(wymagane, 2),
+        Linia(Fr("Przyjęto: ") + Fr(f"c_{{min,b}} = {wynik['c_min_b']:.0f} mm", "B"), 2),
+        Odstep(0.5),
+        Linia(Fr("Ze względu na warunki środowiskowe: c_{min,dur}")),
+        Linia(Fr(f"Dla klasy ekspozycji {inputs['klasa_ekspozycji']} i klasy konstrukcji "
+                 f"{wynik['klasa_konstrukcji_final']} wg Tablicy 4.4N:"), 2),
+        Linia(Fr("Wartość bazowa: ") + Fr(f"c_{{min,dur}} = {wynik['c_min_dur']:.0f} mm", "B"), 2),
+        Odstep(0.5),
+        Linia(Fr("Całkowita otulina minimalna c_{min}")),
+        Linia(Fr("Wzór normowy: c_{min} = max( c_{min,b}; c_{min,dur} + Δc_{dur,γ} - Δc_{dur,st} - Δc_{dur,add}; 10 mm )"), 2),
+        Linia(Fr(f"Obliczenie: c_{{min}} = max( {wynik['c_min_b']:.0f} mm; {wynik['c_min_dur']:.0f} mm + {inputs['dc_gamma']:.0f} mm"
+                 f" - {inputs['dc_st']:.0f} mm - {inputs['dc_add']:.0f} mm; 10 mm )"), 2),
+        Linia(Fr("Wynik: ") + Fr(f"c_{{min}} = {wynik['c_min']:.0f} mm", "B"), 2),
+
+        # 4. OTULINA NOMINALNA
+        Naglowek("4", Fr("Wyznaczenie otuliny nominalnej")),
+        Linia(Fr("Otulinę nominalną wyznacza się przez dodanie odchyłki wykonawczej: c_{nom} = c_{min} + Δc_{dev}")),
+        Odstep(0.5),
+        Linia(Fr(f"Przyjęta odchyłka wykonawcza: Δc_{{dev}} = {inputs['delta_dev']} mm")),
+    ]
+    if wynik["limit_gruntu"] > 0:
+        bloki.append(Linia(Fr(f"Uwzględniono warunek betonowania na gruncie: c_{{nom}} ≥ {wynik['limit_gruntu']:.0f} mm")))
+    bloki += [
+        Odstep(0.5),
+        Linia(Fr("Obliczona wartość: ") + Fr(f"c_{{nom}} = {c_nom:.0f} mm", "B")),
+        Odstep(2.0),
+
+        # 5. PODSUMOWANIE
+        Wynik("WYMAGANA OTULINA NOMINALNA:", Fr(f"c_{{nom}} = {wynik['c_nom']:.0f} mm")),
+    ]
+    return Raport("OtulinaZbrojenia", tuple(bloki), rozmiar_czcionki=10, wysokosc_linii=5.5)
 
-    p = add_p(indent=1.5)
-    run(p, " = ")
-    run(p, f"{wynik['c_min']:.0f} mm", bold=True)
 
-    # 4. Otulina nominalna
-    doc.add_heading("4. Wyznaczenie otuliny nominalnej", level=1)
+@raport_na_dysku("pdf", wersja=WERSJA_RAPORTU)
+def create_pdf_report(wynik: dict, inputs: dict, pdf: "FPDF | None" = None) -> bytes | None:
+    """Raport PDF; z argumentem pdf dopisuje raport do istniejącego dokumentu (od nowej strony)."""
+    return Renderuj(RaportOtuliny(wynik, inputs), "pdf", pdf=pdf)
 
-    p = add_p(indent=0.5)
-    run(p, "c")
-    run(p, "nom", sub=True)
-    run(p, " = c")
-    run(p, "min", sub=True)
-    run(p, " + Δc")
-    run(p, "dev", sub=True)
 
-    p = add_p(indent=0.5)
-    run(p, f"Przyjęta odchyłka Δc")
-    run(p, "dev", sub=True)
-    run(p, f" = {inputs['delta_dev']} mm")
+@raport_na_dysku("docx", wersja=WERSJA_RAPORTU)
+def create_docx_report(wynik: dict, inputs: dict) -> BytesIO:
+    return Renderuj(RaportOtuliny(wynik, inputs), "docx")
 
-    if wynik["limit_gruntu"] > 0:
-        p = add_p(indent=0.5)
-        run(p, f"Minimalna otulina na gruncie: {wynik['limit_gruntu']:.0f} mm")
 
-    p = add_p(space_after=12)
-    p.paragraph_format.space_before = Pt(12)
-    p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    p.paragraph_format.left_indent = Cm(1.0)
-    
-    run(p, "WYMAGANA OTULINA NOMINALNA: ", bold=False).font.size = Pt(12)
-    
-    r = run(p, "c")
-    r.font.bold = True
-    r.font.size = Pt(14)
-    r = run(p, "nom")
-    r.font.bold = True
-    r.font.subscript = True
-    r.font.size = Pt(14)
-    r = run(p, f" = {wynik['c_nom']:.0f} mm", bold=True)
-    r.font.size = Pt(14)
-
-    buffer = BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
-    return buffer
+def create_html_report(wynik: dict, inputs: dict, pelny: bool = False) -> str:
+    """Raport HTML bez fpdf i python-docx: podgląd na stronie lub plik .html (pelny=True)."""
+    return Renderuj(RaportOtuliny(wynik, inputs), "html", pelny=pelny)
+
+
+def create_md_report(wynik: dict, inputs: dict) -> str:
+    return Renderuj(RaportOtuliny(wynik, inputs), "md")
 
 
 # =============================================================================
@@ -738,33 +614,15 @@ def StronaOtulinaZbrojenia():
     col_eksp, col_beton, col_fi = st.columns(3)
     
     with col_eksp:
-        klasy_ekspozycji = [
-            "X0",
-            "XC1",
-            "XC2",
-            "XC3",
-            "XC4",
-            "XD1",
-            "XD2",
-            "XD3",
-            "XS1",
-            "XS2",
-            "XS3",
-        ]
+        klasy_ekspozycji = KLASY_EKSPOZYCJI
         idx_eksp = klasy_ekspozycji.index("XC1")
         klasa_ekspozycji = st.selectbox(
             "Klasa ekspozycji", klasy_ekspozycji, index=idx_eksp
         )
 
     with col_beton:
-        try:
-            from TABLICE.ParametryBetonu import list_concrete_classes
-
-            klasy_betonu = list_concrete_classes()
-            idx_bet = klasy_betonu.index("C30/37") if "C30/37" in klasy_betonu else 0
-        except ImportError:
-            klasy_betonu = ["C25/30", "C30/37"]
-            idx_bet = 1
+        klasy_betonu = KLASY_BETONU
+        idx_bet = klasy_betonu.index("C30/37") if "C30/37" in klasy_betonu else 0
         klasa_betonu = st.selectbox("Klasa betonu", klasy_betonu, index=idx_bet)
 
     with col_fi:
@@ -776,14 +634,13 @@ def StronaOtulinaZbrojenia():
             dostepne_fi = [6, 8, 10, 12, 14, 16, 18, 20, 22, 25, 28, 32, 40]
         fi_mm = st.selectbox("Średnica pręta Φ [mm]", dostepne_fi, index=3)
 
-    with st.expander("ℹ️ Pomoc: Opis klas ekspozycji (Tablica 4.1)", expanded=False):
-        rys_eksp = SCIEZKA_FOLDERU_LOKALNEGO / "Otulina_klasy ekspozycji.png"
-        if rys_eksp.exists():
-            col_l, col_c, col_r = st.columns([1, 2, 1])
-            with col_c:
-                st.image(str(rys_eksp), use_container_width=True)
-        else:
-            st.info(f"Brak pliku pomocy: {rys_eksp.name}")
+    rys_eksp = SCIEZKA_FOLDERU_LOKALNEGO / "Otulina_klasy ekspozycji.png"
+    PomocZRysunkiem(
+        "ℹ️ Pomoc: Opis klas ekspozycji (Tablica 4.1)",
+        rys_eksp,
+        kolumny=[1, 2, 1],
+        brak=f"Brak pliku pomocy: {rys_eksp.name}",
+    )
     st.markdown("---")
 
     # Uwarunkowania konstrukcyjne
@@ -823,14 +680,13 @@ def StronaOtulinaZbrojenia():
         )
         kontrola = kontrola_jakosci_str == "Tak"
 
-    with st.expander("ℹ️ Pomoc: Klasyfikacja konstrukcji (Tablica 4.3N)", expanded=False):
-        rys_klasy = SCIEZKA_FOLDERU_LOKALNEGO / "Otulina_klasy konstrukcji.png"
-        if rys_klasy.exists():
-            col_l, col_c, col_r = st.columns([1, 2, 1])
-            with col_c:
-                st.image(str(rys_klasy), use_container_width=True)
-        else:
-            st.info(f"Brak pliku: {rys_klasy.name}")
+    rys_klasy = SCIEZKA_FOLDERU_LOKALNEGO / "Otulina_klasy konstrukcji.png"
+    PomocZRysunkiem(
+        "ℹ️ Pomoc: Klasyfikacja konstrukcji (Tablica 4.3N)",
+        rys_klasy,
+        kolumny=[1, 2, 1],
+        brak=f"Brak pliku: {rys_klasy.name}",
+    )
     st.markdown("---")
 
     # Uwarunkowania wykonawcze (COMPRESSED - 3 COLUMNS)
@@ -929,22 +785,28 @@ def StronaOtulinaZbrojenia():
     with c_center:
         oblicz = st.button("OBLICZ OTULINĘ", type="primary", use_container_width=True)
 
+    # Graf zależności - przy każdej interakcji przeliczane są tylko węzły o zmienionych wejściach
+    if "otul_graf" not in st.session_state:
+        st.session_state["otul_graf"] = GrafOtuliny()
+    graf = st.session_state["otul_graf"]
+    graf.ustaw(
+        klasa_ekspozycji=klasa_ekspozycji,
+        fi_mm=float(fi_mm),
+        klasa_betonu=klasa_betonu,
+        zywotnosc_100_lat=is_100_lat,
+        element_plytowy=is_plyta,
+        kontrola_jakosci=kontrola,
+        beton_na_gruncie=betonowanie_grunt,
+        dg_gt_32=dg_gt_32,
+        delta_dur_gamma=dc_gamma,
+        delta_dur_st=dc_st,
+        delta_dur_add=dc_add,
+        delta_dev=float(delta_dev),
+    )
+
     if oblicz:
         try:
-            wynik = ObliczOtuline(
-                klasa_ekspozycji=klasa_ekspozycji,
-                fi_mm=float(fi_mm),
-                klasa_betonu=klasa_betonu,
-                zywotnosc_100_lat=is_100_lat,
-                element_plytowy=is_plyta,
-                kontrola_jakosci=kontrola,
-                beton_na_gruncie=betonowanie_grunt,
-                dg_gt_32=dg_gt_32,
-                delta_dur_gamma=dc_gamma,
-                delta_dur_st=dc_st,
-                delta_dur_add=dc_add,
-                delta_dev=float(delta_dev),
-            )
+            wynik = WynikGrafuOtuliny(graf)
 
             st.session_state["wynik_otuliny"] = wynik
             st.session_state["inputs_otuliny"] = {
@@ -984,26 +846,43 @@ def StronaOtulinaZbrojenia():
         )
 
         st.markdown("<div style='height: 12px;'></div>", unsafe_allow_html=True)
-        col_dl1, col_dl2 = st.columns(2)
-
-        from_streamlit_pdf = create_pdf_report(wynik, inputs)
-        from_streamlit_docx = create_docx_report(wynik, inputs)
-
-        with col_dl1:
+        format_raportu = st.radio(
+            "Raport", ["Podgląd HTML", "Markdown", "PDF", "Word"], index=0, horizontal=True, key="otul_format_raportu"
+        )
+        # Tworzony jest tylko wybrany format; podgląd HTML i Markdown nie ładują fpdf / python-docx
+        if format_raportu == "Podgląd HTML":
+            st.markdown(create_html_report(wynik, inputs), unsafe_allow_html=True)
+            st.download_button(
+                "🌐 POBIERZ RAPORT HTML",
+                create_html_report(wynik, inputs, pelny=True),
+                file_name="Raport_Otulina_EC2.html",
+                mime="text/html",
+                use_container_width=True,
+            )
+        elif format_raportu == "Markdown":
+            data_md = create_md_report(wynik, inputs)
+            st.code(data_md, language="markdown")
+            st.download_button(
+                "📋 POBIERZ RAPORT MARKDOWN",
+                data_md,
+                file_name="Raport_Otulina_EC2.md",
+                mime="text/markdown",
+                use_container_width=True,
+            )
+        elif format_raportu == "PDF":
             st.download_button(
                 "📄 POBIERZ RAPORT PDF",
-                from_streamlit_pdf,
-                "Raport_Otulina_EC2.pdf",
-                "application/pdf",
+                create_pdf_report(wynik, inputs),
+                file_name="Raport_Otulina_EC2.pdf",
+                mime="application/pdf",
                 use_container_width=True,
             )
-
-        with col_dl2:
+        else:
             st.download_button(
                 "📝 POBIERZ RAPORT WORD",
-                from_streamlit_docx,
-                "Raport_Otulina_EC2.docx",
-                "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                create_docx_report(wynik, inputs),
+                file_name="Raport_Otulina_EC2.docx",
+                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                 use_container_width=True,
             )
 
@@ -1012,48 +891,11 @@ def StronaOtulinaZbrojenia():
         with st.expander("Szczegóły obliczeń", expanded=False):
             st.write("**1. Klasa konstrukcji (Tablica 4.3N):**")
 
-            zmiana = wynik["zmiana_klasy"]
-            skladniki = []
-
-            if inputs.get("zywotnosc_100"):
-                skladniki.append(
-                    (2, "Zwiększenie okresu użytkowania (100 lat)")
-                )
-
-            try:
-                fck_local = int(
-                    str(inputs["klasa_betonu"]).split("/")[0].replace("C", "")
-                )
-            except Exception:
-                fck_local = 20
-
-            eksp_local = wynik.get("klasa_ekspozycji", inputs["klasa_ekspozycji"])
-            redukcja_wytrz = False
-            if eksp_local == "XC1" and fck_local >= 30:
-                redukcja_wytrz = True
-            elif eksp_local in ["XC2", "XC3"] and fck_local >= 35:
-                redukcja_wytrz = True
-            elif eksp_local == "XC4" and fck_local >= 40:
-                redukcja_wytrz = True
-            elif eksp_local in ["XD1", "XD2", "XS1"] and fck_local >= 40:
-                redukcja_wytrz = True
-            elif eksp_local in ["XD3", "XS2", "XS3"] and fck_local >= 45:
-                redukcja_wytrz = True
-
-            if redukcja_wytrz:
-                skladniki.append(
-                    (-1, f"Redukcja ze względu na klasę wytrzymałości ({inputs['klasa_betonu']})")
-                )
-
-            if inputs.get("plyta") and eksp_local == "XC1":
-                skladniki.append(
-                    (-1, "Element płytowy w klasie ekspozycji XC1")
-                )
-
-            if inputs.get("kontrola_jakosci_str") == "Tak":
-                skladniki.append(
-                    (-1, "Specjalna kontrola jakości produkcji betonu")
-                )
+            skladniki = _skladniki_zmiany_klasy(
+                str(inputs["klasa_betonu"]), wynik.get("klasa_ekspozycji", inputs["klasa_ekspozycji"]),
+                bool(inputs.get("zywotnosc_100")), bool(inputs.get("plyta")),
+                inputs.get("kontrola_jakosci_str") == "Tak",
+            )
 
             st.markdown("Bazowa klasa konstrukcji: S4.")
             st.markdown("Modyfikacja klasy konstrukcji ze względu na warunki projektowe:")
@@ -1099,6 +941,195 @@ def StronaOtulinaZbrojenia():
                 rf" = \mathbf{{{c_nom:.0f}\text{{ mm}}}}"
             )
 
+    # MAPA OTULIN I DOBÓR KLASY BETONU
+    st.markdown("---")
+    with st.expander("🗺️ Mapa otulin i najtańsza klasa betonu", expanded=False):
+        st.write(
+            "c_nom dla wszystkich klas ekspozycji i klas betonu przy powyższych uwarunkowaniach "
+            "(okres użytkowania, kontrola jakości, grunt, kruszywo, odchyłki, Φ). "
+            "Najtańsza klasa = najniższa na liście klas betonu spełniająca c_nom ≤ wartość docelowa."
+        )
+        c_m1, c_m2 = st.columns(2)
+        with c_m1:
+            c_cel = st.number_input("Docelowa otulina c_nom [mm]", value=30.0, step=5.0, key="otul_cel")
+        with c_m2:
+            element_mapy = st.radio("Element", ELEMENTY, index=0, horizontal=True, key="otul_element_mapy")
+
+        if st.button("POKAŻ MAPĘ OTULIN", use_container_width=True, key="otul_mapa_btn"):
+            try:
+                st.session_state["wynik_otul_mapa"] = NajtanszaKlasaBetonu(
+                    c_cel, klasy_betonu, float(fi_mm), is_100_lat, kontrola,
+                    beton_na_gruncie=betonowanie_grunt,
+                    dg_gt_32=dg_gt_32,
+                    delta_dur_gamma=dc_gamma,
+                    delta_dur_st=dc_st,
+                    delta_dur_add=dc_add,
+                    delta_dev=float(delta_dev),
+                )
+                st.session_state["inputs_otul_mapa"] = {"c_cel": c_cel, "betony": list(klasy_betonu)}
+                st.session_state["pokaz_otul_mapa"] = True
+            except (KeyError, ValueError) as e:
+                st.error(f"Wystąpił błąd podczas obliczeń: {e}")
+                st.session_state["pokaz_otul_mapa"] = False
+
+        if st.session_state.get("pokaz_otul_mapa", False):
+            mapa = st.session_state["wynik_otul_mapa"]
+            inp_m = st.session_state["inputs_otul_mapa"]
+            e_idx = mapa["elementy"].index(element_mapy)
+            c_nom_m = mapa["macierz"][:, :, e_idx]
+
+            fig, ax = plt.subplots(figsize=(10, 4.5))
+            obraz = ax.imshow(c_nom_m, cmap="RdYlGn_r", aspect="auto")
+            for i in range(c_nom_m.shape[0]):
+                for j in range(c_nom_m.shape[1]):
+                    ax.text(j, i, f"{c_nom_m[i, j]:.0f}", ha="center", va="center", fontsize=7)
+                klasa_min = mapa["klasa"][i, e_idx]
+                if klasa_min is not None:
+                    j = inp_m["betony"].index(klasa_min)
+                    ax.add_patch(plt.Rectangle((j - 0.5, i - 0.5), 1, 1, fill=False, edgecolor="black", linewidth=2))
+            ax.set_xticks(range(len(inp_m["betony"])))
+            ax.set_xticklabels(inp_m["betony"], rotation=45, ha="right", fontsize=8)
+            ax.set_yticks(range(len(mapa["ekspozycje"])))
+            ax.set_yticklabels(mapa["ekspozycje"], fontsize=8)
+            fig.colorbar(obraz, ax=ax, label="c_nom [mm]")
+            fig.tight_layout()
+            st.pyplot(fig)
+
+            st.dataframe(
+                {
+                    "Klasa ekspozycji": mapa["ekspozycje"],
+                    **{
+                        f"{el} – klasa betonu": [k if k is not None else "—" for k in mapa["klasa"][:, n]]
+                        for n, el in enumerate(mapa["elementy"])
+                    },
+                    **{
+                        f"{el} – c_nom [mm]": ["—" if np.isnan(c) else f"{c:.0f}" for c in mapa["c_nom"][:, n]]
+                        for n, el in enumerate(mapa["elementy"])
+                    },
+                },
+                use_container_width=True,
+                hide_index=True,
+            )
+            st.caption(f"Ramka na mapie: najtańsza klasa betonu spełniająca c_nom ≤ {inp_m['c_cel']:.0f} mm.")
+
+    # PRZEGLĄD PARAMETRÓW
+    with st.expander("📈 Przegląd parametrów (krzywe c_nom)", expanded=False):
+        st.write(
+            "c_nom w funkcji jednego parametru (oś X) i opcjonalnie drugiego (serie krzywych). "
+            "Pozostałe dane jak powyżej. Po zmianie zakresu jednej osi liczone są tylko nowe punkty siatki."
+        )
+        osie = list(OSIE_PRZEGLADU)
+        c_p1, c_p2 = st.columns(2)
+        with c_p1:
+            os_x = st.selectbox("Oś X", osie, index=0, key="otul_prz_x")
+        with c_p2:
+            os_y = st.selectbox("Serie", ["Brak"] + [o for o in osie if o != os_x], index=0, key="otul_prz_y")
+
+        wartosci_osi = {}
+        for os_nazwa, rola in ((os_x, "x"), (os_y, "y")):
+            arg = OSIE_PRZEGLADU.get(os_nazwa)
+            if arg == "fi_mm":
+                domyslne = dostepne_fi if rola == "x" else [f for f in (12, 20, 32) if f in dostepne_fi]
+                wartosci_osi[arg] = st.multiselect(os_nazwa, dostepne_fi, default=domyslne, key=f"otul_prz_fi_{rola}")
+            elif arg == "klasa_betonu":
+                domyslne = klasy_betonu if rola == "x" else [k for k in ("C20/25", "C30/37", "C40/50") if k in klasy_betonu]
+                wartosci_osi[arg] = st.multiselect(os_nazwa, klasy_betonu, default=domyslne, key=f"otul_prz_beton_{rola}")
+            elif arg == "klasa_ekspozycji":
+                domyslne = KLASY_EKSPOZYCJI if rola == "x" else ["XC1", "XC3", "XD1"]
+                wartosci_osi[arg] = st.multiselect(os_nazwa, KLASY_EKSPOZYCJI, default=domyslne, key=f"otul_prz_eksp_{rola}")
+
+        if st.button("PRZELICZ PRZEGLĄD", use_container_width=True, key="otul_prz_btn"):
+            try:
+                arg_x = OSIE_PRZEGLADU[os_x]
+                arg_y = OSIE_PRZEGLADU.get(os_y)
+                x_vals = wartosci_osi[arg_x]
+                y_vals = wartosci_osi[arg_y] if arg_y else [None]
+                if not x_vals or not y_vals:
+                    raise ValueError("Wybierz co najmniej jedną wartość na każdej osi.")
+                stale = {
+                    "klasa_ekspozycji": klasa_ekspozycji,
+                    "fi_mm": float(fi_mm),
+                    "klasa_betonu": klasa_betonu,
+                    "zywotnosc_100_lat": is_100_lat,
+                    "element_plytowy": is_plyta,
+                    "kontrola_jakosci": kontrola,
+                    "beton_na_gruncie": betonowanie_grunt,
+                    "dg_gt_32": dg_gt_32,
+                    "delta_dur_gamma": dc_gamma,
+                    "delta_dur_st": dc_st,
+                    "delta_dur_add": dc_add,
+                    "delta_dev": float(delta_dev),
+                    "klasy_betonu": tuple(klasy_betonu),
+                }
+                for arg in (arg_x, arg_y):
+                    stale.pop(arg, None)
+
+                if "otul_przeglad" not in st.session_state:
+                    st.session_state["otul_przeglad"] = PrzegladParametrow(ObliczOtulineWektorowo)
+                przeglad = st.session_state["otul_przeglad"]
+                c_nom_siatka = przeglad.oblicz(arg_x, x_vals, stale, arg_y, y_vals)
+                st.session_state["wynik_otul_przeglad"] = {
+                    "os_x": os_x,
+                    "os_y": os_y if arg_y else None,
+                    "x": list(x_vals),
+                    "y": list(y_vals),
+                    "c_nom": c_nom_siatka,
+                    "obliczone": przeglad.punkty_obliczone,
+                    "wszystkie": przeglad.punkty_wszystkie,
+                }
+                st.session_state["pokaz_otul_przeglad"] = True
+            except (KeyError, ValueError) as e:
+                st.error(f"Wystąpił błąd podczas obliczeń: {e}")
+                st.session_state["pokaz_otul_przeglad"] = False
+
+        if st.session_state.get("pokaz_otul_przeglad", False):
+            prz = st.session_state["wynik_otul_przeglad"]
+            pozycje = np.arange(len(prz["x"]))
+            fig, ax = plt.subplots(figsize=(9, 3.8))
+            for j, y_val in enumerate(prz["y"]):
+                etykieta = None if prz["os_y"] is None else f"{prz['os_y']}: {y_val}"
+                ax.step(pozycje, prz["c_nom"][j], where="mid", linewidth=1.8, label=etykieta)
+            ax.set_xticks(pozycje)
+            ax.set_xticklabels([str(v) for v in prz["x"]], rotation=45 if len(prz["x"]) > 12 else 0, fontsize=8)
+            ax.set_xlabel(prz["os_x"], fontsize=11)
+            ax.set_ylabel("c_nom [mm]", fontsize=11)
+            ax.grid(True, linestyle="--", alpha=0.4)
+            ax.spines["top"].set_visible(False)
+            ax.spines["right"].set_visible(False)
+            if prz["os_y"] is not None:
+                ax.legend(fontsize=8)
+            fig.tight_layout()
+            st.pyplot(fig)
+
+            kolumny = {prz["os_x"]: [str(v) for v in prz["x"]]}
+            for j, y_val in enumerate(prz["y"]):
+                nazwa = "c_nom [mm]" if prz["os_y"] is None else f"{prz['os_y']}: {y_val}"
+                kolumny[nazwa] = [f"{v:.0f}" for v in prz["c_nom"][j]]
+            st.dataframe(kolumny, use_container_width=True, hide_index=True)
+            st.caption(
+                f"Przeliczono {prz['obliczone']} z {prz['wszystkie']} punktów siatki "
+                "(pozostałe z pamięci poprzednich przeglądów)."
+            )
+
+
+    # GRAF ZALEŻNOŚCI
+    with st.expander("⚙️ Graf zależności: węzły przeliczone w ostatniej interakcji", expanded=False):
+        WynikGrafuOtuliny(graf)
+        przeliczone_wezly = list(graf.przeliczone)
+        if przeliczone_wezly:
+            st.write("Przeliczone: " + ", ".join(f"`{n}`" for n in przeliczone_wezly))
+        else:
+            st.write("Brak zmian danych - wszystkie węzły z pamięci.")
+        liczniki = graf.liczniki
+        st.dataframe(
+            {
+                "Węzeł": list(liczniki),
+                "W tej interakcji": ["✔" if n in przeliczone_wezly else "" for n in liczniki],
+                "Obliczeń łącznie": list(liczniki.values()),
+            },
+            use_container_width=True,
+            hide_index=True,
+        )
 
 if __name__ == "__main__":
     StronaOtulinaZbrojenia()
\ No newline at end of file
@@ -0,0 +1,179 @@
+"""
+PROGRAMY/PelzanieSkurcz.py
+Pełzanie φ(t,t0) i skurcz εcs(t) betonu wg PN-EN 1992-1-1, pkt 3.1.4 i Załącznik B
+
+Funkcje są wektorowe: parametry elementu (klasa betonu, h0, RH, t0, ts,
+cement) i czas t podlegają broadcastowi numpy. Wielkości zależne tylko od
+elementu liczone są na kształcie elementu, a dopiero potem łączone z siatką
+czasu - np. elementy [n x 1] i czas [1 x k] dają wynik [n x k].
+Czas w dniach, h0 w mm, RH w %.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# --- KONFIGURACJA ŚCIEŻEK (SZUKAMY KATALOGU KALKULATORY) ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+if SCIEZKA_BAZOWA is None:
+    # Fallback – dwa poziomy wyżej
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+if str(SCIEZKA_BAZOWA) not in sys.path:
+    sys.path.append(str(SCIEZKA_BAZOWA))
+
+from TABLICE.ParametryBetonu import concrete_class_codes, get_concrete_arrays
+
+# Klasy cementu: (α do t0 wg B.9, αds1, αds2 wg B.11)
+KLASY_CEMENTU = {
+    "S": (-1.0, 3.0, 0.13),
+    "N": (0.0, 4.0, 0.12),
+    "R": (1.0, 6.0, 0.11),
+}
+
+# Tablica 3.3 - współczynnik kh w funkcji h0
+H0_KH = np.array([100.0, 200.0, 300.0, 500.0])
+KH = np.array([1.00, 0.85, 0.75, 0.70])
+
+# Umowny "nieskończony" czas [dni] - 70 lat
+T_NIESKONCZONE = 70 * 365.0
+
+# =============================================================================
+# POMOCNICZE
+# =============================================================================
+
+def _fcm(klasa_betonu) -> np.ndarray:
+    klasa = np.asarray(klasa_betonu)
+    if klasa.dtype.kind in "US":
+        kod = concrete_class_codes(klasa.ravel()).reshape(klasa.shape)
+    else:
+        kod = klasa.astype(np.int64)
+    return get_concrete_arrays()["fcm"][kod]
+
+
+def _parametry_cementu(cement) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    cement = np.asarray(cement)
+    try:
+        tabela = np.array([KLASY_CEMENTU[k] for k in cement.ravel()]).reshape(cement.shape + (3,))
+    except KeyError as exc:
+        raise KeyError(
+            f"Nieznana klasa cementu: {exc.args[0]!r}. Dostępne: {', '.join(KLASY_CEMENTU)}"
+        ) from exc
+    return tabela[..., 0], tabela[..., 1], tabela[..., 2]
+
+
+def MiarodajnyWymiar(Ac, u) -> np.ndarray:
+    """Miarodajny wymiar elementu h0 = 2 Ac / u [mm] (Ac w mm², u w mm)."""
+    return 2.0 * np.asarray(Ac, dtype=np.float64) / np.asarray(u, dtype=np.float64)
+
+# =============================================================================
+# PEŁZANIE (ZAŁĄCZNIK B.1)
+# =============================================================================
+
+def WspolczynnikPelzania(klasa_betonu, h0, RH, t0, t, cement="N") -> np.ndarray:
+    """
+    Współczynnik pełzania φ(t, t0) wg B.1 - B.9.
+    t0 - wiek betonu w chwili obciążenia [dni], t - wiek betonu [dni].
+    """
+    fcm = _fcm(klasa_betonu)
+    h0 = np.asarray(h0, dtype=np.float64)
+    RH = np.asarray(RH, dtype=np.float64)
+    t0 = np.asarray(t0, dtype=np.float64)
+    alfa_c, _, _ = _parametry_cementu(cement)
+
+    # --- Część zależna tylko od elementu ---
+    a1 = (35.0 / fcm) ** 0.7
+    a2 = (35.0 / fcm) ** 0.2
+    a3 = (35.0 / fcm) ** 0.5
+    wysoki = fcm > 35.0
+
+    skladnik = (1.0 - RH / 100.0) / (0.1 * np.cbrt(h0))
+    phi_RH = np.where(wysoki, (1.0 + skladnik * a1) * a2, 1.0 + skladnik)
+    beta_fcm = 16.8 / np.sqrt(fcm)
+
+    t0_mod = np.maximum(t0 * (9.0 / (2.0 + t0 ** 1.2) + 1.0) ** alfa_c, 0.5)
+    beta_t0 = 1.0 / (0.1 + t0_mod ** 0.20)
+    phi_0 = phi_RH * beta_fcm * beta_t0
+
+    beta_H_podst = 1.5 * (1.0 + (0.012 * RH) ** 18) * h0
+    beta_H = np.where(
+        wysoki,
+        np.minimum(beta_H_podst + 250.0 * a3, 1500.0 * a3),
+        np.minimum(beta_H_podst + 250.0, 1500.0),
+    )
+
+    # --- Siatka czasu ---
+    dt = np.maximum(np.asarray(t, dtype=np.float64) - t0, 0.0)
+    return phi_0 * (dt / (beta_H + dt)) ** 0.3
+
+# =============================================================================
+# SKURCZ (PKT 3.1.4 I ZAŁĄCZNIK B.2)
+# =============================================================================
+
+def WspolczynnikKh(h0) -> np.ndarray:
+    """kh wg Tablicy 3.3 (interpolacja liniowa, poza zakresem - wartości skrajne)."""
+    return np.interp(np.asarray(h0, dtype=np.float64), H0_KH, KH)
+
+
+def OdksztalcenieSkurczu(klasa_betonu, h0, RH, ts, t, cement="N") -> dict:
+    """
+    Odkształcenia skurczu (wartości dodatnie = skrócenie, bezwymiarowe):
+    "eps_cd" - od wysychania (3.9, B.11, B.12), "eps_ca" - autogeniczny (3.11 - 3.13),
+    "eps_cs" - całkowity. ts - wiek betonu na początku wysychania [dni].
+    """
+    fcm = _fcm(klasa_betonu)
+    fck = fcm - 8.0
+    h0 = np.asarray(h0, dtype=np.float64)
+    RH = np.asarray(RH, dtype=np.float64)
+    ts = np.asarray(ts, dtype=np.float64)
+    _, a_ds1, a_ds2 = _parametry_cementu(cement)
+
+    # --- Część zależna tylko od elementu ---
+    beta_RH = 1.55 * (1.0 - (RH / 100.0) ** 3)
+    eps_cd0 = 0.85 * (220.0 + 110.0 * a_ds1) * np.exp(-a_ds2 * fcm / 10.0) * 1e-6 * beta_RH
+    eps_cd_inf = WspolczynnikKh(h0) * eps_cd0
+    h0_32 = 0.04 * h0 ** 1.5
+    eps_ca_inf = 2.5 * (fck - 10.0) * 1e-6
+
+    # --- Siatka czasu ---
+    t = np.asarray(t, dtype=np.float64)
+    dt = np.maximum(t - ts, 0.0)
+    eps_cd = dt / (dt + h0_32) * eps_cd_inf
+    eps_ca = (1.0 - np.exp(-0.2 * np.sqrt(t))) * eps_ca_inf
+    return {"eps_cd": eps_cd, "eps_ca": eps_ca, "eps_cs": eps_cd + eps_ca}
+
+
+if __name__ == "__main__":
+    import time
+
+    # Przykład: płyta 200 mm (wysychanie z jednej strony), C30/37, RH = 50%
+    phi = WspolczynnikPelzania("C30/37", 400.0, 50.0, 28.0, T_NIESKONCZONE)
+    sk = OdksztalcenieSkurczu("C30/37", 400.0, 50.0, 7.0, T_NIESKONCZONE)
+    print(f"φ(∞, 28) = {float(phi):.3f}, εcs(∞) = {float(sk['eps_cs']) * 1e3:.3f} ‰")
+
+    rng = np.random.default_rng(0)
+    n_el, n_t = 5_000, 200
+    klasy = rng.choice(["C25/30", "C30/37", "C40/50", "C50/60"], (n_el, 1))
+    h0 = rng.uniform(100.0, 600.0, (n_el, 1))
+    RH = rng.uniform(40.0, 90.0, (n_el, 1))
+    t0 = rng.choice([7.0, 14.0, 28.0, 90.0], (n_el, 1))
+    cement = rng.choice(["S", "N", "R"], (n_el, 1))
+    t = np.geomspace(1.0, T_NIESKONCZONE, n_t)[None, :] + t0
+
+    t_start = time.perf_counter()
+    phi = WspolczynnikPelzania(klasy, h0, RH, t0, t, cement)
+    eps = OdksztalcenieSkurczu(klasy, h0, RH, t0, t, cement)["eps_cs"]
+    t_stop = time.perf_counter()
+
+    i, j = 123, 77
+    assert np.isclose(phi[i, j], WspolczynnikPelzania(str(klasy[i, 0]), h0[i, 0], RH[i, 0],
+                                                      t0[i, 0], t[i, j], str(cement[i, 0])))
+    print(f"{n_el * n_t:,} par (element, czas): pełzanie + skurcz w {(t_stop - t_start) * 1000:.0f} ms; "
+          f"max φ = {phi.max():.2f}, max εcs = {eps.max() * 1e3:.3f} ‰")
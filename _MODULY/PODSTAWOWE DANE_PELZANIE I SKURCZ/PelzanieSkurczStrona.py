@@ -0,0 +1,179 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+import sys
+from pathlib import Path
+
+# --- KONFIGURACJA ŚCIEŻEK (SZUKAMY KATALOGU KALKULATORY) ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+SCIEZKA_FOLDERU_LOKALNEGO = SCIEZKA_PLIKU.parent
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+if SCIEZKA_BAZOWA is None:
+    # Fallback – dwa poziomy wyżej
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+for sciezka in (SCIEZKA_BAZOWA, SCIEZKA_FOLDERU_LOKALNEGO):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+try:
+    from TABLICE.ParametryBetonu import list_concrete_classes
+    from PelzanieSkurcz import (
+        KLASY_CEMENTU,
+        T_NIESKONCZONE,
+        MiarodajnyWymiar,
+        WspolczynnikPelzania,
+        OdksztalcenieSkurczu,
+    )
+except ImportError as e:
+    st.error(f"⚠️ Błąd importu modułu pełzania: {e}. Sprawdź strukturę folderów.")
+    st.stop()
+
+
+def StronaPelzanieSkurcz():
+    # --- STYL (spójny z pozostałymi kalkulatorami) ---
+    st.markdown(
+        """
+        <style>
+        .block-container { padding-top: 1.5rem; padding-bottom: 1.5rem; }
+        h3 { margin-top: 1.0rem !important; margin-bottom: 0.4rem !important; font-size: 1.1rem; }
+        .big-result {
+            font-size: 22px; font-weight: bold; color: #2E8B57; background-color: #f0f2f6;
+            padding: 15px; border-radius: 8px; text-align: center; margin-top: 20px; border: 2px solid #2E8B57;
+        }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # --- TYTUŁ GŁÓWNY ---
+    st.markdown(
+        """
+        <div style="text-align:center; margin-top:0.4rem; margin-bottom:0rem;">
+            <span style="font-size:42px; font-weight:800; letter-spacing:1px; color:#dddddd;">
+                PEŁZANIE I SKURCZ BETONU
+            </span>
+        </div>
+        <div style="text-align:center; font-size:14px; color:#aaaaaa; margin-top:-12px; margin-bottom:0.6rem;">
+            wg PN-EN 1992-1-1, pkt 3.1.4 i Załącznik B
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # 1. DANE WEJŚCIOWE
+    st.markdown("### DANE WEJŚCIOWE")
+    klasy = list_concrete_classes()
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        klasa_betonu = st.selectbox("Klasa betonu", klasy, index=klasy.index("C30/37"))
+    with c2:
+        cement = st.selectbox("Klasa cementu", list(KLASY_CEMENTU.keys()), index=1)
+    with c3:
+        RH = st.number_input("Wilgotność względna RH [%]", 20.0, 100.0, 50.0, 5.0)
+
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        Ac = st.number_input("Pole przekroju A_c [cm²]", 10.0, 1e6, 2000.0, 100.0)
+    with c2:
+        u = st.number_input("Obwód wysychania u [cm]", 1.0, 1e4, 100.0, 10.0)
+    with c3:
+        h0 = float(MiarodajnyWymiar(Ac * 100.0, u * 10.0))
+        st.metric("h₀ = 2A_c/u [mm]", f"{h0:.0f}")
+
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        t0 = st.number_input("Wiek przy obciążeniu t₀ [dni]", 1.0, 3650.0, 28.0, 1.0)
+    with c2:
+        ts = st.number_input("Początek wysychania t_s [dni]", 1.0, 365.0, 7.0, 1.0)
+    with c3:
+        t_lat = st.number_input("Horyzont obliczeń [lata]", 1.0, 100.0, 70.0, 1.0)
+
+    st.markdown("---")
+
+    _, c_btn, _ = st.columns([1, 2, 1])
+    with c_btn:
+        oblicz = st.button("OBLICZ", type="primary", use_container_width=True)
+
+    if oblicz:
+        try:
+            t_max = t_lat * 365.0
+            t = np.unique(np.concatenate([
+                np.geomspace(1.0, t_max, 300),
+                [t0, ts, 28.0, 90.0, 365.0, min(T_NIESKONCZONE, t_max)],
+            ]))
+            phi = WspolczynnikPelzania(klasa_betonu, h0, RH, t0, t, cement)
+            skurcz = OdksztalcenieSkurczu(klasa_betonu, h0, RH, ts, t, cement)
+            st.session_state["wynik_pelzanie"] = {
+                "t": t,
+                "phi": phi,
+                "skurcz": skurcz,
+                "t0": t0,
+            }
+            st.session_state["pokaz_pelzanie"] = True
+        except (KeyError, ValueError) as e:
+            st.error(f"Wystąpił błąd podczas obliczeń: {e}")
+            st.session_state["pokaz_pelzanie"] = False
+
+    # WYNIKI
+    if st.session_state.get("pokaz_pelzanie", False):
+        res = st.session_state["wynik_pelzanie"]
+        t, phi, sk = res["t"], res["phi"], res["skurcz"]
+
+        st.markdown(
+            f"""
+            <div class="big-result">
+                φ(t, t₀) = {phi[-1]:.2f} &nbsp;&nbsp;|&nbsp;&nbsp; ε<sub>cs</sub>(t) = {sk['eps_cs'][-1] * 1e3:.3f} ‰
+                &nbsp;(t = {t[-1] / 365.0:.0f} lat)
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+        st.markdown("<div style='height: 12px;'></div>", unsafe_allow_html=True)
+
+        m1, m2, m3 = st.columns(3)
+        m1.metric("ε_cd [‰]", f"{sk['eps_cd'][-1] * 1e3:.3f}")
+        m2.metric("ε_ca [‰]", f"{sk['eps_ca'][-1] * 1e3:.3f}")
+        m3.metric("E_c,eff / E_cm", f"{1.0 / (1.0 + phi[-1]):.3f}")
+
+        wybrane = [d for d in (28.0, 90.0, 365.0, 3650.0, t[-1]) if d <= t[-1]]
+        idx = np.searchsorted(t, wybrane)
+        st.dataframe(
+            pd.DataFrame({
+                "t [dni]": np.round(t[idx], 0),
+                "φ(t, t₀)": np.round(phi[idx], 3),
+                "ε_cd [‰]": np.round(sk["eps_cd"][idx] * 1e3, 3),
+                "ε_ca [‰]": np.round(sk["eps_ca"][idx] * 1e3, 3),
+                "ε_cs [‰]": np.round(sk["eps_cs"][idx] * 1e3, 3),
+            }),
+            use_container_width=True,
+            hide_index=True,
+        )
+
+        with st.expander("📈 Przebieg w czasie", expanded=True):
+            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 3.5))
+            ax1.semilogx(t, phi, linewidth=2.0)
+            ax1.set_xlabel("t [dni]", fontsize=11)
+            ax1.set_ylabel("φ(t, t₀)", fontsize=11)
+            ax2.semilogx(t, sk["eps_cs"] * 1e3, linewidth=2.0, label="ε_cs")
+            ax2.semilogx(t, sk["eps_cd"] * 1e3, linewidth=1.0, linestyle="--", label="ε_cd")
+            ax2.semilogx(t, sk["eps_ca"] * 1e3, linewidth=1.0, linestyle=":", label="ε_ca")
+            ax2.set_xlabel("t [dni]", fontsize=11)
+            ax2.set_ylabel("ε [‰]", fontsize=11)
+            ax2.legend()
+            for ax in (ax1, ax2):
+                ax.grid(True, linestyle="--", alpha=0.4)
+                ax.spines["top"].set_visible(False)
+                ax.spines["right"].set_visible(False)
+            fig.tight_layout()
+            st.pyplot(fig)
+
+
+if __name__ == "__main__":
+    StronaPelzanieSkurcz()
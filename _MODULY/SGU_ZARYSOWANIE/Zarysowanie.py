@@ -0,0 +1,223 @@
+"""
+PROGRAMY/Zarysowanie.py
+Szerokość rys (PN-EN 1992-1-1, 7.3.4) i ograniczenie naprężeń (7.2)
+dla przekrojów prostokątnych pojedynczo zbrojonych - obliczenia wsadowe
+
+Argumenty są tablicami numpy i podlegają broadcastowi, np. przekroje [n x 1]
+z poziomami obciążenia [1 x k] dają wyniki [n x k] bez pętli po elementach.
+Klasy betonu i średnice prętów zamieniane są na indeksy do kolumnowych
+tablic z TABLICE (get_concrete_arrays, get_bar_arrays).
+Przekrój zarysowany liczony liniowo-sprężyście (faza II).
+Jednostki wejścia: b, h, c, rozstaw [mm], M [kNm].
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# --- KONFIGURACJA ŚCIEŻEK (SZUKAMY KATALOGU KALKULATORY) ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+if SCIEZKA_BAZOWA is None:
+    # Fallback – dwa poziomy wyżej
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+if str(SCIEZKA_BAZOWA) not in sys.path:
+    sys.path.append(str(SCIEZKA_BAZOWA))
+
+from TABLICE.ParametryBetonu import concrete_class_codes, get_concrete_arrays
+from TABLICE.ParametryPretowZbrojeniowych import bar_indices, get_bar_arrays
+from TABLICE.ParametryStali import get_steel_params
+
+# Współczynniki do sr,max (7.11, wartości zalecane / NA)
+K1_PRZYCZEPNOSC = 0.8   # pręty żebrowane
+K2_ZGINANIE = 0.5       # zginanie
+K3 = 3.4
+K4 = 0.425
+
+# kt (7.9): obciążenie długotrwałe / krótkotrwałe
+KT_DLUGOTRWALE = 0.4
+KT_KROTKOTRWALE = 0.6
+
+# Ograniczenie naprężeń (7.2, wartości zalecane)
+K1_SIGMA_C = 0.6    # σc w kombinacji charakterystycznej (klasy XD, XF, XS - KLASY_K1_SIGMA_C)
+K2_SIGMA_C = 0.45   # σc w kombinacji quasi-stałej (liniowe pełzanie)
+K3_SIGMA_S = 0.8    # σs w kombinacji charakterystycznej
+
+# Klasy ekspozycji, w których σc w kombinacji charakterystycznej ograniczane jest do k1·fck (7.2(2))
+KLASY_K1_SIGMA_C = ("XD", "XF", "XS")
+
+# Graniczne szerokości rys wmax [mm] (Tablica 7.1N, żelbet)
+WMAX_KLASY = {
+    "X0": 0.4, "XC1": 0.4,
+    "XC2": 0.3, "XC3": 0.3, "XC4": 0.3,
+    "XD1": 0.3, "XD2": 0.3, "XD3": 0.3,
+    "XS1": 0.3, "XS2": 0.3, "XS3": 0.3,
+}
+
+# =============================================================================
+# PRZEKRÓJ ZARYSOWANY (FAZA II)
+# =============================================================================
+
+def PrzekrojZarysowany(b, d, As, alfa_e) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Wysokość strefy ściskanej x [mm] i moment bezwładności I_II [mm⁴]
+    przekroju prostokątnego z jedną warstwą zbrojenia rozciąganego.
+    """
+    a = alfa_e * As / b
+    x = -a + np.sqrt(a ** 2 + 2.0 * a * d)
+    I_II = b * x ** 3 / 3.0 + alfa_e * As * (d - x) ** 2
+    return x, I_II
+
+# =============================================================================
+# SZEROKOŚĆ RYS I NAPRĘŻENIA
+# =============================================================================
+
+def ObliczZarysowanie(
+    klasa_betonu,
+    b,
+    h,
+    c,
+    fi,
+    rozstaw,
+    M_k=0.0,
+    M_qp=0.0,
+    phi=2.0,
+    stal_nazwa="B500",
+    obciazenie_dlugotrwale=True,
+    w_max=0.3,
+    klasa_ekspozycji=None,
+) -> dict:
+    """
+    Szerokość rys wk dla M_qp i ograniczenie naprężeń dla M_k i M_qp.
+    klasa_betonu - nazwy ("C30/37") lub kody klas; fi - średnice z PARAMETRY_PRETOW;
+    rozstaw - rozstaw prętów [mm] (płyta: b = 1000 mm);
+    c - otulina prętów rozciąganych [mm]; phi - współczynnik pełzania φ(∞,t0);
+    klasa_ekspozycji - warunek σc,k ≤ k1·fck tylko dla klas XD, XF, XS
+    (None - sprawdzany zawsze).
+    Naprężenia charakterystyczne σc,k i σs,k liczone w jednym przekroju
+    z modułem efektywnym dla φ·M_qp/M_k (udział obciążeń długotrwałych).
+    """
+    klasa = np.asarray(klasa_betonu)
+    kod = concrete_class_codes(klasa.ravel()).reshape(klasa.shape) if klasa.dtype.kind in "US" else klasa
+    idx_fi = bar_indices(fi)
+
+    kod, idx_fi, b, h, c, rozstaw, M_k, M_qp, phi, w_max, sprawdz_sigma_c_k = np.broadcast_arrays(
+        np.asarray(kod, dtype=np.int64), idx_fi,
+        *(np.asarray(x, dtype=np.float64) for x in (b, h, c, rozstaw, M_k, M_qp, phi, w_max)),
+        True if klasa_ekspozycji is None
+        else np.isin(np.asarray(klasa_ekspozycji, dtype="U2"), KLASY_K1_SIGMA_C),
+    )
+
+    beton = get_concrete_arrays()
+    fck, fctm, Ecm = beton["fck"][kod], beton["fctm"][kod], beton["Ecm"][kod]
+    stal = get_steel_params(stal_nazwa)
+    Es, fyk = stal.Es, stal.fyk
+
+    prety = get_bar_arrays()
+    fi_mm = prety["fi"][idx_fi].astype(np.float64)
+    As = prety["As"][idx_fi] * b / rozstaw
+    d = h - c - fi_mm / 2.0
+
+    alfa_e = Es / Ecm
+    alfa_e_eff = Es * (1.0 + phi) / Ecm
+    # Kombinacja charakterystyczna: pełzanie od części długotrwałej M_qp/M_k
+    udzial_qp = np.divide(np.abs(M_qp), np.abs(M_k), out=np.zeros_like(M_k), where=M_k != 0.0)
+    alfa_e_k = Es * (1.0 + phi * np.minimum(udzial_qp, 1.0)) / Ecm
+
+    # --- Moment rysujący (przekrój niezarysowany, bez zbrojenia) ---
+    M_cr = fctm * b * h ** 2 / 6.0 / 1e6
+
+    # --- Naprężenia w fazie II ---
+    x_k, I_k = PrzekrojZarysowany(b, d, As, alfa_e_k)
+    x_eff, I_eff = PrzekrojZarysowany(b, d, As, alfa_e_eff)
+
+    Mk = np.abs(M_k) * 1e6
+    Mqp = np.abs(M_qp) * 1e6
+    sigma_c_k = Mk * x_k / I_k
+    sigma_c_qp = Mqp * x_eff / I_eff
+    sigma_s_k = alfa_e_k * Mk * (d - x_k) / I_k
+    sigma_s_qp = alfa_e_eff * Mqp * (d - x_eff) / I_eff
+
+    # --- Szerokość rys (7.3.4) ---
+    h_c_ef = np.minimum.reduce([2.5 * (h - d), (h - x_eff) / 3.0, h / 2.0])
+    rho_p_eff = As / (b * h_c_ef)
+    kt = KT_DLUGOTRWALE if obciazenie_dlugotrwale else KT_KROTKOTRWALE
+    eps_sm_cm = np.maximum(
+        (sigma_s_qp - kt * fctm / rho_p_eff * (1.0 + alfa_e * rho_p_eff)) / Es,
+        0.6 * sigma_s_qp / Es,
+    )
+    sr_max = np.where(
+        rozstaw <= 5.0 * (c + fi_mm / 2.0),
+        K3 * c + K1_PRZYCZEPNOSC * K2_ZGINANIE * K4 * fi_mm / rho_p_eff,
+        1.3 * (h - x_eff),
+    )
+    zarysowany = Mqp > M_cr * 1e6
+    wk = np.where(zarysowany, sr_max * eps_sm_cm, 0.0)
+
+    # --- Wykorzystanie warunków ---
+    u_wk = np.where(w_max > 0.0, wk / w_max, 0.0)
+    u_sigma_c_k = np.where(sprawdz_sigma_c_k, sigma_c_k / (K1_SIGMA_C * fck), 0.0)
+    u_sigma_c_qp = sigma_c_qp / (K2_SIGMA_C * fck)
+    u_sigma_s_k = sigma_s_k / (K3_SIGMA_S * fyk)
+    u_max = np.maximum.reduce([u_wk, u_sigma_c_k, u_sigma_c_qp, u_sigma_s_k])
+
+    return {
+        "As": As,
+        "d": d,
+        "M_cr": M_cr,
+        "zarysowany": zarysowany,
+        "x": x_eff,
+        "I_II": I_eff,
+        "sigma_c_k": sigma_c_k,
+        "sprawdz_sigma_c_k": sprawdz_sigma_c_k,
+        "sigma_c_qp": sigma_c_qp,
+        "sigma_s_k": sigma_s_k,
+        "sigma_s_qp": sigma_s_qp,
+        "h_c_ef": h_c_ef,
+        "rho_p_eff": rho_p_eff,
+        "eps_sm_cm": eps_sm_cm,
+        "sr_max": sr_max,
+        "wk": wk,
+        "u_wk": u_wk,
+        "u_sigma_c_k": u_sigma_c_k,
+        "u_sigma_c_qp": u_sigma_c_qp,
+        "u_sigma_s_k": u_sigma_s_k,
+        "u_max": u_max,
+        "ok": u_max <= 1.0,
+    }
+
+
+if __name__ == "__main__":
+    import time
+
+    r = ObliczZarysowanie("C30/37", 1000, 250, 30, 12, 150, M_k=60.0, M_qp=45.0)
+    for k in ("As", "x", "sigma_s_qp", "rho_p_eff", "sr_max", "wk", "u_max"):
+        print(f"{k:10s} {float(r[k]):.4f}")
+
+    # Wszystkie pasma płyt budynku x poziomy obciążenia
+    rng = np.random.default_rng(0)
+    n, k = 100_000, 10
+    klasy = rng.choice(["C25/30", "C30/37", "C35/45"], (n, 1))
+    h = rng.choice([180.0, 200.0, 220.0, 250.0, 300.0], (n, 1))
+    fi = rng.choice([10, 12, 16], (n, 1))
+    s = rng.choice([100.0, 125.0, 150.0, 200.0], (n, 1))
+    M = rng.uniform(10.0, 80.0, (n, 1)) * np.linspace(0.2, 1.0, k)[None, :]
+
+    t0 = time.perf_counter()
+    w = ObliczZarysowanie(klasy, 1000.0, h, 30.0, fi, s, M_k=1.35 * M, M_qp=M)
+    t1 = time.perf_counter()
+
+    for i in range(0, n, 5000):
+        for j in (0, k - 1):
+            ws = ObliczZarysowanie(str(klasy[i, 0]), 1000.0, h[i, 0], 30.0, int(fi[i, 0]), s[i, 0],
+                                   M_k=1.35 * M[i, j], M_qp=M[i, j])
+            assert np.isclose(ws["wk"], w["wk"][i, j])
+    print(f"{n} pasm x {k} poziomów obciążenia: {(t1 - t0) * 1000:.0f} ms, "
+          f"wk > 0.3 mm: {(w['wk'] > 0.3).sum()}")
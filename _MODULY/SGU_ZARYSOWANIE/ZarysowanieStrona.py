@@ -0,0 +1,218 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+import sys
+from pathlib import Path
+
+# --- KONFIGURACJA ŚCIEŻEK (SZUKAMY KATALOGU KALKULATORY) ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+SCIEZKA_FOLDERU_LOKALNEGO = SCIEZKA_PLIKU.parent
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+if SCIEZKA_BAZOWA is None:
+    # Fallback – dwa poziomy wyżej
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+for sciezka in (SCIEZKA_BAZOWA, SCIEZKA_FOLDERU_LOKALNEGO):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+try:
+    from TABLICE.ParametryBetonu import list_concrete_classes
+    from TABLICE.ParametryPretowZbrojeniowych import list_bar_diameters
+    from TABLICE.ParametryStali import list_steel_grades
+    from Zarysowanie import ObliczZarysowanie, WMAX_KLASY
+except ImportError as e:
+    st.error(f"⚠️ Błąd importu modułu zarysowania: {e}. Sprawdź strukturę folderów.")
+    st.stop()
+
+
+def StronaZarysowanie():
+    # --- STYL (spójny z pozostałymi kalkulatorami) ---
+    st.markdown(
+        """
+        <style>
+        .block-container { padding-top: 1.5rem; padding-bottom: 1.5rem; }
+        h3 { margin-top: 1.0rem !important; margin-bottom: 0.4rem !important; font-size: 1.1rem; }
+        .big-result {
+            font-size: 22px; font-weight: bold; color: #2E8B57; background-color: #f0f2f6;
+            padding: 15px; border-radius: 8px; text-align: center; margin-top: 20px; border: 2px solid #2E8B57;
+        }
+        .big-result-bad {
+            font-size: 22px; font-weight: bold; color: #B22222; background-color: #f0f2f6;
+            padding: 15px; border-radius: 8px; text-align: center; margin-top: 20px; border: 2px solid #B22222;
+        }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # --- TYTUŁ GŁÓWNY ---
+    st.markdown(
+        """
+        <div style="text-align:center; margin-top:0.4rem; margin-bottom:0rem;">
+            <span style="font-size:42px; font-weight:800; letter-spacing:1px; color:#dddddd;">
+                SZEROKOŚĆ RYS I NAPRĘŻENIA
+            </span>
+        </div>
+        <div style="text-align:center; font-size:14px; color:#aaaaaa; margin-top:-12px; margin-bottom:0.6rem;">
+            wg PN-EN 1992-1-1, pkt 7.2 i 7.3.4
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # 1. DANE WEJŚCIOWE
+    st.markdown("### MATERIAŁY")
+    klasy = list_concrete_classes()
+    stale = list_steel_grades()
+    c1, c2, c3, c4 = st.columns(4)
+    with c1:
+        klasa_betonu = st.selectbox("Klasa betonu", klasy, index=klasy.index("C30/37"))
+    with c2:
+        stal_nazwa = st.selectbox("Stal", stale, index=stale.index("B500") if "B500" in stale else 0)
+    with c3:
+        ekspozycja = st.selectbox("Klasa ekspozycji", list(WMAX_KLASY.keys()), index=3)
+    with c4:
+        phi = st.number_input("Współczynnik pełzania φ", 0.0, 5.0, 2.0, 0.1)
+
+    st.markdown("### PRZEKRÓJ I ZBROJENIE")
+    srednice = list_bar_diameters()
+    c1, c2, c3, c4, c5 = st.columns(5)
+    with c1:
+        b = st.number_input("b [mm]", 100.0, 5000.0, 1000.0, 50.0)
+    with c2:
+        h = st.number_input("h [mm]", 80.0, 3000.0, 250.0, 10.0)
+    with c3:
+        c = st.number_input("Otulina c [mm]", 10.0, 100.0, 30.0, 5.0)
+    with c4:
+        fi = st.selectbox("Średnica φ [mm]", srednice, index=srednice.index(12))
+    with c5:
+        rozstaw = st.number_input("Rozstaw s [mm]", 30.0, 500.0, 150.0, 5.0)
+
+    st.markdown("### MOMENTY ZGINAJĄCE (SGU)")
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        M_k = st.number_input("M_k – kombinacja charakterystyczna [kNm]", 0.0, 5000.0, 60.0, 1.0)
+    with c2:
+        M_qp = st.number_input("M_qp – kombinacja quasi-stała [kNm]", 0.0, 5000.0, 45.0, 1.0)
+    with c3:
+        dlugotrwale = st.checkbox("Obciążenie długotrwałe (k_t = 0.4)", value=True)
+
+    st.markdown("---")
+
+    _, c_btn, _ = st.columns([1, 2, 1])
+    with c_btn:
+        oblicz = st.button("OBLICZ", type="primary", use_container_width=True)
+
+    if oblicz:
+        try:
+            w_max = WMAX_KLASY[ekspozycja]
+            wynik = ObliczZarysowanie(
+                klasa_betonu, b, h, c, fi, rozstaw, M_k=M_k, M_qp=M_qp, phi=phi,
+                stal_nazwa=stal_nazwa, obciazenie_dlugotrwale=dlugotrwale, w_max=w_max,
+                klasa_ekspozycji=ekspozycja,
+            )
+            # Krzywa wk(M_qp) - jedno wywołanie dla wszystkich poziomów
+            poziomy = np.linspace(0.0, 1.5 * max(M_qp, 1.0), 61)
+            krzywa = ObliczZarysowanie(
+                klasa_betonu, b, h, c, fi, rozstaw, M_qp=poziomy, phi=phi,
+                stal_nazwa=stal_nazwa, obciazenie_dlugotrwale=dlugotrwale, w_max=w_max,
+            )
+            st.session_state["wynik_rysy"] = {
+                "wynik": {k: float(v) for k, v in wynik.items()},
+                "w_max": w_max,
+                "ekspozycja": ekspozycja,
+                "poziomy": poziomy,
+                "wk": krzywa["wk"],
+                "M_qp": M_qp,
+            }
+            st.session_state["pokaz_rysy"] = True
+        except (KeyError, ValueError) as e:
+            st.error(f"Wystąpił błąd podczas obliczeń: {e}")
+            st.session_state["pokaz_rysy"] = False
+
+    # WYNIKI
+    if st.session_state.get("pokaz_rysy", False):
+        res = st.session_state["wynik_rysy"]
+        w = res["wynik"]
+
+        klasa_css = "big-result" if w["ok"] else "big-result-bad"
+        st.markdown(
+            f"""
+            <div class="{klasa_css}">
+                w<sub>k</sub> = {w['wk']:.3f} mm &nbsp;(w<sub>max</sub> = {res['w_max']:.1f} mm)
+                &nbsp;|&nbsp; wytężenie = {w['u_max'] * 100:.1f}%
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+        st.markdown("<div style='height: 12px;'></div>", unsafe_allow_html=True)
+
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("A_s [mm²]", f"{w['As']:.0f}")
+        m2.metric("M_cr [kNm]", f"{w['M_cr']:.1f}")
+        m3.metric("s_r,max [mm]", f"{w['sr_max']:.0f}")
+        m4.metric("ρ_p,eff [%]", f"{w['rho_p_eff'] * 100:.2f}")
+
+        tabela = pd.DataFrame({
+            "Warunek": [
+                "Szerokość rys w_k ≤ w_max (7.3.4)",
+                "σ_c (char.) ≤ 0.6 f_ck (7.2(2), klasy XD, XF, XS)",
+                "σ_c (quasi-st.) ≤ 0.45 f_ck (7.2(3))",
+                "σ_s (char.) ≤ 0.8 f_yk (7.2(5))",
+            ],
+            "Wartość": [
+                f"{w['wk']:.3f} mm",
+                f"{w['sigma_c_k']:.2f} MPa"
+                + ("" if w["sprawdz_sigma_c_k"] else f" (nie dotyczy {res['ekspozycja']})"),
+                f"{w['sigma_c_qp']:.2f} MPa",
+                f"{w['sigma_s_k']:.1f} MPa",
+            ],
+            "Wytężenie [%]": np.round([
+                w["u_wk"] * 100, w["u_sigma_c_k"] * 100,
+                w["u_sigma_c_qp"] * 100, w["u_sigma_s_k"] * 100,
+            ], 1),
+        })
+        st.dataframe(tabela, use_container_width=True, hide_index=True)
+
+        if not w["zarysowany"]:
+            st.info("M_qp < M_cr – przekrój niezarysowany, w_k = 0.")
+
+        with st.expander("📈 Szerokość rys w funkcji M_qp", expanded=False):
+            fig, ax = plt.subplots(figsize=(7, 3.5))
+            ax.plot(res["poziomy"], res["wk"], linewidth=2.0)
+            ax.axhline(res["w_max"], linestyle="--", color="#B22222", linewidth=1.0, label="w_max")
+            ax.axvline(res["M_qp"], linestyle=":", color="#888888", linewidth=1.0)
+            ax.set_xlabel("M_qp [kNm]", fontsize=11)
+            ax.set_ylabel("w_k [mm]", fontsize=11)
+            ax.grid(True, linestyle="--", alpha=0.4)
+            ax.legend()
+            ax.spines["top"].set_visible(False)
+            ax.spines["right"].set_visible(False)
+            fig.tight_layout()
+            st.pyplot(fig)
+
+        with st.expander("Szczegóły obliczeń", expanded=False):
+            st.markdown(
+                f"""
+                | Wielkość | Wartość |
+                | :--- | :--- |
+                | d | {w['d']:.1f} mm |
+                | x (faza II, α<sub>e,eff</sub>) | {w['x']:.1f} mm |
+                | σ<sub>s</sub> (quasi-st.) | {w['sigma_s_qp']:.1f} MPa |
+                | h<sub>c,ef</sub> | {w['h_c_ef']:.1f} mm |
+                | ε<sub>sm</sub> − ε<sub>cm</sub> | {w['eps_sm_cm'] * 1000:.3f} ‰ |
+                | s<sub>r,max</sub> | {w['sr_max']:.1f} mm |
+                """,
+                unsafe_allow_html=True,
+            )
+
+
+if __name__ == "__main__":
+    StronaZarysowanie()
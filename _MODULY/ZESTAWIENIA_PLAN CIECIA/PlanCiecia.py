@@ -0,0 +1,315 @@
+"""
+PROGRAMY/PlanCiecia.py
+Plan cięcia prętów zbrojeniowych z prętów handlowych (np. 12 m)
+
+1. Pręty dłuższe od pręta handlowego dzielone są na odcinki z zakładami;
+   długości zakładów l0 liczone wsadowo (ObliczDlugoscZakladuWektorowo)
+   dla wszystkich średnic naraz.
+2. Odcinki krótsze od pręta handlowego rozkrajane są heurystyką FFD
+   (First Fit Decreasing) - pierwszy pasujący pręt wyszukiwany w drzewie
+   przedziałów z maksimum pozostałej długości (O(log n) na odcinek).
+3. Poprawa lokalna: próba opróżnienia najsłabiej wykorzystanych prętów
+   przez przenoszenie ich odcinków do pozostałych i zamiany na krótsze.
+Długości w mm.
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# --- KONFIGURACJA ŚCIEŻEK (SZUKAMY KATALOGU KALKULATORY) ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+if SCIEZKA_BAZOWA is None:
+    # Fallback – dwa poziomy wyżej
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+for sciezka in (SCIEZKA_BAZOWA, SCIEZKA_BAZOWA / "_MODULY" / "PODSTAWOWE DANE_DLUGOSC ZAKLADU"):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+from DlugoscZakladu import ObliczDlugoscZakladuWektorowo
+
+DLUGOSC_HANDLOWA = 12000.0
+ZAOKRAGLENIE_ZAKLADU = 10.0
+
+# Liczba prętów (najsłabiej wykorzystanych) sprawdzanych w poprawie lokalnej
+MAKS_PROB_POPRAWY = 200
+
+# =============================================================================
+# ZAKŁADY I PODZIAŁ DŁUGICH PRĘTÓW
+# =============================================================================
+
+def DlugosciZakladow(
+    fi_mm,
+    klasa_betonu: str = "C30/37",
+    stal_nazwa: str = "B500",
+    warunki_przyczepnosci: str = "Dobre",
+    alfa6_proc: str = "100%",
+    procent_naprezenia: float = 100.0,
+    rodzaj_preta: str = "Rozciągany",
+) -> np.ndarray:
+    """Długości zakładów l0 [mm] dla tablicy średnic (zaokrąglone w górę do 10 mm)."""
+    fi_mm = np.asarray(fi_mm, dtype=np.float64)
+    unikalne, odwr = np.unique(fi_mm, return_inverse=True)
+    l0 = ObliczDlugoscZakladuWektorowo(
+        unikalne, klasa_betonu, stal_nazwa, procent_naprezenia, warunki_przyczepnosci,
+        rodzaj_preta, alfa6_proc,
+    )["l0_final"]
+    l0 = np.ceil(l0 / ZAOKRAGLENIE_ZAKLADU - 1e-9) * ZAOKRAGLENIE_ZAKLADU
+    return l0[odwr].reshape(fi_mm.shape)
+
+
+def PodzielPrety(fi_mm, dlugosc, liczba, l0, dlugosc_handlowa: float = DLUGOSC_HANDLOWA) -> dict:
+    """
+    Podział prętów dłuższych od pręta handlowego: k - 1 całych prętów handlowych
+    i reszta, k = ceil((L - l0) / (Lh - l0)). Zwraca odcinki do rozkroju
+    (fi, dlugosc, liczba) oraz liczbę całych prętów i zakładów na średnicę.
+    """
+    fi_mm = np.asarray(fi_mm, dtype=np.int64)
+    dlugosc, liczba, l0 = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (dlugosc, liczba, l0))
+    )
+    if np.any(dlugosc <= 0.0):
+        raise ValueError("Długości prętów muszą być dodatnie.")
+    dlugie = dlugosc > dlugosc_handlowa + 1e-9
+    if np.any(dlugie & (l0 >= dlugosc_handlowa)):
+        raise ValueError("Długość zakładu nie mniejsza od długości pręta handlowego.")
+
+    k = np.where(dlugie, np.ceil((dlugosc - l0) / (dlugosc_handlowa - l0) - 1e-9), 1.0)
+    reszta = dlugosc + (k - 1.0) * l0 - (k - 1.0) * dlugosc_handlowa
+    cale = (k - 1.0) * liczba
+
+    tabela_cale = pd.DataFrame({"fi": fi_mm, "cale": cale, "zaklady": cale})
+    tabela_cale = tabela_cale.groupby("fi", sort=True).sum()
+    return {
+        "fi": fi_mm,
+        "dlugosc": reszta,
+        "liczba": liczba.astype(np.int64),
+        "cale_prety": tabela_cale["cale"].astype(np.int64).to_dict(),
+        "zaklady": tabela_cale["zaklady"].astype(np.int64).to_dict(),
+        "l0": l0,
+    }
+
+# =============================================================================
+# FFD Z DRZEWEM PRZEDZIAŁÓW
+# =============================================================================
+
+class _DrzewoMaksimow:
+    """Drzewo przedziałów: maksimum pozostałej długości; wyszukanie pierwszego pręta z miejscem."""
+
+    def __init__(self, pojemnosc: int):
+        self.rozmiar = 1
+        while self.rozmiar < pojemnosc:
+            self.rozmiar *= 2
+        self.wezly = [-math.inf] * (2 * self.rozmiar)
+
+    def ustaw(self, i: int, wartosc: float):
+        w = self.wezly
+        i += self.rozmiar
+        w[i] = wartosc
+        i //= 2
+        while i:
+            nowa = w[2 * i] if w[2 * i] >= w[2 * i + 1] else w[2 * i + 1]
+            if w[i] == nowa:
+                break
+            w[i] = nowa
+            i //= 2
+
+    def pierwszy(self, potrzeba: float) -> int:
+        """Indeks pierwszego liścia z wartością >= potrzeba; -1 gdy brak."""
+        w = self.wezly
+        if w[1] < potrzeba:
+            return -1
+        i = 1
+        while i < self.rozmiar:
+            i = 2 * i if w[2 * i] >= potrzeba else 2 * i + 1
+        return i - self.rozmiar
+
+
+def _ffd(odcinki: np.ndarray, dlugosc_handlowa: float, rzaz: float):
+    """
+    First Fit Decreasing; odcinki posortowane malejąco. Każde cięcie zabiera
+    rzaz, stąd pojemność pręta Lh + rzaz. Zwraca pręty i pozostałe długości.
+    """
+    drzewo = _DrzewoMaksimow(max(len(odcinki), 1))
+    prety: list[list[float]] = []
+    pozostalo: list[float] = []
+    for d in odcinki.tolist():
+        potrzeba = d + rzaz
+        i = drzewo.pierwszy(potrzeba)
+        if i < 0:
+            i = len(prety)
+            prety.append([])
+            pozostalo.append(dlugosc_handlowa + rzaz)
+        prety[i].append(d)
+        pozostalo[i] -= potrzeba
+        drzewo.ustaw(i, pozostalo[i])
+    return prety, pozostalo
+
+
+def _popraw(prety, pozostalo, rzaz: float, maks_prob: int, maks_krokow: int = 50):
+    """
+    Poprawa lokalna: dla najsłabiej wykorzystanych prętów kolejno przenosi
+    odcinki do innych prętów (pierwszy z miejscem), a gdy się nie da -
+    zamienia odcinek na krótszy z innego pręta, w którym po zamianie jest
+    miejsce. Każdy krok zmniejsza zawartość poprawianego pręta, więc
+    procedura jest skończona; opróżnione pręty są usuwane.
+    """
+    kosz = np.repeat(np.arange(len(prety)), [len(p) for p in prety])
+    dl = np.array([d + rzaz for p in prety for d in p], dtype=np.float64)
+    zapas = np.array(pozostalo, dtype=np.float64)
+
+    for j in np.argsort(-zapas)[:maks_prob].tolist():
+        for _ in range(maks_krokow):
+            w_j = np.flatnonzero(kosz == j)
+            if w_j.size == 0:
+                break
+            zapas_inne = zapas.copy()
+            zapas_inne[j] = -np.inf
+            krok = False
+            for k in w_j[np.argsort(-dl[w_j])].tolist():
+                d = dl[k]
+                i = int(np.argmax(zapas_inne >= d - 1e-9))
+                if zapas_inne[i] >= d - 1e-9:
+                    kosz[k] = i
+                    zapas[i] -= d
+                    zapas[j] += d
+                    krok = True
+                    break
+                kandydaci = np.flatnonzero((kosz != j) & (dl < d) & (zapas[kosz] + dl >= d - 1e-9))
+                if kandydaci.size:
+                    q = int(kandydaci[np.argmin(dl[kandydaci])])
+                    i = int(kosz[q])
+                    kosz[k], kosz[q] = i, j
+                    zapas[i] += dl[q] - d
+                    zapas[j] += d - dl[q]
+                    krok = True
+                    break
+            if not krok:
+                break
+
+    wynik = [[] for _ in range(len(prety))]
+    for k, b in zip(np.argsort(-dl, kind="stable").tolist(), kosz[np.argsort(-dl, kind="stable")].tolist()):
+        wynik[b].append(float(dl[k] - rzaz))
+    return [p for p in wynik if p]
+
+
+def RozkrojOdcinki(
+    dlugosc,
+    liczba,
+    dlugosc_handlowa: float = DLUGOSC_HANDLOWA,
+    rzaz: float = 0.0,
+    maks_prob: int = MAKS_PROB_POPRAWY,
+) -> list[list[float]]:
+    """Rozkrój odcinków jednej średnicy: FFD + poprawa lokalna. Lista prętów handlowych."""
+    odcinki = np.repeat(np.asarray(dlugosc, dtype=np.float64), np.asarray(liczba, dtype=np.int64))
+    if odcinki.size == 0:
+        return []
+    if odcinki.max() > dlugosc_handlowa + 1e-9:
+        raise ValueError("Odcinek dłuższy od pręta handlowego - najpierw PodzielPrety.")
+    odcinki = np.sort(odcinki)[::-1]
+    prety, pozostalo = _ffd(odcinki, dlugosc_handlowa, rzaz)
+    return _popraw(prety, pozostalo, rzaz, maks_prob)
+
+# =============================================================================
+# PLAN CIĘCIA
+# =============================================================================
+
+def PlanCiecia(
+    fi_mm,
+    dlugosc,
+    liczba,
+    dlugosc_handlowa: float = DLUGOSC_HANDLOWA,
+    rzaz: float = 0.0,
+    maks_prob: int = MAKS_PROB_POPRAWY,
+    **parametry_zakladu,
+) -> dict:
+    """
+    Pełny plan cięcia dla wykazu (fi [mm], dlugosc [mm], liczba [szt.]).
+    parametry_zakladu - argumenty DlugosciZakladow (klasa betonu, stal, ...).
+    Zwraca "podsumowanie" (na średnicę) i "wzory" (powtarzalne układy cięcia).
+    """
+    fi_mm = np.asarray(fi_mm, dtype=np.int64)
+    l0 = DlugosciZakladow(fi_mm, **parametry_zakladu)
+    podzial = PodzielPrety(fi_mm, dlugosc, liczba, l0, dlugosc_handlowa)
+
+    wiersze, wzory = [], []
+    for fi in np.unique(fi_mm).tolist():
+        maska = podzial["fi"] == fi
+        prety = RozkrojOdcinki(
+            podzial["dlugosc"][maska], podzial["liczba"][maska], dlugosc_handlowa, rzaz, maks_prob,
+        )
+        cale = int(podzial["cale_prety"].get(fi, 0))
+        dl_odcinkow = float(np.dot(podzial["dlugosc"][maska], podzial["liczba"][maska]))
+        n_handlowych = len(prety) + cale
+        odpad = len(prety) * dlugosc_handlowa - dl_odcinkow
+        wiersze.append({
+            "fi": fi,
+            "l0": float(l0[fi_mm == fi][0]),
+            "zaklady": int(podzial["zaklady"].get(fi, 0)),
+            "prety_handlowe": n_handlowych,
+            "w_tym_cale": cale,
+            "odpad_m": odpad / 1000.0,
+            "odpad_proc": 100.0 * odpad / (n_handlowych * dlugosc_handlowa) if n_handlowych else 0.0,
+        })
+        licznik: dict[tuple, int] = {}
+        for p in prety:
+            klucz = tuple(sorted(p, reverse=True))
+            licznik[klucz] = licznik.get(klucz, 0) + 1
+        for klucz, n in sorted(licznik.items(), key=lambda x: -x[1]):
+            wzory.append({"fi": fi, "liczba": n, "odcinki": klucz, "odpad": dlugosc_handlowa - sum(klucz) - rzaz * (len(klucz) - 1)})
+        if cale:
+            wzory.append({"fi": fi, "liczba": cale, "odcinki": (dlugosc_handlowa,), "odpad": 0.0})
+
+    return {"podsumowanie": pd.DataFrame(wiersze), "wzory": wzory, "dlugosc_handlowa": dlugosc_handlowa}
+
+
+def OpisWzoru(odcinki) -> str:
+    """Zapis układu cięcia, np. "2×4350 + 1×3100"."""
+    czesci, poprzedni, n = [], None, 0
+    for d in list(odcinki) + [None]:
+        if d == poprzedni:
+            n += 1
+            continue
+        if poprzedni is not None:
+            czesci.append(f"{n}×{poprzedni:.0f}")
+        poprzedni, n = d, 1
+    return " + ".join(czesci)
+
+
+if __name__ == "__main__":
+    import time
+
+    # Syntetyczny wykaz: 50 000 odcinków, część dłuższa niż 12 m
+    rng = np.random.default_rng(0)
+    n_poz = 5_000
+    fi = rng.choice([8, 10, 12, 16, 20, 25], n_poz)
+    L = np.round(rng.lognormal(np.log(3500.0), 0.7, n_poz).clip(300.0, 30_000.0), -1)
+    n = rng.integers(1, 20, n_poz)
+    n = np.round(n * 50_000 / n.sum()).astype(np.int64).clip(1)
+
+    t0 = time.perf_counter()
+    plan = PlanCiecia(fi, L, n)
+    t1 = time.perf_counter()
+
+    pods = plan["podsumowanie"]
+    for p in plan["wzory"]:
+        assert sum(p["odcinki"]) <= plan["dlugosc_handlowa"] + 1e-6
+    podzial = PodzielPrety(fi, L, n, DlugosciZakladow(fi))
+    dolna = sum(
+        math.ceil(float(np.dot(podzial["dlugosc"][fi == f], podzial["liczba"][fi == f])) / DLUGOSC_HANDLOWA)
+        for f in np.unique(fi)
+    )
+    print(pods.round(2).to_string(index=False))
+    print(f"{int(n.sum()):,} prętów: {(t1 - t0):.2f} s, prętów handlowych: {pods['prety_handlowe'].sum()} "
+          f"(cięte: {pods['prety_handlowe'].sum() - pods['w_tym_cale'].sum()}, dolne ograniczenie: {dolna}), "
+          f"odpad {pods['odpad_m'].sum():.0f} m")
@@ -0,0 +1,186 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# --- KONFIGURACJA ŚCIEŻEK (SZUKAMY KATALOGU KALKULATORY) ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+SCIEZKA_FOLDERU_LOKALNEGO = SCIEZKA_PLIKU.parent
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+if SCIEZKA_BAZOWA is None:
+    # Fallback – dwa poziomy wyżej
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+for sciezka in (
+    SCIEZKA_BAZOWA,
+    SCIEZKA_FOLDERU_LOKALNEGO,
+    SCIEZKA_BAZOWA / "_MODULY" / "ZESTAWIENIA_ZESTAWIENIE STALI",
+):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+try:
+    from TABLICE.ParametryBetonu import list_concrete_classes
+    from PlanCiecia import DLUGOSC_HANDLOWA, OpisWzoru, PlanCiecia
+    from DlugoscZakladu import MAPA_ALFA6, STAL_DATA
+    from ZestawienieStali import CzytajWykazPaczkami
+except ImportError as e:
+    st.error(f"⚠️ Błąd importu modułu planu cięcia: {e}. Sprawdź strukturę folderów.")
+    st.stop()
+
+WYKAZ_PRZYKLADOWY = pd.DataFrame({
+    "Φ [mm]": [12, 12, 16, 20, 25],
+    "Długość [m]": [5.80, 14.50, 3.45, 21.30, 8.15],
+    "Liczba [szt.]": [48, 20, 64, 12, 16],
+})
+
+
+def StronaPlanCiecia():
+    # --- STYL (spójny z pozostałymi kalkulatorami) ---
+    st.markdown(
+        """
+        <style>
+        .block-container { padding-top: 1.5rem; padding-bottom: 1.5rem; }
+        h3 { margin-top: 1.0rem !important; margin-bottom: 0.4rem !important; font-size: 1.1rem; }
+        .big-result {
+            font-size: 22px; font-weight: bold; color: #2E8B57; background-color: #f0f2f6;
+            padding: 15px; border-radius: 8px; text-align: center; margin-top: 20px; border: 2px solid #2E8B57;
+        }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # --- TYTUŁ GŁÓWNY ---
+    st.markdown(
+        """
+        <div style="text-align:center; margin-top:0.4rem; margin-bottom:0rem;">
+            <span style="font-size:42px; font-weight:800; letter-spacing:1px; color:#dddddd;">
+                PLAN CIĘCIA PRĘTÓW
+            </span>
+        </div>
+        <div style="text-align:center; font-size:14px; color:#aaaaaa; margin-top:-12px; margin-bottom:0.6rem;">
+            rozkrój prętów handlowych z zakładami wg PN-EN 1992-1-1, pkt 8.7
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # 1. DANE WEJŚCIOWE
+    st.markdown("### WYKAZ PRĘTÓW")
+    plik = st.file_uploader("Wykaz prętów (CSV lub XLSX, format jak w zestawieniu stali) - opcjonalnie", type=["csv", "xlsx"])
+    if plik is None:
+        wykaz = st.data_editor(WYKAZ_PRZYKLADOWY, num_rows="dynamic", use_container_width=True, hide_index=True)
+
+    st.markdown("### ZAKŁADY I PRĘTY HANDLOWE")
+    klasy = list_concrete_classes()
+    stale = list(STAL_DATA.keys())
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        klasa_betonu = st.selectbox("Klasa betonu", klasy, index=klasy.index("C30/37"))
+    with c2:
+        stal_nazwa = st.selectbox("Klasa stali", stale, index=stale.index("B500B") if "B500B" in stale else 0)
+    with c3:
+        warunki = st.radio("Warunki przyczepności", ["Dobre", "Złe"], horizontal=True)
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        alfa6_proc = st.selectbox("Udział prętów łączonych ρ₁ (α₆)", list(MAPA_ALFA6.keys()), index=0)
+    with c2:
+        L_h = st.number_input("Długość pręta handlowego [m]", 6.0, 18.0, DLUGOSC_HANDLOWA / 1000.0, 0.5)
+    with c3:
+        rzaz = st.number_input("Strata na cięcie [mm]", 0.0, 20.0, 0.0, 1.0)
+
+    st.markdown("---")
+
+    _, c_btn, _ = st.columns([1, 2, 1])
+    with c_btn:
+        oblicz = st.button("OBLICZ", type="primary", use_container_width=True)
+
+    if oblicz:
+        try:
+            if plik is not None:
+                paczki = list(CzytajWykazPaczkami(plik))
+                dane = pd.concat(paczki, ignore_index=True) if paczki else pd.DataFrame(columns=["fi", "dlugosc"])
+                fi = pd.to_numeric(dane["fi"], errors="coerce").to_numpy()
+                L = pd.to_numeric(dane["dlugosc"], errors="coerce").to_numpy()
+                n = pd.to_numeric(dane["liczba"], errors="coerce").to_numpy() if "liczba" in dane else np.ones(len(dane))
+            else:
+                dane = wykaz.dropna()
+                fi, L, n = (dane[k].to_numpy(dtype=np.float64) for k in WYKAZ_PRZYKLADOWY.columns)
+            if len(fi) == 0 or np.isnan(fi).any() or np.isnan(L).any() or np.isnan(n).any():
+                raise ValueError("Wykaz jest pusty lub zawiera niepoprawne wartości liczbowe.")
+
+            plan = PlanCiecia(
+                fi.astype(np.int64), L * 1000.0, n.astype(np.int64),
+                dlugosc_handlowa=L_h * 1000.0,
+                rzaz=rzaz,
+                klasa_betonu=klasa_betonu,
+                stal_nazwa=stal_nazwa,
+                warunki_przyczepnosci=warunki,
+                alfa6_proc=alfa6_proc,
+            )
+            st.session_state["wynik_plan_ciecia"] = plan
+            st.session_state["pokaz_plan_ciecia"] = True
+        except (KeyError, ValueError) as e:
+            st.error(f"Wystąpił błąd podczas obliczeń: {e}")
+            st.session_state["pokaz_plan_ciecia"] = False
+
+    # WYNIKI
+    if st.session_state.get("pokaz_plan_ciecia", False):
+        plan = st.session_state["wynik_plan_ciecia"]
+        pods = plan["podsumowanie"]
+        L_h_mm = plan["dlugosc_handlowa"]
+        n_h = int(pods["prety_handlowe"].sum())
+        odpad_m = float(pods["odpad_m"].sum())
+
+        st.markdown(
+            f"""
+            <div class="big-result">
+                Pręty handlowe: {n_h} szt. × {L_h_mm / 1000.0:.1f} m &nbsp;|&nbsp;
+                odpad {odpad_m:.1f} m ({100.0 * odpad_m * 1000.0 / (n_h * L_h_mm):.2f}%)
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+        st.markdown("<div style='height: 12px;'></div>", unsafe_allow_html=True)
+
+        m1, m2, m3 = st.columns(3)
+        m1.metric("Zakłady [szt.]", f"{int(pods['zaklady'].sum())}")
+        m2.metric("Pręty całe (bez cięcia)", f"{int(pods['w_tym_cale'].sum())}")
+        m3.metric("Układy cięcia", f"{len(plan['wzory'])}")
+
+        st.dataframe(
+            pods.rename(columns={
+                "fi": "Φ [mm]",
+                "l0": "l₀ [mm]",
+                "zaklady": "Zakłady [szt.]",
+                "prety_handlowe": "Pręty handlowe [szt.]",
+                "w_tym_cale": "w tym całe [szt.]",
+                "odpad_m": "Odpad [m]",
+                "odpad_proc": "Odpad [%]",
+            }).round(2),
+            use_container_width=True,
+            hide_index=True,
+        )
+
+        with st.expander("✂️ Układy cięcia", expanded=False):
+            st.dataframe(
+                pd.DataFrame({
+                    "Φ [mm]": [w["fi"] for w in plan["wzory"]],
+                    "Liczba prętów handlowych": [w["liczba"] for w in plan["wzory"]],
+                    "Odcinki [mm]": [OpisWzoru(w["odcinki"]) for w in plan["wzory"]],
+                    "Odpad na pręt [mm]": [round(w["odpad"]) for w in plan["wzory"]],
+                }),
+                use_container_width=True,
+                hide_index=True,
+            )
+
+
+if __name__ == "__main__":
+    StronaPlanCiecia()
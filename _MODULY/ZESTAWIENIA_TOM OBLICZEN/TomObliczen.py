@@ -0,0 +1,403 @@
+"""
+PROGRAMY/TomObliczen.py
+Tom obliczeń projektu - jeden plik PDF z setkami sprawdzeń
+
+Tabela sprawdzeń (CSV/XLSX lub edytor): kolumna "typ" (Zakotwienie, Zakład,
+Otulina), "oznaczenie" oraz kolumny o nazwach argumentów funkcji
+obliczeniowych (ObliczDlugoscZakotwienia, ObliczDlugoscZakladu,
+ObliczOtuline); brakujące kolumny i puste komórki - wartości domyślne.
+
+Raport zapisywany jest strumieniowo (NARZEDZIA.RaportProjektu): każde
+sprawdzenie rysowane jest tą samą funkcją create_pdf_report co raport
+pojedynczy, a strony trafiają do pliku od razu - pamięć nie rośnie
+z liczbą sprawdzeń. Rozdziały wg typu, spis treści i zakładki na końcu.
+
+ZapiszZIP zapisuje te same sprawdzenia jako archiwum ZIP z osobnymi
+raportami PDF i DOCX (create_pdf_report / create_docx_report) - każdy
+plik trafia do archiwum zaraz po wygenerowaniu, w pamięci jest naraz
+jeden raport.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import unicodedata
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Callable
+
+import pandas as pd
+
+# --- KONFIGURACJA ŚCIEŻEK (SZUKAMY KATALOGU KALKULATORY) ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+if SCIEZKA_BAZOWA is None:
+    # Fallback – dwa poziomy wyżej
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+for sciezka in (
+    SCIEZKA_BAZOWA,
+    SCIEZKA_BAZOWA / "_MODULY" / "PODSTAWOWE DANE_DLUGOSC ZAKOTWIENIA",
+    SCIEZKA_BAZOWA / "_MODULY" / "PODSTAWOWE DANE_DLUGOSC ZAKLADU",
+    SCIEZKA_BAZOWA / "_MODULY" / "PODSTAWOWE DANE_OTULINA ZBROJENIA",
+):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+import DlugoscZakladu
+import DlugoscZakotwienia
+import OtulinaZbrojenia
+from NARZEDZIA.RaportProjektu import RaportProjektu
+
+# =============================================================================
+# RODZAJE SPRAWDZEŃ
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class RodzajSprawdzenia:
+    """
+    Funkcja obliczeniowa, wartości domyślne i dane raportu jednego typu
+    sprawdzenia; dozwolone - wartości kolumn kategorii (argument -> lista).
+    """
+    rozdzial: str
+    oblicz: Callable[..., dict]
+    domyslne: dict
+    dane_raportu: Callable[[dict], dict]
+    opis: Callable[[dict], str]
+    raport_pdf: Callable
+    raport_docx: Callable
+    dozwolone: dict
+
+
+def _dane_zakotwienia(p: dict) -> dict:
+    return {"naprezenie": p["procent_naprezenia"], "warunki": p["warunki_przyczepnosci"], "stal_nazwa": p["stal_nazwa"]}
+
+
+def _dane_zakladu(p: dict) -> dict:
+    return {"naprezenie": p["procent_naprezenia"], "warunki": p["warunki_przyczepnosci"], "alfa6_in": p["alfa6_proc"]}
+
+
+def _dane_otuliny(p: dict) -> dict:
+    return {
+        "klasa_betonu": p["klasa_betonu"],
+        "klasa_ekspozycji": p["klasa_ekspozycji"],
+        "fi_mm": int(p["fi_mm"]) if float(p["fi_mm"]).is_integer() else p["fi_mm"],
+        "zywotnosc_100": p["zywotnosc_100_lat"],
+        "plyta": p["element_plytowy"],
+        "delta_dev": p["delta_dev"],
+        "betonowanie_grunt": p["beton_na_gruncie"],
+        "kontrola_jakosci_str": "Tak" if p["kontrola_jakosci"] else "Nie",
+        "kruszywo_opis": "d_g > 32 mm" if p["dg_gt_32"] else "d_g ≤ 32 mm",
+        "dc_gamma": p["delta_dur_gamma"],
+        "dc_st": p["delta_dur_st"],
+        "dc_add": p["delta_dur_add"],
+    }
+
+
+_PRET = {
+    "fi_mm": 16.0,
+    "klasa_betonu": "C30/37",
+    "stal_nazwa": "B500",
+    "procent_naprezenia": 100.0,
+    "warunki_przyczepnosci": "Dobre",
+    "rodzaj_preta": "Rozciągany",
+}
+
+# Wartości kategorii jak w polach wyboru kalkulatorów (funkcje obliczeniowe
+# dla nieznanej klasy przyjmują po cichu wartości domyślne)
+_OPCJE_PRETA = {
+    "klasa_betonu": list(DlugoscZakotwienia.BETON_DATA),
+    "stal_nazwa": list(DlugoscZakotwienia.STAL_DATA),
+    "warunki_przyczepnosci": ["Dobre", "Złe"],
+    "rodzaj_preta": ["Rozciągany", "Ściskany"],
+}
+
+RODZAJE: dict[str, RodzajSprawdzenia] = {
+    "Zakotwienie": RodzajSprawdzenia(
+        rozdzial="Długości zakotwienia prętów",
+        oblicz=DlugoscZakotwienia.ObliczDlugoscZakotwienia,
+        domyslne={**_PRET, "ksztalt_preta": "Proste", "alfa2": 1.0, "alfa3": 1.0, "alfa4": 1.0, "alfa5": 1.0},
+        dane_raportu=_dane_zakotwienia,
+        opis=lambda w: f"l_bd = {w['lb_final']:.0f} mm",
+        raport_pdf=DlugoscZakotwienia.create_pdf_report,
+        raport_docx=DlugoscZakotwienia.create_docx_report,
+        dozwolone={**_OPCJE_PRETA, "ksztalt_preta": ["Proste", "Inne (haki, pętle)"]},
+    ),
+    "Zakład": RodzajSprawdzenia(
+        rozdzial="Długości zakładów prętów",
+        oblicz=DlugoscZakladu.ObliczDlugoscZakladu,
+        domyslne={**_PRET, "alfa6_proc": "100%", "alfa2": 1.0, "alfa3": 1.0, "alfa5": 1.0},
+        dane_raportu=_dane_zakladu,
+        opis=lambda w: f"l_0 = {w['l0_final']:.0f} mm",
+        raport_pdf=DlugoscZakladu.create_pdf_report,
+        raport_docx=DlugoscZakladu.create_docx_report,
+        dozwolone={**_OPCJE_PRETA, "alfa6_proc": list(DlugoscZakladu.MAPA_ALFA6)},
+    ),
+    "Otulina": RodzajSprawdzenia(
+        rozdzial="Otuliny zbrojenia",
+        oblicz=OtulinaZbrojenia.ObliczOtuline,
+        domyslne={
+            "klasa_ekspozycji": "XC1",
+            "fi_mm": 16.0,
+            "klasa_betonu": "C30/37",
+            "zywotnosc_100_lat": False,
+            "element_plytowy": False,
+            "kontrola_jakosci": False,
+            "beton_na_gruncie": "Nie",
+            "dg_gt_32": False,
+            "delta_dur_gamma": 0.0,
+            "delta_dur_st": 0.0,
+            "delta_dur_add": 0.0,
+            "delta_dev": 10.0,
+        },
+        dane_raportu=_dane_otuliny,
+        opis=lambda w: f"c_nom = {w['c_nom']:.0f} mm",
+        raport_pdf=OtulinaZbrojenia.create_pdf_report,
+        raport_docx=OtulinaZbrojenia.create_docx_report,
+        dozwolone={
+            "klasa_ekspozycji": list(OtulinaZbrojenia.KLASY_EKSPOZYCJI),
+            "klasa_betonu": list(OtulinaZbrojenia.KLASY_BETONU),
+            "beton_na_gruncie": list(OtulinaZbrojenia.LIMITY_GRUNTU),
+        },
+    ),
+}
+
+# Zapis bez polskich znaków w plikach CSV
+_ALIASY_TYPU = {"zakotwienie": "Zakotwienie", "zaklad": "Zakład", "zakład": "Zakład", "otulina": "Otulina"}
+
+TABELA_PRZYKLADOWA = pd.DataFrame({
+    "typ": ["Zakotwienie", "Zakotwienie", "Zakład", "Otulina", "Otulina"],
+    "oznaczenie": ["B-1 pręty dolne", "S-3 pręty podłużne", "W-2 wieniec", "P-1 płyta stropowa", "F-1 ława fundamentowa"],
+    "fi_mm": [16, 25, 12, 10, 16],
+    "klasa_betonu": ["C30/37", "C35/45", "C25/30", "C30/37", "C25/30"],
+    "warunki_przyczepnosci": ["Dobre", "Dobre", "Złe", None, None],
+    "rodzaj_preta": ["Rozciągany", "Ściskany", "Rozciągany", None, None],
+    "klasa_ekspozycji": [None, None, None, "XC1", "XC2"],
+    "element_plytowy": [None, None, None, "Tak", "Nie"],
+    "beton_na_gruncie": [None, None, None, "Nie", "Bezpośrednio na gruncie"],
+})
+
+# =============================================================================
+# PRZYGOTOWANIE SPRAWDZEŃ
+# =============================================================================
+
+
+def _klucz_opcji(tekst) -> str:
+    """Postać porównywana wartości kategorii: bez wielkości liter, spacji i polskich znaków."""
+    tekst = unicodedata.normalize("NFKD", str(tekst).strip().casefold().replace("ł", "l"))
+    return "".join(z for z in tekst if not unicodedata.combining(z) and not z.isspace())
+
+
+def _wartosc(surowa, domyslna, dozwolone=None):
+    """
+    Wartość komórki w typie wartości domyślnej (puste - domyślna);
+    dozwolone - wartość kategorii zamieniana na zapis z listy (c30/37 -> C30/37).
+    """
+    if surowa is None or (isinstance(surowa, float) and surowa != surowa) or str(surowa).strip() == "":
+        return domyslna
+    if isinstance(domyslna, bool):
+        if isinstance(surowa, str):
+            tekst = surowa.strip().lower()
+            if tekst in ("tak", "t", "true", "1", "x"):
+                return True
+            if tekst in ("nie", "n", "false", "0", "-"):
+                return False
+            raise ValueError(f"Nieprawidłowa wartość logiczna: {surowa}")
+        return bool(surowa)
+    if isinstance(domyslna, float):
+        return float(str(surowa).replace(",", "."))
+    if dozwolone is not None:
+        for opcja in dozwolone:
+            if _klucz_opcji(opcja) == _klucz_opcji(surowa):
+                return opcja
+        raise ValueError(f"Nieznana wartość {str(surowa).strip()!r} (dozwolone: {', '.join(dozwolone)})")
+    return str(surowa).strip()
+
+
+def PrzygotujSprawdzenie(wiersz: dict) -> tuple[str, RodzajSprawdzenia, dict]:
+    """(typ, rodzaj, parametry funkcji obliczeniowej) dla wiersza tabeli."""
+    typ = _ALIASY_TYPU.get(str(wiersz.get("typ", "")).strip().lower())
+    if typ is None:
+        raise ValueError(f"Nieznany typ sprawdzenia: {wiersz.get('typ')}")
+    rodzaj = RODZAJE[typ]
+    parametry = {}
+    for k, v in rodzaj.domyslne.items():
+        try:
+            parametry[k] = _wartosc(wiersz.get(k), v, rodzaj.dozwolone.get(k))
+        except ValueError as e:
+            raise ValueError(f"{k}: {e}") from None
+    return typ, rodzaj, parametry
+
+
+def WczytajTabele(zrodlo) -> pd.DataFrame:
+    """Tabela sprawdzeń z pliku CSV (separator ; lub ,) lub XLSX."""
+    nazwa = str(getattr(zrodlo, "name", zrodlo)).lower()
+    if nazwa.endswith((".xlsx", ".xlsm")):
+        tabela = pd.read_excel(zrodlo, dtype=object)
+    else:
+        tabela = pd.read_csv(zrodlo, sep=None, engine="python", dtype=object)
+    tabela.columns = [str(k).strip() for k in tabela.columns]
+    if "typ" not in tabela.columns:
+        raise KeyError("Brak kolumny 'typ' w tabeli sprawdzeń")
+    return tabela
+
+
+def _Sprawdzenia(tabela: pd.DataFrame) -> tuple[dict[str, list], list[str]]:
+    """Sprawdzenia pogrupowane wg typu: {typ: [(nr, oznaczenie, rodzaj, parametry)]} i opisy błędnych wierszy."""
+    grupy: dict[str, list] = {typ: [] for typ in RODZAJE}
+    bledy = []
+    for nr, wiersz in enumerate(tabela.to_dict("records"), start=1):
+        try:
+            typ, rodzaj, parametry = PrzygotujSprawdzenie(wiersz)
+        except (KeyError, ValueError) as e:
+            bledy.append(f"Wiersz {nr}: {e}")
+            continue
+        oznaczenie = _wartosc(wiersz.get("oznaczenie"), f"{typ} nr {nr}")
+        grupy[typ].append((nr, oznaczenie, rodzaj, parametry))
+    return grupy, bledy
+
+
+# =============================================================================
+# ZAPIS TOMU
+# =============================================================================
+
+
+def ZapiszTom(
+    plik: BinaryIO,
+    tabela: pd.DataFrame,
+    tytul: str,
+    opis: str = "",
+    autor: str = "",
+    postep: Callable[[int, int], None] | None = None,
+) -> dict:
+    """
+    Zapisuje tom obliczeń do pliku binarnego (strumieniowo).
+    Zwraca: sprawdzenia, strony, bajty, bledy (lista opisów pominiętych wierszy).
+    """
+    grupy, bledy = _Sprawdzenia(tabela)
+    wszystkie = sum(len(g) for g in grupy.values())
+    gotowe = 0
+    raport = RaportProjektu(plik, tytul, opis, autor)
+    for typ, grupa in grupy.items():
+        if grupa:
+            raport.rozdzial(RODZAJE[typ].rozdzial)
+        for nr, oznaczenie, rodzaj, parametry in grupa:
+            try:
+                wynik = rodzaj.oblicz(**parametry)
+                inputs = rodzaj.dane_raportu(parametry)
+                raport.dodaj(
+                    f"{oznaczenie} ({rodzaj.opis(wynik)})",
+                    lambda pdf: rodzaj.raport_pdf(wynik, inputs, pdf),
+                )
+            except (KeyError, ValueError) as e:
+                bledy.append(f"Wiersz {nr}: {e}")
+            gotowe += 1
+            if postep is not None:
+                postep(gotowe, wszystkie)
+    bajty = raport.zamknij()
+    return {"sprawdzenia": raport.sprawdzenia, "strony": raport.strony, "bajty": bajty, "bledy": bledy}
+
+
+# =============================================================================
+# EKSPORT ZIP
+# =============================================================================
+
+FORMATY_ZIP = ("pdf", "docx")
+
+
+def _nazwa_pliku(tekst: str) -> str:
+    """Nazwa pliku bez znaków niedozwolonych w systemach plików (polskie litery zostają)."""
+    return re.sub(r'[\\/:*?"<>|\s]+', "_", str(tekst)).strip("._")[:80] or "sprawdzenie"
+
+
+def ZapiszZIP(
+    plik: BinaryIO,
+    tabela: pd.DataFrame,
+    formaty: tuple[str, ...] = FORMATY_ZIP,
+    postep: Callable[[int, int], None] | None = None,
+) -> dict:
+    """
+    Zapisuje raporty sprawdzeń (PDF i/lub DOCX) do archiwum ZIP, plik po pliku:
+    katalog wg typu, nazwa "<nr wiersza>_<oznaczenie>.<format>".
+    Zwraca: sprawdzenia, pliki, bajty, bledy (lista opisów pominiętych wierszy).
+    """
+    grupy, bledy = _Sprawdzenia(tabela)
+    wszystkie = sum(len(g) for g in grupy.values())
+    gotowe = sprawdzenia = pliki = 0
+    # PDF i DOCX są już skompresowane - szybka kompresja archiwum wystarcza
+    with zipfile.ZipFile(plik, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as archiwum:
+        for typ, grupa in grupy.items():
+            for nr, oznaczenie, rodzaj, parametry in grupa:
+                try:
+                    wynik = rodzaj.oblicz(**parametry)
+                    inputs = rodzaj.dane_raportu(parametry)
+                    for format in formaty:
+                        raport = rodzaj.raport_pdf(wynik, inputs) if format == "pdf" else rodzaj.raport_docx(wynik, inputs)
+                        dane = raport if isinstance(raport, bytes) else raport.getvalue()
+                        archiwum.writestr(f"{_nazwa_pliku(typ)}/{nr:04d}_{_nazwa_pliku(oznaczenie)}.{format}", dane)
+                        pliki += 1
+                    sprawdzenia += 1
+                except (KeyError, ValueError) as e:
+                    bledy.append(f"Wiersz {nr}: {e}")
+                gotowe += 1
+                if postep is not None:
+                    postep(gotowe, wszystkie)
+    return {"sprawdzenia": sprawdzenia, "pliki": pliki, "bajty": plik.tell(), "bledy": bledy}
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+    import tracemalloc
+
+    n = 1000
+    tabela = pd.concat([TABELA_PRZYKLADOWA] * (n // len(TABELA_PRZYKLADOWA)), ignore_index=True)
+    tabela["fi_mm"] = [8 + 2 * (i % 12) for i in range(len(tabela))]
+
+    # Wartości kategorii: zapis dowolną wielkością liter, nieznane - wiersz pominięty
+    _, _, parametry = PrzygotujSprawdzenie({"typ": "zakotwienie", "klasa_betonu": "c30/37", "warunki_przyczepnosci": "zle"})
+    assert parametry["klasa_betonu"] == "C30/37" and parametry["warunki_przyczepnosci"] == "Złe"
+    _, bledy = _Sprawdzenia(pd.DataFrame({"typ": ["Otulina", "Zakład"], "klasa_ekspozycji": ["XC7", None],
+                                          "alfa6_proc": [None, "60%"]}))
+    assert len(bledy) == 2, bledy
+    print("\n".join(bledy))
+
+    for liczba in (100, n):
+        with tempfile.TemporaryFile() as plik:
+            t0 = time.perf_counter()
+            stat = ZapiszTom(plik, tabela.head(liczba), "Budynek biurowy - tom obliczeń", "Test wydajności")
+            t1 = time.perf_counter()
+        # Szczyt pamięci w osobnym przebiegu (tracemalloc spowalnia obliczenia)
+        with tempfile.TemporaryFile() as plik:
+            tracemalloc.start()
+            ZapiszTom(plik, tabela.head(liczba), "Budynek biurowy - tom obliczeń", "Test wydajności")
+            _, szczyt = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        assert not stat["bledy"], stat["bledy"][:3]
+        print(f"{stat['sprawdzenia']} sprawdzeń: {stat['strony']} stron, {stat['bajty'] / 1024 ** 2:.1f} MB, "
+              f"{t1 - t0:.1f} s ({(t1 - t0) / liczba * 1000:.1f} ms/sprawdzenie), "
+              f"szczyt pamięci {szczyt / 1024 ** 2:.1f} MB")
+
+    # Archiwum ZIP (PDF + DOCX każdego sprawdzenia)
+    liczba = 200
+    with tempfile.TemporaryFile() as plik:
+        t0 = time.perf_counter()
+        stat = ZapiszZIP(plik, tabela.head(liczba))
+        t1 = time.perf_counter()
+        plik.seek(0)
+        with zipfile.ZipFile(plik) as archiwum:
+            assert archiwum.testzip() is None and len(archiwum.namelist()) == stat["pliki"] == 2 * liczba
+            najwiekszy = max(i.file_size for i in archiwum.infolist())
+    with tempfile.TemporaryFile() as plik:
+        tracemalloc.start()
+        ZapiszZIP(plik, tabela.head(liczba))
+        _, szczyt = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    print(f"ZIP {stat['sprawdzenia']} sprawdzeń: {stat['pliki']} plików, {stat['bajty'] / 1024 ** 2:.1f} MB, "
+          f"{t1 - t0:.1f} s, szczyt pamięci {szczyt / 1024 ** 2:.1f} MB (największy raport {najwiekszy / 1024:.0f} kB)")
@@ -0,0 +1,187 @@
+import streamlit as st
+import pandas as pd
+import sys
+from pathlib import Path
+
+# --- KONFIGURACJA ŚCIEŻEK (SZUKAMY KATALOGU KALKULATORY) ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+SCIEZKA_FOLDERU_LOKALNEGO = SCIEZKA_PLIKU.parent
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+if SCIEZKA_BAZOWA is None:
+    # Fallback – dwa poziomy wyżej
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+for sciezka in (SCIEZKA_BAZOWA, SCIEZKA_FOLDERU_LOKALNEGO):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+try:
+    from TomObliczen import RODZAJE, TABELA_PRZYKLADOWA, WczytajTabele, ZapiszTom, ZapiszZIP
+    from NARZEDZIA.ZadaniaRaportow import ANULOWANE, BLAD, GOTOWE, Pula
+except ImportError as e:
+    st.error(f"⚠️ Błąd importu modułu tomu obliczeń: {e}. Sprawdź strukturę folderów.")
+    st.stop()
+
+
+@st.fragment(run_every=1.0)
+def _PostepTomu(id_zadania: str):
+    # Odświeżany co 1 s bez przeładowania strony; po zakończeniu - pełne przeładowanie (wyniki)
+    zadanie = Pula().stan(id_zadania)
+    if zadanie is None or zadanie.zakonczone:
+        st.rerun()
+    tekst = f"Sprawdzenie {zadanie.gotowe} z {zadanie.wszystkie}" if zadanie.wszystkie else "Oczekiwanie na rozpoczęcie..."
+    st.progress(zadanie.postep, text=f"{zadanie.nazwa} (w tle) - {tekst}")
+    if st.button("ANULUJ", key="tom_anuluj"):
+        Pula().anuluj(id_zadania)
+
+
+def StronaTomObliczen():
+    # --- STYL (spójny z pozostałymi kalkulatorami) ---
+    st.markdown(
+        """
+        <style>
+        .block-container { padding-top: 1.5rem; padding-bottom: 1.5rem; }
+        h3 { margin-top: 1.0rem !important; margin-bottom: 0.4rem !important; font-size: 1.1rem; }
+        .big-result {
+            font-size: 22px; font-weight: bold; color: #2E8B57; background-color: #f0f2f6;
+            padding: 15px; border-radius: 8px; text-align: center; margin-top: 20px; border: 2px solid #2E8B57;
+        }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # --- TYTUŁ GŁÓWNY ---
+    st.markdown(
+        """
+        <div style="text-align:center; margin-top:0.4rem; margin-bottom:0rem;">
+            <span style="font-size:42px; font-weight:800; letter-spacing:1px; color:#dddddd;">
+                TOM OBLICZEŃ PROJEKTU
+            </span>
+        </div>
+        <div style="text-align:center; font-size:14px; color:#aaaaaa; margin-top:-12px; margin-bottom:0.6rem;">
+            zakotwienia, zakłady i otuliny w jednym raporcie PDF ze spisem treści
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # 1. DANE PROJEKTU
+    st.markdown("### DANE PROJEKTU")
+    c1, c2 = st.columns(2)
+    with c1:
+        tytul = st.text_input("Nazwa projektu", value="Projekt konstrukcji", key="tom_tytul")
+    with c2:
+        autor = st.text_input("Opracował", value="", key="tom_autor")
+    opis = st.text_input("Opis (strona tytułowa)", value="", key="tom_opis")
+
+    # 2. SPRAWDZENIA
+    st.markdown("### SPRAWDZENIA")
+    plik = st.file_uploader("Tabela sprawdzeń (CSV lub XLSX) - opcjonalnie", type=["csv", "xlsx"], key="tom_plik")
+    if plik is None:
+        tabela = st.data_editor(TABELA_PRZYKLADOWA, num_rows="dynamic", use_container_width=True, hide_index=True,
+                                key="tom_edytor")
+
+    with st.expander("ℹ️ Pomoc: kolumny tabeli sprawdzeń", expanded=False):
+        st.markdown(
+            "Kolumna **typ**: " + ", ".join(f"`{t}`" for t in RODZAJE) + "; kolumna **oznaczenie** - nazwa w spisie treści. "
+            "Pozostałe kolumny to parametry obliczeń; puste komórki i brakujące kolumny przyjmują wartości domyślne. "
+            "Wartości logiczne: Tak / Nie."
+        )
+        st.dataframe(
+            pd.DataFrame(
+                [(typ, k, str(v)) for typ, r in RODZAJE.items() for k, v in r.domyslne.items()],
+                columns=["Typ", "Kolumna", "Wartość domyślna"],
+            ),
+            use_container_width=True,
+            hide_index=True,
+        )
+
+    st.markdown("---")
+
+    eksport = st.radio(
+        "Wynik",
+        ["Tom obliczeń PDF", "Archiwum ZIP (PDF + DOCX każdego sprawdzenia)"],
+        horizontal=True,
+        key="tom_eksport",
+    )
+
+    _, c_btn, _ = st.columns([1, 2, 1])
+    with c_btn:
+        generuj = st.button("GENERUJ TOM OBLICZEŃ", type="primary", use_container_width=True)
+
+    if generuj:
+        try:
+            if plik is not None:
+                tabela = WczytajTabele(plik)
+            tabela = tabela.dropna(how="all")
+            if tabela.empty:
+                raise ValueError("Tabela sprawdzeń jest pusta.")
+
+            # Tom generowany w tle (NARZEDZIA.ZadaniaRaportow) - strony zapisywane na bieżąco do pliku
+            # tymczasowego, strona pozostaje aktywna; poprzednie zadanie tej sesji jest usuwane
+            Pula().usun(st.session_state.get("zadanie_tom"))
+            if eksport.startswith("Archiwum"):
+                # Osobne raporty dopisywane do archiwum po kolei - w pamięci jeden raport naraz
+                st.session_state["zadanie_tom"] = Pula().zlec(
+                    ZapiszZIP, tabela.copy(),
+                    nazwa="Archiwum raportów", plik="RaportySprawdzen.zip", mime="application/zip",
+                )
+            else:
+                st.session_state["zadanie_tom"] = Pula().zlec(
+                    ZapiszTom, tabela.copy(), tytul, opis, autor,
+                    nazwa=f"Tom obliczeń: {tytul}", plik="TomObliczen.pdf", mime="application/pdf",
+                )
+        except (KeyError, ValueError) as e:
+            st.error(f"Wystąpił błąd podczas generowania: {e}")
+            Pula().usun(st.session_state.pop("zadanie_tom", None))
+
+    # WYNIKI
+    zadanie = Pula().stan(st.session_state.get("zadanie_tom"))
+    if zadanie is None and "zadanie_tom" in st.session_state:
+        st.info("Wygenerowany plik został usunięty po czasie przechowywania - wygeneruj go ponownie.")
+        del st.session_state["zadanie_tom"]
+    elif zadanie is not None and not zadanie.zakonczone:
+        _PostepTomu(zadanie.id)
+    elif zadanie is not None and zadanie.stan == BLAD:
+        st.error(f"Wystąpił błąd podczas generowania: {zadanie.blad}")
+    elif zadanie is not None and zadanie.stan == ANULOWANE:
+        st.info("Generowanie anulowano.")
+    elif zadanie is not None and zadanie.stan == GOTOWE:
+        stat = zadanie.wynik
+        if "strony" in stat:
+            podsumowanie = f"Tom obliczeń: {stat['sprawdzenia']} sprawdzeń, {stat['strony']} stron"
+        else:
+            podsumowanie = f"Archiwum ZIP: {stat['sprawdzenia']} sprawdzeń, {stat['pliki']} plików"
+        st.markdown(
+            f"""
+            <div class="big-result">
+                {podsumowanie}
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+        st.markdown("<div style='height: 12px;'></div>", unsafe_allow_html=True)
+
+        for blad in stat["bledy"][:20]:
+            st.warning(f"Pominięto - {blad}")
+        if len(stat["bledy"]) > 20:
+            st.warning(f"... oraz {len(stat['bledy']) - 20} kolejnych pominiętych wierszy")
+
+        # Dane odczytywane z pliku dopiero po kliknięciu (nie przy każdym przeładowaniu strony)
+        st.download_button(
+            "📄 POBIERZ TOM OBLICZEŃ PDF" if zadanie.plik.endswith(".pdf") else "📦 POBIERZ ARCHIWUM ZIP",
+            zadanie.dane,
+            file_name=zadanie.plik,
+            mime=zadanie.mime,
+            use_container_width=True,
+        )
+
+
+if __name__ == "__main__":
+    StronaTomObliczen()
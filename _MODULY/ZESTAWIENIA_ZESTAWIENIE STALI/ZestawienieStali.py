@@ -0,0 +1,329 @@
+"""
+PROGRAMY/ZestawienieStali.py
+Zestawienie stali zbrojeniowej: długość i masa prętów wg średnicy, gatunku
+stali, elementu i kondygnacji na podstawie wykazu prętów (CSV / XLSX).
+
+Wykaz czytany jest paczkami (pandas chunksize / openpyxl read_only), więc
+zużycie pamięci nie zależy od liczby wierszy. Kolumny tekstowe zamieniane są
+na kody kategorii (słowniki rosnące między paczkami), a sumy liczone
+wektorowo przez pd.factorize + np.bincount po kluczu złożonym z kodów.
+Masy liniowe prętów z TABLICE.ParametryPretowZbrojeniowych.
+"""
+
+from __future__ import annotations
+
+import sys
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# --- KONFIGURACJA ŚCIEŻEK (SZUKAMY KATALOGU KALKULATORY) ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+if SCIEZKA_BAZOWA is None:
+    # Fallback – dwa poziomy wyżej
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+if str(SCIEZKA_BAZOWA) not in sys.path:
+    sys.path.append(str(SCIEZKA_BAZOWA))
+
+from TABLICE.ParametryPretowZbrojeniowych import bar_indices, get_bar_arrays
+
+# Kolumny wykazu: nazwa wewnętrzna -> akceptowane nagłówki (bez rozróżniania wielkości liter)
+ALIASY_KOLUMN = {
+    "element": ("element", "pozycja elementu", "element konstrukcyjny"),
+    "kondygnacja": ("kondygnacja", "poziom", "piętro"),
+    "gatunek": ("gatunek", "stal", "gatunek stali", "klasa stali"),
+    "fi": ("fi", "φ", "średnica", "srednica", "fi [mm]", "średnica [mm]"),
+    "dlugosc": ("dlugosc", "długość", "długość [m]", "dlugosc [m]", "l [m]"),
+    "liczba": ("liczba", "ilość", "ilosc", "szt", "liczba sztuk", "n"),
+}
+KOLUMNY_KATEGORII = ("element", "kondygnacja", "gatunek")
+
+# Wartość domyślna kolumn kategorii, gdy brak ich w wykazie
+BRAK_KATEGORII = "-"
+
+ROZMIAR_PACZKI = 500_000
+
+# Kody kategorii pakowane po 15 bitów w jeden klucz int64 grupy
+BITY_KODU = 15
+MAKS_KOD = (1 << BITY_KODU) - 1
+
+# =============================================================================
+# CZYTANIE WYKAZU PACZKAMI
+# =============================================================================
+
+def _mapuj_naglowki(naglowki) -> dict:
+    """Nagłówek z pliku -> nazwa wewnętrzna; KeyError gdy brak kolumn wymaganych."""
+    mapa = {}
+    for nag in naglowki:
+        klucz = str(nag).strip().lower()
+        for nazwa, aliasy in ALIASY_KOLUMN.items():
+            if klucz in aliasy and nazwa not in mapa.values():
+                mapa[nag] = nazwa
+    brak = [k for k in ("fi", "dlugosc") if k not in mapa.values()]
+    if brak:
+        raise KeyError(
+            f"Brak wymaganych kolumn: {', '.join(brak)}. "
+            f"Akceptowane nagłówki: {', '.join(f'{k} ({aliasy[0]})' for k, aliasy in ALIASY_KOLUMN.items())}"
+        )
+    return mapa
+
+
+def _paczki_csv(zrodlo, rozmiar_paczki: int):
+    """
+    Paczki DataFrame z pliku CSV. Separator ; lub , rozpoznawany z nagłówka;
+    przy separatorze ; przecinek dziesiętny (3,0).
+    """
+    if hasattr(zrodlo, "read"):
+        pierwsza = zrodlo.readline()
+        zrodlo.seek(0)
+        if isinstance(pierwsza, bytes):
+            pierwsza = pierwsza.decode("utf-8-sig")
+    else:
+        with open(zrodlo, encoding="utf-8-sig") as f:
+            pierwsza = f.readline()
+    separator = ";" if pierwsza.count(";") > pierwsza.count(",") else ","
+    opcje = {
+        "sep": separator,
+        "decimal": "," if separator == ";" else ".",
+        "encoding": "utf-8-sig",
+        "skipinitialspace": True,
+    }
+
+    # Nagłówki czytane przez pandas (nazwy w cudzysłowach jak w danych)
+    naglowki = pd.read_csv(zrodlo, nrows=0, **opcje).columns
+    if hasattr(zrodlo, "seek"):
+        zrodlo.seek(0)
+    mapa = _mapuj_naglowki(naglowki)
+
+    for paczka in pd.read_csv(
+        zrodlo,
+        usecols=list(mapa),
+        chunksize=rozmiar_paczki,
+        dtype={n: str for n, k in mapa.items() if k in KOLUMNY_KATEGORII},
+        **opcje,
+    ):
+        yield paczka.rename(columns=mapa)
+
+
+def _paczki_xlsx(zrodlo, rozmiar_paczki: int):
+    """Paczki DataFrame z pierwszego arkusza XLSX (openpyxl, tryb read_only)."""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(zrodlo, read_only=True, data_only=True)
+    try:
+        wiersze = wb.worksheets[0].iter_rows(values_only=True)
+        naglowki = [n for n in next(wiersze, ()) if n is not None]
+        mapa = _mapuj_naglowki(naglowki)
+        pozycje = [naglowki.index(n) for n in mapa]
+        nazwy = list(mapa.values())
+
+        bufor = []
+        for wiersz in wiersze:
+            if wiersz is None or all(v is None for v in wiersz):
+                continue
+            bufor.append([wiersz[i] if i < len(wiersz) else None for i in pozycje])
+            if len(bufor) >= rozmiar_paczki:
+                yield pd.DataFrame(bufor, columns=nazwy)
+                bufor = []
+        if bufor:
+            yield pd.DataFrame(bufor, columns=nazwy)
+    finally:
+        wb.close()
+
+
+def CzytajWykazPaczkami(zrodlo, rozmiar_paczki: int = ROZMIAR_PACZKI):
+    """
+    Generator paczek wykazu z kolumnami wewnętrznymi (ALIASY_KOLUMN).
+    zrodlo - ścieżka lub obiekt plikowy z atrybutem name (np. plik z st.file_uploader).
+    """
+    nazwa = str(getattr(zrodlo, "name", zrodlo)).lower()
+    if nazwa.endswith((".xlsx", ".xlsm")):
+        yield from _paczki_xlsx(zrodlo, rozmiar_paczki)
+    elif nazwa.endswith((".csv", ".txt")):
+        yield from _paczki_csv(zrodlo, rozmiar_paczki)
+    else:
+        raise ValueError(f"Nieobsługiwany format wykazu: {nazwa}. Dostępne: CSV, XLSX.")
+
+# =============================================================================
+# AGREGACJA
+# =============================================================================
+
+class _Slownik:
+    """Rosnący słownik kategorii: etykieta -> kod (wspólny dla wszystkich paczek)."""
+
+    def __init__(self):
+        self.kody = {}
+        self.etykiety = []
+
+    def koduj(self, wartosci) -> np.ndarray:
+        # Najpierw kody lokalne (hash), dopiero unikalne wartości normalizowane w Pythonie
+        lokalne, unikalne = pd.factorize(np.asarray(wartosci, dtype=object), use_na_sentinel=True)
+        mapa = np.empty(len(unikalne) + 1, dtype=np.int64)
+        for i, wartosc in enumerate(list(unikalne) + [None]):
+            etykieta = BRAK_KATEGORII if wartosc is None else str(wartosc).strip() or BRAK_KATEGORII
+            if etykieta not in self.kody:
+                if len(self.etykiety) > MAKS_KOD:
+                    raise ValueError(f"Zbyt wiele różnych wartości kategorii (ponad {MAKS_KOD}).")
+                self.kody[etykieta] = len(self.etykiety)
+                self.etykiety.append(etykieta)
+            mapa[i] = self.kody[etykieta]
+        return mapa[lokalne]
+
+
+def ZestawienieStali(zrodlo, rozmiar_paczki: int = ROZMIAR_PACZKI) -> pd.DataFrame:
+    """
+    Sumy wykazu prętów w grupach (element, kondygnacja, gatunek, fi):
+    liczba prętów, długość całkowita [m] i masa [kg]. Jedna paczka w pamięci
+    naraz; akumulator ma rozmiar równy liczbie grup.
+    """
+    prety = get_bar_arrays()
+    slowniki = {k: _Slownik() for k in KOLUMNY_KATEGORII}
+    sumy = {}
+    wiersz_pocz = 0
+
+    for paczka in CzytajWykazPaczkami(zrodlo, rozmiar_paczki):
+        n = len(paczka)
+        fi = pd.to_numeric(paczka["fi"], errors="coerce").to_numpy()
+        dlugosc = pd.to_numeric(paczka["dlugosc"], errors="coerce").to_numpy(dtype=np.float64)
+        liczba = (
+            pd.to_numeric(paczka["liczba"], errors="coerce").to_numpy(dtype=np.float64)
+            if "liczba" in paczka else np.ones(n)
+        )
+        zle = np.isnan(fi) | np.isnan(dlugosc) | np.isnan(liczba)
+        if zle.any():
+            raise ValueError(f"Niepoprawne dane liczbowe w wierszu {wiersz_pocz + int(np.argmax(zle)) + 2} wykazu.")
+        zle = fi != np.round(fi)
+        if zle.any():
+            wiersz = int(np.argmax(zle))
+            raise ValueError(f"Niecałkowita średnica pręta {fi[wiersz]:g} mm w wierszu {wiersz_pocz + wiersz + 2} wykazu.")
+        try:
+            idx_fi = bar_indices(fi.astype(np.int64))
+        except ValueError as exc:
+            raise ValueError(f"{exc} (wiersze {wiersz_pocz + 2}–{wiersz_pocz + n + 1} wykazu)") from exc
+
+        # Brak kolumny kategorii w wykazie - wszystkie wiersze w grupie BRAK_KATEGORII
+        kody = [
+            slowniki[k].koduj(paczka[k] if k in paczka else np.full(n, None, dtype=object))
+            for k in KOLUMNY_KATEGORII
+        ]
+
+        klucz = np.zeros(n, dtype=np.int64)
+        for k in kody + [idx_fi]:
+            klucz = (klucz << BITY_KODU) | k
+        odwr, grupy = pd.factorize(klucz)
+        dl_calk = dlugosc * liczba
+        s_liczba = np.bincount(odwr, weights=liczba, minlength=len(grupy))
+        s_dl = np.bincount(odwr, weights=dl_calk, minlength=len(grupy))
+        s_masa = np.bincount(odwr, weights=dl_calk * prety["masa_liniowa"][idx_fi], minlength=len(grupy))
+
+        for g, a, b, c in zip(grupy.tolist(), s_liczba, s_dl, s_masa):
+            akt = sumy.get(g)
+            sumy[g] = (a, b, c) if akt is None else (akt[0] + a, akt[1] + b, akt[2] + c)
+        wiersz_pocz += n
+
+    klucz = np.array(list(sumy.keys()), dtype=np.int64)
+    klucze = np.column_stack([
+        (klucz >> (BITY_KODU * i)) & MAKS_KOD for i in range(len(KOLUMNY_KATEGORII), -1, -1)
+    ])
+    wartosci = np.array(list(sumy.values()), dtype=np.float64).reshape(-1, 3)
+    wynik = pd.DataFrame({
+        k: pd.Categorical.from_codes(klucze[:, i], categories=slowniki[k].etykiety)
+        for i, k in enumerate(KOLUMNY_KATEGORII)
+    })
+    wynik["fi"] = prety["fi"][klucze[:, -1]]
+    wynik["liczba"] = wartosci[:, 0].round().astype(np.int64)
+    wynik["dlugosc_m"] = wartosci[:, 1]
+    wynik["masa_kg"] = wartosci[:, 2]
+    return wynik.sort_values(list(KOLUMNY_KATEGORII) + ["fi"], ignore_index=True)
+
+
+def ZestawienieWg(zestawienie: pd.DataFrame, wg) -> pd.DataFrame:
+    """Sumy zestawienia wg wybranych kolumn (np. ["gatunek", "fi"])."""
+    return (
+        zestawienie.groupby(list(wg), observed=True, sort=True)[["liczba", "dlugosc_m", "masa_kg"]]
+        .sum()
+        .reset_index()
+    )
+
+# =============================================================================
+# EKSPORT XLSX (OPENPYXL, TRYB WRITE_ONLY)
+# =============================================================================
+
+NAGLOWKI_XLSX = {
+    "element": "Element",
+    "kondygnacja": "Kondygnacja",
+    "gatunek": "Gatunek stali",
+    "fi": "Φ [mm]",
+    "liczba": "Liczba prętów [szt.]",
+    "dlugosc_m": "Długość [m]",
+    "masa_kg": "Masa [kg]",
+}
+
+
+def _arkusz(wb, tytul: str, tabela: pd.DataFrame):
+    ws = wb.create_sheet(tytul)
+    ws.append([NAGLOWKI_XLSX.get(k, k) for k in tabela.columns])
+    for wiersz in tabela.itertuples(index=False):
+        ws.append([
+            round(float(v), 2) if isinstance(v, (float, np.floating)) else
+            int(v) if isinstance(v, (int, np.integer)) else str(v)
+            for v in wiersz
+        ])
+    ws.append([])
+    suma = ["RAZEM"] + [None] * (len(tabela.columns) - 1)
+    for k in ("liczba", "dlugosc_m", "masa_kg"):
+        if k in tabela:
+            suma[list(tabela.columns).index(k)] = round(float(tabela[k].sum()), 2)
+    ws.append(suma)
+
+
+def ZapiszZestawienieXlsx(zestawienie: pd.DataFrame) -> bytes:
+    """Skoroszyt XLSX (openpyxl write_only): pełne zestawienie i sumy cząstkowe."""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    _arkusz(wb, "Wg średnic", ZestawienieWg(zestawienie, ["gatunek", "fi"]))
+    _arkusz(wb, "Wg elementów", ZestawienieWg(zestawienie, ["element", "gatunek", "fi"]))
+    _arkusz(wb, "Wg kondygnacji", ZestawienieWg(zestawienie, ["kondygnacja", "gatunek", "fi"]))
+    _arkusz(wb, "Zestawienie", zestawienie)
+    bufor = BytesIO()
+    wb.save(bufor)
+    return bufor.getvalue()
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    rng = np.random.default_rng(0)
+    n = 2_000_000
+    sciezka = Path(tempfile.gettempdir()) / "wykaz_pretow_test.csv"
+    pd.DataFrame({
+        "Element": rng.choice(["Strop", "Belka B1", "Belka B2", "Słup S1", "Ściana W1"], n),
+        "Kondygnacja": rng.choice(["-1", "0", "1", "2", "3"], n),
+        "Gatunek": rng.choice(["B500B", "B500SP"], n),
+        "Fi": rng.choice([8, 10, 12, 16, 20, 25], n),
+        "Długość [m]": rng.uniform(0.5, 12.0, n).round(2),
+        "Liczba": rng.integers(1, 20, n),
+    }).to_csv(sciezka, index=False, sep=";", decimal=",")
+
+    t0 = time.perf_counter()
+    z = ZestawienieStali(sciezka)
+    t1 = time.perf_counter()
+    xlsx = ZapiszZestawienieXlsx(z)
+    t2 = time.perf_counter()
+
+    kontrola = pd.read_csv(sciezka, sep=";", decimal=",")
+    masa = (kontrola["Długość [m]"] * kontrola["Liczba"]
+            * get_bar_arrays()["masa_liniowa"][bar_indices(kontrola["Fi"].to_numpy())]).sum()
+    assert np.isclose(z["masa_kg"].sum(), masa)
+    print(f"{n:,} wierszy: agregacja {t1 - t0:.2f} s, XLSX {t2 - t1:.2f} s ({len(xlsx) / 1024:.0f} kB), "
+          f"grup: {len(z)}, masa: {z['masa_kg'].sum() / 1000:.1f} t")
+    sciezka.unlink()
@@ -0,0 +1,167 @@
+import streamlit as st
+import pandas as pd
+import sys
+from pathlib import Path
+
+# --- KONFIGURACJA ŚCIEŻEK (SZUKAMY KATALOGU KALKULATORY) ---
+SCIEZKA_PLIKU = Path(__file__).resolve()
+SCIEZKA_FOLDERU_LOKALNEGO = SCIEZKA_PLIKU.parent
+
+SCIEZKA_BAZOWA = None
+for parent in SCIEZKA_PLIKU.parents:
+    if parent.name.upper() == "KALKULATORY":
+        SCIEZKA_BAZOWA = parent
+        break
+if SCIEZKA_BAZOWA is None:
+    # Fallback – dwa poziomy wyżej
+    SCIEZKA_BAZOWA = SCIEZKA_PLIKU.parents[2]
+
+for sciezka in (SCIEZKA_BAZOWA, SCIEZKA_FOLDERU_LOKALNEGO):
+    if str(sciezka) not in sys.path:
+        sys.path.append(str(sciezka))
+
+try:
+    from ZestawienieStali import (
+        ALIASY_KOLUMN,
+        NAGLOWKI_XLSX,
+        ZapiszZestawienieXlsx,
+        ZestawienieStali,
+        ZestawienieWg,
+    )
+except ImportError as e:
+    st.error(f"⚠️ Błąd importu modułu zestawienia stali: {e}. Sprawdź strukturę folderów.")
+    st.stop()
+
+WZOR_WYKAZU = (
+    "Element;Kondygnacja;Gatunek;Fi;Długość [m];Liczba\n"
+    "Belka B1;1;B500B;20;6.35;4\n"
+    "Belka B1;1;B500B;8;1.42;32\n"
+    "Strop;1;B500B;12;5.80;48\n"
+)
+
+
+def StronaZestawienieStali():
+    # --- STYL (spójny z pozostałymi kalkulatorami) ---
+    st.markdown(
+        """
+        <style>
+        .block-container { padding-top: 1.5rem; padding-bottom: 1.5rem; }
+        h3 { margin-top: 1.0rem !important; margin-bottom: 0.4rem !important; font-size: 1.1rem; }
+        .big-result {
+            font-size: 22px; font-weight: bold; color: #2E8B57; background-color: #f0f2f6;
+            padding: 15px; border-radius: 8px; text-align: center; margin-top: 20px; border: 2px solid #2E8B57;
+        }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # --- TYTUŁ GŁÓWNY ---
+    st.markdown(
+        """
+        <div style="text-align:center; margin-top:0.4rem; margin-bottom:0rem;">
+            <span style="font-size:42px; font-weight:800; letter-spacing:1px; color:#dddddd;">
+                ZESTAWIENIE STALI ZBROJENIOWEJ
+            </span>
+        </div>
+        <div style="text-align:center; font-size:14px; color:#aaaaaa; margin-top:-12px; margin-bottom:0.6rem;">
+            długość i masa prętów wg średnic, gatunków, elementów i kondygnacji
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # 1. DANE WEJŚCIOWE
+    st.markdown("### WYKAZ PRĘTÓW")
+    plik = st.file_uploader("Wykaz prętów (CSV lub XLSX)", type=["csv", "xlsx"])
+
+    with st.expander("ℹ️ Pomoc: Format wykazu", expanded=False):
+        st.write(
+            "Pierwszy wiersz to nagłówki. Wymagane kolumny: średnica i długość jednego pręta [m]; "
+            "opcjonalnie liczba sztuk (domyślnie 1), element, kondygnacja i gatunek stali. "
+            "Separator CSV: średnik lub przecinek."
+        )
+        st.dataframe(
+            pd.DataFrame({"Kolumna": list(ALIASY_KOLUMN), "Akceptowane nagłówki": [", ".join(a) for a in ALIASY_KOLUMN.values()]}),
+            use_container_width=True,
+            hide_index=True,
+        )
+        st.download_button(
+            "⬇️ POBIERZ WZÓR WYKAZU (CSV)",
+            WZOR_WYKAZU.encode("utf-8-sig"),
+            file_name="WykazPretow_wzor.csv",
+            mime="text/csv",
+        )
+
+    st.markdown("---")
+
+    _, c_btn, _ = st.columns([1, 2, 1])
+    with c_btn:
+        oblicz = st.button("OBLICZ", type="primary", use_container_width=True)
+
+    if oblicz:
+        if plik is None:
+            st.error("Wczytaj wykaz prętów.")
+            st.session_state["pokaz_zestawienie"] = False
+        else:
+            try:
+                with st.spinner("Przetwarzanie wykazu..."):
+                    zestawienie = ZestawienieStali(plik)
+                    st.session_state["wynik_zestawienie"] = {
+                        "zestawienie": zestawienie,
+                        "xlsx": ZapiszZestawienieXlsx(zestawienie),
+                        "nazwa": Path(plik.name).stem,
+                    }
+                st.session_state["pokaz_zestawienie"] = True
+            except (KeyError, ValueError) as e:
+                st.error(f"Wystąpił błąd podczas obliczeń: {e}")
+                st.session_state["pokaz_zestawienie"] = False
+
+    # WYNIKI
+    if st.session_state.get("pokaz_zestawienie", False):
+        res = st.session_state["wynik_zestawienie"]
+        z = res["zestawienie"]
+
+        st.markdown(
+            f"""
+            <div class="big-result">
+                Masa stali zbrojeniowej: {z['masa_kg'].sum() / 1000.0:.3f} t
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+        st.markdown("<div style='height: 12px;'></div>", unsafe_allow_html=True)
+
+        m1, m2, m3 = st.columns(3)
+        m1.metric("Liczba prętów [szt.]", f"{int(z['liczba'].sum()):,}".replace(",", " "))
+        m2.metric("Długość całkowita [m]", f"{z['dlugosc_m'].sum():,.1f}".replace(",", " "))
+        m3.metric("Grupy zestawienia", f"{len(z)}")
+
+        st.download_button(
+            "📊 POBIERZ ZESTAWIENIE XLSX",
+            res["xlsx"],
+            file_name=f"{res['nazwa']}_zestawienie.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            use_container_width=True,
+        )
+
+        wg = st.radio(
+            "Grupowanie",
+            ["Średnica", "Element", "Kondygnacja", "Pełne"],
+            horizontal=True,
+        )
+        kolumny = {
+            "Średnica": ["gatunek", "fi"],
+            "Element": ["element", "gatunek", "fi"],
+            "Kondygnacja": ["kondygnacja", "gatunek", "fi"],
+        }
+        tabela = z if wg == "Pełne" else ZestawienieWg(z, kolumny[wg])
+        st.dataframe(
+            tabela.rename(columns=NAGLOWKI_XLSX).round(2),
+            use_container_width=True,
+            hide_index=True,
+        )
+
+
+if __name__ == "__main__":
+    StronaZestawienieStali()